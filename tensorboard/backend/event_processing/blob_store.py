@@ -0,0 +1,205 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Keeps blob data on local disk rather than in memory."""
+
+
+import collections
+import tempfile
+import threading
+import weakref
+
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Default size of the cache of recently read blobs.
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# The spill file is compacted once it holds at least this many bytes of
+# unreferenced blobs, and more of those than of referenced ones.
+_MIN_COMPACTION_BYTES = 64 * 1024 * 1024
+
+
+class BlobRef:
+    """A reference to a sequence of blobs stored in a `BlobStore`.
+
+    The blobs stay stored for as long as the reference is alive.
+
+    Attributes:
+      lengths: A tuple with the length of each blob, in bytes.
+    """
+
+    __slots__ = ("_store", "_offset", "lengths", "__weakref__")
+
+    def __init__(self, store, offset, lengths):
+        self._store = store
+        self._offset = offset
+        self.lengths = lengths
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def Read(self, index):
+        """Returns the blob at `index` as `bytes`.
+
+        Raises:
+          IndexError: If there is no blob at `index`.
+        """
+        return self._store.Read(self, index)
+
+    def ReadAll(self):
+        """Returns a list of all blobs, as `bytes`."""
+        return [self.Read(i) for i in range(len(self.lengths))]
+
+
+class BlobStore:
+    """Stores blobs in an anonymous local file, with a cache of hot blobs.
+
+    Blobs are appended to a temporary file, which is deleted when the
+    store is closed or the process exits. Callers keep `BlobRef`s rather
+    than the blobs themselves. Once a ref is garbage collected, the space
+    of its blobs is reclaimed by compacting the file when enough of it is
+    unreferenced.
+    """
+
+    def __init__(self, directory=None, cache_bytes=DEFAULT_CACHE_BYTES):
+        """Creates a `BlobStore`.
+
+        Args:
+          directory: Optional local directory in which to create the spill
+            file. Defaults to the system temporary directory.
+          cache_bytes: Maximum total size of the recently read blobs that
+            are cached in memory.
+        """
+        self._directory = directory
+        self._file = self._NewFile()
+        self._file_size = 0
+        self._live_bytes = 0
+        # Sizes of the blobs of refs that were garbage collected. Appended
+        # to without the mutex, since a collection may happen at any time,
+        # including while the mutex is held by the same thread.
+        self._released = []
+        self._refs = weakref.WeakSet()
+        self._mutex = threading.Lock()
+        self._cache_bytes = cache_bytes
+        self._cache_size = 0
+        # Maps `(ref, index)` to a blob, least recently used first.
+        self._cache = collections.OrderedDict()
+        self._cache_mutex = threading.Lock()
+
+    def _NewFile(self):
+        return tempfile.TemporaryFile(
+            prefix="tensorboard-blobs-", dir=self._directory
+        )
+
+    @property
+    def num_bytes(self):
+        """The size of the spill file, in bytes."""
+        return self._file_size
+
+    def Put(self, blobs):
+        """Stores a sequence of blobs.
+
+        Args:
+          blobs: A sequence of `bytes`.
+
+        Returns:
+          A `BlobRef` for the stored blobs.
+        """
+        lengths = tuple(len(blob) for blob in blobs)
+        data = b"".join(blobs)
+        with self._mutex:
+            self._MaybeCompact()
+            ref = BlobRef(self, self._file_size, lengths)
+            self._file.seek(self._file_size)
+            self._file.write(data)
+            self._file_size += len(data)
+            self._live_bytes += len(data)
+            self._refs.add(ref)
+        weakref.finalize(ref, self._released.append, len(data))
+        return ref
+
+    def Read(self, ref, index):
+        """Returns a blob; see `BlobRef.Read`."""
+        if not 0 <= index < len(ref.lengths):
+            raise IndexError(
+                "blob index %d out of range for %d blobs"
+                % (index, len(ref.lengths))
+            )
+        key = (ref, index)
+        with self._cache_mutex:
+            blob = self._cache.get(key)
+            if blob is not None:
+                self._cache.move_to_end(key)
+                return blob
+        start = sum(ref.lengths[:index])
+        with self._mutex:
+            self._file.seek(ref._offset + start)
+            blob = self._file.read(ref.lengths[index])
+        self._CachePut(key, blob)
+        return blob
+
+    def _CachePut(self, key, blob):
+        if len(blob) > self._cache_bytes:
+            return
+        with self._cache_mutex:
+            if key in self._cache:
+                return
+            self._cache[key] = blob
+            self._cache_size += len(blob)
+            while self._cache_size > self._cache_bytes:
+                (_, evicted) = self._cache.popitem(last=False)
+                self._cache_size -= len(evicted)
+
+    def _MaybeCompact(self):
+        """Rewrites the file without unreferenced blobs, if worthwhile.
+
+        Must be called with the mutex held.
+        """
+        while self._released:
+            self._live_bytes -= self._released.pop()
+        dead_bytes = self._file_size - self._live_bytes
+        if dead_bytes < max(_MIN_COMPACTION_BYTES, self._live_bytes):
+            return
+        refs = sorted(list(self._refs), key=lambda ref: ref._offset)
+        # Refs collected since the sizes were drained above are not among
+        # `refs`, so are not copied; the others stay alive during the copy.
+        del self._released[:]
+        new_file = self._NewFile()
+        new_size = 0
+        for ref in refs:
+            length = sum(ref.lengths)
+            self._file.seek(ref._offset)
+            new_file.write(self._file.read(length))
+            ref._offset = new_size
+            new_size += length
+        logger.info(
+            "Compacted blob spill file from %d to %d bytes",
+            self._file_size,
+            new_size,
+        )
+        self._file.close()
+        self._file = new_file
+        self._file_size = new_size
+        self._live_bytes = new_size
+
+    def Close(self):
+        """Deletes the spill file. Refs must not be read afterward."""
+        with self._mutex:
+            self._file.close()
+        with self._cache_mutex:
+            self._cache.clear()
+            self._cache_size = 0
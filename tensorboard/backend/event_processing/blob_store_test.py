@@ -0,0 +1,73 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for blob_store."""
+
+
+import gc
+from unittest import mock
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import blob_store
+
+
+class BlobStoreTest(tb_test.TestCase):
+    def _store(self, **kwargs):
+        store = blob_store.BlobStore(self.get_temp_dir(), **kwargs)
+        self.addCleanup(store.Close)
+        return store
+
+    def test_put_and_read(self):
+        store = self._store()
+        ref1 = store.Put([b"abc", b"", b"defgh"])
+        ref2 = store.Put([b"xyz"])
+        self.assertLen(ref1, 3)
+        self.assertEqual(ref1.ReadAll(), [b"abc", b"", b"defgh"])
+        self.assertEqual(ref1.Read(2), b"defgh")
+        self.assertEqual(ref2.Read(0), b"xyz")
+        self.assertEqual(store.num_bytes, 11)
+        with self.assertRaises(IndexError):
+            ref2.Read(1)
+
+    def test_caches_recently_read_blobs(self):
+        store = self._store(cache_bytes=10)
+        refs = [store.Put([b"%05d" % i]) for i in range(3)]
+        self.assertEqual(refs[0].Read(0), b"00000")
+        self.assertEqual(refs[1].Read(0), b"00001")
+        with mock.patch.object(store, "_file") as mock_file:
+            self.assertEqual(refs[0].Read(0), b"00000")
+            self.assertEqual(refs[1].Read(0), b"00001")
+            mock_file.read.assert_not_called()
+        # Reading a third blob evicts the least recently used one.
+        self.assertEqual(refs[2].Read(0), b"00002")
+        self.assertNotIn((refs[0], 0), store._cache)
+
+    def test_compacts_unreferenced_blobs(self):
+        store = self._store(cache_bytes=0)
+        with mock.patch.object(blob_store, "_MIN_COMPACTION_BYTES", 100):
+            kept = [store.Put([b"k%d" % i, b"-" * 10]) for i in range(5)]
+            for i in range(20):
+                store.Put([b"x" * 10])
+            gc.collect()
+            last = store.Put([b"last"])
+        self.assertLess(store.num_bytes, 100)
+        self.assertEqual(
+            [ref.ReadAll() for ref in kept],
+            [[b"k%d" % i, b"-" * 10] for i in range(5)],
+        )
+        self.assertEqual(last.Read(0), b"last")
+
+
+if __name__ == "__main__":
+    tb_test.main()
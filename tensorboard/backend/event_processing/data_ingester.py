@@ -14,14 +14,19 @@
 # ==============================================================================
 """Provides data ingestion logic backed by local event processing."""
 
+import functools
 import os
 import re
 import threading
 import time
 
 
+from tensorboard.backend.event_processing import blob_store
 from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import ingest_cache
+from tensorboard.backend.event_processing import logdir_watcher
 from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.backend.event_processing import reload_scheduler
 from tensorboard.backend.event_processing import tag_types
 from tensorboard.compat import tf
 from tensorboard.data import ingester
@@ -46,6 +51,13 @@ DEFAULT_TENSOR_SIZE_GUIDANCE = {
     pr_curve_metadata.PLUGIN_NAME: 100,
 }
 
+# Memory budget for caching data provider results between reloads.
+RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+
+# With `--reload_watch`, logdirs are still scanned and all runs reloaded
+# this often, in case the watcher missed any changes.
+FULL_RELOAD_SECS_WHEN_WATCHING = 300
+
 logger = tb_logging.get_logger()
 
 
@@ -70,12 +82,26 @@ class LocalDataIngester(ingester.DataIngester):
             max_reload_threads=flags.max_reload_threads,
             event_file_active_filter=_get_event_file_active_filter(flags),
             detect_file_replacement=flags.detect_file_replacement,
+            verify_data_crc=not flags.skip_data_crc,
+            ingest_cache=_get_ingest_cache(flags),
+            reload_incremental=bool(flags.reload_incremental),
+            max_reload_processes=flags.max_reload_processes,
+            max_bytes_per_tag=flags.max_bytes_per_tag,
+            bytes_per_plugin=flags.bytes_per_plugin,
+            max_tensor_bytes=flags.max_tensor_bytes,
+            blob_store=_get_blob_store(flags),
+            load_on_demand=bool(flags.load_on_demand),
+            idle_run_ttl_secs=flags.idle_run_ttl_secs,
+            reload_scheduler=_get_reload_scheduler(flags),
         )
         self._data_provider = data_provider.MultiplexerDataProvider(
-            self._multiplexer, flags.logdir or flags.logdir_spec
+            self._multiplexer,
+            flags.logdir or flags.logdir_spec,
+            response_cache_bytes=RESPONSE_CACHE_BYTES,
         )
         self._reload_interval = flags.reload_interval
         self._reload_task = flags.reload_task
+        self._reload_watch = bool(flags.reload_watch)
         if flags.logdir:
             self._path_to_run = {os.path.expanduser(flags.logdir): None}
         else:
@@ -97,23 +123,63 @@ class LocalDataIngester(ingester.DataIngester):
         """Starts ingesting data based on the ingester flag configuration."""
 
         def _reload():
+            watcher = None
+            if self._reload_watch and self._reload_interval != 0:
+                watcher = logdir_watcher.Create(list(self._path_to_run))
+            # Directories with changed event files, as reported by the
+            # watcher; None if the logdirs must be scanned again.
+            changed = None
+            last_full_reload = 0
             while True:
                 start = time.time()
-                logger.info("TensorBoard reload process beginning")
-                for path, name in self._path_to_run.items():
-                    self._multiplexer.AddRunsFromDirectory(path, name)
-                logger.info(
-                    "TensorBoard reload process: Reload the whole Multiplexer"
-                )
-                self._multiplexer.Reload()
-                duration = time.time() - start
-                logger.info(
-                    "TensorBoard done reloading. Load took %0.3f secs", duration
-                )
+                runs = None
+                if (
+                    changed is not None
+                    and start - last_full_reload
+                    < FULL_RELOAD_SECS_WHEN_WATCHING
+                ):
+                    runs = self._runs_in_directories(changed)
+                if runs is None:
+                    logger.info("TensorBoard reload process beginning")
+                    for path, name in self._path_to_run.items():
+                        self._multiplexer.AddRunsFromDirectory(path, name)
+                    logger.info(
+                        "TensorBoard reload process: Reload the whole Multiplexer"
+                    )
+                    self._multiplexer.Reload()
+                    last_full_reload = start
+                elif runs:
+                    logger.info(
+                        "TensorBoard reload process: Reload %d changed runs",
+                        len(runs),
+                    )
+                    self._multiplexer.Reload(runs)
+                if runs is None or runs:
+                    duration = time.time() - start
+                    stats = self._multiplexer.LastReloadStats()
+                    logger.info(
+                        "TensorBoard done reloading. Load took %0.3f secs "
+                        "(%d runs reloaded, %d unchanged runs skipped, "
+                        "%d runs not yet due)",
+                        duration,
+                        stats.num_reloaded,
+                        stats.num_skipped,
+                        stats.num_deferred,
+                    )
                 if self._reload_interval == 0:
                     # Only load the multiplexer once. Do not continuously reload.
                     break
-                time.sleep(self._reload_interval)
+                if watcher is None:
+                    time.sleep(self._reload_interval)
+                    continue
+                changed = watcher.Wait(
+                    max(
+                        0,
+                        last_full_reload
+                        + FULL_RELOAD_SECS_WHEN_WATCHING
+                        - time.time(),
+                    )
+                )
 
         if self._reload_task == "process":
             logger.info("Launching reload in a child process")
@@ -139,6 +205,25 @@ class LocalDataIngester(ingester.DataIngester):
         else:
             raise ValueError("unrecognized reload_task: %s" % self._reload_task)
 
+    def _runs_in_directories(self, directories):
+        """Returns names of the runs in the given directories, if known.
+
+        Returns:
+          A set of run names, or None if any of the directories is not the
+          directory of a known run (e.g., because it holds a new run).
+        """
+        path_to_run = {
+            os.path.normpath(path): name
+            for (name, path) in self._multiplexer.RunPaths().items()
+        }
+        runs = set()
+        for directory in directories:
+            name = path_to_run.get(directory)
+            if name is None:
+                return None
+            runs.add(name)
+        return runs
+
 
 def _get_event_file_active_filter(flags):
     """Returns a predicate for whether an event file load timestamp is active.
@@ -152,9 +237,47 @@ def _get_event_file_active_filter(flags):
     inactive_secs = flags.reload_multifile_inactive_secs
     if inactive_secs == 0:
         return None
+    # Use module-level functions rather than lambdas, so that the filter
+    # can be pickled for `--max_reload_processes`.
     if inactive_secs < 0:
-        return lambda timestamp: True
-    return lambda timestamp: timestamp + inactive_secs >= time.time()
+        return _always_active
+    return functools.partial(_is_recently_active, inactive_secs)
+
+
+def _always_active(timestamp):
+    return True
+
+
+def _is_recently_active(inactive_secs, timestamp):
+    return timestamp + inactive_secs >= time.time()
+
+
+def _get_ingest_cache(flags):
+    """Returns an `IngestCache` for `--ingest_cache_dir`, or None if unset."""
+    if not flags.ingest_cache_dir:
+        return None
+    return ingest_cache.IngestCache(flags.ingest_cache_dir)
+
+
+def _get_reload_scheduler(flags):
+    """Returns a `ReloadScheduler` for `--reload_backoff`, or None."""
+    if not flags.reload_backoff or flags.reload_interval == 0:
+        return None
+    inactive_secs = flags.reload_multifile_inactive_secs
+    return reload_scheduler.ReloadScheduler(
+        min_interval_secs=flags.reload_interval,
+        max_interval_secs=max(flags.reload_max_interval, flags.reload_interval),
+        inactive_secs=inactive_secs if inactive_secs > 0 else None,
+    )
+
+
+def _get_blob_store(flags):
+    """Returns a `BlobStore` for `--blob_spill_dir`, or None if unset."""
+    if not flags.blob_spill_dir:
+        return None
+    spill_dir = os.path.expanduser(flags.blob_spill_dir)
+    os.makedirs(spill_dir, exist_ok=True)
+    return blob_store.BlobStore(spill_dir)
 
 
 def _parse_event_files_spec(logdir_spec):
@@ -32,32 +32,58 @@ _TENSORFLOW_IO_MODULE = "tensorflow_io"
 class FakeFlags:
     def __init__(
         self,
+        blob_spill_dir="",
+        bytes_per_plugin=None,
         detect_file_replacement=None,
         generic_data="auto",
+        idle_run_ttl_secs=0,
+        ingest_cache_dir="",
+        load_on_demand=None,
         logdir="",
         logdir_spec="",
+        max_bytes_per_tag=0,
         max_reload_threads=1,
         path_prefix="",
         purge_orphaned_data=True,
+        max_reload_processes=0,
+        max_tensor_bytes=0,
+        reload_backoff=None,
+        reload_incremental=None,
         reload_interval=60,
+        reload_max_interval=300,
         reload_multifile=False,
         reload_multifile_inactive_secs=4000,
         reload_task="auto",
+        reload_watch=None,
         samples_per_plugin=None,
+        skip_data_crc=None,
         window_title="",
     ):
+        self.blob_spill_dir = blob_spill_dir
+        self.bytes_per_plugin = bytes_per_plugin or {}
         self.detect_file_replacement = detect_file_replacement
         self.generic_data = generic_data
+        self.idle_run_ttl_secs = idle_run_ttl_secs
+        self.ingest_cache_dir = ingest_cache_dir
+        self.load_on_demand = load_on_demand
         self.logdir = logdir
         self.logdir_spec = logdir_spec
+        self.max_bytes_per_tag = max_bytes_per_tag
         self.max_reload_threads = max_reload_threads
         self.path_prefix = path_prefix
         self.purge_orphaned_data = purge_orphaned_data
+        self.max_reload_processes = max_reload_processes
+        self.max_tensor_bytes = max_tensor_bytes
+        self.reload_backoff = reload_backoff
+        self.reload_incremental = reload_incremental
         self.reload_interval = reload_interval
+        self.reload_max_interval = reload_max_interval
         self.reload_multifile = reload_multifile
         self.reload_multifile_inactive_secs = reload_multifile_inactive_secs
         self.reload_task = reload_task
+        self.reload_watch = reload_watch
         self.samples_per_plugin = samples_per_plugin or {}
+        self.skip_data_crc = skip_data_crc
         self.window_title = window_title
 
 
@@ -413,5 +439,26 @@ class FileSystemSupportTest(tb_test.TestCase):
         mock_check_filesystem_support.assert_not_called()
 
 
+class RunsInDirectoriesTest(tb_test.TestCase):
+    def testMapsDirectoriesToRuns(self):
+        logdir = self.get_temp_dir()
+        ingester = data_ingester.LocalDataIngester(
+            flags=FakeFlags(logdir=logdir)
+        )
+        multiplexer = ingester.deprecated_multiplexer
+        multiplexer.AddRun(os.path.join(logdir, "a/"), "a")
+        multiplexer.AddRun(os.path.join(logdir, "b"), "b")
+        self.assertEqual(
+            ingester._runs_in_directories({os.path.join(logdir, "a")}), {"a"}
+        )
+        self.assertEqual(ingester._runs_in_directories(set()), set())
+        # Unknown directories may hold new runs, so need a full reload.
+        self.assertIsNone(
+            ingester._runs_in_directories(
+                {os.path.join(logdir, "b"), os.path.join(logdir, "c")}
+            )
+        )
+
+
 if __name__ == "__main__":
     tb_test.main()
@@ -17,8 +17,11 @@
 
 import base64
 import collections
+import hashlib
 import json
 import random
+import threading
+import uuid
 
 from tensorboard import errors
 from tensorboard.compat.proto import summary_pb2
@@ -30,7 +33,7 @@ logger = tb_logging.get_logger()
 
 
 class MultiplexerDataProvider(provider.DataProvider):
-    def __init__(self, multiplexer, logdir):
+    def __init__(self, multiplexer, logdir, response_cache_bytes=0):
         """Trivial initializer.
 
         Args:
@@ -38,9 +41,21 @@ class MultiplexerDataProvider(provider.DataProvider):
             not a boring old `event_multiplexer.EventMultiplexer`).
           logdir: The log directory from which data is being read. Only used
             cosmetically. Should be a `str`.
+          response_cache_bytes: Approximate maximum size of an LRU cache
+            of `read_*` results, which are reused until the data of the
+            runs involved changes (as reported by the multiplexer's data
+            generations). If `0`, nothing is cached.
         """
         self._multiplexer = multiplexer
         self._logdir = logdir
+        self._response_cache = (
+            _ResponseCache(response_cache_bytes)
+            if response_cache_bytes > 0
+            else None
+        )
+        # Distinguishes data generations of this provider from those of
+        # other instances, e.g., before a server restart.
+        self._instance_id = uuid.uuid4().hex[:8]
 
     def __str__(self):
         return "MultiplexerDataProvider(logdir=%r)" % self._logdir
@@ -133,10 +148,32 @@ class MultiplexerDataProvider(provider.DataProvider):
         self._validate_context(ctx)
         self._validate_experiment_id(experiment_id)
         self._validate_downsample(downsample)
-        index = self._index(
+        self._load_runs(
             plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
         )
-        return self._read(_convert_scalar_event, index, downsample)
+
+        def compute():
+            index = self._index(
+                plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
+            )
+            result = {}
+            for run, tags_for_run in index.items():
+                result_for_run = {}
+                result[run] = result_for_run
+                for tag, metadata in tags_for_run.items():
+                    series = self._multiplexer.Scalars(run, tag)
+                    indices = _downsample_indices(len(series.step), downsample)
+                    result_for_run[tag] = _scalar_data(series, indices)
+            return result
+
+        return self._cached(
+            "read_scalars",
+            experiment_id,
+            plugin_name,
+            downsample,
+            run_tag_filter,
+            compute,
+        )
 
     def read_last_scalars(
         self,
@@ -154,10 +191,14 @@ class MultiplexerDataProvider(provider.DataProvider):
         run_tag_to_last_scalar_datum = collections.defaultdict(dict)
         for run, tags_for_run in index.items():
             for tag, metadata in tags_for_run.items():
-                events = self._multiplexer.Tensors(run, tag)
-                if events:
+                last = self._multiplexer.TimeSeriesStats(run, tag).last
+                if last is not None:
                     run_tag_to_last_scalar_datum[run][tag] = (
-                        _convert_scalar_event(events[-1])
+                        provider.ScalarDatum(
+                            step=last.step,
+                            wall_time=last.wall_time,
+                            value=last.value,
+                        )
                     )
 
         return run_tag_to_last_scalar_datum
@@ -184,10 +225,105 @@ class MultiplexerDataProvider(provider.DataProvider):
         self._validate_context(ctx)
         self._validate_experiment_id(experiment_id)
         self._validate_downsample(downsample)
-        index = self._index(
+        self._load_runs(
             plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_TENSOR
         )
-        return self._read(_convert_tensor_event, index, downsample)
+
+        def compute():
+            index = self._index(
+                plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_TENSOR
+            )
+            return self._read(_convert_tensor_event, index, downsample)
+
+        return self._cached(
+            "read_tensors",
+            experiment_id,
+            plugin_name,
+            downsample,
+            run_tag_filter,
+            compute,
+        )
+
+    def data_generation(self, ctx=None, *, experiment_id, run_tag_filter=None):
+        self._validate_context(ctx)
+        self._validate_experiment_id(experiment_id)
+        generations = self._run_generations(run_tag_filter)
+        digest = hashlib.sha256(repr(generations).encode("utf-8"))
+        return "%s-%s" % (self._instance_id, digest.hexdigest()[:16])
+
+    def _run_generations(self, run_tag_filter):
+        """Returns a hashable token for the data generations of some runs.
+
+        The token changes whenever the data of any run admitted by
+        `run_tag_filter` may have changed, including when such a run is
+        added or removed.
+        """
+        runs = run_tag_filter.runs if run_tag_filter is not None else None
+        if runs is None:
+            return self._multiplexer.Generation()
+        run_generations = self._multiplexer.RunGenerations()
+        return tuple(sorted((run, run_generations.get(run)) for run in runs))
+
+    def _cached(
+        self,
+        method,
+        experiment_id,
+        plugin_name,
+        downsample,
+        run_tag_filter,
+        compute,
+    ):
+        """Returns `compute()`, reusing an earlier result if still current.
+
+        Args:
+          method: Name of the calling `read_*` method.
+          experiment_id, plugin_name, downsample, run_tag_filter: The
+            arguments to the `read_*` method, which together with `method`
+            determine the result for a given state of the data.
+          compute: Thunk returning a nested dict `d[run][tag]` of lists.
+
+        Returns:
+          The nested dict. It and its lists are copies, so callers may
+          modify them without affecting the cache.
+        """
+        if self._response_cache is None:
+            return compute()
+        # Read generations before the data, so that data that changes
+        # concurrently is never cached under the newer generation.
+        key = (
+            method,
+            experiment_id,
+            plugin_name,
+            downsample,
+            run_tag_filter.runs if run_tag_filter is not None else None,
+            run_tag_filter.tags if run_tag_filter is not None else None,
+            self._run_generations(run_tag_filter),
+        )
+        result = self._response_cache.get(key)
+        if result is None:
+            result = compute()
+            size = sum(
+                _datum_size(datum)
+                for tag_to_data in result.values()
+                for data in tag_to_data.values()
+                for datum in data
+            )
+            self._response_cache.put(key, result, size)
+        return {
+            run: {tag: list(data) for (tag, data) in tag_to_data.items()}
+            for (run, tag_to_data) in result.items()
+        }
+
+    def _load_runs(self, plugin_name, run_tag_filter, data_class_filter):
+        """Notes reads of runs with matching time series; see `LoadRuns`.
+
+        This must happen before the response cache is consulted, since
+        loading a run changes its data generation.
+        """
+        if not self._multiplexer.tracks_reads:
+            return
+        index = self._index(plugin_name, run_tag_filter, data_class_filter)
+        self._multiplexer.LoadRuns(index)
 
     def _index(self, plugin_name, run_tag_filter, data_class_filter):
         """List time series and metadata matching the given filters.
@@ -241,6 +377,9 @@ class MultiplexerDataProvider(provider.DataProvider):
     def _list(self, construct_time_series, index):
         """Helper to list scalar or tensor time series.
 
+        This uses the statistics maintained by the accumulators, so it
+        takes constant time per time series.
+
         Args:
           construct_time_series: `ScalarTimeSeries` or `TensorTimeSeries`.
           index: The result of `self._index(...)`.
@@ -254,17 +393,10 @@ class MultiplexerDataProvider(provider.DataProvider):
             result_for_run = {}
             result[run] = result_for_run
             for tag, summary_metadata in tag_to_metadata.items():
-                max_step = None
-                max_wall_time = None
-                for event in self._multiplexer.Tensors(run, tag):
-                    if max_step is None or max_step < event.step:
-                        max_step = event.step
-                    if max_wall_time is None or max_wall_time < event.wall_time:
-                        max_wall_time = event.wall_time
-                summary_metadata = self._multiplexer.SummaryMetadata(run, tag)
+                stats = self._multiplexer.TimeSeriesStats(run, tag)
                 result_for_run[tag] = construct_time_series(
-                    max_step=max_step,
-                    max_wall_time=max_wall_time,
+                    max_step=stats.max_step,
+                    max_wall_time=stats.max_wall_time,
                     plugin_content=summary_metadata.plugin_data.content,
                     description=summary_metadata.summary_description,
                     display_name=summary_metadata.display_name,
@@ -276,14 +408,14 @@ class MultiplexerDataProvider(provider.DataProvider):
 
         Args:
           convert_event: Takes `plugin_event_accumulator.TensorEvent` to
-            either `provider.ScalarDatum` or `provider.TensorDatum`.
+            `provider.TensorDatum`.
           index: The result of `self._index(...)`.
           downsample: Non-negative `int`; how many samples to return per
             time series.
 
         Returns:
           A dict of dicts of values returned by `convert_event` calls,
-          suitable to be returned from `read_scalars` or `read_tensors`.
+          suitable to be returned from `read_tensors`.
         """
         result = {}
         for run, tags_for_run in index.items():
@@ -341,25 +473,43 @@ class MultiplexerDataProvider(provider.DataProvider):
         self._validate_context(ctx)
         self._validate_experiment_id(experiment_id)
         self._validate_downsample(downsample)
-        index = self._index(
+        self._load_runs(
             plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_BLOB_SEQUENCE
         )
-        result = {}
-        for run, tags in index.items():
-            result_for_run = {}
-            result[run] = result_for_run
-            for tag in tags:
-                events = self._multiplexer.Tensors(run, tag)
-                data_by_step = {}
-                for event in events:
-                    if event.step in data_by_step:
-                        continue
-                    data_by_step[event.step] = _convert_blob_sequence_event(
-                        experiment_id, plugin_name, run, tag, event
-                    )
-                data = [datum for (step, datum) in sorted(data_by_step.items())]
-                result_for_run[tag] = _downsample(data, downsample)
-        return result
+
+        def compute():
+            index = self._index(
+                plugin_name,
+                run_tag_filter,
+                summary_pb2.DATA_CLASS_BLOB_SEQUENCE,
+            )
+            result = {}
+            for run, tags in index.items():
+                result_for_run = {}
+                result[run] = result_for_run
+                for tag in tags:
+                    events = self._multiplexer.Tensors(run, tag)
+                    data_by_step = {}
+                    for event in events:
+                        if event.step in data_by_step:
+                            continue
+                        data_by_step[event.step] = _convert_blob_sequence_event(
+                            experiment_id, plugin_name, run, tag, event
+                        )
+                    data = [
+                        datum for (step, datum) in sorted(data_by_step.items())
+                    ]
+                    result_for_run[tag] = _downsample(data, downsample)
+            return result
+
+        return self._cached(
+            "read_blob_sequences",
+            experiment_id,
+            plugin_name,
+            downsample,
+            run_tag_filter,
+            compute,
+        )
 
     def read_blob(self, ctx=None, *, blob_key):
         self._validate_context(ctx)
@@ -375,15 +525,55 @@ class MultiplexerDataProvider(provider.DataProvider):
         summary_metadata = self._multiplexer.SummaryMetadata(run, tag)
         if summary_metadata.data_class != summary_pb2.DATA_CLASS_BLOB_SEQUENCE:
             raise errors.NotFoundError(blob_key)
+        self._multiplexer.LoadRuns([run])
         tensor_events = self._multiplexer.Tensors(run, tag)
         # In case of multiple events at this step, take first (arbitrary).
         matching_step = next((e for e in tensor_events if e.step == step), None)
         if not matching_step:
             raise errors.NotFoundError("%s: no such step %r" % (blob_key, step))
+        if matching_step.blob_ref is not None:
+            return matching_step.blob_ref.Read(index)
         tensor = tensor_util.make_ndarray(matching_step.tensor_proto)
         return tensor[index]
 
 
+class _ResponseCache:
+    """A thread-safe LRU cache bounded by the total size of its values."""
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._size = 0
+        # Maps key to `(value, size)`, least recently used first.
+        self._entries = collections.OrderedDict()
+        self._mutex = threading.Lock()
+
+    def get(self, key):
+        """Returns the value for `key`, or `None` if it is not cached."""
+        with self._mutex:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Caches `value`, evicting least recently used values as needed.
+
+        Values larger than the whole cache are not cached.
+        """
+        if size > self._max_size:
+            return
+        with self._mutex:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self._max_size:
+                (_, (_, evicted_size)) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+
 # TODO(davidsoergel): deduplicate with other implementations
 def _encode_blob_key(experiment_id, plugin_name, run, tag, step, index):
     """Generate a blob key: a short, URL-safe string identifying a blob.
@@ -444,13 +634,33 @@ def _decode_blob_key(key):
     return (experiment_id, plugin_name, run, tag, step, index)
 
 
-def _convert_scalar_event(event):
-    """Helper for `read_scalars`."""
-    return provider.ScalarDatum(
-        step=event.step,
-        wall_time=event.wall_time,
-        value=tensor_util.make_ndarray(event.tensor_proto).item(),
-    )
+def _scalar_data(series, indices):
+    """Helper for `read_scalars` and `read_last_scalars`.
+
+    Args:
+      series: A `plugin_event_accumulator.ScalarSeries`.
+      indices: A sorted list of indices of points to include.
+
+    Returns:
+      A list of `provider.ScalarDatum`s, one per index.
+    """
+    steps = series.step[indices].tolist()
+    wall_times = series.wall_time[indices].tolist()
+    values = series.value[indices].tolist()
+    return [
+        provider.ScalarDatum(step=step, wall_time=wall_time, value=value)
+        for (step, wall_time, value) in zip(steps, wall_times, values)
+    ]
+
+
+def _datum_size(datum):
+    """Estimates the memory used by a datum returned from a `read_*` call."""
+    # Rough size of the datum object and its fields; the values of blob
+    # sequences are short blob keys.
+    size = 200
+    if isinstance(datum, provider.TensorDatum):
+        size += datum.numpy.nbytes
+    return size
 
 
 def _convert_tensor_event(event):
@@ -528,11 +738,24 @@ def _downsample(xs, k):
       element of `xs`, uniformly selected among such subsequences.
     """
 
-    if k > len(xs):
-        return list(xs)
+    return [xs[i] for i in _downsample_indices(len(xs), k)]
+
+
+def _downsample_indices(n, k):
+    """Selects the indices that `_downsample` keeps from a length-`n` list.
+
+    Args:
+      n: A non-negative integer; the length of the sequence.
+      k: A non-negative integer.
+
+    Returns:
+      A sorted list of `min(k, n)` indices into `range(n)`.
+    """
+    if k > n:
+        return list(range(n))
     if k == 0:
         return []
-    indices = random.Random(0).sample(range(len(xs) - 1), k - 1)
+    indices = random.Random(0).sample(range(n - 1), k - 1)
     indices.sort()
-    indices += [len(xs) - 1]
-    return [xs[i] for i in indices]
+    indices += [n - 1]
+    return indices
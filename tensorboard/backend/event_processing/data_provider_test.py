@@ -16,14 +16,17 @@
 
 
 import os
+from unittest import mock
 
 import numpy as np
 
 from tensorboard import context
+from tensorboard.backend.event_processing import blob_store
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
+from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import summary_pb2
 from tensorboard.data import provider as base_provider
 from tensorboard.plugins.graph import metadata as graph_metadata
@@ -33,6 +36,7 @@ from tensorboard.plugins.scalar import metadata as scalar_metadata
 from tensorboard.plugins.scalar import summary_v2 as scalar_summary
 from tensorboard.plugins.image import metadata as image_metadata
 from tensorboard.plugins.image import summary_v2 as image_summary
+from tensorboard.summary.writer import event_file_writer
 from tensorboard.util import tensor_util
 import tensorflow.compat.v1 as tf1
 import tensorflow.compat.v2 as tf
@@ -315,18 +319,75 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
     def test_read_scalars_but_not_rank_0(self):
         provider = self.create_provider()
         run_tag_filter = base_provider.RunTagFilter(["waves"], ["bad"])
-        # No explicit checks yet.
-        with self.assertRaisesRegex(
-            ValueError,
-            "can only convert an array of size 1 to a Python scalar",
-        ):
-            provider.read_scalars(
-                self.ctx,
-                experiment_id="unused",
-                plugin_name="greetings",
-                run_tag_filter=run_tag_filter,
-                downsample=100,
+        # Non-scalar points are dropped (with a warning) at load time.
+        result = provider.read_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name="greetings",
+            run_tag_filter=run_tag_filter,
+            downsample=100,
+        )
+        self.assertEqual(result, {"waves": {"bad": []}})
+
+    def test_read_scalars_with_late_summary_metadata(self):
+        # A scalar time series whose first value has no summary metadata
+        # is held as tensors; it is still readable as scalars.
+        logdir = os.path.join(self.logdir, "latecomer")
+        writer = event_file_writer.EventFileWriter(logdir)
+
+        def write(step, metadata=None):
+            value = summary_pb2.Summary.Value(
+                tag="loss",
+                tensor=tensor_util.make_tensor_proto(np.float32(step / 2)),
+            )
+            if metadata is not None:
+                value.metadata.CopyFrom(metadata)
+            writer.add_event(
+                event_pb2.Event(
+                    wall_time=1000.0 + step,
+                    step=step,
+                    summary=summary_pb2.Summary(value=[value]),
+                )
             )
+            writer.flush()
+
+        multiplexer = event_multiplexer.EventMultiplexer()
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        write(0)
+        multiplexer.Reload()
+        metadata = scalar_metadata.create_summary_metadata("", "")
+        metadata.data_class = summary_pb2.DATA_CLASS_SCALAR
+        write(1, metadata)
+        write(2)
+        multiplexer.Reload()
+        writer.close()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+        run_tag_filter = base_provider.RunTagFilter(["latecomer"], ["loss"])
+
+        result = provider.read_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            run_tag_filter=run_tag_filter,
+            downsample=100,
+        )
+        data = result["latecomer"]["loss"]
+        self.assertEqual([d.step for d in data], [0, 1, 2])
+        self.assertEqual([d.wall_time for d in data], [1000.0, 1001.0, 1002.0])
+        self.assertEqual([d.value for d in data], [0.0, 0.5, 1.0])
+
+        result = provider.read_last_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            run_tag_filter=run_tag_filter,
+        )
+        self.assertEqual(
+            result["latecomer"]["loss"],
+            base_provider.ScalarDatum(step=2, wall_time=1002.0, value=1.0),
+        )
 
     def test_read_last_scalars(self):
         multiplexer = self.create_multiplexer()
@@ -538,6 +599,140 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
                 base_provider.BlobSequenceDatum,
             )
 
+    def test_read_blob_from_blob_store(self):
+        store = blob_store.BlobStore(self.get_temp_dir())
+        self.addCleanup(store.Close)
+        multiplexer = event_multiplexer.EventMultiplexer(blob_store=store)
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        spilled_provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+        provider = self.create_provider()
+        events = multiplexer.Tensors("mondrian", "blue")
+        self.assertIsNotNone(events[-1].blob_ref)
+        self.assertEmpty(events[-1].tensor_proto.string_val)
+        self.assertGreater(store.num_bytes, 0)
+
+        def read_all(provider):
+            result = provider.read_blob_sequences(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=image_metadata.PLUGIN_NAME,
+                downsample=100,
+            )
+            return {
+                (run, tag, datum.step): [
+                    provider.read_blob(self.ctx, blob_key=v.blob_key)
+                    for v in datum.values
+                ]
+                for (run, tag_to_data) in result.items()
+                for (tag, data) in tag_to_data.items()
+                for datum in data
+            }
+
+        self.assertEqual(read_all(spilled_provider), read_all(provider))
+
+    def test_load_on_demand(self):
+        multiplexer = event_multiplexer.EventMultiplexer(load_on_demand=True)
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        lazy_provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir, response_cache_bytes=10**6
+        )
+        provider = self.create_provider()
+
+        def list_scalars(provider):
+            return provider.list_scalars(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=scalar_metadata.PLUGIN_NAME,
+            )
+
+        def read_scalars(provider, runs):
+            return provider.read_scalars(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=scalar_metadata.PLUGIN_NAME,
+                downsample=100,
+                run_tag_filter=base_provider.RunTagFilter(runs=runs),
+            )
+
+        # Tags are listed without loading any run.
+        self.assertEqual(list_scalars(lazy_provider), list_scalars(provider))
+        self.assertTrue(multiplexer.GetAccumulator("polynomials").index_only)
+        self.assertEqual(
+            read_scalars(lazy_provider, ["polynomials"]),
+            read_scalars(provider, ["polynomials"]),
+        )
+        self.assertFalse(multiplexer.GetAccumulator("polynomials").index_only)
+        self.assertTrue(multiplexer.GetAccumulator("waves").index_only)
+
+    def test_response_cache(self):
+        multiplexer = self.create_multiplexer()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir, response_cache_bytes=10**6
+        )
+
+        def read(runs=None):
+            return provider.read_scalars(
+                self.ctx,
+                experiment_id="unused",
+                plugin_name=scalar_metadata.PLUGIN_NAME,
+                downsample=100,
+                run_tag_filter=base_provider.RunTagFilter(runs=runs),
+            )
+
+        first = read(["polynomials"])
+        with mock.patch.object(
+            multiplexer, "Scalars", side_effect=AssertionError("not cached")
+        ):
+            second = read(["polynomials"])
+        self.assertEqual(first, second)
+        # But results may be freely modified by callers.
+        second["polynomials"]["square"].clear()
+        del second["polynomials"]["cube"]
+        self.assertEqual(read(["polynomials"]), first)
+
+        with tf.summary.create_file_writer(
+            os.path.join(self.logdir, "polynomials"), filename_suffix=".2"
+        ).as_default():
+            scalar_summary.scalar("square", 400, step=40)
+        multiplexer.Reload()
+        third = read(["polynomials"])
+        self.assertLen(third["polynomials"]["square"], 11)
+        self.assertLen(read()["polynomials"]["square"], 11)
+
+    def test_data_generation(self):
+        multiplexer = self.create_multiplexer()
+        provider = data_provider.MultiplexerDataProvider(
+            multiplexer, self.logdir
+        )
+
+        def generation(runs=None):
+            return provider.data_generation(
+                self.ctx,
+                experiment_id="unused",
+                run_tag_filter=base_provider.RunTagFilter(runs=runs),
+            )
+
+        polynomials = generation(["polynomials"])
+        waves = generation(["waves"])
+        everything = generation()
+        self.assertNotEqual(polynomials, waves)
+        multiplexer.Reload()
+        self.assertEqual(generation(["polynomials"]), polynomials)
+        self.assertEqual(generation(), everything)
+
+        with tf.summary.create_file_writer(
+            os.path.join(self.logdir, "polynomials"), filename_suffix=".2"
+        ).as_default():
+            scalar_summary.scalar("square", 400, step=40)
+        multiplexer.Reload()
+        self.assertNotEqual(generation(["polynomials"]), polynomials)
+        self.assertEqual(generation(["waves"]), waves)
+        self.assertNotEqual(generation(), everything)
+
 
 class DownsampleTest(tf.test.TestCase):
     """Tests for the `_downsample` private helper function."""
@@ -101,6 +101,59 @@ class DirectoryLoader:
             else:
                 logger.info("Ignoring error during file loading: %s" % e)
 
+    def SaveState(self):
+        """Returns the position of every file loader, for `RestoreState`.
+
+        Returns:
+          A picklable dict, or None if the state could not be captured.
+        """
+        loaders = {}
+        for path, loader in self._loaders.items():
+            loaders[path] = loader.SaveState()
+            if loaders[path] is None:
+                return None
+        return {
+            "loaders": loaders,
+            "max_timestamps": {
+                path: timestamp
+                for (path, timestamp) in self._max_timestamps.items()
+                if timestamp is not _INACTIVE
+            },
+            "inactive_paths": [
+                path
+                for (path, timestamp) in self._max_timestamps.items()
+                if timestamp is _INACTIVE
+            ],
+        }
+
+    def RestoreState(self, state):
+        """Resumes loading from positions saved by `SaveState`.
+
+        This must be called before the first `Load`.
+
+        Args:
+          state: A dict returned by `SaveState` on a loader for this
+            directory.
+
+        Returns:
+          True if every file loader now resumes where it left off; False if
+          any could not be resumed, in which case this loader is unchanged.
+        """
+        loaders = {}
+        for path, loader_state in state["loaders"].items():
+            try:
+                loader = self._loader_factory(path)
+            except tf.errors.NotFoundError:
+                return False
+            if not loader.RestoreState(loader_state):
+                return False
+            loaders[path] = loader
+        self._loaders = loaders
+        self._max_timestamps = dict(state["max_timestamps"])
+        for path in state["inactive_paths"]:
+            self._max_timestamps[path] = _INACTIVE
+        return True
+
     def _LoadPath(self, path):
         """Generator for values from a single path's loader.
 
@@ -152,6 +152,51 @@ class DirectoryWatcher:
             # Advance to the next path and start over.
             self._SetPath(next_path)
 
+    def SaveState(self):
+        """Returns the position of this watcher, for `RestoreState`.
+
+        Returns:
+          A picklable dict, or None if the state could not be captured.
+        """
+        loader_state = None
+        if self._loader is not None:
+            loader_state = self._loader.SaveState()
+            if loader_state is None:
+                return None
+        return {
+            "path": self._path,
+            "loader": loader_state,
+            "finalized_sizes": dict(self._finalized_sizes),
+            "ooo_writes_detected": self._ooo_writes_detected,
+        }
+
+    def RestoreState(self, state):
+        """Resumes watching from a position saved by `SaveState`.
+
+        This must be called before the first `Load`.
+
+        Args:
+          state: A dict returned by `SaveState` on a watcher for this
+            directory.
+
+        Returns:
+          True if the watcher now resumes where the saved watcher left
+          off; False if the current path could not be resumed, in which
+          case the watcher is unchanged.
+        """
+        if state["path"] is not None:
+            try:
+                loader = self._loader_factory(state["path"])
+            except tf.errors.NotFoundError:
+                return False
+            if not loader.RestoreState(state["loader"]):
+                return False
+            self._path = state["path"]
+            self._loader = loader
+        self._finalized_sizes = dict(state["finalized_sizes"])
+        self._ooo_writes_detected = state["ooo_writes_detected"]
+        return True
+
     # The number of paths before the current one to check for out of order writes.
     _OOO_WRITE_CHECK_COUNT = 20
 
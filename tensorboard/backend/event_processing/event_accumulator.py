@@ -600,7 +600,7 @@ class EventAccumulator:
         Returns:
           An array of `ScalarEvent`s.
         """
-        return self.scalars.Items(tag)
+        return list(self.scalars.Items(tag))
 
     def Graph(self):
         """Return the graph definition, if there is one.
@@ -666,7 +666,7 @@ class EventAccumulator:
         Returns:
           An array of `HistogramEvent`s.
         """
-        return self.histograms.Items(tag)
+        return list(self.histograms.Items(tag))
 
     def CompressedHistograms(self, tag):
         """Given a summary tag, return all associated compressed histograms.
@@ -680,7 +680,7 @@ class EventAccumulator:
         Returns:
           An array of `CompressedHistogramEvent`s.
         """
-        return self.compressed_histograms.Items(tag)
+        return list(self.compressed_histograms.Items(tag))
 
     def Images(self, tag):
         """Given a summary tag, return all associated images.
@@ -694,7 +694,7 @@ class EventAccumulator:
         Returns:
           An array of `ImageEvent`s.
         """
-        return self.images.Items(tag)
+        return list(self.images.Items(tag))
 
     def Audio(self, tag):
         """Given a summary tag, return all associated audio.
@@ -708,7 +708,7 @@ class EventAccumulator:
         Returns:
           An array of `AudioEvent`s.
         """
-        return self.audios.Items(tag)
+        return list(self.audios.Items(tag))
 
     def Tensors(self, tag):
         """Given a summary tag, return all associated tensors.
@@ -722,7 +722,7 @@ class EventAccumulator:
         Returns:
           An array of `TensorEvent`s.
         """
-        return self.tensors.Items(tag)
+        return list(self.tensors.Items(tag))
 
     def _MaybePurgeOrphanedData(self, event):
         """Maybe purge orphaned data due to a TensorFlow crash.
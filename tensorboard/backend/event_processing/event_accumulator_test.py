@@ -285,6 +285,18 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
         self.assertEqual(acc.Scalars("s1"), [s1])
         self.assertEqual(acc.Scalars("s2"), [s2])
 
+    def testReturnedEventsAreCopies(self):
+        """Tests that mutating returned events does not affect later reads."""
+        gen = _EventGenerator(self)
+        acc = ea.EventAccumulator(gen)
+        gen.AddScalar("s1", wall_time=1, step=10, value=32)
+        acc.Reload()
+        acc.Scalars("s1").clear()
+        self.assertEqual(
+            acc.Scalars("s1"),
+            [ea.ScalarEvent(wall_time=1, step=10, value=32)],
+        )
+
     def testHistograms(self):
         """Tests whether histograms are inserted into EventAccumulator."""
         gen = _EventGenerator(self)
@@ -16,11 +16,17 @@
 """Functionality for loading events from a record file."""
 
 import contextlib
+import functools
+import mmap
+import os
+import struct
 
 from tensorboard import data_compat
 from tensorboard import dataclass_compat
 from tensorboard.compat import tf
 from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
 from tensorboard.util import platform_util
 from tensorboard.util import tb_logging
 
@@ -49,15 +55,39 @@ def _silence_deprecation_warnings():
         return _NULLCONTEXT
 
 
-def _make_tf_record_iterator(file_path):
-    """Returns an iterator over TF records for the given tfrecord file."""
-    # If we don't have TF at all, use the stub implementation.
+# Bytes of framing around each record payload: an 8-byte length, and
+# 4-byte masked CRCs of the length and of the payload.
+_RECORD_OVERHEAD = 16
+_RECORD_HEADER_SIZE = 12
+
+
+def _make_tf_record_iterator(file_path, start_offset=0, verify_data_crc=True):
+    """Returns an iterator over TF records for the given tfrecord file.
+
+    Args:
+      file_path: file path of the tfrecord file to read
+      start_offset: byte offset of the first record to read; must be the
+        offset of a record boundary.
+      verify_data_crc: if False, the CRC of record payloads is not checked.
+        TensorFlow's readers always check it, so local files are then read
+        without TensorFlow even if it is installed.
+    """
+    # If we don't have TF at all, or need to skip data CRCs, which TF's
+    # readers cannot do, read local files through a memory map.
+    is_local = "://" not in file_path
+    if is_local and (tf.__version__ == "stub" or not verify_data_crc):
+        logger.debug("Opening an mmap record reader pointing at %s", file_path)
+        return _MmapRecordIterator(file_path, start_offset, verify_data_crc)
     if tf.__version__ == "stub":
         # TODO(#1711): Reshape stub implementation to fit tf_record_iterator API
         # rather than needlessly emulating the old PyRecordReader_New API.
         logger.debug("Opening a stub record reader pointing at %s", file_path)
+        py_record_reader_new = functools.partial(
+            tf.pywrap_tensorflow.PyRecordReader_New,
+            verify_data_crc=verify_data_crc,
+        )
         return _PyRecordReaderIterator(
-            tf.pywrap_tensorflow.PyRecordReader_New, file_path
+            py_record_reader_new, file_path, start_offset
         )
     # If PyRecordReader exists, use it, otherwise use tf_record_iterator().
     # Check old first, then new, since tf_record_iterator existed previously but
@@ -74,27 +104,36 @@ def _make_tf_record_iterator(file_path):
         py_record_reader_new = None
     if py_record_reader_new:
         logger.debug("Opening a PyRecordReader pointing at %s", file_path)
-        return _PyRecordReaderIterator(py_record_reader_new, file_path)
+        return _PyRecordReaderIterator(
+            py_record_reader_new, file_path, start_offset
+        )
     else:
         logger.debug("Opening a tf_record_iterator pointing at %s", file_path)
         # TODO(#1711): Find non-deprecated replacement for tf_record_iterator.
         with _silence_deprecation_warnings():
-            return tf.compat.v1.io.tf_record_iterator(file_path)
+            iterator = tf.compat.v1.io.tf_record_iterator(file_path)
+        if start_offset:
+            return _SkippingRecordIterator(iterator, start_offset)
+        return iterator
 
 
 class _PyRecordReaderIterator:
     """Python iterator for TF Records based on PyRecordReader."""
 
-    def __init__(self, py_record_reader_new, file_path):
+    def __init__(self, py_record_reader_new, file_path, start_offset=0):
         """Constructs a _PyRecordReaderIterator for the given file path.
 
         Args:
           py_record_reader_new: pywrap_tensorflow.PyRecordReader_New
           file_path: file path of the tfrecord file to read
+          start_offset: byte offset of the first record to read
         """
         with tf.compat.v1.errors.raise_exception_on_not_ok_status() as status:
             self._reader = py_record_reader_new(
-                tf.compat.as_bytes(file_path), 0, tf.compat.as_bytes(""), status
+                tf.compat.as_bytes(file_path),
+                start_offset,
+                tf.compat.as_bytes(""),
+                status,
             )
         if not self._reader:
             raise IOError(
@@ -114,10 +153,158 @@ class _PyRecordReaderIterator:
     next = __next__  # for python2 compatibility
 
 
+class _MmapRecordIterator:
+    """Python iterator for TF Records in a local file, read via `mmap`.
+
+    Records are returned as `memoryview` slices of the mapping, so that
+    payloads can be parsed without first being copied into `bytes`. When
+    reading reaches the end of the mapping and the file has since grown,
+    the file is mapped again.
+
+    Like `PyRecordReader`, a truncated record raises `DataLossError` and
+    is read again from its start on the next call, once it is complete.
+    """
+
+    def __init__(self, file_path, start_offset=0, verify_data_crc=True):
+        """Constructs an iterator for the given file path.
+
+        Args:
+          file_path: path of the local tfrecord file to read
+          start_offset: byte offset of the first record to read
+          verify_data_crc: if False, skip checking the CRC of each record
+            payload; the length header is always checked.
+
+        Raises:
+          tf.errors.NotFoundError: if the file does not exist.
+        """
+        self._file_path = file_path
+        self._offset = start_offset
+        self._verify_data_crc = verify_data_crc
+        self._view = None
+        self._size = 0
+        self._map()
+
+    def _map(self):
+        """Maps the current contents of the file, replacing any mapping."""
+        # Any earlier mapping is unmapped only once all slices of it that
+        # have been returned are released.
+        self._view = None
+        self._size = 0
+        try:
+            with open(self._file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._view = memoryview(mapping)
+                    self._size = size
+        except FileNotFoundError:
+            raise tf.errors.NotFoundError(
+                None, None, "{} does not exist".format(self._file_path)
+            )
+
+    def _available(self, n):
+        """Returns the bytes mapped past the offset, remapping if fewer than n."""
+        available = self._size - self._offset
+        if available < n:
+            try:
+                grown = os.stat(self._file_path).st_size > self._size
+            except FileNotFoundError:
+                grown = False
+            if grown or self._view is None:
+                self._map()
+                available = self._size - self._offset
+        return available
+
+    def _data_loss(self, what):
+        return tf.errors.DataLossError(
+            None,
+            None,
+            "{} in {} at offset {}".format(what, self._file_path, self._offset),
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        offset = self._offset
+        available = self._available(_RECORD_HEADER_SIZE)
+        if available <= 0:
+            raise StopIteration
+        if available < _RECORD_HEADER_SIZE:
+            raise self._data_loss("Truncated record header")
+        view = self._view
+        (length, header_crc) = struct.unpack_from("<QI", view, offset)
+        header = view[offset : offset + 8]
+        if pywrap_tensorflow.masked_crc32c(header) != header_crc:
+            raise self._data_loss("Corrupted record header")
+        record_size = length + _RECORD_OVERHEAD
+        if self._available(record_size) < record_size:
+            raise self._data_loss("Truncated record")
+        # The file may have been remapped.
+        view = self._view
+        data_start = offset + _RECORD_HEADER_SIZE
+        data_end = data_start + length
+        data = view[data_start:data_end]
+        if self._verify_data_crc:
+            (data_crc,) = struct.unpack_from("<I", view, data_end)
+            if pywrap_tensorflow.masked_crc32c(data) != data_crc:
+                raise self._data_loss("Corrupted record")
+        self._offset = offset + record_size
+        return data
+
+    def close(self):
+        self._view = None
+        self._size = 0
+
+    def reopen(self):
+        # The file is mapped again, from its current path, when next read.
+        pass
+
+
+class _SkippingRecordIterator:
+    """Wraps a record iterator that cannot seek, to start at an offset.
+
+    Records before the offset are still read by the wrapped iterator, but
+    are discarded without being parsed.
+    """
+
+    def __init__(self, iterator, start_offset):
+        self._iterator = iterator
+        self._bytes_to_skip = start_offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self._bytes_to_skip > 0:
+            record = next(self._iterator)
+            self._bytes_to_skip -= len(record) + _RECORD_OVERHEAD
+        return next(self._iterator)
+
+    def __getattr__(self, name):
+        # Delegate `close`, `reopen`, etc. to the wrapped iterator.
+        return getattr(self._iterator, name)
+
+
+def _stat_fingerprint(file_path):
+    """Returns a `(length, mtime_nsec)` pair for a file, or None on error.
+
+    The modification time is None if the filesystem does not report it.
+    """
+    try:
+        stat = tf.io.gfile.stat(file_path)
+    except tf.errors.OpError as e:
+        logger.error("Failed to stat %s: %s", file_path, e)
+        return None
+    return (stat.length, getattr(stat, "mtime_nsec", None))
+
+
 class RawEventFileLoader:
     """An iterator that yields Event protos as serialized bytestrings."""
 
-    def __init__(self, file_path, detect_file_replacement=False):
+    def __init__(
+        self, file_path, detect_file_replacement=False, verify_data_crc=True
+    ):
         """Constructs a RawEventFileLoader for the given file path.
 
         Args:
@@ -127,13 +314,21 @@ class RawEventFileLoader:
               that the file has grown, it will reopen the file entirely (while
               preserving the current offset) before attempting to read from it.
               Otherwise, Load() will simply poll at EOF for new data.
+          verify_data_crc: if False, skip checking the CRC of each record's
+              payload where the reader allows it (when reading without
+              TensorFlow). Only appropriate for trusted logdirs.
         """
         if file_path is None:
             raise ValueError("A file path is required")
         self._file_path = platform_util.readahead_file_path(file_path)
         self._detect_file_replacement = detect_file_replacement
+        self._verify_data_crc = verify_data_crc
         self._file_size = None
-        self._iterator = _make_tf_record_iterator(self._file_path)
+        # Byte offset just past the last record yielded.
+        self._offset = 0
+        self._iterator = _make_tf_record_iterator(
+            self._file_path, verify_data_crc=verify_data_crc
+        )
         if self._detect_file_replacement and not hasattr(
             self._iterator, "reopen"
         ):
@@ -153,6 +348,17 @@ class RawEventFileLoader:
         Yields:
           All event proto bytestrings in the file that have not been yielded yet.
         """
+        for record in self._LoadRecords():
+            # Records may be views of a memory-mapped file; this copies
+            # them only in that case.
+            yield bytes(record)
+
+    def _LoadRecords(self):
+        """Like `Load`, but may yield `memoryview`s rather than bytes.
+
+        The views may share memory with a mapping of the file, so callers
+        should not hold on to them.
+        """
         logger.debug("Loading events from %s", self._file_path)
         if self._detect_file_replacement:
             has_increased = self.CheckForIncreasedFileSize()
@@ -175,7 +381,7 @@ class RawEventFileLoader:
                     return
         while True:
             try:
-                yield next(self._iterator)
+                record = next(self._iterator)
             except StopIteration:
                 logger.debug("End of file in %s", self._file_path)
                 break
@@ -185,8 +391,55 @@ class RawEventFileLoader:
                 # the same point in the file since the iterator holds the offset.
                 logger.debug("Truncated record in %s (%s)", self._file_path, e)
                 break
+            self._offset += len(record) + _RECORD_OVERHEAD
+            yield record
         logger.debug("No more events in %s", self._file_path)
 
+    def SaveState(self):
+        """Returns the read position of this loader, for `RestoreState`.
+
+        The state includes a fingerprint of the file, so that a restore
+        can detect whether the file has since been modified other than
+        by appending.
+
+        Returns:
+          A picklable dict, or None if the file could not be stat'd.
+        """
+        fingerprint = _stat_fingerprint(self._file_path)
+        if fingerprint is None:
+            return None
+        return {"offset": self._offset, "fingerprint": fingerprint}
+
+    def RestoreState(self, state):
+        """Resumes reading from a position saved by `SaveState`.
+
+        This must be called before the first `Load`.
+
+        Args:
+          state: A dict returned by `SaveState` on a loader for this file.
+
+        Returns:
+          True if the loader now resumes where the saved loader left off;
+          False if the file no longer matches its saved fingerprint, in
+          which case the loader is unchanged and reads from the start.
+        """
+        fingerprint = _stat_fingerprint(self._file_path)
+        if fingerprint is None:
+            return False
+        (length, mtime_nsec) = fingerprint
+        (saved_length, saved_mtime_nsec) = state["fingerprint"]
+        if length < saved_length:
+            logger.info("%s shrank since state was saved", self._file_path)
+            return False
+        if length == saved_length and mtime_nsec != saved_mtime_nsec:
+            logger.info("%s changed since state was saved", self._file_path)
+            return False
+        self._offset = state["offset"]
+        self._iterator = _make_tf_record_iterator(
+            self._file_path, self._offset, self._verify_data_crc
+        )
+        return True
+
     def CheckForIncreasedFileSize(self):
         """Stats the file to get its updated size, returning True if it grew.
 
@@ -241,7 +494,7 @@ class LegacyEventFileLoader(RawEventFileLoader):
         Yields:
           All events in the file that have not been yielded yet.
         """
-        for record in super().Load():
+        for record in self._LoadRecords():
             yield event_pb2.Event.FromString(record)
 
 
@@ -249,10 +502,21 @@ class EventFileLoader(LegacyEventFileLoader):
     """An iterator that passes events through read-time compat layers.
 
     Specifically, this includes `data_compat` and `dataclass_compat`.
+
+    If constructed with `index_only=True`, the loader only yields what
+    is needed to index the file: every event other than a summary, every
+    summary with a value of a new tag or with metadata other than that
+    first seen for its tag, and the latest value of each other tag. The
+    other events are only parsed, and skip the compat layers entirely.
+    Yielded events keep their order in the file.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, index_only=False, **kwargs):
         super().__init__(*args, **kwargs)
+        self._index_only = index_only
+        # With `index_only`, maps the tag of each summary value yielded so
+        # far to the first `SummaryMetadata` yielded for it, if any.
+        self._index_metadata = {}
         # Track initial metadata for each tag, for `dataclass_compat`.
         # This is meant to be tracked per run, not per event file, so
         # there is a potential failure case when the second event file
@@ -266,8 +530,29 @@ class EventFileLoader(LegacyEventFileLoader):
         # sufficiently improbable that we don't take extra mitigations.
         self._initial_metadata = {}  # from tag name to `SummaryMetadata`
 
+    def SaveState(self):
+        state = super().SaveState()
+        if state is not None:
+            state["initial_metadata"] = {
+                tag: metadata.SerializeToString()
+                for (tag, metadata) in self._initial_metadata.items()
+            }
+        return state
+
+    def RestoreState(self, state):
+        if not super().RestoreState(state):
+            return False
+        self._initial_metadata = {
+            tag: summary_pb2.SummaryMetadata.FromString(metadata)
+            for (tag, metadata) in state["initial_metadata"].items()
+        }
+        return True
+
     def Load(self):
-        for event in super().Load():
+        events = super().Load()
+        if self._index_only:
+            events = self._SkipSupersededEvents(events)
+        for event in events:
             event = data_compat.migrate_event(event)
             events = dataclass_compat.migrate_event(
                 event, self._initial_metadata
@@ -275,6 +560,92 @@ class EventFileLoader(LegacyEventFileLoader):
             for event in events:
                 yield event
 
+    def _SkipSupersededEvents(self, events):
+        """Drops summary values superseded by later values of their tag.
+
+        Summary values of known tags that have no new metadata are held
+        back until an event that must be yielded comes along or the file
+        has no more events, and only the latest of them for each tag is
+        yielded then.
+        """
+        latest = {}  # from held back tag to index of its latest event
+        held = {}  # from index to event with any latest values
+        num_latest = {}  # from index in `held` to number of latest tags
+        for i, event in enumerate(events):
+            if event.WhichOneof("what") == "summary":
+                values = event.summary.value
+                tags = [_ValueTag(value) for value in values]
+                if all(
+                    self._IsKnownValue(tag, value)
+                    for (tag, value) in zip(tags, values)
+                ):
+                    held[i] = event
+                    num_latest[i] = 0
+                    for tag in set(tags):
+                        superseded = latest.get(tag)
+                        latest[tag] = i
+                        num_latest[i] += 1
+                        if superseded is None:
+                            continue
+                        num_latest[superseded] -= 1
+                        if not num_latest[superseded]:
+                            del num_latest[superseded]
+                            del held[superseded]
+                    continue
+                for tag, value in zip(tags, values):
+                    if self._index_metadata.get(tag) is not None:
+                        continue
+                    metadata = None
+                    if value.HasField("metadata"):
+                        # Copied, as the compat layers modify the event.
+                        metadata = summary_pb2.SummaryMetadata()
+                        metadata.CopyFrom(value.metadata)
+                    self._index_metadata[tag] = metadata
+            yield from _LatestValues(held, latest)
+            latest = {}
+            held = {}
+            num_latest = {}
+            yield event
+        yield from _LatestValues(held, latest)
+
+    def _IsKnownValue(self, tag, value):
+        """Whether a value's tag and metadata were yielded before."""
+        if tag not in self._index_metadata:
+            return False
+        if not value.HasField("metadata"):
+            return True
+        return value.metadata == self._index_metadata[tag]
+
+
+def _ValueTag(value):
+    """Returns the tag of a `Summary.Value`, as `EventAccumulator` does."""
+    return value.tag or value.node_name
+
+
+def _LatestValues(events, latest):
+    """Yields the summary values that are the latest of their tag.
+
+    Args:
+      events: Dict mapping indices in file order to summary `Event`s.
+      latest: Dict mapping tags to the index in `events` of the latest
+        event with a value for that tag.
+
+    Yields:
+      The events in `events`, in file order, with all values that are
+      not the latest of their tag removed.
+    """
+    for i in sorted(events):
+        event = events[i]
+        values = event.summary.value
+        if all(latest[_ValueTag(value)] == i for value in values):
+            yield event
+            continue
+        filtered = event_pb2.Event(wall_time=event.wall_time, step=event.step)
+        filtered.summary.value.extend(
+            value for value in values if latest[_ValueTag(value)] == i
+        )
+        yield filtered
+
 
 class TimestampedEventFileLoader(EventFileLoader):
     """An iterator that yields (UNIX timestamp float, Event proto) pairs."""
@@ -26,7 +26,9 @@ from tensorboard import test as tb_test
 from tensorboard.backend.event_processing import event_file_loader
 from tensorboard.compat import tf
 from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
 from tensorboard.summary.writer import record_writer
+from tensorboard.util import tensor_util
 
 
 FILENAME = "test.events"
@@ -189,6 +191,41 @@ class EventFileLoaderTestBase(metaclass=abc.ABCMeta):
         self._append_record(_make_event(wall_time=3.0))
         self.assertEventWallTimes(loader.Load(), [3.0])
 
+    def testRestoreState_resumesAfterSavedOffset(self):
+        self._append_record(_make_event(wall_time=1.0))
+        self._append_record(_make_event(wall_time=2.0))
+        loader = self._make_loader()
+        self.assertEventWallTimes(loader.Load(), [1.0, 2.0])
+        state = loader.SaveState()
+        self._append_record(_make_event(wall_time=3.0))
+        new_loader = self._make_loader()
+        self.assertTrue(new_loader.RestoreState(state))
+        self.assertEventWallTimes(new_loader.Load(), [3.0])
+        self.assertEventWallTimes(new_loader.Load(), [])
+
+    def testRestoreState_rejectsShrunkFile(self):
+        self._append_record(_make_event(wall_time=1.0))
+        self._append_record(_make_event(wall_time=2.0))
+        loader = self._make_loader()
+        self.assertEventWallTimes(loader.Load(), [1.0, 2.0])
+        state = loader.SaveState()
+        os.remove(self._get_filename())
+        self._append_record(_make_event(wall_time=4.0))
+        new_loader = self._make_loader()
+        self.assertFalse(new_loader.RestoreState(state))
+        self.assertEventWallTimes(new_loader.Load(), [4.0])
+
+    def testRestoreState_rejectsRewrittenFileOfSameSize(self):
+        self._append_record(_make_event(wall_time=1.0))
+        loader = self._make_loader()
+        self.assertEventWallTimes(loader.Load(), [1.0])
+        state = loader.SaveState()
+        (length, mtime_nsec) = state["fingerprint"]
+        state["fingerprint"] = (length, mtime_nsec - 1)
+        new_loader = self._make_loader()
+        self.assertFalse(new_loader.RestoreState(state))
+        self.assertEventWallTimes(new_loader.Load(), [1.0])
+
 
 class RawEventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
     @property
@@ -216,6 +253,60 @@ class EventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
             event_wall_times_in_order,
         )
 
+    def testLoad_indexOnly(self):
+        def summary_event(step, *tags, display_name=""):
+            # Like TensorFlow 2.x writers, set metadata on every value.
+            event = event_pb2.Event(step=step)
+            for tag in tags:
+                value = event.summary.value.add(tag=tag)
+                value.tensor.CopyFrom(tensor_util.make_tensor_proto(step))
+                value.metadata.plugin_data.plugin_name = "scalars"
+                value.metadata.display_name = display_name
+            return event
+
+        self._append_record(
+            event_pb2.Event(file_version="brain.Event:2").SerializeToString()
+        )
+        for event in [
+            summary_event(1, "a", "b"),
+            summary_event(2, "a"),
+            summary_event(3, "a", "b"),
+            summary_event(4, "a"),
+            event_pb2.Event(step=5, session_log={"status": "START"}),
+            summary_event(6, "b"),
+            summary_event(7, "a", display_name="A"),
+            summary_event(8, "b"),
+            summary_event(9, "c"),
+            summary_event(10, "b"),
+        ]:
+            self._append_record(event.SerializeToString())
+        loader = self._make_loader(index_only=True)
+
+        def load():
+            return [
+                (event.step, [value.tag for value in event.summary.value])
+                for event in loader.Load()
+            ]
+
+        self.assertEqual(
+            load(),
+            [
+                (0, []),
+                (1, ["a", "b"]),
+                (3, ["b"]),
+                (4, ["a"]),
+                (5, []),
+                (6, ["b"]),
+                (7, ["a"]),
+                (8, ["b"]),
+                (9, ["c"]),
+                (10, ["b"]),
+            ],
+        )
+        self._append_record(summary_event(11, "a").SerializeToString())
+        self._append_record(summary_event(12, "a").SerializeToString())
+        self.assertEqual(load(), [(12, ["a"])])
+
 
 class TimestampedEventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
     @property
@@ -235,6 +326,128 @@ class TimestampedEventFileLoaderTest(EventFileLoaderTestBase, tb_test.TestCase):
         )
 
 
+class MmapEventFileLoaderTest(EventFileLoaderTest):
+    """Runs the loader tests against the mmap record reader."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(
+            event_file_loader,
+            "_make_tf_record_iterator",
+            event_file_loader._MmapRecordIterator,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testLoad_detectFileReplacement_statFailsTransiently_shouldRecover(self):
+        self.skipTest(
+            "the mmap reader maps the file by path whenever it grows, so it "
+            "sees a replaced file even while polling"
+        )
+
+
+class MmapRecordIteratorTest(tb_test.TestCase):
+    def _get_filename(self):
+        return os.path.join(self.get_temp_dir(), FILENAME)
+
+    def _append_record(self, data):
+        with open(self._get_filename(), "ab") as f:
+            record_writer.RecordWriter(f).write(data)
+
+    def testYieldsViews(self):
+        self._append_record(b"foo")
+        self._append_record(b"")
+        self._append_record(b"quux")
+        iterator = event_file_loader._MmapRecordIterator(self._get_filename())
+        records = list(iterator)
+        self.assertTrue(all(isinstance(r, memoryview) for r in records))
+        self.assertEqual([bytes(r) for r in records], [b"foo", b"", b"quux"])
+
+    def testStartOffset(self):
+        self._append_record(b"foo")
+        self._append_record(b"quux")
+        iterator = event_file_loader._MmapRecordIterator(
+            self._get_filename(), start_offset=3 + 16
+        )
+        self.assertEqual([bytes(r) for r in iterator], [b"quux"])
+
+    def testRemapsWhenFileGrows(self):
+        self._append_record(b"foo")
+        iterator = event_file_loader._MmapRecordIterator(self._get_filename())
+        first = next(iterator)
+        self.assertEqual(list(iterator), [])
+        self._append_record(b"bar")
+        self.assertEqual([bytes(r) for r in iterator], [b"bar"])
+        # Views from the earlier mapping remain usable.
+        self.assertEqual(bytes(first), b"foo")
+
+    def testEmptyFile_thenGrows(self):
+        open(self._get_filename(), "wb").close()
+        iterator = event_file_loader._MmapRecordIterator(self._get_filename())
+        self.assertEqual(list(iterator), [])
+        self._append_record(b"foo")
+        self.assertEqual([bytes(r) for r in iterator], [b"foo"])
+
+    def testCorruptedRecord(self):
+        self._append_record(b"foo")
+        with open(self._get_filename(), "r+b") as f:
+            f.seek(12)
+            f.write(b"g")
+        iterator = event_file_loader._MmapRecordIterator(self._get_filename())
+        with self.assertRaises(tf.errors.DataLossError):
+            next(iterator)
+
+    def testCorruptedRecord_dataCrcNotVerified(self):
+        self._append_record(b"foo")
+        with open(self._get_filename(), "r+b") as f:
+            f.seek(12)
+            f.write(b"g")
+        iterator = event_file_loader._MmapRecordIterator(
+            self._get_filename(), verify_data_crc=False
+        )
+        self.assertEqual([bytes(r) for r in iterator], [b"goo"])
+
+    def testCorruptedHeader_dataCrcNotVerified(self):
+        self._append_record(b"foo")
+        with open(self._get_filename(), "r+b") as f:
+            f.write(b"\x04")
+        iterator = event_file_loader._MmapRecordIterator(
+            self._get_filename(), verify_data_crc=False
+        )
+        with self.assertRaises(tf.errors.DataLossError):
+            next(iterator)
+
+    def testMissingFile(self):
+        with self.assertRaises(tf.errors.NotFoundError):
+            event_file_loader._MmapRecordIterator(self._get_filename())
+
+    def testCrcsComputedOnViews(self):
+        self._append_record(b"foo")
+        received = []
+
+        def native_crc32c(data):
+            received.append(type(data))
+            return pywrap_tensorflow.crc_finalize(
+                pywrap_tensorflow.crc_update(0, data)
+            )
+
+        iterator = event_file_loader._MmapRecordIterator(self._get_filename())
+        with mock.patch.object(
+            pywrap_tensorflow, "_native_crc32c", native_crc32c
+        ):
+            self.assertEqual([bytes(r) for r in iterator], [b"foo"])
+        # The header and payload are checked without being copied.
+        self.assertEqual(received, [memoryview, memoryview])
+
+    def testUnverifiedLocalFilesAreMapped(self):
+        self._append_record(b"foo")
+        iterator = event_file_loader._make_tf_record_iterator(
+            self._get_filename(), verify_data_crc=False
+        )
+        self.assertIsInstance(iterator, event_file_loader._MmapRecordIterator)
+        self.assertEqual([bytes(r) for r in iterator], [b"foo"])
+
+
 def _make_event(**kwargs):
     return event_pb2.Event(**kwargs).SerializeToString()
 
@@ -0,0 +1,178 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""On-disk snapshots of accumulator state, to warm-start after restarts."""
+
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Bump this whenever the format of `EventAccumulator.SaveState` changes
+# incompatibly, so that stale snapshots are ignored rather than misread.
+_FORMAT_VERSION = 2
+
+# Minimum time between two snapshots of a run that keeps growing.
+DEFAULT_MIN_SAVE_INTERVAL_SECS = 300.0
+
+
+class IngestCache:
+    """Persists `EventAccumulator` snapshots in a local directory.
+
+    Each run path gets one snapshot file, holding the accumulator's
+    reservoirs, summary metadata, and the byte offset reached in each
+    event file. Restoring a snapshot lets a new accumulator skip the data
+    that was already loaded and only read what has been appended since.
+
+    Writing a snapshot costs time proportional to all of the run's data,
+    so a run that is still being written is not saved after every reload:
+    it is saved once it stops growing, or at most once per
+    `min_save_interval_secs` while it keeps growing.
+
+    Snapshots are pickled, so the cache directory must not be writable by
+    untrusted users.
+    """
+
+    def __init__(
+        self, cache_dir, min_save_interval_secs=DEFAULT_MIN_SAVE_INTERVAL_SECS
+    ):
+        """Creates an `IngestCache`.
+
+        Args:
+          cache_dir: Local directory in which to store snapshots. Created
+            if it does not exist.
+          min_save_interval_secs: Minimum number of seconds between two
+            snapshots of a run that grows on every reload.
+        """
+        self._cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._min_save_interval_secs = min_save_interval_secs
+        # Maps run path to the `NumEventsProcessed()` of the accumulator
+        # at the time its snapshot was last written or restored.
+        self._saved_event_counts = {}
+        # Maps run path to the time its snapshot was last written or
+        # restored.
+        self._save_times = {}
+        # Maps run path to the `NumEventsProcessed()` of the accumulator
+        # at the previous call to `Save`.
+        self._seen_event_counts = {}
+        self._mutex = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        """The directory in which snapshots are stored."""
+        return self._cache_dir
+
+    @property
+    def min_save_interval_secs(self):
+        """The minimum time between snapshots of a growing run."""
+        return self._min_save_interval_secs
+
+    def _SnapshotPath(self, path):
+        digest = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, digest + ".pkl")
+
+    def Restore(self, path, accumulator):
+        """Restores an accumulator from its snapshot, if one is valid.
+
+        Args:
+          path: The run path that `accumulator` reads from.
+          accumulator: A freshly constructed `EventAccumulator`.
+
+        Returns:
+          True if the accumulator was restored; False if there was no
+          snapshot or it was rejected, in which case the accumulator will
+          load from scratch.
+        """
+        snapshot_path = self._SnapshotPath(path)
+        try:
+            with open(snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning("Unable to read snapshot %s: %s", snapshot_path, e)
+            return False
+        if (
+            snapshot.get("version") != _FORMAT_VERSION
+            or snapshot.get("path") != path
+        ):
+            logger.info("Ignoring incompatible snapshot for %s", path)
+            return False
+        if not accumulator.RestoreState(snapshot["state"]):
+            return False
+        with self._mutex:
+            self._saved_event_counts[path] = accumulator.NumEventsProcessed()
+            self._save_times[path] = time.time()
+        logger.info("Restored %s from snapshot", path)
+        return True
+
+    def Save(self, path, accumulator, force=False):
+        """Writes a snapshot of an accumulator, if it has new data.
+
+        Call this after each reload of the accumulator. A run's first
+        snapshot is written right away; later ones only once the run has
+        not grown since the previous call, or once
+        `min_save_interval_secs` have passed since its last snapshot.
+
+        Args:
+          path: The run path that `accumulator` reads from.
+          accumulator: An `EventAccumulator`.
+          force: If true, write the snapshot if there is new data, even if
+            the run is still growing, as before its data is discarded.
+        """
+        num_events = accumulator.NumEventsProcessed()
+        now = time.time()
+        with self._mutex:
+            if self._saved_event_counts.get(path) == num_events:
+                return
+            quiet = self._seen_event_counts.get(path) == num_events
+            self._seen_event_counts[path] = num_events
+            last_save_time = self._save_times.get(path)
+            due = (
+                last_save_time is None
+                or now - last_save_time >= self._min_save_interval_secs
+            )
+            if not (force or quiet or due):
+                return
+        state = accumulator.SaveState()
+        if state is None:
+            return
+        snapshot = {"version": _FORMAT_VERSION, "path": path, "state": state}
+        snapshot_path = self._SnapshotPath(path)
+        # Write to a temporary file and rename it into place, so that a
+        # crash mid-write never leaves a truncated snapshot.
+        (fd, temp_path) = tempfile.mkstemp(dir=self._cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, snapshot_path)
+        except OSError as e:
+            logger.warning("Unable to write snapshot for %s: %s", path, e)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        with self._mutex:
+            self._saved_event_counts[path] = state["num_events_processed"]
+            self._save_times[path] = now
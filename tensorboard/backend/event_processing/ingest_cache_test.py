@@ -0,0 +1,216 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for ingest_cache."""
+
+
+import os
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import ingest_cache
+from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.compat.proto import event_pb2
+from tensorboard.plugins.scalar import summary_v2 as scalar_summary
+from tensorboard.summary.writer import record_writer
+
+
+class IngestCacheTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._logdir = self.create_tempdir().full_path
+        self._cache_dir = os.path.join(self.get_temp_dir(), "cache")
+
+    def _write_scalars(self, run, steps, filename="events.out.tfevents.1"):
+        run_dir = os.path.join(self._logdir, run)
+        os.makedirs(run_dir, exist_ok=True)
+        with open(os.path.join(run_dir, filename), "ab") as f:
+            writer = record_writer.RecordWriter(f)
+            for step in steps:
+                event = event_pb2.Event(
+                    wall_time=1000.0 + step,
+                    step=step,
+                    summary=scalar_summary.scalar_pb("loss", step * 0.5),
+                )
+                writer.write(event.SerializeToString())
+
+    def _make_multiplexer(self, min_save_interval_secs=300.0, **kwargs):
+        kwargs.setdefault("event_file_active_filter", None)
+        cache = ingest_cache.IngestCache(
+            self._cache_dir, min_save_interval_secs=min_save_interval_secs
+        )
+        multiplexer = plugin_event_multiplexer.EventMultiplexer(
+            ingest_cache=cache, **kwargs
+        )
+        multiplexer.AddRunsFromDirectory(self._logdir)
+        return multiplexer
+
+    def _steps(self, multiplexer, run):
+        return [event.step for event in multiplexer.Tensors(run, "loss")]
+
+    def test_restart_restores_snapshot_and_reads_only_new_data(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(10)))
+        self.assertLen(os.listdir(self._cache_dir), 1)
+
+        self._write_scalars("train", range(10, 15))
+        multiplexer = self._make_multiplexer()
+        accumulator = multiplexer.GetAccumulator("train")
+        # Data is available even before the first reload.
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(10)))
+        self.assertEqual(
+            multiplexer.SummaryMetadata(
+                "train", "loss"
+            ).plugin_data.plugin_name,
+            "scalars",
+        )
+        events_before = accumulator.NumEventsProcessed()
+        multiplexer.Reload()
+        self.assertEqual(accumulator.NumEventsProcessed() - events_before, 5)
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(15)))
+
+    def test_restored_reservoir_samples_like_uninterrupted_one(self):
+        size_guidance = {"tensors": 5}
+        self._write_scalars("train", range(50))
+        multiplexer = self._make_multiplexer(size_guidance=size_guidance)
+        multiplexer.Reload()
+        self._write_scalars("train", range(50, 100))
+        multiplexer.Reload()
+        expected = self._steps(multiplexer, "train")
+
+        os.remove(os.path.join(self._logdir, "train", "events.out.tfevents.1"))
+        for path in os.listdir(self._cache_dir):
+            os.remove(os.path.join(self._cache_dir, path))
+        self._write_scalars("train", range(50))
+        multiplexer = self._make_multiplexer(size_guidance=size_guidance)
+        multiplexer.Reload()
+        self._write_scalars("train", range(50, 100))
+        multiplexer = self._make_multiplexer(size_guidance=size_guidance)
+        multiplexer.Reload()
+        self.assertEqual(self._steps(multiplexer, "train"), expected)
+
+    def test_rewritten_file_falls_back_to_full_reload(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+
+        os.remove(os.path.join(self._logdir, "train", "events.out.tfevents.1"))
+        self._write_scalars("train", range(3))
+        multiplexer = self._make_multiplexer()
+        self.assertEqual(
+            multiplexer.GetAccumulator("train").Tags()["tensors"], []
+        )
+        multiplexer.Reload()
+        self.assertEqual(self._steps(multiplexer, "train"), [0, 1, 2])
+
+    def test_changed_options_fall_back_to_full_reload(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+
+        multiplexer = self._make_multiplexer(purge_orphaned_data=False)
+        self.assertEqual(
+            multiplexer.GetAccumulator("train").Tags()["tensors"], []
+        )
+        multiplexer.Reload()
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(10)))
+
+    def test_multifile_directory_loader(self):
+        self._write_scalars("train", range(5), filename="events.out.tfevents.1")
+        self._write_scalars(
+            "train", range(5, 8), filename="events.out.tfevents.2"
+        )
+        multiplexer = self._make_multiplexer(
+            event_file_active_filter=lambda timestamp: True
+        )
+        multiplexer.Reload()
+
+        self._write_scalars(
+            "train", range(8, 10), filename="events.out.tfevents.1"
+        )
+        multiplexer = self._make_multiplexer(
+            event_file_active_filter=lambda timestamp: True
+        )
+        self.assertLen(self._steps(multiplexer, "train"), 8)
+        multiplexer.Reload()
+        self.assertCountEqual(self._steps(multiplexer, "train"), range(10))
+
+    def test_unchanged_run_is_not_rewritten(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+        (snapshot,) = os.listdir(self._cache_dir)
+        snapshot_path = os.path.join(self._cache_dir, snapshot)
+        os.utime(snapshot_path, (0, 0))
+        multiplexer.Reload()
+        self.assertEqual(os.stat(snapshot_path).st_mtime, 0)
+
+    def _snapshot_path(self):
+        (snapshot,) = os.listdir(self._cache_dir)
+        return os.path.join(self._cache_dir, snapshot)
+
+    def test_growing_run_is_saved_once_quiet(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+        snapshot_path = self._snapshot_path()
+        os.utime(snapshot_path, (0, 0))
+        for start in range(10, 40, 10):
+            self._write_scalars("train", range(start, start + 10))
+            multiplexer.Reload()
+            self.assertEqual(os.stat(snapshot_path).st_mtime, 0)
+        # Once the run stops growing, its new data is saved.
+        multiplexer.Reload()
+        self.assertNotEqual(os.stat(snapshot_path).st_mtime, 0)
+        multiplexer = self._make_multiplexer()
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(40)))
+
+    def test_skipped_run_is_saved_once_quiet(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer(reload_incremental=True)
+        multiplexer.Reload()
+        snapshot_path = self._snapshot_path()
+        os.utime(snapshot_path, (0, 0))
+        self._write_scalars("train", range(10, 20))
+        multiplexer.Reload()
+        self.assertEqual(os.stat(snapshot_path).st_mtime, 0)
+        # This reload skips the unchanged run, but still saves it.
+        multiplexer.Reload()
+        self.assertNotEqual(os.stat(snapshot_path).st_mtime, 0)
+
+    def test_growing_run_is_saved_after_interval(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer(min_save_interval_secs=0)
+        multiplexer.Reload()
+        snapshot_path = self._snapshot_path()
+        os.utime(snapshot_path, (0, 0))
+        self._write_scalars("train", range(10, 20))
+        multiplexer.Reload()
+        self.assertNotEqual(os.stat(snapshot_path).st_mtime, 0)
+
+    def test_corrupt_snapshot_is_ignored(self):
+        self._write_scalars("train", range(10))
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+        (snapshot,) = os.listdir(self._cache_dir)
+        with open(os.path.join(self._cache_dir, snapshot), "wb") as f:
+            f.write(b"not a pickle")
+        multiplexer = self._make_multiplexer()
+        multiplexer.Reload()
+        self.assertEqual(self._steps(multiplexer, "train"), list(range(10)))
+
+
+if __name__ == "__main__":
+    tb_test.main()
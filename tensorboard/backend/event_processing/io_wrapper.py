@@ -15,8 +15,10 @@
 """IO helper functions."""
 
 import collections
+import concurrent.futures
 import os
 import re
+import time
 
 
 from tensorboard.compat import tf
@@ -28,6 +30,10 @@ logger = tb_logging.get_logger()
 
 _ESCAPE_GLOB_CHARACTERS_REGEX = re.compile("([*?[])")
 
+# Number of list requests that `ListRecursivelyViaParallelListing` keeps
+# in flight.
+_LISTING_THREADS = 16
+
 
 def PathSeparator(path):
     return "/" if io_util.IsCloudPath(path) else os.sep
@@ -176,6 +182,68 @@ def ListRecursivelyViaWalking(top):
         )
 
 
+def ListRecursivelyViaParallelListing(top, max_workers=_LISTING_THREADS):
+    """Lists a directory tree, listing its subtrees concurrently.
+
+    After `top` itself is listed, each of its subdirectories is listed as a
+    separate shard on a thread pool, so that the latency of list requests to
+    a remote filesystem overlaps. Where the filesystem supports it (as does
+    the TensorFlow stub's `find` for object stores), each shard is listed
+    with a single flat recursive listing, which is much cheaper than
+    walking it one directory at a time; otherwise, each shard is walked.
+
+    Unlike the other `ListRecursively*` functions, this omits directories
+    that contain no files. If the directory does not exist,
+    this yields nothing.
+
+    Args:
+      top: A path to a directory.
+      max_workers: The maximum number of concurrent list requests.
+
+    Yields:
+      A (dir_path, file_paths) tuple for each directory/subdirectory, in no
+      particular order.
+    """
+    try:
+        entries = tf.io.gfile.listdir(top)
+    except tf.errors.NotFoundError:
+        return
+    # Object store listings may mark directories with a trailing slash.
+    paths = [os.path.join(top, entry.rstrip("/")) for entry in entries]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        is_dirs = list(executor.map(tf.io.gfile.isdir, paths))
+        files = [p for (p, is_dir) in zip(paths, is_dirs) if not is_dir]
+        if files:
+            yield (top, tuple(files))
+        shards = [p for (p, is_dir) in zip(paths, is_dirs) if is_dir]
+        futures = [executor.submit(_ListShard, shard) for shard in shards]
+        for future in concurrent.futures.as_completed(futures):
+            for pair in future.result():
+                yield pair
+
+
+def _ListShard(top):
+    """Lists a subtree for `ListRecursivelyViaParallelListing`."""
+    find = getattr(tf.io.gfile, "find", None)
+    if find is not None:
+        try:
+            file_paths = find(top)
+        except tf.errors.UnimplementedError:
+            pass
+        else:
+            pairs = collections.defaultdict(list)
+            for file_path in file_paths:
+                pairs[os.path.dirname(file_path)].append(file_path)
+            return [
+                (dir_name, tuple(paths)) for (dir_name, paths) in pairs.items()
+            ]
+    return [
+        (dir_path, tuple(os.path.join(dir_path, f) for f in filenames))
+        for (dir_path, _, filenames) in tf.io.gfile.walk(top, topdown=True)
+        if filenames
+    ]
+
+
 def GetLogdirSubdirectories(path):
     """Obtains all subdirectories with events files.
 
@@ -202,7 +270,16 @@ def GetLogdirSubdirectories(path):
             "directory, %s" % path
         )
 
-    if io_util.IsCloudPath(path):
+    if not _IsLocalPath(path) and hasattr(tf.io.gfile, "find"):
+        # The TensorFlow stub can list a whole prefix of an object store
+        # at once, so list the top-level prefixes of the logdir that way,
+        # concurrently.
+        logger.info(
+            "GetLogdirSubdirectories: Starting to list directories in "
+            "parallel."
+        )
+        traversal_method = ListRecursivelyViaParallelListing
+    elif io_util.IsCloudPath(path):
         # Glob-ing for files can be significantly faster than recursively
         # walking through directories for some file systems.
         logger.info(
@@ -222,3 +299,135 @@ def GetLogdirSubdirectories(path):
         for (subdir, files) in traversal_method(path)
         if any(IsTensorFlowEventsFile(f) for f in files)
     )
+
+
+# Directory listings whose directory was modified this recently (relative
+# to when it was listed) are not trusted, since the modification may have
+# raced with the listing without changing the modification time.
+_MTIME_SLACK_NSEC = 2 * 10**9
+
+
+def _IsLocalPath(path):
+    """Whether `path` can be accessed with the `os` module."""
+    return "://" not in path
+
+
+class IncrementalLogdirScanner:
+    """Finds subdirectories with events files, re-listing only changed ones.
+
+    Like `GetLogdirSubdirectories`, but remembers the listing of every
+    directory under the logdir, and on later scans only re-lists those
+    whose modification time has changed. Unchanged directories cost one
+    `stat` each. This relies on directory modification times, so it is
+    only done for local paths; other paths are scanned in full each time.
+    """
+
+    def __init__(self, path):
+        """Creates a scanner for the given logdir.
+
+        Args:
+          path: The path to a directory under which to find subdirectories.
+        """
+        self._path = path
+        # Maps directory path to `(mtime_nsec, listed_at_nsec, subdirs,
+        # has_events)` as of the last time it was listed.
+        self._listings = {}
+        self.num_listed = 0
+
+    def Scan(self):
+        """Obtains all subdirectories with events files.
+
+        Returns:
+          A list of absolute paths of all subdirectories each with at least
+          1 events file directly within the subdirectory.
+
+        Raises:
+          ValueError: If the path exists and is not a directory.
+        """
+        if not _IsLocalPath(self._path):
+            return list(GetLogdirSubdirectories(self._path))
+        if not os.path.exists(self._path):
+            self._listings.clear()
+            return []
+        if not os.path.isdir(self._path):
+            raise ValueError(
+                "IncrementalLogdirScanner: path exists and is not a "
+                "directory, %s" % self._path
+            )
+        self.num_listed = 0
+        listings = {}
+        result = []
+        pending = [self._path]
+        while pending:
+            directory = pending.pop()
+            listing = self._ListDirectory(directory)
+            if listing is None:
+                continue
+            listings[directory] = listing
+            (_, _, subdirs, has_events) = listing
+            if has_events:
+                result.append(directory)
+            pending.extend(subdirs)
+        # Forget directories that no longer exist.
+        self._listings = listings
+        return result
+
+    def _ListDirectory(self, directory):
+        """Returns a possibly cached listing, or None if it is gone."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._listings.get(directory)
+        if (
+            cached is not None
+            and cached[0] == mtime
+            and mtime + _MTIME_SLACK_NSEC < cached[1]
+        ):
+            return cached
+        listed_at = time.time_ns()
+        subdirs = []
+        has_events = False
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                    elif IsTensorFlowEventsFile(entry.name):
+                        has_events = True
+        except OSError:
+            return None
+        self.num_listed += 1
+        return (mtime, listed_at, tuple(subdirs), has_events)
+
+
+def EventFilesFingerprint(path):
+    """Returns a value that changes whenever a run's event files change.
+
+    The fingerprint covers the name, size, and modification time of each
+    events file directly within `path` (or of `path` itself, if it is an
+    events file), so it changes when data is appended or files are added,
+    removed, or replaced.
+
+    Args:
+      path: A run directory, or a single events file.
+
+    Returns:
+      A hashable fingerprint, or None if `path` does not exist or is not a
+      local path, for which this could cost more than reading new data.
+    """
+    if not _IsLocalPath(path):
+        return None
+    try:
+        if not os.path.isdir(path):
+            stat = os.stat(path)
+            return ((path, stat.st_size, stat.st_mtime_ns),)
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if IsTensorFlowEventsFile(entry.name):
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(sorted(entries))
+    except OSError:
+        return None
@@ -16,6 +16,7 @@
 
 import os
 import tempfile
+from unittest import mock
 
 import tensorflow as tf
 
@@ -302,6 +303,74 @@ class IoWrapperTest(tf.test.TestCase):
             expected, io_wrapper.ListRecursivelyViaWalking(temp_dir)
         )
 
+    def _ExpectedNonEmptyListing(self, top):
+        expected = [
+            ["", ["a.tfevents.1", "model.ckpt"]],
+            ["bar", ["b.tfevents.1", "red_herring.txt"]],
+            ["bar/baz", ["c.tfevents.1", "d.tfevents.1"]],
+            [
+                "bar/quux",
+                ["some_flume_output.txt", "some_more_flume_output.txt"],
+            ],
+            ["quuz", ["e.tfevents.1"]],
+            ["quuz/garply", ["f.tfevents.1"]],
+            ["quuz/garply/corge", ["g.tfevents.1"]],
+            ["quuz/garply/grault", ["h.tfevents.1"]],
+            ["waldo/fred", ["i.tfevents.1"]],
+        ]
+        for pair in expected:
+            pair[0] = os.path.join(top, pair[0]) if pair[0] else top
+            pair[1] = [os.path.join(pair[0], f) for f in pair[1]]
+        return expected
+
+    def testListRecursivelyViaParallelListing(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._CompareFilesPerSubdirectory(
+            self._ExpectedNonEmptyListing(temp_dir),
+            io_wrapper.ListRecursivelyViaParallelListing(
+                temp_dir, max_workers=3
+            ),
+        )
+
+    def testListRecursivelyViaParallelListing_usesFlatListing(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+
+        def find(top):
+            return [
+                os.path.join(dir_path, f)
+                for (dir_path, _, filenames) in os.walk(top)
+                for f in filenames
+            ]
+
+        with mock.patch.object(
+            tf.io.gfile, "find", create=True, side_effect=find
+        ) as mock_find, mock.patch.object(
+            tf.io.gfile, "walk", wraps=tf.io.gfile.walk
+        ) as mock_walk:
+            listing = list(
+                io_wrapper.ListRecursivelyViaParallelListing(temp_dir)
+            )
+        self._CompareFilesPerSubdirectory(
+            self._ExpectedNonEmptyListing(temp_dir), listing
+        )
+        # One flat listing per top-level subdirectory.
+        self.assertCountEqual(
+            [c.args[0] for c in mock_find.call_args_list],
+            [
+                os.path.join(temp_dir, d)
+                for d in ("foo", "bar", "quuz", "waldo")
+            ],
+        )
+        mock_walk.assert_not_called()
+
+    def testListRecursivelyViaParallelListing_missingDirectory(self):
+        missing = os.path.join(self.get_temp_dir(), "missing")
+        self.assertEmpty(
+            list(io_wrapper.ListRecursivelyViaParallelListing(missing))
+        )
+
     def testGetLogdirSubdirectories(self):
         temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
         self._CreateDeepDirectoryStructure(temp_dir)
@@ -325,6 +394,85 @@ class IoWrapperTest(tf.test.TestCase):
             io_wrapper.GetLogdirSubdirectories(temp_dir),
         )
 
+    def _SetDirectoryTimesToPast(self, top_directory):
+        for dir_path, _, _ in os.walk(top_directory):
+            os.utime(dir_path, (1000, 1000))
+
+    def testIncrementalLogdirScanner(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._SetDirectoryTimesToPast(temp_dir)
+        scanner = io_wrapper.IncrementalLogdirScanner(temp_dir)
+        expected = list(io_wrapper.GetLogdirSubdirectories(temp_dir))
+        self.assertCountEqual(scanner.Scan(), expected)
+        first_listed = scanner.num_listed
+        self.assertGreater(first_listed, 0)
+
+        # Nothing changed, so nothing is re-listed.
+        self.assertCountEqual(scanner.Scan(), expected)
+        self.assertEqual(scanner.num_listed, 0)
+
+        # Adding a run only re-lists its parent and the new directory.
+        new_run = os.path.join(temp_dir, "quuz", "garply", "new_run")
+        os.mkdir(new_run)
+        open(os.path.join(new_run, "a.tfevents.1"), "w").close()
+        self.assertCountEqual(scanner.Scan(), expected + [new_run])
+        self.assertEqual(scanner.num_listed, 2)
+
+        # Removing a run drops it.
+        os.remove(os.path.join(new_run, "a.tfevents.1"))
+        os.rmdir(new_run)
+        self.assertCountEqual(scanner.Scan(), expected)
+
+    def testIncrementalLogdirScanner_relistsRecentlyModifiedDirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        scanner = io_wrapper.IncrementalLogdirScanner(temp_dir)
+        self.assertEqual(scanner.Scan(), [])
+        # The directory was modified just before being listed, so a change
+        # made in the same clock tick might have been missed.
+        self.assertEqual(scanner.Scan(), [])
+        self.assertEqual(scanner.num_listed, 1)
+
+    def testIncrementalLogdirScanner_nonexistentDirectory(self):
+        path = os.path.join(self.get_temp_dir(), "does_not_exist")
+        scanner = io_wrapper.IncrementalLogdirScanner(path)
+        self.assertEqual(scanner.Scan(), [])
+
+    def testEventFilesFingerprint(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        events_path = os.path.join(temp_dir, "a.tfevents.1")
+        with open(events_path, "w") as f:
+            f.write("x")
+        open(os.path.join(temp_dir, "not_events.txt"), "w").close()
+        fingerprint = io_wrapper.EventFilesFingerprint(temp_dir)
+        self.assertEqual(
+            io_wrapper.EventFilesFingerprint(temp_dir), fingerprint
+        )
+
+        # Unrelated files do not matter.
+        with open(os.path.join(temp_dir, "not_events.txt"), "w") as f:
+            f.write("changed")
+        self.assertEqual(
+            io_wrapper.EventFilesFingerprint(temp_dir), fingerprint
+        )
+
+        with open(events_path, "a") as f:
+            f.write("y")
+        appended = io_wrapper.EventFilesFingerprint(temp_dir)
+        self.assertNotEqual(appended, fingerprint)
+
+        open(os.path.join(temp_dir, "a.tfevents.2"), "w").close()
+        self.assertNotEqual(
+            io_wrapper.EventFilesFingerprint(temp_dir), appended
+        )
+
+        single_file = io_wrapper.EventFilesFingerprint(events_path)
+        self.assertIsNotNone(single_file)
+        self.assertIsNone(
+            io_wrapper.EventFilesFingerprint(os.path.join(temp_dir, "gone"))
+        )
+        self.assertIsNone(io_wrapper.EventFilesFingerprint("gs://bucket/run"))
+
     def _CreateDeepDirectoryStructure(self, top_directory):
         """Creates a reasonable deep structure of subdirectories with files.
 
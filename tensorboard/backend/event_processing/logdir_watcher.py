@@ -0,0 +1,235 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Watches local logdirs for new event data with Linux inotify."""
+
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Constants from <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+
+# `struct inotify_event`, without its variable-length name.
+_EVENT_HEADER = struct.Struct("iIII")
+
+# After a change wakes up `Wait`, it waits this long for further changes,
+# so that a burst of writes leads to a single reload.
+_SETTLE_SECS = 0.1
+
+
+class InotifyWatcher:
+    """Reports which directories under some local logdirs have new data.
+
+    Every directory under the logdirs is watched with inotify, so changes
+    are reported without polling. Only changes to events files are
+    reported as such; directories being created, deleted, or moved, or
+    the kernel's event queue overflowing, are reported as a need to scan
+    the logdirs again.
+    """
+
+    def __init__(self, paths):
+        """Starts watching the given logdirs.
+
+        Args:
+          paths: Paths of local directories to watch, recursively.
+
+        Raises:
+          OSError: If inotify is not available, or a directory could not
+            be watched (e.g., because it does not exist, or the limit on
+            inotify watches was reached).
+        """
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            _raise_errno("inotify_init1")
+        # Maps watch descriptor to the path of the watched directory.
+        self._directories = {}
+        try:
+            for path in paths:
+                self._WatchTree(path)
+        except OSError:
+            self.Close()
+            raise
+
+    def _WatchTree(self, top):
+        for directory, _, _ in os.walk(top):
+            self._Watch(directory)
+        if not self._directories:
+            raise OSError(errno.ENOENT, "No directory to watch", top)
+
+    def _Watch(self, directory):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if wd < 0:
+            _raise_errno("inotify_add_watch", directory)
+        self._directories[wd] = os.path.normpath(directory)
+
+    def Wait(self, timeout):
+        """Blocks until events data changes, or the timeout elapses.
+
+        Args:
+          timeout: The maximum number of seconds to wait, or None to wait
+            indefinitely.
+
+        Returns:
+          A set of the (normalized) paths of directories in which events
+          files were created or written; or None if the logdirs must be
+          scanned again for new, removed, or missed runs. On timeout, the
+          set is empty.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                return set()
+            (readable, _, _) = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+            time.sleep(_SETTLE_SECS)
+            changed = self._ReadEvents()
+            if changed is None or changed:
+                return changed
+
+    def _ReadEvents(self):
+        """Drains pending events; returns as for `Wait`."""
+        changed = set()
+        rescan = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(buf):
+                (wd, mask, _, name_len) = _EVENT_HEADER.unpack_from(buf, pos)
+                pos += _EVENT_HEADER.size
+                name = buf[pos : pos + name_len].rstrip(b"\0")
+                pos += name_len
+                directory = self._directories.get(wd)
+                if mask & _IN_Q_OVERFLOW:
+                    rescan = True
+                elif mask & _IN_IGNORED:
+                    # The directory was removed, or unmounted.
+                    self._directories.pop(wd, None)
+                    rescan = True
+                elif mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    rescan = True
+                elif mask & _IN_ISDIR:
+                    rescan = True
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and directory:
+                        self._WatchNewTree(
+                            os.path.join(directory, os.fsdecode(name))
+                        )
+                elif (
+                    directory is not None
+                    and io_wrapper.IsTensorFlowEventsFile(os.fsdecode(name))
+                ):
+                    changed.add(directory)
+        return None if rescan else changed
+
+    def _WatchNewTree(self, top):
+        try:
+            for directory, _, _ in os.walk(top):
+                self._Watch(directory)
+        except OSError as e:
+            # E.g., the directory is already gone again. A rescan will
+            # find anything that is not.
+            logger.warning("Could not watch %s: %s", top, e)
+
+    def Close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def Create(paths):
+    """Returns an `InotifyWatcher` for the given logdirs, or None.
+
+    None is returned, and a message logged, if the logdirs cannot be watched
+    with inotify: e.g., if not on Linux, if some paths are not local, or if
+    the watches could not be set up.
+    """
+    if not sys.platform.startswith("linux"):
+        logger.info("Not watching logdirs for changes: requires Linux")
+        return None
+    for path in paths:
+        if "://" in path:
+            logger.info("Not watching %s for changes: not a local path", path)
+            return None
+    try:
+        return InotifyWatcher(paths)
+    except OSError as e:
+        logger.warning("Not watching logdirs for changes: %s", e)
+        return None
+
+
+def _load_libc():
+    libc = ctypes.CDLL(
+        ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+    )
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "inotify is not available")
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint32,
+    ]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    return libc
+
+
+def _raise_errno(function, *filename):
+    code = ctypes.get_errno()
+    raise OSError(code, "%s: %s" % (function, os.strerror(code)), *filename)
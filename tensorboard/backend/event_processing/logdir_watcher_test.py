@@ -0,0 +1,84 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for logdir_watcher."""
+
+
+import os
+import sys
+import unittest
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import logdir_watcher
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "requires inotify")
+class InotifyWatcherTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._logdir = self.create_tempdir().full_path
+        self._run_dir = os.path.join(self._logdir, "run")
+        os.mkdir(self._run_dir)
+
+    def _watcher(self):
+        watcher = logdir_watcher.InotifyWatcher([self._logdir])
+        self.addCleanup(watcher.Close)
+        return watcher
+
+    def _append(self, path, data=b"x"):
+        with open(path, "ab") as f:
+            f.write(data)
+
+    def test_timeout(self):
+        watcher = self._watcher()
+        self.assertEqual(watcher.Wait(0.01), set())
+
+    def test_reports_changed_event_file_directories(self):
+        watcher = self._watcher()
+        self._append(os.path.join(self._run_dir, "events.out.tfevents.1"))
+        self.assertEqual(watcher.Wait(5), {os.path.normpath(self._run_dir)})
+        self._append(os.path.join(self._run_dir, "events.out.tfevents.1"))
+        self.assertEqual(watcher.Wait(5), {os.path.normpath(self._run_dir)})
+
+    def test_ignores_other_files(self):
+        watcher = self._watcher()
+        self._append(os.path.join(self._run_dir, "checkpoint"))
+        self.assertEqual(watcher.Wait(0.5), set())
+
+    def test_new_directory_requires_rescan_and_is_watched(self):
+        watcher = self._watcher()
+        new_run_dir = os.path.join(self._logdir, "new_run")
+        os.mkdir(new_run_dir)
+        self.assertIsNone(watcher.Wait(5))
+        self._append(os.path.join(new_run_dir, "events.out.tfevents.1"))
+        self.assertEqual(watcher.Wait(5), {os.path.normpath(new_run_dir)})
+
+    def test_deleted_directory_requires_rescan(self):
+        watcher = self._watcher()
+        os.rmdir(self._run_dir)
+        self.assertIsNone(watcher.Wait(5))
+
+    def test_missing_logdir(self):
+        with self.assertRaises(OSError):
+            logdir_watcher.InotifyWatcher([os.path.join(self._logdir, "nope")])
+
+    def test_create_falls_back_for_remote_paths(self):
+        self.assertIsNone(logdir_watcher.Create(["gs://bucket/logs"]))
+        watcher = logdir_watcher.Create([self._logdir])
+        self.assertIsInstance(watcher, logdir_watcher.InotifyWatcher)
+        watcher.Close()
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -16,10 +16,15 @@
 
 import collections
 import dataclasses
+import random
 import threading
+import time
 
 from typing import Optional
 
+import numpy as np
+
+from tensorboard.backend.event_processing import blob_store as blob_store_lib
 from tensorboard.backend.event_processing import directory_loader
 from tensorboard.backend.event_processing import directory_watcher
 from tensorboard.backend.event_processing import event_file_loader
@@ -32,8 +37,11 @@ from tensorboard.compat.proto import config_pb2
 from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import graph_pb2
 from tensorboard.compat.proto import meta_graph_pb2
+from tensorboard.compat.proto import summary_pb2
 from tensorboard.compat.proto import tensor_pb2
+from tensorboard.compat.proto import types_pb2
 from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
 
 
 logger = tb_logging.get_logger()
@@ -55,6 +63,13 @@ STORE_EVERYTHING_SIZE_GUIDANCE = {
 
 _TENSOR_RESERVOIR_KEY = "."  # arbitrary
 
+# While reloading, newly loaded data is made visible to readers at most
+# this often, rather than after every event.
+_PUBLISH_INTERVAL_SECS = 1.0
+
+# Tensor values are added to reservoirs in batches of up to this many.
+_INGEST_BATCH_SIZE = 4096
+
 
 @dataclasses.dataclass(frozen=True)
 class TensorEvent:
@@ -64,11 +79,49 @@ class TensorEvent:
       wall_time: Timestamp of the event in seconds.
       step: Global step of the event.
       tensor_proto: A `TensorProto`.
+      blob_ref: If the string values of the tensor were moved to a
+        `blob_store.BlobStore`, a `blob_store.BlobRef` to them; then
+        `tensor_proto` only holds the dtype and shape. Otherwise None.
     """
 
     wall_time: float
     step: int
     tensor_proto: tensor_pb2.TensorProto
+    blob_ref: Optional[blob_store_lib.BlobRef] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ScalarEvent:
+    """A single point of a scalar time series.
+
+    Attributes:
+      wall_time: Timestamp of the event in seconds.
+      step: Global step of the event.
+      value: The scalar value, as a Python number.
+    """
+
+    wall_time: float
+    step: int
+    value: float
+
+
+@dataclasses.dataclass(frozen=True)
+class ScalarSeries:
+    """A scalar time series in columnar form.
+
+    The three arrays have the same length and are ordered as the points
+    were accumulated (as for `Tensors`). They are copies, so callers may
+    keep them without holding any locks.
+
+    Attributes:
+      step: A 1-D `int64` array of global steps.
+      wall_time: A 1-D `float64` array of timestamps in seconds.
+      value: A 1-D array of values, with the dtype of the summary data.
+    """
+
+    step: np.ndarray
+    wall_time: np.ndarray
+    value: np.ndarray
 
 
 class EventAccumulator:
@@ -102,10 +155,14 @@ class EventAccumulator:
       path: A file path to a directory containing tf events files, or a single
           tf events file. The accumulator will load events from this path.
       tensors_by_tag: A dictionary mapping each tag name to a
-        reservoir.Reservoir of tensor summaries. Each such reservoir will
-        only use a single key, given by `_TENSOR_RESERVOIR_KEY`.
+        reservoir.Reservoir of tensor summaries, or, for scalar time
+        series, a columnar reservoir with the same interface. Each such
+        reservoir will only use a single key, given by
+        `_TENSOR_RESERVOIR_KEY`.
 
     @@Tensors
+    @@Scalars
+    @@TimeSeriesStats
     """
 
     def __init__(
@@ -116,6 +173,12 @@ class EventAccumulator:
         purge_orphaned_data=True,
         event_file_active_filter=None,
         detect_file_replacement=None,
+        verify_data_crc=True,
+        max_bytes_per_tag=0,
+        plugin_byte_budgets=None,
+        byte_budget=None,
+        blob_store=None,
+        index_only=False,
     ):
         """Construct the `EventAccumulator`.
 
@@ -142,6 +205,25 @@ class EventAccumulator:
           detect_file_replacement: Optional boolean; if True, event file loading
             will try to detect when a file has been replaced with a new version
             that contains additional data, by monitoring the file size.
+          verify_data_crc: If False, the CRC of each record's payload is not
+            checked where the record reader allows it. Only appropriate for
+            trusted logdirs.
+          max_bytes_per_tag: The maximum total serialized size of the tensors
+            kept for any one non-scalar tag. If 0, only the number of items
+            is limited.
+          plugin_byte_budgets: Optional dict mapping plugin name to a
+            `reservoir.ByteBudget` for the tensors of all tags of that
+            plugin, typically shared by the accumulators of all runs.
+          byte_budget: Optional `reservoir.ByteBudget` for the tensors of
+            all non-scalar tags, typically shared by the accumulators of
+            all runs.
+          blob_store: Optional `blob_store.BlobStore`. If given, the values
+            of blob sequence tensors are kept there rather than in memory,
+            and the `TensorEvent`s for them have a `blob_ref`.
+          index_only: If True, only the latest event of each tag is kept,
+            regardless of size guidance, and values superseded within a
+            reload are skipped right after parsing. This is enough to list
+            tags and their latest values; see also `ReduceToIndex`.
         """
         size_guidance = dict(size_guidance or DEFAULT_SIZE_GUIDANCE)
         sizes = {}
@@ -152,6 +234,11 @@ class EventAccumulator:
                 sizes[key] = DEFAULT_SIZE_GUIDANCE[key]
         self._size_guidance = size_guidance
         self._tensor_size_guidance = dict(tensor_size_guidance or {})
+        self._max_bytes_per_tag = max_bytes_per_tag
+        self._plugin_byte_budgets = dict(plugin_byte_budgets or {})
+        self._byte_budget = byte_budget
+        self._blob_store = blob_store
+        self._index_only = index_only
 
         self._first_event_timestamp = None
 
@@ -162,6 +249,11 @@ class EventAccumulator:
         self.summary_metadata = {}
         self.tensors_by_tag = {}
         self._tensors_by_tag_lock = threading.Lock()
+        # Tensor values not yet added to their reservoirs: maps each tag to
+        # lists `[wall_times, steps, tensor_protos]`. Only accessed with
+        # the generator mutex held.
+        self._pending_tensors = {}
+        self._num_pending_tensors = 0
 
         # Keep a mapping from plugin name to a dict mapping from tag to plugin data
         # content obtained from the SummaryMetadata (metadata field of Value) for
@@ -175,10 +267,18 @@ class EventAccumulator:
         self._plugin_tag_lock = threading.Lock()
 
         self.path = path
+        self._event_file_active_filter = event_file_active_filter
+        self._detect_file_replacement = detect_file_replacement
+        self._verify_data_crc = verify_data_crc
         self._generator = _GeneratorFromPath(
-            path, event_file_active_filter, detect_file_replacement
+            path,
+            event_file_active_filter,
+            detect_file_replacement,
+            verify_data_crc,
+            index_only,
         )
         self._generator_mutex = threading.Lock()
+        self._num_events_processed = 0
 
         self.purge_orphaned_data = purge_orphaned_data
         self._seen_session_start = False
@@ -195,14 +295,250 @@ class EventAccumulator:
 
         If `Reload` was never called, loads all events in the file.
 
+        Readers see the new data in batches: it is published about every
+        `_PUBLISH_INTERVAL_SECS` during the reload, and when it finishes.
+
         Returns:
           The `EventAccumulator`.
         """
         with self._generator_mutex:
+            next_publish = time.monotonic() + _PUBLISH_INTERVAL_SECS
             for event in self._generator.Load():
                 self._ProcessEvent(event)
+                if time.monotonic() >= next_publish:
+                    self._Publish()
+                    next_publish = time.monotonic() + _PUBLISH_INTERVAL_SECS
+            self._Publish()
         return self
 
+    def _Publish(self):
+        """Makes all loaded data visible to readers of the reservoirs.
+
+        Must be called with the generator mutex held.
+        """
+        self._FlushTensors()
+        with self._tensors_by_tag_lock:
+            reservoirs = list(self.tensors_by_tag.values())
+        for tag_reservoir in reservoirs:
+            tag_reservoir.Publish()
+
+    def NumEventsProcessed(self):
+        """Returns the number of events loaded so far.
+
+        This increases whenever a `Reload` ingests new data, so callers
+        can cheaply check whether anything has changed.
+        """
+        return self._num_events_processed
+
+    @property
+    def index_only(self):
+        """Whether only the latest event of each tag is kept."""
+        return self._index_only
+
+    def ReduceToIndex(self):
+        """Discards all but the latest event of each tag.
+
+        Tags, metadata and the read position are kept, so the accumulator
+        continues loading from where it was. From then on, it is
+        `index_only`.
+        """
+        with self._generator_mutex:
+            self._index_only = True
+            with self._tensors_by_tag_lock:
+                old_tensors_by_tag = dict(self.tensors_by_tag)
+            tensors_by_tag = {}
+            for tag, tag_reservoir in old_tensors_by_tag.items():
+                new_reservoir = self._NewTensorReservoir(tag)
+                for item in tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)[-1:]:
+                    new_reservoir.AddItem(_TENSOR_RESERVOIR_KEY, item)
+                new_reservoir.Publish()
+                tensors_by_tag[tag] = new_reservoir
+            with self._tensors_by_tag_lock:
+                self.tensors_by_tag = tensors_by_tag
+            _ReleaseBudgets(old_tensors_by_tag)
+
+    def ReleaseBudgets(self):
+        """Releases the data of this accumulator from shared byte budgets.
+
+        Call this before discarding an accumulator created with
+        `plugin_byte_budgets` or `byte_budget`, so that its data no longer
+        counts against them.
+        """
+        with self._tensors_by_tag_lock:
+            tensors_by_tag = dict(self.tensors_by_tag)
+        _ReleaseBudgets(tensors_by_tag)
+
+    def SaveState(self):
+        """Returns a snapshot of all loaded data and the read position.
+
+        The snapshot can be passed to `RestoreState` on a new accumulator
+        for the same path (e.g., after a TensorBoard restart) so that it
+        only needs to load events written after the snapshot was taken.
+
+        Returns:
+          A picklable dict, or None if the read position could not be
+          captured.
+        """
+        with self._generator_mutex:
+            generator_state = self._generator.SaveState()
+            if generator_state is None:
+                return None
+            state = self._ExportDataLocked()
+            state["config"] = self._StateConfig()
+            state["generator"] = generator_state
+            return state
+
+    def ExportData(self):
+        """Returns a snapshot of all loaded data, without the read position.
+
+        Unlike `SaveState`, this works for any kind of event source. It is
+        used to replicate data loaded by an accumulator in another process
+        into this one with `ImportData`.
+
+        Returns:
+          A picklable dict.
+        """
+        with self._generator_mutex:
+            return self._ExportDataLocked()
+
+    def _ExportDataLocked(self):
+        with self._tensors_by_tag_lock:
+            tensors_by_tag = dict(self.tensors_by_tag)
+        with self._plugin_tag_lock:
+            plugin_to_tag_to_content = {
+                plugin_name: dict(tag_to_content)
+                for (
+                    plugin_name,
+                    tag_to_content,
+                ) in self._plugin_to_tag_to_content.items()
+            }
+        return {
+            "num_events_processed": self._num_events_processed,
+            "first_event_timestamp": self._first_event_timestamp,
+            "graph": self._graph,
+            "graph_from_metagraph": self._graph_from_metagraph,
+            "meta_graph": self._meta_graph,
+            "tagged_metadata": dict(self._tagged_metadata),
+            "summary_metadata": {
+                tag: metadata.SerializeToString()
+                for (tag, metadata) in self.summary_metadata.items()
+            },
+            "plugin_to_tag_to_content": plugin_to_tag_to_content,
+            "tensors_by_tag": {
+                tag: self._SaveReservoirState(tag_reservoir)
+                for (tag, tag_reservoir) in tensors_by_tag.items()
+            },
+            "seen_session_start": self._seen_session_start,
+            "most_recent_step": self.most_recent_step,
+            "most_recent_wall_time": self.most_recent_wall_time,
+            "file_version": self.file_version,
+            "source_writer": self._source_writer,
+        }
+
+    def RestoreState(self, state):
+        """Restores data and read position from a `SaveState` snapshot.
+
+        This must be called before any events are loaded. If the snapshot
+        was taken with different options, or any event file has since been
+        modified other than by appending, the snapshot is rejected and the
+        accumulator is left unchanged, so that it will load from scratch.
+
+        Args:
+          state: A dict returned by `SaveState`.
+
+        Returns:
+          True if the snapshot was restored, False if it was rejected.
+        """
+        with self._generator_mutex:
+            if self._num_events_processed:
+                raise RuntimeError(
+                    "Cannot restore state after events have been loaded"
+                )
+            if state["config"] != self._StateConfig():
+                logger.info(
+                    "Ignoring saved state for %s: options changed", self.path
+                )
+                return False
+            generator = _GeneratorFromPath(
+                self.path,
+                self._event_file_active_filter,
+                self._detect_file_replacement,
+                self._verify_data_crc,
+                self._index_only,
+            )
+            if not generator.RestoreState(state["generator"]):
+                logger.info(
+                    "Ignoring saved state for %s: files changed", self.path
+                )
+                return False
+            self._generator = generator
+            self._ImportDataLocked(state)
+            return True
+
+    def ImportData(self, data):
+        """Replaces all loaded data with a snapshot from `ExportData`.
+
+        The read position is unaffected, so this is only useful for an
+        accumulator whose events are loaded elsewhere and which is never
+        itself reloaded.
+
+        Args:
+          data: A dict returned by `ExportData` on an accumulator with the
+            same options.
+        """
+        with self._generator_mutex:
+            self._ImportDataLocked(data)
+
+    def _ImportDataLocked(self, state):
+        self._num_events_processed = state["num_events_processed"]
+        self._first_event_timestamp = state["first_event_timestamp"]
+        self._graph = state["graph"]
+        self._graph_from_metagraph = state["graph_from_metagraph"]
+        self._meta_graph = state["meta_graph"]
+        self._tagged_metadata = dict(state["tagged_metadata"])
+        self.summary_metadata = {
+            tag: summary_pb2.SummaryMetadata.FromString(metadata)
+            for (tag, metadata) in state["summary_metadata"].items()
+        }
+        with self._plugin_tag_lock:
+            self._plugin_to_tag_to_content.clear()
+            for plugin_name, tag_to_content in state[
+                "plugin_to_tag_to_content"
+            ].items():
+                self._plugin_to_tag_to_content[plugin_name] = dict(
+                    tag_to_content
+                )
+        tensors_by_tag = {}
+        for tag, reservoir_state in state["tensors_by_tag"].items():
+            if self._ShouldSpill(tag):
+                reservoir_state = _MapReservoirItems(
+                    reservoir_state, self._SpillTensorEvent
+                )
+            tensors_by_tag[tag] = self._NewTensorReservoir(tag)
+            tensors_by_tag[tag].RestoreState(reservoir_state)
+        with self._tensors_by_tag_lock:
+            (old_tensors_by_tag, self.tensors_by_tag) = (
+                self.tensors_by_tag,
+                tensors_by_tag,
+            )
+        _ReleaseBudgets(old_tensors_by_tag)
+        self._seen_session_start = state["seen_session_start"]
+        self.most_recent_step = state["most_recent_step"]
+        self.most_recent_wall_time = state["most_recent_wall_time"]
+        self.file_version = state["file_version"]
+        self._source_writer = state["source_writer"]
+
+    def _StateConfig(self):
+        """Options that must match for a saved state to be restored."""
+        return {
+            "size_guidance": dict(self._size_guidance),
+            "tensor_size_guidance": dict(self._tensor_size_guidance),
+            "purge_orphaned_data": self.purge_orphaned_data,
+            "max_bytes_per_tag": self._max_bytes_per_tag,
+            "index_only": self._index_only,
+            "generator": type(self._generator).__name__,
+        }
+
     def PluginAssets(self, plugin_name):
         """Return a list of all plugin assets for the given plugin.
 
@@ -253,6 +589,7 @@ class EventAccumulator:
             try:
                 event = next(self._generator.Load())
                 self._ProcessEvent(event)
+                self._Publish()
                 return self._first_event_timestamp
 
             except StopIteration:
@@ -266,6 +603,7 @@ class EventAccumulator:
             try:
                 event = next(self._generator.Load())
                 self._ProcessEvent(event)
+                self._Publish()
                 return self._source_writer
             except StopIteration:
                 logger.info(
@@ -327,6 +665,7 @@ class EventAccumulator:
 
     def _ProcessEvent(self, event):
         """Called whenever an event is loaded."""
+        self._num_events_processed += 1
         if self._first_event_timestamp is None:
             self._first_event_timestamp = event.wall_time
 
@@ -527,10 +866,81 @@ class EventAccumulator:
           KeyError: If the tag is not found.
 
         Returns:
-          An array of `TensorEvent`s.
+          A tuple of `TensorEvent`s, shared with other readers.
         """
         return self.tensors_by_tag[tag].Items(_TENSOR_RESERVOIR_KEY)
 
+    def TimeSeriesStats(self, tag):
+        """Given a summary tag, return summary statistics of its data.
+
+        This takes constant time, as the statistics are maintained as
+        data is loaded and purged.
+
+        Args:
+          tag: A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          A `reservoir.ItemStats`. Its `last` field is a `ScalarEvent` for
+          scalar time series and a `TensorEvent` otherwise.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        stats = tag_reservoir.Stats(_TENSOR_RESERVOIR_KEY)
+        if (
+            not isinstance(tag_reservoir, _ScalarReservoir)
+            and stats.last is not None
+            and self._IsScalarTag(tag)
+        ):
+            # See `Scalars`. Points that are not scalars are not kept in
+            # scalar time series, so neither are they reported here.
+            last = stats.last
+            if _NumElements(last.tensor_proto) == 1:
+                last = ScalarEvent(
+                    wall_time=last.wall_time,
+                    step=last.step,
+                    value=_ScalarValue(last.tensor_proto).item(),
+                )
+            else:
+                last = None
+            stats = dataclasses.replace(stats, last=last)
+        return stats
+
+    def Scalars(self, tag):
+        """Given a scalar summary tag, return its points in columnar form.
+
+        This is much cheaper than `Tensors` for scalar time series, which
+        are stored as arrays rather than as `TensorProto`s.
+
+        Args:
+          tag: A string tag whose summary metadata has data class
+            `DATA_CLASS_SCALAR`.
+
+        Raises:
+          KeyError: If the tag is not found or is not a scalar time series.
+
+        Returns:
+          A `ScalarSeries`.
+        """
+        tag_reservoir = self.tensors_by_tag[tag]
+        if isinstance(tag_reservoir, _ScalarReservoir):
+            return tag_reservoir.Series()
+        if not self._IsScalarTag(tag):
+            raise KeyError("Tag %r is not a scalar time series" % tag)
+        # The tag's first values were stored before its summary metadata
+        # was seen, so they are kept as `TensorEvent`s.
+        return _ScalarSeriesFromEvents(
+            tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)
+        )
+
+    def _IsScalarTag(self, tag):
+        summary_metadata = self.summary_metadata.get(tag)
+        return (
+            summary_metadata is not None
+            and summary_metadata.data_class == summary_pb2.DATA_CLASS_SCALAR
+        )
+
     def _MaybePurgeOrphanedData(self, event):
         """Maybe purge orphaned data due to a TensorFlow crash.
 
@@ -604,14 +1014,134 @@ class EventAccumulator:
             self._Purge(event, by_tags=True)
 
     def _ProcessTensor(self, tag, wall_time, step, tensor):
-        tv = TensorEvent(wall_time=wall_time, step=step, tensor_proto=tensor)
+        """Queues a tensor value, to be added by `_FlushTensors`."""
+        pending = self._pending_tensors.get(tag)
+        if pending is None:
+            pending = ([], [], [])
+            self._pending_tensors[tag] = pending
+        pending[0].append(wall_time)
+        pending[1].append(step)
+        pending[2].append(tensor)
+        self._num_pending_tensors += 1
+        if self._num_pending_tensors >= _INGEST_BATCH_SIZE:
+            self._FlushTensors()
+
+    def _FlushTensors(self):
+        """Adds the queued tensor values to their reservoirs, by tag.
+
+        Each reservoir is updated once per batch, so its locks are taken
+        once rather than once per value. Values of scalar time series are
+        added in bulk without creating a `TensorEvent` for each.
+
+        Must be called with the generator mutex held.
+        """
+        if not self._pending_tensors:
+            return
+        pending = self._pending_tensors
+        self._pending_tensors = {}
+        self._num_pending_tensors = 0
         with self._tensors_by_tag_lock:
-            if tag not in self.tensors_by_tag:
-                reservoir_size = self._GetTensorReservoirSize(tag)
-                self.tensors_by_tag[tag] = reservoir.Reservoir(reservoir_size)
-        self.tensors_by_tag[tag].AddItem(_TENSOR_RESERVOIR_KEY, tv)
+            for tag in pending:
+                if tag not in self.tensors_by_tag:
+                    self.tensors_by_tag[tag] = self._NewTensorReservoir(tag)
+            reservoirs = {tag: self.tensors_by_tag[tag] for tag in pending}
+        for tag, (wall_times, steps, tensors) in pending.items():
+            tag_reservoir = reservoirs[tag]
+            if isinstance(tag_reservoir, _ScalarReservoir):
+                num_dropped = tag_reservoir.AddPoints(
+                    steps, wall_times, tensors
+                )
+                if num_dropped:
+                    logger.warning(
+                        "Dropping %d malformed scalars for tag %r",
+                        num_dropped,
+                        tag,
+                    )
+                continue
+            events = [
+                TensorEvent(wall_time=wall_time, step=step, tensor_proto=tensor)
+                for (wall_time, step, tensor) in zip(wall_times, steps, tensors)
+            ]
+            if self._ShouldSpill(tag):
+                # Only spill the events that the reservoir keeps.
+                tag_reservoir.AddItems(
+                    _TENSOR_RESERVOIR_KEY, events, self._SpillTensorEvent
+                )
+            else:
+                tag_reservoir.AddItems(_TENSOR_RESERVOIR_KEY, events)
+
+    def _SaveReservoirState(self, tag_reservoir):
+        """Saves a reservoir, reading back any values in the blob store."""
+        state = tag_reservoir.SaveState()
+        if self._blob_store is not None and isinstance(
+            tag_reservoir, reservoir.Reservoir
+        ):
+            state = _MapReservoirItems(state, _UnspillTensorEvent)
+        return state
+
+    def _ShouldSpill(self, tag):
+        """Whether the values of `tag` belong in the blob store."""
+        if self._blob_store is None:
+            return False
+        summary_metadata = self.summary_metadata.get(tag)
+        return (
+            summary_metadata is not None
+            and summary_metadata.data_class
+            == summary_pb2.DATA_CLASS_BLOB_SEQUENCE
+        )
+
+    def _SpillTensorEvent(self, tensor_event):
+        """Moves the values of a string tensor to the blob store."""
+        tensor_proto = tensor_event.tensor_proto
+        if tensor_event.blob_ref is not None or (
+            tensor_proto.dtype != types_pb2.DT_STRING
+        ):
+            return tensor_event
+        return TensorEvent(
+            wall_time=tensor_event.wall_time,
+            step=tensor_event.step,
+            tensor_proto=tensor_pb2.TensorProto(
+                dtype=tensor_proto.dtype,
+                tensor_shape=tensor_proto.tensor_shape,
+            ),
+            blob_ref=self._blob_store.Put(tensor_proto.string_val),
+        )
+
+    def _NewTensorReservoir(self, tag):
+        """Creates the reservoir for a tag, based on its summary metadata.
+
+        Scalar time series get a columnar `_ScalarReservoir`; all others
+        get a `reservoir.Reservoir` of `TensorEvent`s.
+        """
+        reservoir_size = self._GetTensorReservoirSize(tag)
+        summary_metadata = self.summary_metadata.get(tag)
+        if self._IsScalarTag(tag):
+            return _ScalarReservoir(reservoir_size, deferred_publish=True)
+        byte_budgets = []
+        if summary_metadata is not None:
+            plugin_budget = self._plugin_byte_budgets.get(
+                summary_metadata.plugin_data.plugin_name
+            )
+            if plugin_budget is not None:
+                byte_budgets.append(plugin_budget)
+        if self._byte_budget is not None:
+            byte_budgets.append(self._byte_budget)
+        if not self._max_bytes_per_tag and not byte_budgets:
+            return reservoir.Reservoir(
+                reservoir_size, track_stats=True, deferred_publish=True
+            )
+        return reservoir.Reservoir(
+            reservoir_size,
+            track_stats=True,
+            size_fn=_TensorEventSize,
+            max_bytes=self._max_bytes_per_tag,
+            byte_budgets=byte_budgets,
+            deferred_publish=True,
+        )
 
     def _GetTensorReservoirSize(self, tag):
+        if self._index_only:
+            return 1
         default = self._size_guidance[TENSORS]
         summary_metadata = self.summary_metadata.get(tag)
         if summary_metadata is None:
@@ -642,6 +1172,8 @@ class EventAccumulator:
           by_tags: Bool to dictate whether to discard all out-of-order events or
             only those that are associated with the given reference event.
         """
+        # Queued values must be purged too.
+        self._FlushTensors()
         ## Keep data in reservoirs that has a step less than event.step
         _NotExpired = lambda x: x.step < event.step
 
@@ -691,18 +1223,575 @@ def _GetPurgeMessage(
     )
 
 
+class _ScalarReservoir:
+    """A reservoir of scalar points, stored as parallel typed arrays.
+
+    This is a drop-in replacement for a single-key `reservoir.Reservoir`
+    of `TensorEvent`s, for time series whose values are scalars. Storing
+    each point as a step, a wall time, and a value costs a couple dozen
+    bytes, instead of a `TensorEvent` plus a `TensorProto`.
+
+    Sampling decisions are made exactly as by `reservoir.Reservoir` with
+    the same size and seed, so switching storage does not change which
+    points are kept. Reads see published snapshots, also as with
+    `reservoir.Reservoir`; their arrays are read-only.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(
+        self, size, seed=0, always_keep_last=True, deferred_publish=False
+    ):
+        if size < 0 or size != round(size):
+            raise ValueError("size must be nonnegative integer, was %s" % size)
+        self.size = size
+        self.always_keep_last = always_keep_last
+        self._random = random.Random(seed)
+        self._num_items_seen = 0
+        self._length = 0
+        self._steps = np.empty(0, dtype=np.int64)
+        self._wall_times = np.empty(0, dtype=np.float64)
+        # The value dtype is taken from the first point added.
+        self._values = None
+        self._max_step = None
+        self._max_wall_time = None
+        self._mutex = threading.Lock()
+        self._deferred_publish = deferred_publish
+        # A tuple `(series, stats)` for readers, replaced as a whole, or
+        # None if it must be built on the next read.
+        self._published = None
+        self._dirty = False
+
+    def Keys(self):
+        with self._mutex:
+            return [_TENSOR_RESERVOIR_KEY] if self._values is not None else []
+
+    def AddItem(self, key, item, f=None):
+        """Adds a `TensorEvent` whose tensor has exactly one element.
+
+        Args:
+          key: Must be `_TENSOR_RESERVOIR_KEY`.
+          item: A `TensorEvent`.
+          f: Unsupported; present for interface compatibility.
+
+        Raises:
+          ValueError: If the tensor does not have exactly one element.
+        """
+        del key  # only one key
+        if f is not None:
+            raise TypeError("_ScalarReservoir does not support item transforms")
+        value = tensor_util.make_ndarray(item.tensor_proto)
+        if value.size != 1:
+            raise ValueError(
+                "Expected a scalar tensor, but got shape %r" % (value.shape,)
+            )
+        self._AddPoint(item.step, item.wall_time, value.reshape(()))
+
+    def AddItems(self, key, items, f=None):
+        """Adds `TensorEvent`s, as if by `AddItem` on each in turn.
+
+        Unlike `AddItem`, events whose tensors do not have exactly one
+        element are skipped rather than rejected.
+
+        Returns:
+          The number of events skipped.
+        """
+        del key  # only one key
+        if f is not None:
+            raise TypeError("_ScalarReservoir does not support item transforms")
+        return self.AddPoints(
+            [item.step for item in items],
+            [item.wall_time for item in items],
+            [item.tensor_proto for item in items],
+        )
+
+    def AddPoints(self, steps, wall_times, tensor_protos):
+        """Adds points in bulk, as if by `AddItem` on each in turn.
+
+        Points that fit while the reservoir has room are appended in
+        place. For the rest, the sampling decisions are made first, on
+        point indices, drawing the same random numbers as one `AddItem`
+        call per point would; the columns are only compacted if a stored
+        point is replaced. Only values of points that enter the reservoir
+        are decoded.
+
+        Args:
+          steps: A sequence of steps.
+          wall_times: A sequence of wall times, parallel to `steps`.
+          tensor_protos: A sequence of `TensorProto`s with the values,
+            parallel to `steps`.
+
+        Returns:
+          The number of points skipped because their tensor does not have
+          exactly one element.
+        """
+        valid = [
+            i
+            for (i, tensor_proto) in enumerate(tensor_protos)
+            if _NumElements(tensor_proto) == 1
+        ]
+        num_skipped = len(tensor_protos) - len(valid)
+        if not valid:
+            return num_skipped
+        with self._mutex:
+            if self.size == 0:
+                num_appended = len(valid)
+            else:
+                num_appended = min(len(valid), max(0, self.size - self._length))
+            n = self._length + num_appended
+            num_seen = self._num_items_seen + num_appended
+            # Indices of the kept points, built only once a stored point is
+            # deleted: below `n` for stored points, and `n + j` for the
+            # `j`th valid point of this batch. Until then, only the last
+            # point can be replaced, by the `last`th valid point.
+            kept = None
+            last = None
+            for j in range(num_appended, len(valid)):
+                r = self._random.randint(0, num_seen)
+                num_seen += 1
+                if r < self.size:
+                    if kept is None:
+                        kept = list(range(n))
+                        if last is not None:
+                            kept[-1] = n + last
+                    del kept[r]
+                    kept.append(n + j)
+                elif self.always_keep_last:
+                    if kept is None:
+                        last = j
+                    else:
+                        kept[-1] = n + j
+            self._num_items_seen = num_seen
+            if num_appended:
+                self._AppendPoints(
+                    [valid[j] for j in range(num_appended)],
+                    steps,
+                    wall_times,
+                    tensor_protos,
+                )
+            if kept is not None:
+                self._GatherPoints(
+                    kept, n, valid, steps, wall_times, tensor_protos
+                )
+            elif last is not None:
+                i = valid[last]
+                k = self._length - 1
+                removed = (int(self._steps[k]), float(self._wall_times[k]))
+                self._Set(
+                    k, steps[i], wall_times[i], _ScalarValue(tensor_protos[i])
+                )
+                self._UpdateStats(steps[i], wall_times[i], removed)
+            if num_appended or kept is not None or last is not None:
+                self._Changed()
+        return num_skipped
+
+    def _AppendPoints(self, points, steps, wall_times, tensor_protos):
+        """Appends the given points in place, growing storage as needed."""
+        values = [_ScalarValue(tensor_protos[i]) for i in points]
+        dtype = np.result_type(*[value.dtype for value in values])
+        if self._values is None:
+            self._values = np.empty(0, dtype=dtype)
+        elif not np.can_cast(dtype, self._values.dtype):
+            self._values = self._values.astype(
+                np.result_type(self._values.dtype, dtype)
+            )
+        start = self._length
+        end = start + len(points)
+        if end > len(self._steps):
+            self._Resize(max(self._INITIAL_CAPACITY, 2 * start, end))
+        new_steps = np.array([steps[i] for i in points], dtype=np.int64)
+        new_wall_times = np.array(
+            [wall_times[i] for i in points], dtype=self._wall_times.dtype
+        )
+        self._steps[start:end] = new_steps
+        self._wall_times[start:end] = new_wall_times
+        self._values[start:end] = values
+        self._length = end
+        max_step = int(new_steps.max())
+        if self._max_step is None or max_step > self._max_step:
+            self._max_step = max_step
+        max_wall_time = float(new_wall_times.max())
+        if self._max_wall_time is None or max_wall_time > self._max_wall_time:
+            self._max_wall_time = max_wall_time
+
+    def _GatherPoints(self, kept, n, valid, steps, wall_times, tensor_protos):
+        """Replaces the columns by the kept stored and new points.
+
+        Args:
+          kept: Indices of the kept points, as built by `AddPoints`: below
+            `n` for stored points, and `n + j` for the `j`th valid point.
+          n: The number of stored points.
+          valid: Indices into `steps` etc. of the valid points.
+          steps: As passed to `AddPoints`.
+          wall_times: As passed to `AddPoints`.
+          tensor_protos: As passed to `AddPoints`.
+        """
+        kept = np.array(kept, dtype=np.int64)
+        is_new = kept >= n
+        new_points = [valid[j] for j in (kept[is_new] - n).tolist()]
+        new_values = [_ScalarValue(tensor_protos[i]) for i in new_points]
+        dtypes = [self._values.dtype] + [value.dtype for value in new_values]
+        columns = []
+        for column, new, dtype in (
+            (self._steps, [steps[i] for i in new_points], np.int64),
+            (self._wall_times, [wall_times[i] for i in new_points], None),
+            (self._values, new_values, np.result_type(*dtypes)),
+        ):
+            dtype = dtype or column.dtype
+            result = np.empty(len(kept), dtype=dtype)
+            result[~is_new] = column[kept[~is_new]]
+            result[is_new] = np.array(new, dtype=dtype)
+            columns.append(result)
+        (self._steps, self._wall_times, self._values) = columns
+        self._length = len(kept)
+        self._RecomputeStats()
+
+    def _AddPoint(self, step, wall_time, value):
+        with self._mutex:
+            if self._length < self.size or self.size == 0:
+                self._Append(step, wall_time, value)
+                self._UpdateStats(step, wall_time, None)
+            else:
+                r = self._random.randint(0, self._num_items_seen)
+                if r < self.size:
+                    removed = (int(self._steps[r]), float(self._wall_times[r]))
+                    self._Delete(r)
+                    self._Append(step, wall_time, value)
+                    self._UpdateStats(step, wall_time, removed)
+                elif self.always_keep_last:
+                    i = self._length - 1
+                    removed = (int(self._steps[i]), float(self._wall_times[i]))
+                    self._Set(i, step, wall_time, value)
+                    self._UpdateStats(step, wall_time, removed)
+                else:
+                    self._num_items_seen += 1
+                    return
+            self._num_items_seen += 1
+            self._Changed()
+
+    def _Changed(self):
+        """Like `reservoir._ReservoirBucket._Changed`."""
+        if self._deferred_publish and self._published is not None:
+            self._dirty = True
+        else:
+            self._published = None
+
+    def _UpdateStats(self, step, wall_time, removed):
+        """Like `reservoir._ReservoirBucket._UpdateStats`."""
+        if removed is not None and (
+            step < removed[0] or wall_time < removed[1]
+        ):
+            self._RecomputeStats()
+            return
+        if self._max_step is None or step > self._max_step:
+            self._max_step = step
+        if self._max_wall_time is None or wall_time > self._max_wall_time:
+            self._max_wall_time = wall_time
+
+    def _RecomputeStats(self):
+        n = self._length
+        if n == 0:
+            self._max_step = None
+            self._max_wall_time = None
+        else:
+            self._max_step = int(self._steps[:n].max())
+            self._max_wall_time = float(self._wall_times[:n].max())
+
+    def _Append(self, step, wall_time, value):
+        if self._values is None:
+            self._values = np.empty(0, dtype=value.dtype)
+        if self._length == len(self._steps):
+            self._Resize(max(self._INITIAL_CAPACITY, 2 * self._length))
+        self._Set(self._length, step, wall_time, value)
+        self._length += 1
+
+    def _Set(self, i, step, wall_time, value):
+        if not np.can_cast(value.dtype, self._values.dtype):
+            self._values = self._values.astype(
+                np.result_type(self._values.dtype, value.dtype)
+            )
+        self._steps[i] = step
+        self._wall_times[i] = wall_time
+        self._values[i] = value
+
+    def _Delete(self, i):
+        n = self._length
+        for column in (self._steps, self._wall_times, self._values):
+            column[i : n - 1] = column[i + 1 : n]
+        self._length -= 1
+
+    def _Resize(self, capacity):
+        n = self._length
+        (self._steps, self._wall_times, self._values) = (
+            np.concatenate(
+                [column[:n], np.empty(capacity - n, dtype=column.dtype)]
+            )
+            for column in (self._steps, self._wall_times, self._values)
+        )
+
+    def Publish(self):
+        """Makes the current points visible to readers."""
+        with self._mutex:
+            if self._published is None or self._dirty:
+                self._PublishLocked()
+
+    def _PublishLocked(self):
+        n = self._length
+        if self._values is None:
+            columns = (
+                np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.float64),
+                np.empty(0, dtype=np.float64),
+            )
+        else:
+            columns = (
+                self._steps[:n].copy(),
+                self._wall_times[:n].copy(),
+                self._values[:n].copy(),
+            )
+        for column in columns:
+            column.flags.writeable = False
+        series = ScalarSeries(*columns)
+        last = None
+        if n:
+            last = ScalarEvent(
+                wall_time=float(series.wall_time[-1]),
+                step=int(series.step[-1]),
+                value=series.value[-1].item(),
+            )
+        stats = reservoir.ItemStats(
+            count=n,
+            max_step=self._max_step,
+            max_wall_time=self._max_wall_time,
+            last=last,
+        )
+        self._published = (series, stats)
+        self._dirty = False
+
+    def _Published(self):
+        published = self._published
+        if published is None:
+            with self._mutex:
+                if self._published is None:
+                    self._PublishLocked()
+                published = self._published
+        return published
+
+    def Series(self):
+        """Returns a `ScalarSeries` of the published points.
+
+        Its arrays are read-only, and shared with other readers.
+        """
+        return self._Published()[0]
+
+    def Stats(self, key):
+        """Returns a `reservoir.ItemStats` whose `last` is a `ScalarEvent`."""
+        if key != _TENSOR_RESERVOIR_KEY:
+            raise KeyError("Key %s was not found in Reservoir" % key)
+        return self._Published()[1]
+
+    def Items(self, key):
+        """Returns the stored points as `TensorEvent`s.
+
+        This rebuilds a `TensorProto` per point, so prefer `Series` where
+        possible.
+        """
+        if key != _TENSOR_RESERVOIR_KEY:
+            raise KeyError("Key %s was not found in Reservoir" % key)
+        series = self.Series()
+        return [
+            TensorEvent(
+                wall_time=wall_time,
+                step=step,
+                tensor_proto=tensor_util.make_tensor_proto(value),
+            )
+            for (step, wall_time, value) in zip(
+                series.step.tolist(), series.wall_time.tolist(), series.value
+            )
+        ]
+
+    def FilterItems(self, filterFn, key=None):
+        """Filters points, with the same semantics as `reservoir.Reservoir`.
+
+        Args:
+          filterFn: A function that takes a `ScalarEvent` and returns True
+            for the points to be kept.
+          key: An optional key; only `_TENSOR_RESERVOIR_KEY` has points.
+
+        Returns:
+          The number of points removed.
+        """
+        if key is not None and key != _TENSOR_RESERVOIR_KEY:
+            return 0
+        with self._mutex:
+            n = self._length
+            if n == 0:
+                self._num_items_seen = 0
+                return 0
+            keep = np.fromiter(
+                (
+                    filterFn(
+                        ScalarEvent(wall_time=wall_time, step=step, value=value)
+                    )
+                    for (step, wall_time, value) in zip(
+                        self._steps[:n].tolist(),
+                        self._wall_times[:n].tolist(),
+                        self._values[:n].tolist(),
+                    )
+                ),
+                dtype=bool,
+                count=n,
+            )
+            self._steps = self._steps[:n][keep]
+            self._wall_times = self._wall_times[:n][keep]
+            self._values = self._values[:n][keep]
+            self._length = len(self._steps)
+            # Same estimate as `reservoir._ReservoirBucket.FilterItems`.
+            prop_remaining = self._length / float(n)
+            self._num_items_seen = int(
+                round(self._num_items_seen * prop_remaining)
+            )
+            self._RecomputeStats()
+            if self._length != n:
+                self._Changed()
+            return n - self._length
+
+    def SaveState(self):
+        """Returns the points and sampling state of the reservoir.
+
+        Unlike reads, this includes points not yet published.
+        """
+        with self._mutex:
+            n = self._length
+            return {
+                "step": self._steps[:n].copy(),
+                "wall_time": self._wall_times[:n].copy(),
+                "value": (
+                    self._values[:n].copy()
+                    if self._values is not None
+                    else None
+                ),
+                "num_items_seen": self._num_items_seen,
+                "random_state": self._random.getstate(),
+            }
+
+    def RestoreState(self, state):
+        """Restores points and sampling state saved by `SaveState`."""
+        with self._mutex:
+            self._steps = np.array(state["step"], dtype=np.int64)
+            self._wall_times = np.array(state["wall_time"], dtype=np.float64)
+            if state["value"] is None:
+                self._values = None
+            else:
+                self._values = np.array(state["value"])
+            self._length = len(self._steps)
+            self._num_items_seen = state["num_items_seen"]
+            self._random.setstate(state["random_state"])
+            self._RecomputeStats()
+            self._PublishLocked()
+
+
+def _NumElements(tensor_proto):
+    """Returns the number of elements of a tensor, from its shape."""
+    num_elements = 1
+    for dim in tensor_proto.tensor_shape.dim:
+        num_elements *= dim.size
+    return num_elements
+
+
+def _ScalarValue(tensor_proto):
+    """Decodes the value of a one-element tensor as a 0-d array.
+
+    Same as `tensor_util.make_ndarray(tensor_proto).reshape(())`, with a
+    fast path for the common float dtypes.
+    """
+    if tensor_proto.dtype == types_pb2.DT_FLOAT:
+        if len(tensor_proto.float_val) == 1:
+            return np.array(tensor_proto.float_val[0], dtype=np.float32)
+    elif tensor_proto.dtype == types_pb2.DT_DOUBLE:
+        if len(tensor_proto.double_val) == 1:
+            return np.array(tensor_proto.double_val[0], dtype=np.float64)
+    return tensor_util.make_ndarray(tensor_proto).reshape(())
+
+
+def _ScalarSeriesFromEvents(tensor_events):
+    """Converts `TensorEvent`s to a `ScalarSeries`, skipping non-scalars."""
+    tensor_events = [
+        e for e in tensor_events if _NumElements(e.tensor_proto) == 1
+    ]
+    values = [_ScalarValue(e.tensor_proto) for e in tensor_events]
+    dtype = (
+        np.result_type(*[value.dtype for value in values])
+        if values
+        else np.float64
+    )
+    columns = (
+        np.array([e.step for e in tensor_events], dtype=np.int64),
+        np.array([e.wall_time for e in tensor_events], dtype=np.float64),
+        np.array(values, dtype=dtype),
+    )
+    for column in columns:
+        column.flags.writeable = False
+    return ScalarSeries(*columns)
+
+
+def _UnspillTensorEvent(tensor_event):
+    """Returns a `TensorEvent` with the values read back from its blob ref."""
+    if tensor_event.blob_ref is None:
+        return tensor_event
+    tensor_proto = tensor_pb2.TensorProto()
+    tensor_proto.CopyFrom(tensor_event.tensor_proto)
+    tensor_proto.string_val.extend(tensor_event.blob_ref.ReadAll())
+    return TensorEvent(
+        wall_time=tensor_event.wall_time,
+        step=tensor_event.step,
+        tensor_proto=tensor_proto,
+    )
+
+
+def _MapReservoirItems(reservoir_state, fn):
+    """Applies `fn` to the items of a `reservoir.Reservoir` state."""
+    return {
+        key: dict(bucket_state, items=[fn(x) for x in bucket_state["items"]])
+        for (key, bucket_state) in reservoir_state.items()
+    }
+
+
+def _TensorEventSize(tensor_event):
+    return tensor_event.tensor_proto.ByteSize()
+
+
+def _ReleaseBudgets(tensors_by_tag):
+    """Releases the shared byte budgets of discarded tensor reservoirs."""
+    for tag_reservoir in tensors_by_tag.values():
+        if isinstance(tag_reservoir, reservoir.Reservoir):
+            tag_reservoir.ReleaseBudgets()
+
+
 def _GeneratorFromPath(
-    path, event_file_active_filter=None, detect_file_replacement=None
+    path,
+    event_file_active_filter=None,
+    detect_file_replacement=None,
+    verify_data_crc=True,
+    index_only=False,
 ):
     """Create an event generator for file or directory at given path string."""
     if not path:
         raise ValueError("path must be a valid string")
     if io_wrapper.IsSummaryEventsFile(path):
-        return event_file_loader.EventFileLoader(path, detect_file_replacement)
+        return event_file_loader.EventFileLoader(
+            path,
+            detect_file_replacement,
+            verify_data_crc,
+            index_only=index_only,
+        )
     elif event_file_active_filter:
         loader_factory = (
             lambda path: event_file_loader.TimestampedEventFileLoader(
-                path, detect_file_replacement
+                path,
+                detect_file_replacement,
+                verify_data_crc,
+                index_only=index_only,
             )
         )
         return directory_loader.DirectoryLoader(
@@ -713,7 +1802,10 @@ def _GeneratorFromPath(
         )
     else:
         loader_factory = lambda path: event_file_loader.EventFileLoader(
-            path, detect_file_replacement
+            path,
+            detect_file_replacement,
+            verify_data_crc,
+            index_only=index_only,
         )
         return directory_watcher.DirectoryWatcher(
             path,
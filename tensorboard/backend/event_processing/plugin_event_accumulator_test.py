@@ -15,6 +15,7 @@
 
 
 import os
+import pickle
 from unittest import mock
 
 import numpy as np
@@ -22,7 +23,9 @@ import tensorflow as tf
 
 from tensorboard import data_compat
 from tensorboard import dataclass_compat
+from tensorboard.backend.event_processing import blob_store
 from tensorboard.backend.event_processing import plugin_event_accumulator as ea
+from tensorboard.backend.event_processing import reservoir
 from tensorboard.compat.proto import config_pb2
 from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import graph_pb2
@@ -84,6 +87,25 @@ class _EventGenerator:
         )
         self.AddEvent(event)
 
+    def AddScalarSummary(self, tag, wall_time=0, step=0, value=0):
+        """Add a scalar plugin summary event, with data class scalar."""
+        tensor = tensor_util.make_tensor_proto(np.float32(value))
+        metadata = scalar_metadata.create_summary_metadata(
+            display_name=tag, description=""
+        )
+        event = event_pb2.Event(
+            wall_time=wall_time,
+            step=step,
+            summary=summary_pb2.Summary(
+                value=[
+                    summary_pb2.Summary.Value(
+                        tag=tag, metadata=metadata, tensor=tensor
+                    )
+                ]
+            ),
+        )
+        self.AddEvent(event)
+
     def AddEvent(self, event):
         event = event_pb2.Event.FromString(event.SerializeToString())
         if self.zero_out_timestamps:
@@ -475,6 +497,96 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
             [scalar_metadata.PLUGIN_NAME, graph_metadata.PLUGIN_NAME],
         )
 
+    def testScalars(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        for step in range(5):
+            gen.AddScalarSummary(
+                "loss", wall_time=10 + step, step=step, value=step / 4
+            )
+        gen.AddScalarTensor("untyped", step=1, value=2)
+        acc.Reload()
+
+        series = acc.Scalars("loss")
+        np.testing.assert_array_equal(series.step, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(series.wall_time, [10, 11, 12, 13, 14])
+        np.testing.assert_array_equal(series.value, [0, 0.25, 0.5, 0.75, 1])
+        self.assertEqual(series.value.dtype, np.float32)
+        # `Tensors` still works for scalar time series.
+        tensors = acc.Tensors("loss")
+        self.assertEqual([t.step for t in tensors], [0, 1, 2, 3, 4])
+        self.assertEqual(
+            [tensor_util.make_ndarray(t.tensor_proto).item() for t in tensors],
+            [0, 0.25, 0.5, 0.75, 1],
+        )
+        with self.assertRaises(KeyError):
+            acc.Scalars("untyped")
+        with self.assertRaises(KeyError):
+            acc.Scalars("missing")
+
+    def testTimeSeriesStats(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        gen.AddEvent(
+            event_pb2.Event(wall_time=0, step=0, file_version="brain.Event:1")
+        )
+        for step in (100, 200, 300):
+            gen.AddScalarSummary("loss", wall_time=step, step=step, value=1.5)
+            gen.AddScalarTensor("untyped", wall_time=step, step=step, value=2)
+        acc.Reload()
+
+        stats = acc.TimeSeriesStats("loss")
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.max_step, 300)
+        self.assertEqual(stats.max_wall_time, 300)
+        self.assertEqual(
+            stats.last, ea.ScalarEvent(wall_time=300, step=300, value=1.5)
+        )
+        stats = acc.TimeSeriesStats("untyped")
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.max_step, 300)
+        self.assertEqual(stats.last.step, 300)
+
+        # Purging orphaned data updates the statistics.
+        gen.AddScalarSummary("loss", wall_time=400, step=150, value=2.5)
+        acc.Reload()
+        stats = acc.TimeSeriesStats("loss")
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.max_step, 150)
+        self.assertEqual(stats.max_wall_time, 400)
+        self.assertEqual(stats.last.value, 2.5)
+        with self.assertRaises(KeyError):
+            acc.TimeSeriesStats("missing")
+
+    def testScalars_purgedAfterRestart(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        gen.AddEvent(
+            event_pb2.Event(wall_time=0, step=0, file_version="brain.Event:1")
+        )
+        for step in (100, 200, 300, 101):
+            gen.AddScalarSummary("s1", wall_time=1, step=step, value=step)
+        acc.Reload()
+        np.testing.assert_array_equal(acc.Scalars("s1").step, [100, 101])
+        np.testing.assert_array_equal(acc.Scalars("s1").value, [100, 101])
+
+    def testExportAndImportData(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        gen.AddScalarSummary("loss", wall_time=10, step=1, value=0.5)
+        gen.AddScalarTensor("untyped", step=1, value=2)
+        acc.Reload()
+
+        replica = ea.EventAccumulator("path/is/ignored")
+        replica.ImportData(pickle.loads(pickle.dumps(acc.ExportData())))
+        self.assertEqual(replica.Tags(), acc.Tags())
+        self.assertEqual(replica.NumEventsProcessed(), 2)
+        self.assertEqual(
+            replica.SummaryMetadata("loss"), acc.SummaryMetadata("loss")
+        )
+        np.testing.assert_array_equal(replica.Scalars("loss").value, [0.5])
+        self.assertEqual(replica.Tensors("untyped"), acc.Tensors("untyped"))
+
     def testNewStyleAudioSummary(self):
         """Verify processing of tensorboard.plugins.audio.summary."""
         event_sink = _EventGenerator(self, zero_out_timestamps=True)
@@ -683,6 +795,370 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
             expected_count=size_small,
         )
 
+    def _addBlobEvents(self, gen, tag, plugin_name, steps, blob_size):
+        metadata = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name=plugin_name
+            ),
+            data_class=summary_pb2.DATA_CLASS_BLOB_SEQUENCE,
+        )
+        for step in steps:
+            tensor = tensor_util.make_tensor_proto(
+                [b"x" * blob_size], dtype=tf.string
+            )
+            gen.AddEvent(
+                event_pb2.Event(
+                    wall_time=step,
+                    step=step,
+                    summary=summary_pb2.Summary(
+                        value=[
+                            summary_pb2.Summary.Value(
+                                tag=tag, metadata=metadata, tensor=tensor
+                            )
+                        ]
+                    ),
+                )
+            )
+
+    def testMaxBytesPerTag(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(
+            gen, tensor_size_guidance={"images": 20}, max_bytes_per_tag=10000
+        )
+        self._addBlobEvents(gen, "big", "images", range(100), 1000)
+        self._addBlobEvents(gen, "small", "images", range(100), 10)
+        gen.AddScalarSummary("loss", step=1, value=1.0)
+        acc.Reload()
+        big = acc.Tensors("big")
+        self.assertBetween(len(big), 5, 9)
+        self.assertEqual(big[-1].step, 99)
+        self.assertLessEqual(sum(t.tensor_proto.ByteSize() for t in big), 10000)
+        # Small tags are limited by count as usual.
+        self.assertLen(acc.Tensors("small"), 20)
+        self.assertLen(acc.Tensors("loss"), 1)
+
+    def testByteBudgets(self):
+        plugin_budget = reservoir.ByteBudget(10000)
+        budget = reservoir.ByteBudget(50000)
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(
+            gen,
+            tensor_size_guidance={"images": 100},
+            plugin_byte_budgets={"images": plugin_budget},
+            byte_budget=budget,
+        )
+        self._addBlobEvents(gen, "a", "images", range(100), 1000)
+        self._addBlobEvents(gen, "b", "audio", range(100), 1000)
+        acc.Reload()
+        self.assertLessEqual(plugin_budget.num_bytes, 10000)
+        self.assertLessEqual(budget.num_bytes, 50000)
+        self.assertBetween(len(acc.Tensors("a")), 5, 9)
+        self.assertEqual(
+            budget.num_bytes,
+            sum(
+                t.tensor_proto.ByteSize()
+                for tag in ("a", "b")
+                for t in acc.Tensors(tag)
+            ),
+        )
+        acc.ReleaseBudgets()
+        self.assertEqual(plugin_budget.num_bytes, 0)
+        self.assertEqual(budget.num_bytes, 0)
+
+    def testBlobStore(self):
+        store = blob_store.BlobStore(self.get_temp_dir())
+        self.addCleanup(store.Close)
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(
+            gen, tensor_size_guidance={"images": 5}, blob_store=store
+        )
+        self._addBlobEvents(gen, "img", "images", range(20), 100)
+        gen.AddScalarSummary("loss", step=1, value=1.0)
+        acc.Reload()
+        events = acc.Tensors("img")
+        self.assertLen(events, 5)
+        self.assertEqual(events[-1].step, 19)
+        for event in events:
+            self.assertEqual(event.blob_ref.ReadAll(), [b"x" * 100])
+            self.assertEmpty(event.tensor_proto.string_val)
+            self.assertEqual(event.tensor_proto.tensor_shape.dim[0].size, 1)
+        self.assertIsNone(acc.Tensors("loss")[0].blob_ref)
+
+        # Exported data holds the values themselves, and importing it
+        # moves them to the importer's store, if any.
+        data = pickle.loads(pickle.dumps(acc.ExportData()))
+        plain = ea.EventAccumulator("path/is/ignored")
+        plain.ImportData(data)
+        self.assertEqual(
+            [e.tensor_proto.string_val for e in plain.Tensors("img")],
+            [[b"x" * 100]] * 5,
+        )
+        self.assertIsNone(plain.Tensors("img")[0].blob_ref)
+        spilled = ea.EventAccumulator("path/is/ignored", blob_store=store)
+        spilled.ImportData(data)
+        self.assertEqual(
+            [e.blob_ref.ReadAll() for e in spilled.Tensors("img")],
+            [[b"x" * 100]] * 5,
+        )
+
+    def testReloadPublishesData(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        gen.AddScalarSummary("loss", step=0, value=1.0)
+        gen.AddScalarTensor("t", step=0, value=1.0)
+        acc.Reload()
+        scalars = acc.Scalars("loss")
+        tensors = acc.Tensors("t")
+        gen.AddScalarSummary("loss", step=1, value=2.0)
+        gen.AddScalarTensor("t", step=1, value=2.0)
+        # Snapshots are reused until new data is published.
+        self.assertIs(acc.Scalars("loss"), scalars)
+        self.assertIs(acc.Tensors("t"), tensors)
+        acc.Reload()
+        self.assertEqual(acc.Scalars("loss").step.tolist(), [0, 1])
+        self.assertEqual([e.step for e in acc.Tensors("t")], [0, 1])
+        self.assertLen(tensors, 1)
+
+    def testIndexOnly(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen, index_only=True)
+        self.assertTrue(acc.index_only)
+        for step in range(10):
+            gen.AddScalarSummary("loss", step=step, value=step * 0.5)
+        self._addBlobEvents(gen, "img", "images", range(10), 100)
+        acc.Reload()
+        self.assertEqual(acc.Scalars("loss").step.tolist(), [9])
+        self.assertEqual(acc.TimeSeriesStats("loss").last.value, 4.5)
+        self.assertEqual([e.step for e in acc.Tensors("img")], [9])
+
+    def testReduceToIndex(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen, tensor_size_guidance={"images": 0})
+        for step in range(10):
+            gen.AddScalarSummary("loss", step=step, value=step * 0.5)
+        self._addBlobEvents(gen, "img", "images", range(10), 100)
+        acc.Reload()
+        self.assertLen(acc.Tensors("img"), 10)
+
+        acc.ReduceToIndex()
+        self.assertTrue(acc.index_only)
+        self.assertEqual(acc.Scalars("loss").step.tolist(), [9])
+        self.assertEqual(acc.Scalars("loss").value.tolist(), [4.5])
+        self.assertEqual([e.step for e in acc.Tensors("img")], [9])
+        self.assertEqual(
+            acc.SummaryMetadata("img").plugin_data.plugin_name, "images"
+        )
+
+        # Loading continues from where it was.
+        gen.AddScalarSummary("loss", step=10, value=5.0)
+        acc.Reload()
+        self.assertEqual(acc.Scalars("loss").step.tolist(), [10])
+
+
+class ScalarReservoirTest(tf.test.TestCase):
+    def _scalar_event(self, i):
+        return ea.TensorEvent(
+            wall_time=1000.0 + i,
+            step=i,
+            tensor_proto=tensor_util.make_tensor_proto(np.float32(i)),
+        )
+
+    def _assertSameItems(self, scalar_reservoir, tensor_reservoir):
+        expected = tensor_reservoir.Items(ea._TENSOR_RESERVOIR_KEY)
+        series = scalar_reservoir.Series()
+        self.assertEqual(series.step.tolist(), [e.step for e in expected])
+        self.assertEqual(
+            series.wall_time.tolist(), [e.wall_time for e in expected]
+        )
+
+    def testSamplesLikeReservoir(self):
+        scalar_reservoir = ea._ScalarReservoir(10)
+        tensor_reservoir = reservoir.Reservoir(10)
+        for i in range(1000):
+            event = self._scalar_event(i)
+            scalar_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+            tensor_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+        self._assertSameItems(scalar_reservoir, tensor_reservoir)
+
+        keep = lambda x: x.step % 3 != 0
+        self.assertEqual(
+            scalar_reservoir.FilterItems(keep, ea._TENSOR_RESERVOIR_KEY),
+            tensor_reservoir.FilterItems(keep, ea._TENSOR_RESERVOIR_KEY),
+        )
+        for i in range(1000, 1500):
+            event = self._scalar_event(i)
+            scalar_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+            tensor_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+        self._assertSameItems(scalar_reservoir, tensor_reservoir)
+
+    def testAddItemsSamplesLikeAddItem(self):
+        key = ea._TENSOR_RESERVOIR_KEY
+        for always_keep_last in (True, False):
+            one_by_one = ea._ScalarReservoir(
+                10, always_keep_last=always_keep_last
+            )
+            batched = ea._ScalarReservoir(10, always_keep_last=always_keep_last)
+            for start in range(0, 1000, 7):
+                events = [
+                    self._scalar_event(i)
+                    for i in range(start, min(start + 7, 1000))
+                ]
+                for event in events:
+                    one_by_one.AddItem(key, event)
+                self.assertEqual(batched.AddItems(key, events), 0)
+            expected = one_by_one.Series()
+            actual = batched.Series()
+            for field in ("step", "wall_time", "value"):
+                np.testing.assert_array_equal(
+                    getattr(actual, field), getattr(expected, field)
+                )
+            self.assertEqual(actual.value.dtype, expected.value.dtype)
+            self.assertEqual(batched.Stats(key), one_by_one.Stats(key))
+            self.assertEqual(
+                batched.SaveState()["num_items_seen"],
+                one_by_one.SaveState()["num_items_seen"],
+            )
+
+    def testAddPointsMatchesAddItemAcrossSizes(self):
+        key = ea._TENSOR_RESERVOIR_KEY
+        events = [self._scalar_event(i) for i in range(5000)]
+        for size in (0, 100, 3000, 10000):
+            one_by_one = ea._ScalarReservoir(size)
+            batched = ea._ScalarReservoir(size)
+            for event in events:
+                one_by_one.AddItem(key, event)
+            for start in range(0, len(events), 1024):
+                batched.AddItems(key, events[start : start + 1024])
+            expected = one_by_one.Series()
+            actual = batched.Series()
+            for field in ("step", "wall_time", "value"):
+                np.testing.assert_array_equal(
+                    getattr(actual, field), getattr(expected, field)
+                )
+            self.assertEqual(batched.Stats(key), one_by_one.Stats(key))
+
+    def testAddPointsAppendsInPlace(self):
+        scalar_reservoir = ea._ScalarReservoir(0)
+        key = ea._TENSOR_RESERVOIR_KEY
+        scalar_reservoir.AddItems(
+            key, [self._scalar_event(i) for i in range(100)]
+        )
+        steps = scalar_reservoir._steps
+        # Storage grows geometrically, and is not rebuilt by later
+        # batches that fit, so unbounded ingestion takes linear time.
+        self.assertGreaterEqual(len(steps), 100)
+        scalar_reservoir.AddItems(
+            key, [self._scalar_event(i) for i in range(100, len(steps))]
+        )
+        self.assertIs(scalar_reservoir._steps, steps)
+        np.testing.assert_array_equal(
+            scalar_reservoir.Series().step, np.arange(len(steps))
+        )
+
+    def testAddPointsSkipsNonScalars(self):
+        scalar_reservoir = ea._ScalarReservoir(0)
+        tensor_protos = [
+            tensor_util.make_tensor_proto(np.float32(1.0)),
+            tensor_util.make_tensor_proto([1.0, 2.0]),
+            tensor_util.make_tensor_proto(np.float64(3.0)),
+            tensor_util.make_tensor_proto([4], dtype=np.int32),
+        ]
+        num_skipped = scalar_reservoir.AddPoints(
+            [0, 1, 2, 3], [10.0, 11.0, 12.0, 13.0], tensor_protos
+        )
+        self.assertEqual(num_skipped, 1)
+        series = scalar_reservoir.Series()
+        self.assertEqual(series.step.tolist(), [0, 2, 3])
+        self.assertEqual(series.value.tolist(), [1.0, 3.0, 4.0])
+        self.assertEqual(series.value.dtype, np.float64)
+
+    def testDeferredPublish(self):
+        scalar_reservoir = ea._ScalarReservoir(10, deferred_publish=True)
+        key = ea._TENSOR_RESERVOIR_KEY
+        scalar_reservoir.AddItem(key, self._scalar_event(0))
+        series = scalar_reservoir.Series()
+        self.assertEqual(series.step.tolist(), [0])
+        self.assertFalse(series.step.flags.writeable)
+        scalar_reservoir.AddItem(key, self._scalar_event(1))
+        self.assertIs(scalar_reservoir.Series(), series)
+        self.assertEqual(scalar_reservoir.Stats(key).max_step, 0)
+        self.assertLen(scalar_reservoir.SaveState()["step"], 2)
+        scalar_reservoir.Publish()
+        self.assertEqual(scalar_reservoir.Series().step.tolist(), [0, 1])
+        self.assertEqual(scalar_reservoir.Stats(key).last.step, 1)
+        self.assertEqual(series.step.tolist(), [0])
+
+    def testUnboundedSize(self):
+        scalar_reservoir = ea._ScalarReservoir(0)
+        for i in range(100):
+            scalar_reservoir.AddItem(
+                ea._TENSOR_RESERVOIR_KEY, self._scalar_event(i)
+            )
+        np.testing.assert_array_equal(
+            scalar_reservoir.Series().value, np.arange(100)
+        )
+
+    def testWidensValueDtype(self):
+        scalar_reservoir = ea._ScalarReservoir(0)
+        scalar_reservoir.AddItem(
+            ea._TENSOR_RESERVOIR_KEY, self._scalar_event(1)
+        )
+        event = ea.TensorEvent(
+            wall_time=0.0,
+            step=2,
+            tensor_proto=tensor_util.make_tensor_proto(np.float64(0.1)),
+        )
+        scalar_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+        series = scalar_reservoir.Series()
+        self.assertEqual(series.value.dtype, np.float64)
+        self.assertEqual(series.value.tolist(), [1.0, 0.1])
+
+    def testRejectsNonScalar(self):
+        scalar_reservoir = ea._ScalarReservoir(0)
+        event = ea.TensorEvent(
+            wall_time=0.0,
+            step=0,
+            tensor_proto=tensor_util.make_tensor_proto([1.0, 2.0]),
+        )
+        with self.assertRaises(ValueError):
+            scalar_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+        self.assertEmpty(scalar_reservoir.Series().step)
+
+    def testSaveAndRestoreState(self):
+        original = ea._ScalarReservoir(5)
+        for i in range(20):
+            original.AddItem(ea._TENSOR_RESERVOIR_KEY, self._scalar_event(i))
+        restored = ea._ScalarReservoir(5)
+        restored.RestoreState(original.SaveState())
+        for i in range(20, 40):
+            original.AddItem(ea._TENSOR_RESERVOIR_KEY, self._scalar_event(i))
+            restored.AddItem(ea._TENSOR_RESERVOIR_KEY, self._scalar_event(i))
+        self.assertEqual(
+            restored.Series().step.tolist(), original.Series().step.tolist()
+        )
+        self.assertEqual(
+            restored.Stats(ea._TENSOR_RESERVOIR_KEY),
+            original.Stats(ea._TENSOR_RESERVOIR_KEY),
+        )
+
+    def testStatsMatchReservoir(self):
+        scalar_reservoir = ea._ScalarReservoir(10)
+        tensor_reservoir = reservoir.Reservoir(10, track_stats=True)
+        for i in range(1000):
+            event = ea.TensorEvent(
+                wall_time=float(i % 89),
+                step=i % 97,
+                tensor_proto=tensor_util.make_tensor_proto(np.float32(i)),
+            )
+            scalar_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+            tensor_reservoir.AddItem(ea._TENSOR_RESERVOIR_KEY, event)
+            actual = scalar_reservoir.Stats(ea._TENSOR_RESERVOIR_KEY)
+            expected = tensor_reservoir.Stats(ea._TENSOR_RESERVOIR_KEY)
+            self.assertEqual(actual.count, expected.count)
+            self.assertEqual(actual.max_step, expected.max_step)
+            self.assertEqual(actual.max_wall_time, expected.max_wall_time)
+            self.assertEqual(actual.last.step, expected.last.step)
+
 
 class RealisticEventAccumulatorTest(EventAccumulatorTest):
     def testTensorsRealistically(self):
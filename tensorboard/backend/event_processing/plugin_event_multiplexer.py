@@ -15,9 +15,12 @@
 """Provides an interface for working with multiple event files."""
 
 
+import concurrent.futures
+import dataclasses
 import os
 import queue
 import threading
+import time
 
 from typing import Optional
 
@@ -26,12 +29,34 @@ from tensorboard.backend.event_processing import (
     plugin_event_accumulator as event_accumulator,
 )
 from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.backend.event_processing import process_reloader
+from tensorboard.backend.event_processing import reservoir
 from tensorboard.util import tb_logging
 
 
 logger = tb_logging.get_logger()
 
 
+@dataclasses.dataclass(frozen=True)
+class ReloadStats:
+    """Statistics about one call to `EventMultiplexer.Reload`.
+
+    Attributes:
+      num_reloaded: The number of runs whose accumulators were reloaded.
+      num_skipped: The number of runs skipped because none of their event
+        files had changed since the previous reload (only with
+        `reload_incremental`).
+      duration_secs: Wall time taken by the reload, in seconds.
+      num_deferred: The number of runs not reloaded because they were not
+        yet due (only with a `reload_scheduler`).
+    """
+
+    num_reloaded: int
+    num_skipped: int
+    duration_secs: float
+    num_deferred: int = 0
+
+
 class EventMultiplexer:
     """An `EventMultiplexer` manages access to multiple `EventAccumulator`s.
 
@@ -68,6 +93,8 @@ class EventMultiplexer:
       (if necessary) and then periodically pick up new runs, use
       `AutoloadingMultiplexer`
     @@Tensors
+    @@Generation
+    @@RunGenerations
     """
 
     def __init__(
@@ -79,6 +106,17 @@ class EventMultiplexer:
         max_reload_threads=None,
         event_file_active_filter=None,
         detect_file_replacement=None,
+        verify_data_crc=True,
+        ingest_cache=None,
+        reload_incremental=False,
+        max_reload_processes=None,
+        max_bytes_per_tag=0,
+        bytes_per_plugin=None,
+        max_tensor_bytes=0,
+        blob_store=None,
+        load_on_demand=False,
+        idle_run_ttl_secs=0,
+        reload_scheduler=None,
     ):
         """Constructor for the `EventMultiplexer`.
 
@@ -103,7 +141,61 @@ class EventMultiplexer:
           detect_file_replacement: Optional boolean; if True, event file loading
             will try to detect when a file has been replaced with a new version
             that contains additional data, by monitoring the file size.
+          verify_data_crc: If False, the CRC of each record's payload is not
+            checked where the record reader allows it. See
+            `event_accumulator.EventAccumulator`.
+          ingest_cache: Optional `ingest_cache.IngestCache`; if given, each
+            new accumulator is restored from its snapshot when possible, and
+            snapshots are saved after each reload that ingests new data.
+          reload_incremental: Optional boolean; if True, `Reload` skips runs
+            whose event files have not changed since they were last reloaded,
+            and `AddRunsFromDirectory` only re-lists directories that have
+            been modified since the last call. This applies to local paths
+            only.
+          max_reload_processes: Optional number of worker processes with
+            which to load event files. If given, runs are loaded in these
+            processes rather than in `max_reload_threads` threads, and runs
+            added after the first `Reload` are only loaded by the next
+            `Reload`. See `process_reloader.ProcessReloader`.
+          max_bytes_per_tag: The maximum total serialized size of the
+            tensors kept for each non-scalar tag of each run, or 0 for no
+            limit. See `event_accumulator.EventAccumulator`.
+          bytes_per_plugin: Optional dict mapping plugin name to the
+            maximum total serialized size of the tensors kept for that
+            plugin across all runs.
+          max_tensor_bytes: The maximum total serialized size of the
+            non-scalar tensors kept across all runs, or 0 for no limit.
+            With `max_reload_processes`, this and `bytes_per_plugin` bound
+            the data kept in the serving process, not that in the workers.
+          blob_store: Optional `blob_store.BlobStore` in which accumulators
+            keep the values of blob sequences (e.g., images), rather than in
+            memory. With `max_reload_processes`, it is used by the serving
+            process only.
+          load_on_demand: Optional boolean; if True, runs are at first only
+            indexed: their accumulators keep just the latest event of each
+            tag, which suffices to list tags, and the values that other
+            events supersede are not processed at all. A run is fully
+            loaded when `LoadRuns` is first called for it, from its
+            snapshot in `ingest_cache` if there is one. Nothing is written
+            to disk unless `ingest_cache` is given. Incompatible with
+            `max_reload_processes`.
+          idle_run_ttl_secs: With `load_on_demand`, fully loaded runs that
+            have not been passed to `LoadRuns` for this many seconds are
+            saved to `ingest_cache`, if given, and reduced back to an index
+            by the next `Reload`. If 0, they are kept loaded.
+          reload_scheduler: Optional `reload_scheduler.ReloadScheduler`. If
+            given, `Reload()` only reloads the runs that it deems due, most
+            urgent first, and runs passed to `LoadRuns` are treated as
+            recently read.
+
+        Raises:
+          ValueError: If both `load_on_demand` and `max_reload_processes`
+            are given.
         """
+        if load_on_demand and max_reload_processes:
+            raise ValueError(
+                "load_on_demand is incompatible with max_reload_processes"
+            )
         logger.info("Event Multiplexer initializing.")
         self._accumulators_mutex = threading.Lock()
         self._accumulators = {}
@@ -117,6 +209,53 @@ class EventMultiplexer:
         self._max_reload_threads = max_reload_threads or 1
         self._event_file_active_filter = event_file_active_filter
         self._detect_file_replacement = detect_file_replacement
+        self._verify_data_crc = verify_data_crc
+        self._ingest_cache = ingest_cache
+        self._reload_incremental = reload_incremental
+        self._max_bytes_per_tag = max_bytes_per_tag
+        self._blob_store = blob_store
+        self._load_on_demand = load_on_demand
+        self._idle_run_ttl_secs = idle_run_ttl_secs
+        self._reload_scheduler = reload_scheduler
+        # Maps run name to the time it was last passed to `LoadRuns`.
+        self._last_access_times = {}
+        # Maps run name to a lock held while fully loading that run.
+        self._load_locks = {}
+        self._plugin_byte_budgets = {
+            plugin_name: reservoir.ByteBudget(max_bytes)
+            for (plugin_name, max_bytes) in (bytes_per_plugin or {}).items()
+            if max_bytes
+        }
+        self._byte_budget = (
+            reservoir.ByteBudget(max_tensor_bytes) if max_tensor_bytes else None
+        )
+        # Maps logdir path to its `io_wrapper.IncrementalLogdirScanner`.
+        self._logdir_scanners = {}
+        # Maps run name to `(accumulator, fingerprint)`, where `fingerprint`
+        # was taken just before that accumulator's last successful reload.
+        self._fingerprints = {}
+        self._last_reload_stats = None
+        # `_generation` is bumped whenever any run's data changes or a run
+        # is added or removed; `_run_generations` maps each run name to the
+        # value of `_generation` just after that run's data last changed.
+        self._generation_mutex = threading.Lock()
+        self._generation = 0
+        self._run_generations = {}
+        self._process_reloader = None
+        if max_reload_processes:
+            self._process_reloader = process_reloader.ProcessReloader(
+                max_reload_processes,
+                accumulator_kwargs=dict(
+                    size_guidance=self._size_guidance,
+                    tensor_size_guidance=self._tensor_size_guidance,
+                    purge_orphaned_data=self.purge_orphaned_data,
+                    event_file_active_filter=self._event_file_active_filter,
+                    detect_file_replacement=self._detect_file_replacement,
+                    verify_data_crc=self._verify_data_crc,
+                    max_bytes_per_tag=self._max_bytes_per_tag,
+                ),
+                ingest_cache=self._ingest_cache,
+            )
         if run_path_map is not None:
             logger.info(
                 "Event Multplexer doing initialization load for %s",
@@ -159,21 +298,154 @@ class EventMultiplexer:
                         path,
                     )
                 logger.info("Constructing EventAccumulator for %s", path)
-                accumulator = event_accumulator.EventAccumulator(
-                    path,
-                    size_guidance=self._size_guidance,
-                    tensor_size_guidance=self._tensor_size_guidance,
-                    purge_orphaned_data=self.purge_orphaned_data,
-                    event_file_active_filter=self._event_file_active_filter,
-                    detect_file_replacement=self._detect_file_replacement,
+                accumulator = self._NewAccumulator(
+                    path, index_only=self._load_on_demand
                 )
+                if name in self._accumulators:
+                    self._ReleaseBudgets(self._accumulators[name])
+                    self._last_access_times.pop(name, None)
+                if self._ingest_cache is not None and not self._load_on_demand:
+                    # Restore before the accumulator is visible to readers,
+                    # which may otherwise start loading events.
+                    self._ingest_cache.Restore(path, accumulator)
                 self._accumulators[name] = accumulator
                 self._paths[name] = path
         if accumulator:
-            if self._reload_called:
+            if self._reload_called and self._process_reloader is None:
                 accumulator.Reload()
+            self._BumpGeneration(name)
         return self
 
+    def _NewAccumulator(self, path, index_only=False):
+        return event_accumulator.EventAccumulator(
+            path,
+            size_guidance=self._size_guidance,
+            tensor_size_guidance=self._tensor_size_guidance,
+            purge_orphaned_data=self.purge_orphaned_data,
+            event_file_active_filter=self._event_file_active_filter,
+            detect_file_replacement=self._detect_file_replacement,
+            verify_data_crc=self._verify_data_crc,
+            max_bytes_per_tag=self._max_bytes_per_tag,
+            plugin_byte_budgets=self._plugin_byte_budgets,
+            byte_budget=self._byte_budget,
+            blob_store=self._blob_store,
+            index_only=index_only,
+        )
+
+    @property
+    def load_on_demand(self):
+        """Whether runs are only fully loaded by `LoadRuns`."""
+        return self._load_on_demand
+
+    @property
+    def tracks_reads(self):
+        """Whether `LoadRuns` should be called before reading runs."""
+        return self._load_on_demand or self._reload_scheduler is not None
+
+    def LoadRuns(self, runs):
+        """Notes that the data of the given runs is about to be read.
+
+        With `load_on_demand`, runs not yet fully loaded are loaded
+        synchronously, ahead of any background `Reload`; runs loaded by
+        other callers concurrently are waited for. With a
+        `reload_scheduler`, the runs are reloaded often for a while.
+        Unknown runs are ignored. If `tracks_reads` is false, this does
+        nothing.
+
+        Args:
+          runs: A collection of run names.
+        """
+        if not self.tracks_reads:
+            return
+        now = time.time()
+        pending = []
+        with self._accumulators_mutex:
+            runs = [name for name in runs if name in self._accumulators]
+            for name in runs:
+                accumulator = self._accumulators[name]
+                if not self._load_on_demand:
+                    continue
+                self._last_access_times[name] = now
+                if accumulator.index_only:
+                    lock = self._load_locks.setdefault(name, threading.Lock())
+                    pending.append((name, accumulator, lock))
+        if self._reload_scheduler is not None:
+            self._reload_scheduler.RecordRead(runs)
+        if not pending:
+            return
+        num_threads = min(self._max_reload_threads, len(pending))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="RunLoader"
+        ) as executor:
+            for _ in executor.map(lambda args: self._LoadRun(*args), pending):
+                pass
+
+    def _SaveSnapshot(self, name, accumulator):
+        """Offers the ingest cache a snapshot of a reloaded run."""
+        if self._ingest_cache is None or accumulator.index_only:
+            return
+        if self._process_reloader is not None:
+            self._process_reloader.SaveSnapshot(name, accumulator)
+        else:
+            self._ingest_cache.Save(accumulator.path, accumulator)
+
+    def _LoadRun(self, name, index_accumulator, lock):
+        """Replaces an index-only accumulator with a fully loaded one."""
+        with lock:
+            with self._accumulators_mutex:
+                if self._accumulators.get(name) is not index_accumulator:
+                    # Loaded by another caller, or removed.
+                    return
+            logger.info("Loading run %r on demand", name)
+            start = time.time()
+            accumulator = self._NewAccumulator(index_accumulator.path)
+            try:
+                if self._ingest_cache is not None:
+                    self._ingest_cache.Restore(accumulator.path, accumulator)
+                accumulator.Reload()
+                if self._ingest_cache is not None:
+                    self._ingest_cache.Save(accumulator.path, accumulator)
+            except (OSError, IOError) as e:
+                logger.error("Unable to load run %r: %s", name, e)
+                self._ReleaseBudgets(accumulator)
+                return
+            except directory_watcher.DirectoryDeletedError:
+                # The next `Reload` removes the run.
+                self._ReleaseBudgets(accumulator)
+                return
+            with self._accumulators_mutex:
+                replaced = self._accumulators.get(name) is index_accumulator
+                if replaced:
+                    self._accumulators[name] = accumulator
+                    self._fingerprints.pop(name, None)
+            self._ReleaseBudgets(index_accumulator if replaced else accumulator)
+            if replaced:
+                self._BumpGeneration(name)
+                logger.info(
+                    "Loaded run %r in %.3f seconds", name, time.time() - start
+                )
+
+    def _EvictIdleRuns(self):
+        """Reduces runs that were not read within the TTL to an index."""
+        deadline = time.time() - self._idle_run_ttl_secs
+        with self._accumulators_mutex:
+            idle = [
+                (name, accumulator)
+                for (name, accumulator) in self._accumulators.items()
+                if not accumulator.index_only
+                and self._last_access_times.get(name, 0) < deadline
+            ]
+        for name, accumulator in idle:
+            logger.info("Evicting data of idle run %r", name)
+            if self._ingest_cache is not None:
+                # Reading the run again then restores this snapshot,
+                # rather than parsing its event files from the start.
+                self._ingest_cache.Save(
+                    accumulator.path, accumulator, force=True
+                )
+            accumulator.ReduceToIndex()
+            self._BumpGeneration(name)
+
     def AddRunsFromDirectory(self, path, name=None):
         """Load runs from a directory; recursively walks subdirectories.
 
@@ -203,7 +475,27 @@ class EventMultiplexer:
         """
         path = os.path.expanduser(path)
         logger.info("Starting AddRunsFromDirectory: %s", path)
-        for subdir in io_wrapper.GetLogdirSubdirectories(path):
+        start = time.time()
+        if self._reload_incremental:
+            scanner = self._logdir_scanners.get(path)
+            if scanner is None:
+                scanner = io_wrapper.IncrementalLogdirScanner(path)
+                self._logdir_scanners[path] = scanner
+            subdirs = scanner.Scan()
+            logger.info(
+                "Re-listed %d modified directories under %s",
+                scanner.num_listed,
+                path,
+            )
+        else:
+            subdirs = list(io_wrapper.GetLogdirSubdirectories(path))
+        logger.info(
+            "Found %d run directories under %s in %.3f seconds",
+            len(subdirs),
+            path,
+            time.time() - start,
+        )
+        for subdir in subdirs:
             logger.info("Adding run from directory %s", subdir)
             rpath = os.path.relpath(subdir, path)
             subname = os.path.join(name, rpath) if name else rpath
@@ -211,14 +503,31 @@ class EventMultiplexer:
         logger.info("Done with AddRunsFromDirectory: %s", path)
         return self
 
-    def Reload(self):
-        """Call `Reload` on every `EventAccumulator`."""
+    def Reload(self, runs=None):
+        """Call `Reload` on every `EventAccumulator`.
+
+        Args:
+          runs: Optional collection of run names. If given, only these runs
+            are reloaded; the others are left as they are.
+        """
         logger.info("Beginning EventMultiplexer.Reload()")
+        start = time.time()
         self._reload_called = True
+        if self._load_on_demand and self._idle_run_ttl_secs:
+            self._EvictIdleRuns()
         # Build a list so we're safe even if the list of accumulators is modified
         # even while we're reloading.
         with self._accumulators_mutex:
             items = list(self._accumulators.items())
+        if runs is not None:
+            runs = frozenset(runs)
+            items = [(name, acc) for (name, acc) in items if name in runs]
+        num_deferred = 0
+        if self._reload_scheduler is not None and runs is None:
+            accumulators = dict(items)
+            due = self._reload_scheduler.DueRuns(list(accumulators))
+            num_deferred = len(items) - len(due)
+            items = [(name, accumulators[name]) for name in due]
         items_queue = queue.Queue()
         for item in items:
             items_queue.put(item)
@@ -227,8 +536,12 @@ class EventMultiplexer:
         # for the thread exists, but we might as well be careful.
         names_to_delete = set()
         names_to_delete_mutex = threading.Lock()
+        num_skipped = [0]
+        num_skipped_mutex = threading.Lock()
+        # `reload_scheduler.RunReload`s, with a scheduler.
+        run_reloads = []
 
-        def Worker():
+        def Worker(items_queue):
             """Keeps reloading accumulators til none are left."""
             while True:
                 try:
@@ -237,21 +550,88 @@ class EventMultiplexer:
                     # No more runs to reload.
                     break
 
+                run_start = time.time()
+                grew = False
+                deleted = False
                 try:
-                    accumulator.Reload()
+                    fingerprint = None
+                    if self._reload_incremental:
+                        # Take the fingerprint before reloading, so that data
+                        # written during the reload is picked up next time.
+                        fingerprint = io_wrapper.EventFilesFingerprint(
+                            accumulator.path
+                        )
+                        previous = self._fingerprints.get(name)
+                        if fingerprint is not None and previous == (
+                            accumulator,
+                            fingerprint,
+                        ):
+                            with num_skipped_mutex:
+                                num_skipped[0] += 1
+                            # The run has stopped growing, so a snapshot
+                            # deferred while it grew may be written now.
+                            self._SaveSnapshot(name, accumulator)
+                            continue
+                    num_events = accumulator.NumEventsProcessed()
+                    if self._process_reloader is not None:
+                        self._process_reloader.Reload(name, accumulator)
+                    else:
+                        accumulator.Reload()
+                        self._SaveSnapshot(name, accumulator)
+                    if accumulator.NumEventsProcessed() != num_events:
+                        grew = True
+                        self._BumpGeneration(name)
+                    if fingerprint is not None:
+                        self._fingerprints[name] = (accumulator, fingerprint)
                 except (OSError, IOError) as e:
                     logger.error("Unable to reload accumulator %r: %s", name, e)
                 except directory_watcher.DirectoryDeletedError:
+                    deleted = True
                     with names_to_delete_mutex:
                         names_to_delete.add(name)
                 finally:
+                    if self._reload_scheduler is not None and not deleted:
+                        run_reloads.append(
+                            self._reload_scheduler.RecordReload(
+                                name,
+                                run_start,
+                                grew,
+                                accumulator.most_recent_wall_time,
+                            )
+                        )
                     items_queue.task_done()
 
-        if self._max_reload_threads > 1:
+        if self._process_reloader is not None:
+            # One thread per worker process, each handling the runs assigned
+            # to that worker, so that every worker is kept busy.
+            queues = [
+                queue.Queue()
+                for _ in range(self._process_reloader.num_processes)
+            ]
+            for name, accumulator in items:
+                queues[self._process_reloader.Slot(name, accumulator)].put(
+                    (name, accumulator)
+                )
+            threads = []
+            for i, slot_queue in enumerate(queues):
+                if slot_queue.empty():
+                    continue
+                thread = threading.Thread(
+                    target=Worker, args=(slot_queue,), name="Reloader %d" % i
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+            logger.info("Reloading runs in %d worker processes", len(threads))
+            for thread in threads:
+                thread.join()
+        elif self._max_reload_threads > 1:
             num_threads = min(self._max_reload_threads, len(items))
             logger.info("Starting %d threads to reload runs", num_threads)
             for i in range(num_threads):
-                thread = threading.Thread(target=Worker, name="Reloader %d" % i)
+                thread = threading.Thread(
+                    target=Worker, args=(items_queue,), name="Reloader %d" % i
+                )
                 thread.daemon = True
                 thread.start()
             items_queue.join()
@@ -260,15 +640,77 @@ class EventMultiplexer:
                 "Reloading runs serially (one after another) on the main "
                 "thread."
             )
-            Worker()
+            Worker(items_queue)
 
         with self._accumulators_mutex:
             for name in names_to_delete:
                 logger.warning("Deleting accumulator %r", name)
-                del self._accumulators[name]
-        logger.info("Finished with EventMultiplexer.Reload()")
+                self._ReleaseBudgets(self._accumulators.pop(name))
+                self._fingerprints.pop(name, None)
+                self._last_access_times.pop(name, None)
+                self._load_locks.pop(name, None)
+                if self._process_reloader is not None:
+                    self._process_reloader.RemoveRun(name)
+                if self._reload_scheduler is not None:
+                    self._reload_scheduler.RemoveRun(name)
+        for name in names_to_delete:
+            self._BumpGeneration(name, deleted=True)
+        self._last_reload_stats = ReloadStats(
+            num_reloaded=len(items) - num_skipped[0],
+            num_skipped=num_skipped[0],
+            duration_secs=time.time() - start,
+            num_deferred=num_deferred,
+        )
+        logger.info(
+            "Finished with EventMultiplexer.Reload(): reloaded %d runs, "
+            "skipped %d unchanged runs, deferred %d runs not yet due",
+            self._last_reload_stats.num_reloaded,
+            self._last_reload_stats.num_skipped,
+            self._last_reload_stats.num_deferred,
+        )
+        if run_reloads:
+            _LogRunReloads(run_reloads)
         return self
 
+    def _ReleaseBudgets(self, accumulator):
+        """Releases a discarded accumulator's data from the byte budgets."""
+        if self._plugin_byte_budgets or self._byte_budget is not None:
+            accumulator.ReleaseBudgets()
+
+    def LastReloadStats(self):
+        """Returns a `ReloadStats` for the last `Reload`, or None."""
+        return self._last_reload_stats
+
+    def Generation(self):
+        """Returns a counter that increases whenever any data changes.
+
+        The counter is bumped after a run ingests new events, and when a
+        run is added or removed. Callers that cache results derived from
+        the multiplexer should read the generation *before* reading any
+        data, so that data changed concurrently is never cached under the
+        newer generation.
+        """
+        with self._generation_mutex:
+            return self._generation
+
+    def RunGenerations(self):
+        """Returns a dict mapping each run name to its data generation.
+
+        A run's generation is the value of `Generation()` just after its
+        data last changed, so it differs from its previous value whenever
+        the run's data may have changed. See `Generation` for caveats.
+        """
+        with self._generation_mutex:
+            return dict(self._run_generations)
+
+    def _BumpGeneration(self, name, deleted=False):
+        with self._generation_mutex:
+            self._generation += 1
+            if deleted:
+                self._run_generations.pop(name, None)
+            else:
+                self._run_generations[name] = self._generation
+
     def PluginAssets(self, plugin_name):
         """Get index of runs and assets for a given plugin.
 
@@ -420,6 +862,42 @@ class EventMultiplexer:
         accumulator = self.GetAccumulator(run)
         return accumulator.Tensors(tag)
 
+    def TimeSeriesStats(self, run, tag):
+        """Retrieve summary statistics of the data for a run and tag.
+
+        Unlike `Tensors`, this takes constant time per time series.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          A `reservoir.ItemStats`.
+        """
+        accumulator = self.GetAccumulator(run)
+        return accumulator.TimeSeriesStats(tag)
+
+    def Scalars(self, run, tag):
+        """Retrieve the points of a scalar time series in columnar form.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of a scalar tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run or is not a scalar time series.
+
+        Returns:
+          An `event_accumulator.ScalarSeries`.
+        """
+        accumulator = self.GetAccumulator(run)
+        return accumulator.Scalars(tag)
+
     def PluginRunToTagToContent(self, plugin_name):
         """Returns a 2-layer dictionary of the form {run: {tag: content}}.
 
@@ -522,3 +1000,36 @@ class EventMultiplexer:
         """
         with self._accumulators_mutex:
             return self._accumulators[run]
+
+
+def _LogRunReloads(run_reloads):
+    """Logs the latency and staleness of the runs of one reload."""
+    for run_reload in run_reloads:
+        logger.debug(
+            "Reloaded run %r in %.3f secs, %s since its last reload%s",
+            run_reload.name,
+            run_reload.duration_secs,
+            (
+                "%.1f secs" % run_reload.staleness_secs
+                if run_reload.staleness_secs is not None
+                else "never loaded"
+            ),
+            " (new data)" if run_reload.grew else "",
+        )
+    slowest = max(run_reloads, key=lambda r: r.duration_secs)
+    stalenesses = sorted(
+        r.staleness_secs for r in run_reloads if r.staleness_secs is not None
+    )
+    logger.info(
+        "Reloaded %d runs, %d with new data; slowest %r took %.3f secs",
+        len(run_reloads),
+        sum(1 for r in run_reloads if r.grew),
+        slowest.name,
+        slowest.duration_secs,
+    )
+    if stalenesses:
+        logger.info(
+            "Run staleness before reload: median %.1f secs, max %.1f secs",
+            stalenesses[len(stalenesses) // 2],
+            stalenesses[-1],
+        )
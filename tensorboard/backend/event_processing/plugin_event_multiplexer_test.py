@@ -18,6 +18,7 @@ import os
 import os.path
 import queue
 import shutil
+from unittest import mock
 
 import tensorflow as tf
 
@@ -27,6 +28,10 @@ from tensorboard.backend.event_processing import (
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
+from tensorboard.backend.event_processing import ingest_cache
+from tensorboard.backend.event_processing import reload_scheduler
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.util import tensor_util
 from tensorboard.util import test_util
 
 
@@ -94,6 +99,9 @@ class _FakeAccumulator:
     def Reload(self):
         self.reload_called = True
 
+    def NumEventsProcessed(self):
+        return 1 if self.reload_called else 0
+
 
 def _GetFakeAccumulator(
     path,
@@ -141,6 +149,15 @@ class EventMultiplexerTest(tf.test.TestCase):
         self.assertTrue(x.GetAccumulator("run1").reload_called)
         self.assertTrue(x.GetAccumulator("run2").reload_called)
 
+    def testReloadSomeRuns(self):
+        x = event_multiplexer.EventMultiplexer(
+            {"run1": "path1", "run2": "path2"}
+        )
+        x.Reload(["run2", "nonexistent"])
+        self.assertFalse(x.GetAccumulator("run1").reload_called)
+        self.assertTrue(x.GetAccumulator("run2").reload_called)
+        self.assertEqual(x.LastReloadStats().num_reloaded, 1)
+
     def testGetSourceWriter(self):
         x = event_multiplexer.EventMultiplexer(
             {"run1": "path1", "run2": "path2"}
@@ -461,6 +478,306 @@ class EventMultiplexerWithRealAccumulatorTest(tf.test.TestCase):
         x.Reload()
         self.assertNotIn("run2", x.Runs().keys())
 
+    def testByteBudgetsAcrossRuns(self):
+        logdir = self.get_temp_dir()
+        metadata = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="images"
+            ),
+            data_class=summary_pb2.DATA_CLASS_BLOB_SEQUENCE,
+        )
+        tensor = tensor_util.make_tensor_proto([b"x" * 1000], dtype=tf.string)
+        for run in ("run1", "run2"):
+            with test_util.FileWriter(os.path.join(logdir, run)) as writer:
+                for step in range(50):
+                    summary = summary_pb2.Summary(
+                        value=[
+                            summary_pb2.Summary.Value(
+                                tag="img", metadata=metadata, tensor=tensor
+                            )
+                        ]
+                    )
+                    writer.add_summary(summary, global_step=step)
+        multiplexer = event_multiplexer.EventMultiplexer(
+            tensor_size_guidance={"images": 50},
+            bytes_per_plugin={"images": 30000},
+            max_tensor_bytes=100000,
+        )
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        budget = multiplexer._plugin_byte_budgets["images"]
+        # Each tag keeps at least one tensor, even when over budget.
+        self.assertLessEqual(budget.num_bytes, 30000 + tensor.ByteSize())
+        self.assertEqual(multiplexer._byte_budget.num_bytes, budget.num_bytes)
+        num_tensors = len(multiplexer.Tensors("run1", "img")) + len(
+            multiplexer.Tensors("run2", "img")
+        )
+        self.assertBetween(num_tensors, 20, 30)
+
+        shutil.rmtree(os.path.join(logdir, "run2"))
+        multiplexer.Reload()
+        self.assertNotIn("run2", multiplexer.Runs())
+        self.assertEqual(
+            budget.num_bytes,
+            sum(
+                t.tensor_proto.ByteSize()
+                for t in multiplexer.Tensors("run1", "img")
+            ),
+        )
+
+    def testReloadIncrementalSkipsUnchangedRuns(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer(
+            reload_incremental=True
+        )
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            writer.add_test_summary("a", step=1)
+        with test_util.FileWriter(os.path.join(logdir, "run2")) as writer:
+            writer.add_test_summary("a", step=1)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 2)
+        self.assertEqual(multiplexer.LastReloadStats().num_skipped, 0)
+
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 0)
+        self.assertEqual(multiplexer.LastReloadStats().num_skipped, 2)
+
+        with test_util.FileWriter(
+            os.path.join(logdir, "run2"), filename_suffix=".b"
+        ) as writer:
+            writer.add_test_summary("b", step=2)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 1)
+        self.assertEqual(multiplexer.LastReloadStats().num_skipped, 1)
+        self.assertLen(multiplexer.Tensors("run2", "b"), 1)
+
+        with test_util.FileWriter(os.path.join(logdir, "run3")) as writer:
+            writer.add_test_summary("a", step=1)
+        multiplexer.AddRunsFromDirectory(logdir)
+        self.assertIn("run3", multiplexer.Runs())
+        self.assertLen(multiplexer.Tensors("run3", "a"), 1)
+
+        shutil.rmtree(os.path.join(logdir, "run1"))
+        multiplexer.Reload()
+        self.assertNotIn("run1", multiplexer.Runs())
+
+    def testReloadInWorkerProcesses(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer(max_reload_processes=2)
+        self.addCleanup(multiplexer._process_reloader.Close)
+        for run in ("run1", "run2", "run3"):
+            with test_util.FileWriter(os.path.join(logdir, run)) as writer:
+                writer.add_test_summary("a", step=1)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        self.assertCountEqual(multiplexer.Runs(), ["run1", "run2", "run3"])
+        self.assertLen(multiplexer.Tensors("run1", "a"), 1)
+
+        accumulator = multiplexer.GetAccumulator("run2")
+        num_events = accumulator.NumEventsProcessed()
+        with test_util.FileWriter(
+            os.path.join(logdir, "run2"), filename_suffix=".b"
+        ) as writer:
+            writer.add_test_summary("b", step=2)
+        multiplexer.Reload()
+        # Only the new file was read, and the data was imported into the
+        # same serving accumulator.
+        self.assertIs(multiplexer.GetAccumulator("run2"), accumulator)
+        self.assertGreater(accumulator.NumEventsProcessed(), num_events)
+        self.assertLen(multiplexer.Tensors("run2", "a"), 1)
+        self.assertLen(multiplexer.Tensors("run2", "b"), 1)
+
+        shutil.rmtree(os.path.join(logdir, "run1"))
+        multiplexer.Reload()
+        self.assertNotIn("run1", multiplexer.Runs())
+
+    def testGenerations(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer()
+        self.assertEqual(multiplexer.RunGenerations(), {})
+        for run in ("run1", "run2"):
+            with test_util.FileWriter(os.path.join(logdir, run)) as writer:
+                writer.add_test_summary("a", step=1)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        generation = multiplexer.Generation()
+        generations = multiplexer.RunGenerations()
+        self.assertCountEqual(generations.keys(), ["run1", "run2"])
+
+        # Nothing new to load.
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.Generation(), generation)
+        self.assertEqual(multiplexer.RunGenerations(), generations)
+
+        with test_util.FileWriter(
+            os.path.join(logdir, "run2"), filename_suffix=".b"
+        ) as writer:
+            writer.add_test_summary("b", step=2)
+        multiplexer.Reload()
+        self.assertGreater(multiplexer.Generation(), generation)
+        new_generations = multiplexer.RunGenerations()
+        self.assertEqual(new_generations["run1"], generations["run1"])
+        self.assertGreater(new_generations["run2"], generations["run2"])
+
+        generation = multiplexer.Generation()
+        shutil.rmtree(os.path.join(logdir, "run1"))
+        multiplexer.Reload()
+        self.assertGreater(multiplexer.Generation(), generation)
+        self.assertNotIn("run1", multiplexer.RunGenerations())
+
+    def testLoadOnDemand(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer(load_on_demand=True)
+        for run in ("run1", "run2"):
+            with test_util.FileWriter(os.path.join(logdir, run)) as writer:
+                for step in range(5):
+                    writer.add_test_summary("a", simple_value=step, step=step)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        self.assertCountEqual(multiplexer.Runs(), ["run1", "run2"])
+        # Only the latest point is kept until a run is loaded.
+        self.assertEqual(multiplexer.Scalars("run1", "a").step.tolist(), [4])
+        self.assertEqual(multiplexer.TimeSeriesStats("run1", "a").max_step, 4)
+
+        generation = multiplexer.RunGenerations()["run1"]
+        multiplexer.LoadRuns(["run1", "nonexistent"])
+        self.assertGreater(multiplexer.RunGenerations()["run1"], generation)
+        self.assertFalse(multiplexer.GetAccumulator("run1").index_only)
+        self.assertTrue(multiplexer.GetAccumulator("run2").index_only)
+        self.assertEqual(
+            multiplexer.Scalars("run1", "a").step.tolist(), [0, 1, 2, 3, 4]
+        )
+        self.assertEqual(multiplexer.Scalars("run2", "a").step.tolist(), [4])
+
+        # Loaded runs keep loading in full.
+        with test_util.FileWriter(
+            os.path.join(logdir, "run1"), filename_suffix=".b"
+        ) as writer:
+            writer.add_test_summary("a", step=5)
+        multiplexer.Reload()
+        self.assertLen(multiplexer.Scalars("run1", "a").step, 6)
+
+    def testIdleRunsAreReducedToIndex(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer(
+            load_on_demand=True, idle_run_ttl_secs=60
+        )
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            for step in range(5):
+                writer.add_test_summary("a", step=step)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        multiplexer.LoadRuns(["run1"])
+        multiplexer.Reload()
+        self.assertLen(multiplexer.Scalars("run1", "a").step, 5)
+
+        multiplexer._last_access_times["run1"] -= 120
+        generation = multiplexer.RunGenerations()["run1"]
+        multiplexer.Reload()
+        self.assertGreater(multiplexer.RunGenerations()["run1"], generation)
+        self.assertEqual(multiplexer.Scalars("run1", "a").step.tolist(), [4])
+        multiplexer.LoadRuns(["run1"])
+        self.assertLen(multiplexer.Scalars("run1", "a").step, 5)
+
+    def testLoadOnDemandIndexSkipsSupersededEvents(self):
+        logdir = self.get_temp_dir()
+        multiplexer = event_multiplexer.EventMultiplexer(load_on_demand=True)
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            for step in range(100):
+                writer.add_test_summary("a", simple_value=step, step=step)
+                writer.add_test_summary("b", simple_value=-step, step=step)
+        multiplexer.AddRunsFromDirectory(logdir)
+        process_event = event_accumulator.EventAccumulator._ProcessEvent
+        with mock.patch.object(
+            event_accumulator.EventAccumulator,
+            "_ProcessEvent",
+            autospec=True,
+            side_effect=process_event,
+        ) as mock_process_event:
+            multiplexer.Reload()
+        # The file version, and the first and latest value of each tag.
+        self.assertLessEqual(mock_process_event.call_count, 5)
+        self.assertEqual(multiplexer.Scalars("run1", "a").step.tolist(), [99])
+        self.assertEqual(multiplexer.Scalars("run1", "b").value.tolist(), [-99])
+        multiplexer.LoadRuns(["run1"])
+        self.assertLen(multiplexer.Scalars("run1", "a").step, 100)
+
+    def testLoadOnDemandSavesToIngestCacheOnlyIfGiven(self):
+        logdir = os.path.join(self.get_temp_dir(), "logs")
+        cache_dir = os.path.join(self.get_temp_dir(), "cache")
+        multiplexer = event_multiplexer.EventMultiplexer(
+            load_on_demand=True,
+            idle_run_ttl_secs=60,
+            ingest_cache=ingest_cache.IngestCache(
+                cache_dir, min_save_interval_secs=0
+            ),
+        )
+        with test_util.FileWriter(os.path.join(logdir, "run1")) as writer:
+            for step in range(5):
+                writer.add_test_summary("a", step=step)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        # Indexing a run writes nothing.
+        self.assertEmpty(os.listdir(cache_dir))
+
+        multiplexer.LoadRuns(["run1"])
+        multiplexer._last_access_times["run1"] -= 120
+        multiplexer.Reload()
+        self.assertTrue(multiplexer.GetAccumulator("run1").index_only)
+        self.assertNotEmpty(os.listdir(cache_dir))
+
+        # Reading the run again restores it rather than parsing it.
+        with mock.patch.object(
+            event_accumulator.EventAccumulator, "_ProcessEvent"
+        ) as mock_process_event:
+            multiplexer.LoadRuns(["run1"])
+        mock_process_event.assert_not_called()
+        self.assertLen(multiplexer.Scalars("run1", "a").step, 5)
+
+    def testLoadOnDemandIsIncompatibleWithWorkerProcesses(self):
+        with self.assertRaises(ValueError):
+            event_multiplexer.EventMultiplexer(
+                load_on_demand=True, max_reload_processes=2
+            )
+
+    def testReloadScheduler(self):
+        logdir = self.get_temp_dir()
+        scheduler = reload_scheduler.ReloadScheduler(
+            min_interval_secs=60, max_interval_secs=600
+        )
+        multiplexer = event_multiplexer.EventMultiplexer(
+            reload_scheduler=scheduler
+        )
+        for run in ("run1", "run2"):
+            with test_util.FileWriter(os.path.join(logdir, run)) as writer:
+                writer.add_test_summary("a", step=1)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 2)
+
+        # Neither run is due again yet.
+        with test_util.FileWriter(
+            os.path.join(logdir, "run2"), filename_suffix=".b"
+        ) as writer:
+            writer.add_test_summary("b", step=2)
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 0)
+        self.assertEqual(multiplexer.LastReloadStats().num_deferred, 2)
+
+        # Reading a run makes it due once the shortest interval has passed.
+        self.assertTrue(multiplexer.tracks_reads)
+        scheduler._runs["run2"].last_reload -= 60
+        multiplexer.LoadRuns(["run2"])
+        multiplexer.Reload()
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 1)
+        self.assertLen(multiplexer.Tensors("run2", "b"), 1)
+
+        # Explicitly requested runs are reloaded regardless of schedule.
+        multiplexer.Reload(["run1"])
+        self.assertEqual(multiplexer.LastReloadStats().num_reloaded, 1)
+
     def _add3RunsToMultiplexer(self, logdir, multiplexer):
         """Creates and adds 3 runs to the multiplexer."""
         run1_dir = os.path.join(logdir, "run1")
@@ -0,0 +1,255 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Loads event files for an `EventMultiplexer` in worker processes."""
+
+
+import concurrent.futures
+import multiprocessing
+import threading
+
+from tensorboard.backend.event_processing import directory_watcher
+from tensorboard.backend.event_processing import ingest_cache
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+
+class ProcessReloader:
+    """Reloads runs in a pool of worker processes.
+
+    Parsing and migrating event protos holds the GIL, so reloading with
+    more threads stops helping after a few. Instead, each run is assigned
+    to one of several worker processes, which keeps its own accumulator
+    for that run and so only reads data appended since the last reload.
+    After a reload that ingests new events, the worker ships back the
+    sampled data with `EventAccumulator.ExportData`, and the serving
+    accumulator is updated with `ImportData`. The serving process thus
+    only unpickles the data that is kept, not every event read.
+
+    Each worker holds a full copy of the data for its runs, so this
+    roughly doubles the memory used for loaded data.
+    """
+
+    def __init__(self, num_processes, accumulator_kwargs, ingest_cache=None):
+        """Creates a `ProcessReloader`. Processes are started lazily.
+
+        Args:
+          num_processes: The number of worker processes to use.
+          accumulator_kwargs: Keyword arguments for constructing each
+            `EventAccumulator` in the workers, other than the path. These
+            must be picklable.
+          ingest_cache: Optional `ingest_cache.IngestCache`; if given,
+            workers restore new accumulators from it and offer it a
+            snapshot after each reload.
+        """
+        if num_processes < 1:
+            raise ValueError(
+                "num_processes must be positive, got %r" % num_processes
+            )
+        self._accumulator_kwargs = dict(accumulator_kwargs)
+        self._cache_args = (
+            (ingest_cache.cache_dir, ingest_cache.min_save_interval_secs)
+            if ingest_cache
+            else None
+        )
+        # "spawn" rather than "fork", since the serving process is
+        # multithreaded and forking it could deadlock the children.
+        self._context = multiprocessing.get_context("spawn")
+        self._executors = [None] * num_processes
+        # Maps run name to `(accumulator, slot)`, where `accumulator` is
+        # the serving accumulator whose data is loaded by the worker in
+        # `self._executors[slot]`.
+        self._runs = {}
+        self._mutex = threading.Lock()
+
+    @property
+    def num_processes(self):
+        return len(self._executors)
+
+    def Slot(self, name, accumulator):
+        """Returns the index of the worker that loads the given run.
+
+        Runs stay with the same worker across reloads, so that it can keep
+        its read position. New runs go to the worker with the fewest runs.
+        """
+        with self._mutex:
+            assignment = self._runs.get(name)
+            if assignment is not None and assignment[0] is accumulator:
+                return assignment[1]
+            counts = [0] * len(self._executors)
+            for _, slot in self._runs.values():
+                counts[slot] += 1
+            slot = counts.index(min(counts))
+            self._runs[name] = (accumulator, slot)
+            return slot
+
+    def Reload(self, name, accumulator):
+        """Loads new events for a run in its worker, blocking until done.
+
+        Calls for runs assigned to different workers (see `Slot`) proceed
+        in parallel; calls for the same worker are serialized.
+
+        Args:
+          name: The run name.
+          accumulator: The serving `EventAccumulator` for the run. It is
+            updated in place if any new events were loaded.
+
+        Raises:
+          directory_watcher.DirectoryDeletedError: If the run directory
+            was deleted.
+          OSError: If the event files could not be read.
+        """
+        slot = self.Slot(name, accumulator)
+        executor = self._Executor(slot)
+        try:
+            data = executor.submit(
+                _ReloadInWorker, name, id(accumulator), accumulator.path
+            ).result()
+        except concurrent.futures.BrokenExecutor:
+            logger.error(
+                "Reload worker %d died; its runs will be reloaded from scratch",
+                slot,
+            )
+            self._ResetSlot(slot, executor)
+            return
+        except directory_watcher.DirectoryDeletedError:
+            self.RemoveRun(name)
+            raise
+        if data is not None:
+            accumulator.ImportData(data)
+
+    def SaveSnapshot(self, name, accumulator):
+        """Offers the ingest cache a snapshot of a run that was not reloaded.
+
+        Workers already do this after each `Reload`; this lets a run that
+        was skipped because it did not change still have a snapshot
+        written once it stops growing. Does not block.
+        """
+        if self._cache_args is None:
+            return
+        with self._mutex:
+            assignment = self._runs.get(name)
+            if assignment is None or assignment[0] is not accumulator:
+                return
+            executor = self._executors[assignment[1]]
+        if executor is not None:
+            executor.submit(_SaveInWorker, name, id(accumulator))
+
+    def RemoveRun(self, name):
+        """Forgets a run, e.g. after its directory was deleted."""
+        with self._mutex:
+            assignment = self._runs.pop(name, None)
+            if assignment is None:
+                return
+            executor = self._executors[assignment[1]]
+        if executor is not None:
+            executor.submit(_RemoveInWorker, name)
+
+    def Close(self):
+        """Shuts down all worker processes."""
+        with self._mutex:
+            executors = self._executors
+            self._executors = [None] * len(executors)
+            self._runs.clear()
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _Executor(self, slot):
+        with self._mutex:
+            executor = self._executors[slot]
+            if executor is None:
+                logger.info("Starting reload worker process %d", slot)
+                executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=self._context,
+                    initializer=_InitWorker,
+                    initargs=(self._accumulator_kwargs, self._cache_args),
+                )
+                self._executors[slot] = executor
+            return executor
+
+    def _ResetSlot(self, slot, executor):
+        with self._mutex:
+            if self._executors[slot] is executor:
+                self._executors[slot] = None
+            for name, (_, run_slot) in list(self._runs.items()):
+                if run_slot == slot:
+                    del self._runs[name]
+        executor.shutdown(wait=False)
+
+
+# State of a worker process, set by `_InitWorker`.
+_worker_accumulator_kwargs = None
+_worker_ingest_cache = None
+# Maps run name to `(accumulator_id, accumulator, num_events_exported)`,
+# where `accumulator_id` identifies the serving accumulator that this
+# worker accumulator loads for.
+_worker_runs = {}
+
+
+def _InitWorker(accumulator_kwargs, cache_args):
+    global _worker_accumulator_kwargs
+    global _worker_ingest_cache
+    _worker_accumulator_kwargs = accumulator_kwargs
+    if cache_args is not None:
+        _worker_ingest_cache = ingest_cache.IngestCache(*cache_args)
+
+
+def _ReloadInWorker(name, accumulator_id, path):
+    """Reloads a run in a worker process.
+
+    Returns:
+      The `ExportData` of the run's accumulator, or None if no events were
+      loaded since the data was last returned.
+    """
+    entry = _worker_runs.get(name)
+    if entry is None or entry[0] != accumulator_id:
+        accumulator = event_accumulator.EventAccumulator(
+            path, **_worker_accumulator_kwargs
+        )
+        if _worker_ingest_cache is not None:
+            _worker_ingest_cache.Restore(path, accumulator)
+        entry = (accumulator_id, accumulator, None)
+        _worker_runs[name] = entry
+    (_, accumulator, num_events_exported) = entry
+    try:
+        accumulator.Reload()
+    except directory_watcher.DirectoryDeletedError:
+        del _worker_runs[name]
+        raise
+    if _worker_ingest_cache is not None:
+        _worker_ingest_cache.Save(path, accumulator)
+    num_events = accumulator.NumEventsProcessed()
+    if num_events == num_events_exported:
+        return None
+    _worker_runs[name] = (accumulator_id, accumulator, num_events)
+    return accumulator.ExportData()
+
+
+def _SaveInWorker(name, accumulator_id):
+    entry = _worker_runs.get(name)
+    if entry is None or entry[0] != accumulator_id:
+        return
+    accumulator = entry[1]
+    _worker_ingest_cache.Save(accumulator.path, accumulator)
+
+
+def _RemoveInWorker(name):
+    _worker_runs.pop(name, None)
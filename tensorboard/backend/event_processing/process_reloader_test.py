@@ -0,0 +1,134 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for process_reloader."""
+
+
+import os
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import directory_watcher
+from tensorboard.backend.event_processing import ingest_cache
+from tensorboard.backend.event_processing import (
+    plugin_event_accumulator as event_accumulator,
+)
+from tensorboard.backend.event_processing import process_reloader
+from tensorboard.compat.proto import event_pb2
+from tensorboard.plugins.scalar import summary_v2 as scalar_summary
+from tensorboard.summary.writer import record_writer
+
+
+class ProcessReloaderTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._logdir = self.create_tempdir().full_path
+
+    def _write_scalars(self, run, steps):
+        run_dir = os.path.join(self._logdir, run)
+        os.makedirs(run_dir, exist_ok=True)
+        with open(os.path.join(run_dir, "events.out.tfevents.1"), "ab") as f:
+            writer = record_writer.RecordWriter(f)
+            for step in steps:
+                event = event_pb2.Event(
+                    wall_time=1000.0 + step,
+                    step=step,
+                    summary=scalar_summary.scalar_pb("loss", step * 0.5),
+                )
+                writer.write(event.SerializeToString())
+        return run_dir
+
+    def _make_reloader(self, num_processes, **kwargs):
+        reloader = process_reloader.ProcessReloader(
+            num_processes, accumulator_kwargs={}, **kwargs
+        )
+        self.addCleanup(reloader.Close)
+        return reloader
+
+    def test_assigns_runs_to_least_loaded_worker(self):
+        reloader = self._make_reloader(2)
+        accumulators = [
+            event_accumulator.EventAccumulator(str(i)) for i in range(3)
+        ]
+        self.assertEqual(reloader.Slot("a", accumulators[0]), 0)
+        self.assertEqual(reloader.Slot("b", accumulators[1]), 1)
+        self.assertEqual(reloader.Slot("c", accumulators[2]), 0)
+        self.assertEqual(reloader.Slot("b", accumulators[1]), 1)
+        reloader.RemoveRun("a")
+        self.assertEqual(reloader.Slot("d", accumulators[0]), 0)
+
+    def test_reload_imports_new_data(self):
+        run_dir = self._write_scalars("train", range(5))
+        accumulator = event_accumulator.EventAccumulator(run_dir)
+        reloader = self._make_reloader(1)
+        reloader.Reload("train", accumulator)
+        self.assertEqual(accumulator.NumEventsProcessed(), 5)
+        self.assertEqual(
+            accumulator.Scalars("loss").step.tolist(), [0, 1, 2, 3, 4]
+        )
+
+        self._write_scalars("train", range(5, 8))
+        reloader.Reload("train", accumulator)
+        self.assertEqual(accumulator.NumEventsProcessed(), 8)
+        self.assertEqual(
+            accumulator.Scalars("loss").step.tolist(), list(range(8))
+        )
+
+    def test_replaced_accumulator_is_loaded_from_scratch(self):
+        run_dir = self._write_scalars("train", range(5))
+        reloader = self._make_reloader(1)
+        reloader.Reload("train", event_accumulator.EventAccumulator(run_dir))
+        accumulator = event_accumulator.EventAccumulator(run_dir)
+        reloader.Reload("train", accumulator)
+        self.assertLen(accumulator.Tensors("loss"), 5)
+
+    def test_deleted_directory(self):
+        run_dir = self._write_scalars("train", range(5))
+        accumulator = event_accumulator.EventAccumulator(run_dir)
+        reloader = self._make_reloader(1)
+        reloader.Reload("train", accumulator)
+        os.remove(os.path.join(run_dir, "events.out.tfevents.1"))
+        os.rmdir(run_dir)
+        with self.assertRaises(directory_watcher.DirectoryDeletedError):
+            reloader.Reload("train", accumulator)
+
+    def test_workers_save_snapshots(self):
+        cache_dir = os.path.join(self.get_temp_dir(), "cache")
+        cache = ingest_cache.IngestCache(cache_dir)
+        run_dir = self._write_scalars("train", range(5))
+        reloader = self._make_reloader(1, ingest_cache=cache)
+        reloader.Reload("train", event_accumulator.EventAccumulator(run_dir))
+        self.assertLen(os.listdir(cache_dir), 1)
+        accumulator = event_accumulator.EventAccumulator(run_dir)
+        self.assertTrue(cache.Restore(run_dir, accumulator))
+        self.assertLen(accumulator.Tensors("loss"), 5)
+
+    def test_save_snapshot_of_skipped_run(self):
+        cache_dir = os.path.join(self.get_temp_dir(), "cache")
+        cache = ingest_cache.IngestCache(cache_dir)
+        run_dir = self._write_scalars("train", range(5))
+        reloader = self._make_reloader(1, ingest_cache=cache)
+        accumulator = event_accumulator.EventAccumulator(run_dir)
+        reloader.Reload("train", accumulator)
+        self._write_scalars("train", range(5, 10))
+        # Deferred, since the run grew right after its first snapshot.
+        reloader.Reload("train", accumulator)
+        reloader.SaveSnapshot("train", accumulator)
+        reloader.Close()
+        restored = event_accumulator.EventAccumulator(run_dir)
+        self.assertTrue(cache.Restore(run_dir, restored))
+        self.assertLen(restored.Tensors("loss"), 10)
+
+
+if __name__ == "__main__":
+    tb_test.main()
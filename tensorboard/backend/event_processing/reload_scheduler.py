@@ -0,0 +1,213 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Decides how often each run of an `EventMultiplexer` is reloaded."""
+
+
+import dataclasses
+import threading
+import time
+
+from typing import Optional
+
+
+# Runs read within this many seconds are reloaded at the shortest interval.
+DEFAULT_HOT_SECS = 300
+
+
+@dataclasses.dataclass
+class _RunState:
+    # Seconds between reloads while the run stays as it is.
+    interval: float
+    # Time at which the run is next due, or 0 if it was never reloaded.
+    next_due: float = 0.0
+    last_reload: Optional[float] = None
+    last_growth: Optional[float] = None
+    last_read: Optional[float] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class RunReload:
+    """The outcome of reloading one run, as logged by the scheduler.
+
+    Attributes:
+      name: The run name.
+      staleness_secs: Seconds since the run was last reloaded, or None if
+        it was never reloaded before.
+      duration_secs: Wall time taken by the reload, in seconds.
+      grew: Whether the reload loaded new events.
+    """
+
+    name: str
+    staleness_secs: Optional[float]
+    duration_secs: float
+    grew: bool
+
+
+class ReloadScheduler:
+    """Reloads active and recently read runs often, and others rarely.
+
+    Each run has its own reload interval. It is reset to `min_interval_secs`
+    whenever a reload loads new events or the run's data is read, and
+    doubles after each reload that loads nothing, up to
+    `max_interval_secs`. Runs whose latest event is older than
+    `inactive_secs` go straight to the longest interval, much like event
+    files that `DirectoryLoader` stops polling once they are inactive.
+
+    This class is thread-safe.
+    """
+
+    def __init__(
+        self,
+        min_interval_secs,
+        max_interval_secs,
+        hot_secs=DEFAULT_HOT_SECS,
+        inactive_secs=None,
+        clock=None,
+    ):
+        """Creates a `ReloadScheduler`.
+
+        Args:
+          min_interval_secs: The interval at which growing and recently
+            read runs are reloaded.
+          max_interval_secs: The longest interval between two reloads of
+            any run.
+          hot_secs: Runs read within this many seconds are kept at the
+            shortest interval even if they do not grow.
+          inactive_secs: Optional age in seconds of the latest event of a
+            run after which it is considered inactive.
+          clock: Optional object with a `time()` method, for tests.
+            Defaults to the `time` module.
+        """
+        if max_interval_secs < min_interval_secs:
+            raise ValueError(
+                "max_interval_secs (%r) must be at least min_interval_secs (%r)"
+                % (max_interval_secs, min_interval_secs)
+            )
+        self._min_interval = min_interval_secs
+        self._max_interval = max_interval_secs
+        self._hot_secs = hot_secs
+        self._inactive_secs = inactive_secs
+        self._clock = clock or time
+        self._runs = {}
+        self._mutex = threading.Lock()
+
+    def _State(self, name):
+        state = self._runs.get(name)
+        if state is None:
+            state = _RunState(interval=self._min_interval)
+            self._runs[name] = state
+        return state
+
+    def DueRuns(self, names):
+        """Selects and orders the runs to reload now.
+
+        Args:
+          names: A collection of run names.
+
+        Returns:
+          A list of those of `names` that are due, most urgent first:
+          runs read most recently come first, followed by runs that grew
+          most recently.
+        """
+        now = self._clock.time()
+        with self._mutex:
+            due = [
+                (name, self._State(name))
+                for name in names
+                if self._State(name).next_due <= now
+            ]
+        due.sort(
+            key=lambda item: (
+                -(item[1].last_read or 0),
+                -(item[1].last_growth or 0),
+                item[0],
+            )
+        )
+        return [name for (name, _) in due]
+
+    def RecordRead(self, names):
+        """Notes that the data of the given runs was requested.
+
+        The runs become due once the shortest interval has passed since
+        their last reload, and stay at that interval for `hot_secs`.
+        """
+        now = self._clock.time()
+        with self._mutex:
+            for name in names:
+                state = self._State(name)
+                state.last_read = now
+                state.interval = self._min_interval
+                state.next_due = min(
+                    state.next_due,
+                    (state.last_reload or 0) + self._min_interval,
+                )
+
+    def RecordReload(self, name, start, grew, latest_wall_time=None):
+        """Schedules the next reload of a run after reloading it.
+
+        Args:
+          name: The run name.
+          start: The time at which the reload started, from `time.time()`.
+          grew: Whether the reload loaded any new events.
+          latest_wall_time: Optional wall time of the latest event of the
+            run.
+
+        Returns:
+          A `RunReload`.
+        """
+        now = self._clock.time()
+        with self._mutex:
+            state = self._State(name)
+            staleness = (
+                start - state.last_reload
+                if state.last_reload is not None
+                else None
+            )
+            state.last_reload = start
+            if grew:
+                state.last_growth = now
+            hot = grew or (
+                state.last_read is not None
+                and now - state.last_read < self._hot_secs
+            )
+            inactive = (
+                self._inactive_secs is not None
+                and latest_wall_time is not None
+                and latest_wall_time >= 0
+                and now - latest_wall_time > self._inactive_secs
+            )
+            if hot:
+                state.interval = self._min_interval
+            elif inactive:
+                state.interval = self._max_interval
+            else:
+                state.interval = min(state.interval * 2, self._max_interval)
+            state.next_due = start + state.interval
+        return RunReload(
+            name=name,
+            staleness_secs=staleness,
+            duration_secs=now - start,
+            grew=grew,
+        )
+
+    def Interval(self, name):
+        """Returns the current reload interval of a run, in seconds."""
+        with self._mutex:
+            return self._State(name).interval
+
+    def RemoveRun(self, name):
+        """Forgets a run, e.g. after it was deleted."""
+        with self._mutex:
+            self._runs.pop(name, None)
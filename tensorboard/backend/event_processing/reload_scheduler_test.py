@@ -0,0 +1,117 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for reload_scheduler."""
+
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import reload_scheduler
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1e9
+
+    def time(self):
+        return self.now
+
+
+class ReloadSchedulerTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = _FakeClock()
+
+    def _make_scheduler(self, **kwargs):
+        kwargs.setdefault("min_interval_secs", 5)
+        kwargs.setdefault("max_interval_secs", 60)
+        kwargs.setdefault("hot_secs", 100)
+        return reload_scheduler.ReloadScheduler(clock=self.clock, **kwargs)
+
+    def _reload(self, scheduler, name, grew=False, latest_wall_time=None):
+        return scheduler.RecordReload(
+            name, self.clock.now, grew, latest_wall_time
+        )
+
+    def test_new_runs_are_due(self):
+        scheduler = self._make_scheduler()
+        self.assertEqual(scheduler.DueRuns(["b", "a"]), ["a", "b"])
+
+    def test_backs_off_idle_runs(self):
+        scheduler = self._make_scheduler()
+        intervals = []
+        for _ in range(6):
+            self._reload(scheduler, "a")
+            intervals.append(scheduler.Interval("a"))
+        self.assertEqual(intervals, [10, 20, 40, 60, 60, 60])
+        self.assertEqual(scheduler.DueRuns(["a"]), [])
+        self.clock.now += 59
+        self.assertEqual(scheduler.DueRuns(["a"]), [])
+        self.clock.now += 1
+        self.assertEqual(scheduler.DueRuns(["a"]), ["a"])
+
+    def test_growing_runs_stay_hot(self):
+        scheduler = self._make_scheduler()
+        for _ in range(3):
+            self._reload(scheduler, "a")
+        self._reload(scheduler, "a", grew=True)
+        self.assertEqual(scheduler.Interval("a"), 5)
+
+    def test_read_runs_become_due_and_stay_hot(self):
+        scheduler = self._make_scheduler()
+        for _ in range(4):
+            self._reload(scheduler, "a")
+        self.clock.now += 5
+        self.assertEqual(scheduler.DueRuns(["a"]), [])
+        scheduler.RecordRead(["a"])
+        self.assertEqual(scheduler.DueRuns(["a"]), ["a"])
+        self._reload(scheduler, "a")
+        self.assertEqual(scheduler.Interval("a"), 5)
+        self.clock.now += 100
+        self._reload(scheduler, "a")
+        self.assertEqual(scheduler.Interval("a"), 10)
+
+    def test_orders_read_then_growing_runs_first(self):
+        scheduler = self._make_scheduler()
+        for name in ("a", "b", "c"):
+            self._reload(scheduler, name)
+        self.clock.now += 1
+        self._reload(scheduler, "b", grew=True)
+        self.clock.now += 1
+        scheduler.RecordRead(["c"])
+        self.clock.now += 100
+        self.assertEqual(scheduler.DueRuns(["a", "b", "c"]), ["c", "b", "a"])
+
+    def test_inactive_runs_go_to_longest_interval(self):
+        scheduler = self._make_scheduler(inactive_secs=3600)
+        self._reload(scheduler, "old", latest_wall_time=self.clock.now - 7200)
+        self._reload(scheduler, "new", latest_wall_time=self.clock.now - 60)
+        self.assertEqual(scheduler.Interval("old"), 60)
+        self.assertEqual(scheduler.Interval("new"), 10)
+
+    def test_reports_staleness(self):
+        scheduler = self._make_scheduler()
+        first = self._reload(scheduler, "a")
+        self.assertIsNone(first.staleness_secs)
+        self.clock.now += 12
+        second = self._reload(scheduler, "a", grew=True)
+        self.assertEqual(second.staleness_secs, 12)
+        self.assertTrue(second.grew)
+
+    def test_rejects_bad_intervals(self):
+        with self.assertRaises(ValueError):
+            self._make_scheduler(min_interval_secs=10, max_interval_secs=5)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -17,8 +17,147 @@
 
 
 import collections
+import dataclasses
 import random
 import threading
+import weakref
+
+from typing import Any, Optional
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemStats:
+    """Summary statistics of the items stored under one reservoir key.
+
+    Attributes:
+      count: The number of items currently stored.
+      max_step: The largest `step` of any stored item, or `None` if there
+        are no items.
+      max_wall_time: The largest `wall_time` of any stored item, or `None`
+        if there are no items.
+      last: The last stored item, or `None` if there are no items.
+    """
+
+    count: int
+    max_step: Optional[int]
+    max_wall_time: Optional[float]
+    last: Any
+
+
+class ByteBudget:
+    """A limit on the total size of items, shared by several reservoirs.
+
+    Reservoirs charge the size of each item they keep to their budgets.
+    Once a budget is exceeded, items are evicted from the keys that hold
+    the most bytes, bringing them down to a common level, until the
+    budget is met with some room to spare. A key that adds items is thus
+    not starved by keys that filled the budget before it. Since every key
+    keeps at least its latest item, the budget may be exceeded by up to
+    one item per key.
+    """
+
+    def __init__(self, max_bytes):
+        """Creates a budget of `max_bytes` (a positive integer) bytes."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive, was %s" % max_bytes)
+        self.max_bytes = max_bytes
+        self._num_bytes = 0
+        # The `_ReservoirBucket`s charging this budget.
+        self._holders = weakref.WeakSet()
+        self._mutex = threading.Lock()
+        # Held while evicting, so that concurrent writers do not all
+        # evict for the same excess.
+        self._evict_mutex = threading.Lock()
+
+    @property
+    def num_bytes(self):
+        """The total size of the items currently charged to the budget."""
+        return self._num_bytes
+
+    def Charge(self, num_bytes):
+        """Adds `num_bytes`, which is negative for released items."""
+        with self._mutex:
+            self._num_bytes += num_bytes
+
+    def Exceeded(self):
+        return self._num_bytes > self.max_bytes
+
+    def HasRoom(self, num_bytes):
+        """Whether `num_bytes` more can be charged without exceeding."""
+        return self._num_bytes + num_bytes <= self.max_bytes
+
+    def _AddHolder(self, bucket):
+        with self._mutex:
+            self._holders.add(bucket)
+
+    def _RemoveHolder(self, bucket):
+        with self._mutex:
+            self._holders.discard(bucket)
+
+    def Enforce(self):
+        """Evicts items from the largest holders while exceeded.
+
+        Must be called without holding the mutex of any reservoir bucket.
+        If another thread is already evicting for this budget, returns
+        right away.
+        """
+        if not self._evict_mutex.acquire(blocking=False):
+            return
+        try:
+            while self.Exceeded():
+                with self._mutex:
+                    holders = list(self._holders)
+                # Keys with a single item cannot evict.
+                sizes = sorted(
+                    (
+                        (bucket.num_bytes, bucket)
+                        for bucket in holders
+                        if len(bucket.items) > 1
+                    ),
+                    key=lambda pair: pair[0],
+                    reverse=True,
+                )
+                target = self.max_bytes - self.max_bytes // _EVICTION_SLACK
+                level = _EvictionLevel(
+                    [size for (size, _) in sizes], self._num_bytes - target
+                )
+                evicted = False
+                for size, bucket in sizes:
+                    if size <= level:
+                        break
+                    evicted |= bucket._EvictTo(level, self)
+                if not evicted:
+                    break
+        finally:
+            self._evict_mutex.release()
+
+
+# When a `ByteBudget` is exceeded, it evicts down to `1 / _EVICTION_SLACK`
+# below its limit, so that the holders are not sorted on every item added.
+_EVICTION_SLACK = 16
+
+
+def _EvictionLevel(sizes, excess):
+    """Finds the level to which to cut the largest sizes to free `excess`.
+
+    Args:
+      sizes: A list of sizes, sorted in decreasing order.
+      excess: The total amount to remove from the sizes.
+
+    Returns:
+      The largest `level` such that cutting every size above `level` down
+      to `level` removes at least `excess`, or 0 if no level does.
+    """
+    total = 0
+    for i, size in enumerate(sizes):
+        total += size
+        next_size = sizes[i + 1] if i + 1 < len(sizes) else 0
+        # Cutting the first `i + 1` sizes to `level` removes
+        # `total - (i + 1) * level`.
+        level = (total - excess) // (i + 1)
+        if level >= next_size:
+            return max(level, 0)
+    return 0
 
 
 class Reservoir:
@@ -50,13 +189,45 @@ class Reservoir:
 
     Adding items has amortized O(1) runtime.
 
+    If constructed with `track_stats=True`, the reservoir also maintains
+    an `ItemStats` for each key as items are added and filtered, so that
+    `Stats` runs in constant time. This requires every stored item to
+    have numeric `step` and `wall_time` attributes.
+
+    If constructed with a `size_fn`, the reservoir can also limit the
+    total size of the items for each key, to `max_bytes` and to each of
+    the given shared `ByteBudget`s. When a limit is exceeded, items are
+    evicted uniformly at random (sparing the last item if
+    `always_keep_last`), and the key's capacity is lowered to the number
+    of items that remain, so that the items stay a uniform sample. The
+    capacity grows again, one item at a time, while the limits have room
+    for another item of the key's average size.
+
+    Reads do not contend with writes: `Items` and `Stats` return an
+    immutable snapshot of a key's items, published by the writer, without
+    taking any lock or copying. By default, a snapshot is published on the
+    first read after each change. With `deferred_publish`, changes are
+    only published by `Publish`, so that a writer adding many items can
+    publish them in batches, and readers meanwhile see the previous
+    snapshot.
+
     Fields:
       always_keep_last: Whether the latest seen sample is always at the
         end of the reservoir. Defaults to True.
       size: An integer of the maximum number of samples.
     """
 
-    def __init__(self, size, seed=0, always_keep_last=True):
+    def __init__(
+        self,
+        size,
+        seed=0,
+        always_keep_last=True,
+        track_stats=False,
+        size_fn=None,
+        max_bytes=0,
+        byte_budgets=(),
+        deferred_publish=False,
+    ):
         """Creates a new reservoir.
 
         Args:
@@ -67,15 +238,36 @@ class Reservoir:
             input items.
           always_keep_last: Whether to always keep the latest seen item in the
             end of the reservoir. Defaults to True.
+          track_stats: Whether to maintain the statistics returned by
+            `Stats`. Defaults to False.
+          size_fn: Optional function returning the size in bytes of an item
+            (after transformation by the `f` passed to `AddItem`). Required
+            for `max_bytes` and `byte_budgets`.
+          max_bytes: The maximum total size of the items for each key. If 0,
+            the size is not limited.
+          byte_budgets: `ByteBudget`s to charge the size of all items to.
+          deferred_publish: Whether changes only become visible to readers
+            once `Publish` is called. Keys are always published on their
+            first read.
 
         Raises:
-          ValueError: If size is negative or not an integer.
+          ValueError: If size is negative or not an integer, or if byte
+            limits are given without a `size_fn`.
         """
         if size < 0 or size != round(size):
             raise ValueError("size must be nonnegative integer, was %s" % size)
+        if (max_bytes or byte_budgets) and size_fn is None:
+            raise ValueError("byte limits require a size_fn")
         self._buckets = collections.defaultdict(
             lambda: _ReservoirBucket(
-                size, random.Random(seed), always_keep_last
+                size,
+                random.Random(seed),
+                always_keep_last,
+                track_stats,
+                size_fn=size_fn,
+                max_bytes=max_bytes,
+                byte_budgets=byte_budgets,
+                deferred_publish=deferred_publish,
             )
         )
         # _mutex guards the keys - creating new keys, retrieving by key, etc
@@ -103,14 +295,34 @@ class Reservoir:
           KeyError: If the key is not found in the reservoir.
 
         Returns:
-          [list, of, items] associated with that key.
+          A tuple of the items associated with that key, shared with other
+          readers.
         """
-        with self._mutex:
-            if key not in self._buckets:
-                raise KeyError("Key %s was not found in Reservoir" % key)
-            bucket = self._buckets[key]
+        # Reading a dict entry is atomic, so this takes no lock.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            raise KeyError("Key %s was not found in Reservoir" % key)
         return bucket.Items()
 
+    def Stats(self, key):
+        """Return summary statistics of the items associated with a key.
+
+        Only available if the reservoir was created with `track_stats`.
+
+        Args:
+          key: The key for which we are finding statistics.
+
+        Raises:
+          KeyError: If the key is not found in the reservoir.
+
+        Returns:
+          An `ItemStats`.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            raise KeyError("Key %s was not found in Reservoir" % key)
+        return bucket.Stats()
+
     def AddItem(self, key, item, f=lambda x: x):
         """Add a new item to the Reservoir with the given tag.
 
@@ -137,6 +349,20 @@ class Reservoir:
             bucket = self._buckets[key]
         bucket.AddItem(item, f)
 
+    def AddItems(self, key, items, f=lambda x: x):
+        """Adds several items, as if by `AddItem` on each in turn.
+
+        This takes the locks once for all items, rather than once per item.
+
+        Args:
+          key: The key to store the items under.
+          items: A sequence of items to add to the reservoir.
+          f: An optional function to transform the items that are kept.
+        """
+        with self._mutex:
+            bucket = self._buckets[key]
+        bucket.AddItems(items, f)
+
     def FilterItems(self, filterFn, key=None):
         """Filter items within a Reservoir, using a filtering function.
 
@@ -160,6 +386,68 @@ class Reservoir:
                     for bucket in self._buckets.values()
                 )
 
+    def SaveState(self):
+        """Returns the contents and sampling state of every bucket.
+
+        Returns:
+          A dict from key to bucket state, to pass to `RestoreState`. It is
+          picklable if the items are.
+        """
+        with self._mutex:
+            buckets = list(self._buckets.items())
+        return {key: bucket.SaveState() for (key, bucket) in buckets}
+
+    def RestoreState(self, state):
+        """Replaces all buckets with ones saved by `SaveState`.
+
+        Subsequent sampling decisions match those the saved reservoir
+        would have made.
+
+        Args:
+          state: A dict returned by `SaveState` on a reservoir of the same
+            size.
+        """
+        with self._mutex:
+            for bucket in self._buckets.values():
+                bucket.ReleaseBudgets()
+            self._buckets.clear()
+            for key, bucket_state in state.items():
+                self._buckets[key].RestoreState(bucket_state)
+
+    def Publish(self):
+        """Makes all changes visible to readers.
+
+        Only needed with `deferred_publish`. This copies the items of each
+        key that changed since it was last published.
+        """
+        with self._mutex:
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.Publish()
+
+    def NumBytes(self):
+        """Returns the total size of all items, if sizes are tracked.
+
+        Returns:
+          The sum of `size_fn` over all items, or 0 if the reservoir was
+          created without a `size_fn`.
+        """
+        with self._mutex:
+            buckets = list(self._buckets.values())
+        return sum(bucket.num_bytes for bucket in buckets)
+
+    def ReleaseBudgets(self):
+        """Stops charging items to the shared `ByteBudget`s.
+
+        The size of all items is released from the budgets. Call this
+        before discarding a reservoir with shared budgets, which would
+        otherwise stay charged for its items. The items remain readable.
+        """
+        with self._mutex:
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.ReleaseBudgets()
+
 
 class _ReservoirBucket:
     """A container for items from a stream, that implements reservoir sampling.
@@ -167,7 +455,17 @@ class _ReservoirBucket:
     It always stores the most recent item as its final item.
     """
 
-    def __init__(self, _max_size, _random=None, always_keep_last=True):
+    def __init__(
+        self,
+        _max_size,
+        _random=None,
+        always_keep_last=True,
+        track_stats=False,
+        size_fn=None,
+        max_bytes=0,
+        byte_budgets=(),
+        deferred_publish=False,
+    ):
         """Create the _ReservoirBucket.
 
         Args:
@@ -177,6 +475,13 @@ class _ReservoirBucket:
             random.Random(0).
           always_keep_last: Whether the latest seen item should always be included
             in the end of the bucket.
+          track_stats: Whether to maintain the maximum `step` and `wall_time`
+            of the items, for `Stats`.
+          size_fn: Optional function returning the size of an item in bytes.
+          max_bytes: The maximum total size of the items, or 0 for no limit.
+          byte_budgets: Shared `ByteBudget`s to charge item sizes to.
+          deferred_publish: Whether changes are only published by
+            `Publish`, rather than on the next read.
 
         Raises:
           ValueError: if the size is not a nonnegative integer.
@@ -196,6 +501,32 @@ class _ReservoirBucket:
         else:
             self._random = random.Random(0)
         self.always_keep_last = always_keep_last
+        self._track_stats = track_stats
+        self._max_step = None
+        self._max_wall_time = None
+        self._size_fn = size_fn
+        self._max_bytes = max_bytes
+        self._byte_budgets = tuple(byte_budgets)
+        for budget in self._byte_budgets:
+            budget._AddHolder(self)
+        # With a `size_fn`, `_sizes[i]` is the size of `items[i]`.
+        self._sizes = []
+        self.num_bytes = 0
+        # Capacity imposed by the byte limits, or 0 if none was yet.
+        self._byte_capacity = 0
+        self._deferred_publish = deferred_publish
+        # What readers see: a tuple `(items, stats)`, replaced as a whole
+        # and never mutated, or None if it must be built on the next read.
+        self._published = None
+        # Whether `items` changed since `_published` was built.
+        self._dirty = False
+
+    def _Capacity(self):
+        if self._byte_capacity and (
+            self._max_size == 0 or self._byte_capacity < self._max_size
+        ):
+            return self._byte_capacity
+        return self._max_size
 
     def AddItem(self, item, f=lambda x: x):
         """Add an item to the ReservoirBucket, replacing an old item if
@@ -217,16 +548,179 @@ class _ReservoirBucket:
             the reservoir.
         """
         with self._mutex:
-            if len(self.items) < self._max_size or self._max_size == 0:
-                self.items.append(f(item))
+            self._AddItemLocked(item, f)
+        self._EnforceBudgets()
+
+    def AddItems(self, items, f=lambda x: x):
+        """Adds several items in turn, holding the mutex only once."""
+        with self._mutex:
+            for item in items:
+                self._AddItemLocked(item, f)
+        self._EnforceBudgets()
+
+    def _AddItemLocked(self, item, f):
+        """Implements `AddItem`. Must be called with the mutex held."""
+        capacity = self._Capacity()
+        if capacity and len(self.items) >= capacity and self._HasByteRoom():
+            # The byte limits that lowered the capacity have room again.
+            self._byte_capacity += 1
+            if self._max_size and self._byte_capacity >= self._max_size:
+                self._byte_capacity = 0
+            capacity = self._Capacity()
+        index = None
+        if len(self.items) < capacity or capacity == 0:
+            added = f(item)
+            self.items.append(added)
+            removed = None
+        else:
+            r = self._random.randint(0, self._num_items_seen)
+            if r < capacity:
+                removed = self.items.pop(r)
+                index = r
+                added = f(item)
+                self.items.append(added)
+            elif self.always_keep_last:
+                removed = self.items[-1]
+                index = -1
+                added = f(item)
+                self.items[-1] = added
+            else:
+                added = removed = None
+        self._num_items_seen += 1
+        evicted = False
+        if self._size_fn is not None and added is not None:
+            if index is not None:
+                self._ChargeBytes(-self._sizes.pop(index))
+            size = self._size_fn(added)
+            self._sizes.append(size)
+            self._ChargeBytes(size)
+            evicted = self._EnforceByteLimits()
+        if self._track_stats and added is not None:
+            if evicted:
+                self._RecomputeStats()
+            else:
+                self._UpdateStats(added, removed)
+        if added is not None:
+            self._Changed()
+
+    def _Changed(self):
+        """Notes that the items changed. Must be called with the mutex held."""
+        if self._deferred_publish and self._published is not None:
+            self._dirty = True
+        else:
+            self._published = None
+
+    def _ChargeBytes(self, num_bytes):
+        self.num_bytes += num_bytes
+        for budget in self._byte_budgets:
+            budget.Charge(num_bytes)
+
+    def _HasByteRoom(self):
+        """Whether the byte limits that lowered the capacity have room for
+        another item of average size. Must be called with the mutex held."""
+        if not self._byte_capacity or not self.items:
+            return False
+        average = self.num_bytes / len(self.items)
+        if self._max_bytes and self.num_bytes + average > self._max_bytes:
+            return False
+        return all(budget.HasRoom(average) for budget in self._byte_budgets)
+
+    def _EnforceByteLimits(self):
+        """Evicts random items while `max_bytes` is exceeded.
+
+        Shared budgets are enforced separately, by `_EnforceBudgets`. Must
+        be called with the mutex held.
+
+        Returns:
+          Whether any items were evicted.
+        """
+        if not self._max_bytes:
+            return False
+        return self._EvictToLocked(self._max_bytes)
+
+    def _EvictToLocked(self, max_bytes):
+        """Evicts random items until they total at most `max_bytes`.
+
+        At least one item is always kept, and the capacity is lowered to
+        the number of items that remain. Must be called with the mutex
+        held.
+
+        Returns:
+          A list of the evicted items.
+        """
+        evicted = []
+        while len(self.items) > 1 and self.num_bytes > max_bytes:
+            # Evicting uniformly keeps the items a uniform sample.
+            if self.always_keep_last:
+                i = self._random.randrange(len(self.items) - 1)
+            else:
+                i = self._random.randrange(len(self.items))
+            evicted.append(self.items.pop(i))
+            self._ChargeBytes(-self._sizes.pop(i))
+        if evicted:
+            self._byte_capacity = len(self.items)
+        return evicted
+
+    def _EvictTo(self, max_bytes, budget):
+        """Evicts items on behalf of a shared `budget`; see `_EvictToLocked`.
+
+        Unlike other changes, evictions are published right away, so that
+        the memory of the evicted items is freed even if this bucket's own
+        writer is not publishing. Does nothing if the bucket no longer
+        charges `budget`.
+
+        Returns:
+          Whether any items were evicted.
+        """
+        with self._mutex:
+            if budget not in self._byte_budgets:
+                return False
+            evicted = self._EvictToLocked(max_bytes)
+            if not evicted:
+                return False
+            if self._track_stats:
+                self._RecomputeStats()
+            if not self._deferred_publish:
+                self._published = None
+            elif not self._dirty:
+                self._PublishLocked()
             else:
-                r = self._random.randint(0, self._num_items_seen)
-                if r < self._max_size:
-                    self.items.pop(r)
-                    self.items.append(f(item))
-                elif self.always_keep_last:
-                    self.items[-1] = f(item)
-            self._num_items_seen += 1
+                # Drop the evicted items from the published snapshot,
+                # without publishing the writer's other pending changes.
+                evicted_ids = set(map(id, evicted))
+                (items, _) = self._published
+                self._published = self._Snapshot(
+                    tuple(x for x in items if id(x) not in evicted_ids)
+                )
+            return True
+
+    def _EnforceBudgets(self):
+        """Enforces exceeded shared budgets. Call without the mutex held."""
+        for budget in self._byte_budgets:
+            if budget.Exceeded():
+                budget.Enforce()
+
+    def _UpdateStats(self, added, removed):
+        """Updates the tracked maxima after replacing `removed` by `added`.
+
+        This is O(1) unless the removed item held a maximum that the added
+        item does not match, which is rare for monotonic steps and times.
+        """
+        if removed is not None and (
+            added.step < removed.step or added.wall_time < removed.wall_time
+        ):
+            self._RecomputeStats()
+            return
+        if self._max_step is None or added.step > self._max_step:
+            self._max_step = added.step
+        if self._max_wall_time is None or added.wall_time > self._max_wall_time:
+            self._max_wall_time = added.wall_time
+
+    def _RecomputeStats(self):
+        self._max_step = max((x.step for x in self.items), default=None)
+        self._max_wall_time = max(
+            (x.wall_time for x in self.items), default=None
+        )
 
     def FilterItems(self, filterFn):
         """Filter items in a ReservoirBucket, using a filtering function.
@@ -249,7 +743,18 @@ class _ReservoirBucket:
         """
         with self._mutex:
             size_before = len(self.items)
-            self.items = list(filter(filterFn, self.items))
+            if self._size_fn is None:
+                self.items = list(filter(filterFn, self.items))
+            else:
+                kept = [
+                    (item, size)
+                    for (item, size) in zip(self.items, self._sizes)
+                    if filterFn(item)
+                ]
+                self.items = [item for (item, _) in kept]
+                sizes = [size for (_, size) in kept]
+                self._ChargeBytes(sum(sizes) - self.num_bytes)
+                self._sizes = sizes
             size_diff = size_before - len(self.items)
 
             # Estimate a correction the number of items seen
@@ -259,9 +764,101 @@ class _ReservoirBucket:
             self._num_items_seen = int(
                 round(self._num_items_seen * prop_remaining)
             )
+            if self._track_stats and size_diff:
+                self._RecomputeStats()
+            if size_diff:
+                self._Changed()
             return size_diff
 
-    def Items(self):
-        """Get all the items in the bucket."""
+    def SaveState(self):
+        """Returns the items and sampling state of the bucket."""
+        with self._mutex:
+            return {
+                "items": list(self.items),
+                "num_items_seen": self._num_items_seen,
+                "random_state": self._random.getstate(),
+                "byte_capacity": self._byte_capacity,
+            }
+
+    def RestoreState(self, state):
+        """Restores items and sampling state saved by `SaveState`.
+
+        Byte limits are enforced on the restored items, evicting some if
+        needed.
+        """
+        with self._mutex:
+            self.items = list(state["items"])
+            self._num_items_seen = state["num_items_seen"]
+            self._random.setstate(state["random_state"])
+            self._byte_capacity = state.get("byte_capacity", 0)
+            if self._size_fn is not None:
+                self._ChargeBytes(-self.num_bytes)
+                self._sizes = [self._size_fn(item) for item in self.items]
+                self._ChargeBytes(sum(self._sizes))
+                self._EnforceByteLimits()
+            if self._track_stats:
+                self._RecomputeStats()
+            self._PublishLocked()
+        self._EnforceBudgets()
+
+    def ReleaseBudgets(self):
+        """Releases all items from, and stops charging, shared budgets."""
         with self._mutex:
-            return list(self.items)
+            for budget in self._byte_budgets:
+                budget.Charge(-self.num_bytes)
+                budget._RemoveHolder(self)
+            self._byte_budgets = ()
+
+    def Publish(self):
+        """Makes the current items visible to readers."""
+        with self._mutex:
+            if self._published is None or self._dirty:
+                self._PublishLocked()
+
+    def _PublishLocked(self):
+        items = tuple(self.items)
+        stats = None
+        if self._track_stats:
+            stats = ItemStats(
+                count=len(items),
+                max_step=self._max_step,
+                max_wall_time=self._max_wall_time,
+                last=items[-1] if items else None,
+            )
+        self._published = (items, stats)
+        self._dirty = False
+
+    def _Snapshot(self, items):
+        """Returns a published tuple for `items`, computing their stats."""
+        stats = None
+        if self._track_stats:
+            stats = ItemStats(
+                count=len(items),
+                max_step=max((x.step for x in items), default=None),
+                max_wall_time=max((x.wall_time for x in items), default=None),
+                last=items[-1] if items else None,
+            )
+        return (items, stats)
+
+    def _Published(self):
+        published = self._published
+        if published is None:
+            with self._mutex:
+                if self._published is None:
+                    self._PublishLocked()
+                published = self._published
+        return published
+
+    def Items(self):
+        """Get a tuple of all the published items in the bucket."""
+        return self._Published()[0]
+
+    def Stats(self):
+        """Get an `ItemStats` for the published items in the bucket.
+
+        Raises:
+          ValueError: If the bucket was not created with `track_stats`.
+        """
+        if not self._track_stats:
+            raise ValueError("Reservoir was not created with track_stats")
+        return self._Published()[1]
@@ -14,11 +14,16 @@
 # ==============================================================================
 
 
+import collections
+
 import tensorflow as tf
 
 from tensorboard.backend.event_processing import reservoir
 
 
+_Event = collections.namedtuple("_Event", ["step", "wall_time"])
+
+
 class ReservoirTest(tf.test.TestCase):
     def testEmptyReservoir(self):
         r = reservoir.Reservoir(1)
@@ -34,8 +39,8 @@ class ReservoirTest(tf.test.TestCase):
         r.AddItem("bar", 9)
         r.AddItem("foo", 19)
         self.assertCountEqual(r.Keys(), ["foo", "bar"])
-        self.assertEqual(r.Items("foo"), [4, 19])
-        self.assertEqual(r.Items("bar"), [9])
+        self.assertEqual(r.Items("foo"), (4, 19))
+        self.assertEqual(r.Items("bar"), (9,))
 
     def testExceptions(self):
         with self.assertRaises(ValueError):
@@ -90,6 +95,16 @@ class ReservoirTest(tf.test.TestCase):
             r2.AddItem("key", i)
         self.assertNotEqual(r1.Items(key), r2.Items(key))
 
+    def testAddItemsMatchesAddItem(self):
+        one_by_one = reservoir.Reservoir(10)
+        batched = reservoir.Reservoir(10)
+        for start in range(0, 1000, 100):
+            items = list(range(start, start + 100))
+            for item in items:
+                one_by_one.AddItem("key", item, lambda x: -x)
+            batched.AddItems("key", items, lambda x: -x)
+        self.assertEqual(batched.Items("key"), one_by_one.Items("key"))
+
     def testFilterItemsByKey(self):
         r = reservoir.Reservoir(100, seed=0)
         for i in range(10):
@@ -107,6 +122,237 @@ class ReservoirTest(tf.test.TestCase):
         self.assertEqual(len(r.Items("key1")), 4)
         self.assertEqual(len(r.Items("key2")), 8)
 
+    def _assertStatsMatchItems(self, r, key):
+        items = r.Items(key)
+        stats = r.Stats(key)
+        self.assertEqual(stats.count, len(items))
+        self.assertEqual(
+            stats.max_step, max((x.step for x in items), default=None)
+        )
+        self.assertEqual(
+            stats.max_wall_time,
+            max((x.wall_time for x in items), default=None),
+        )
+        self.assertEqual(stats.last, items[-1] if items else None)
+
+    def testStats(self):
+        r = reservoir.Reservoir(10, track_stats=True)
+        with self.assertRaises(KeyError):
+            r.Stats("key")
+        for i in range(1000):
+            # Steps and wall times that are mostly, but not always,
+            # increasing, so that evictions sometimes remove the maximum.
+            r.AddItem("key", _Event(step=i % 97, wall_time=float(i % 89)))
+            self._assertStatsMatchItems(r, "key")
+
+    def testStatsAfterFilterItems(self):
+        r = reservoir.Reservoir(0, track_stats=True)
+        for i in range(10):
+            r.AddItem("key", _Event(step=i, wall_time=100.0 - i))
+        r.FilterItems(lambda x: x.step < 5, "key")
+        self._assertStatsMatchItems(r, "key")
+        self.assertEqual(r.Stats("key").max_step, 4)
+        self.assertEqual(r.Stats("key").max_wall_time, 100.0)
+        r.FilterItems(lambda x: False, "key")
+        self._assertStatsMatchItems(r, "key")
+        self.assertEqual(r.Stats("key").count, 0)
+
+    def testStatsRequireTracking(self):
+        r = reservoir.Reservoir(10)
+        r.AddItem("key", 1)
+        with self.assertRaises(ValueError):
+            r.Stats("key")
+
+    def testStatsAfterRestoreState(self):
+        r = reservoir.Reservoir(5, track_stats=True)
+        for i in range(20):
+            r.AddItem("key", _Event(step=i, wall_time=float(i)))
+        restored = reservoir.Reservoir(5, track_stats=True)
+        restored.RestoreState(r.SaveState())
+        self.assertEqual(restored.Stats("key"), r.Stats("key"))
+
+    def testMaxBytes(self):
+        r = reservoir.Reservoir(100, size_fn=len, max_bytes=50)
+        for i in range(1000):
+            r.AddItem("key", "x" * 10 + str(i))
+            self.assertLessEqual(r.NumBytes(), 50)
+        items = r.Items("key")
+        self.assertEqual(items[-1], "x" * 10 + "999")
+        # Items are 12-13 bytes, so 3 fit in the budget.
+        self.assertLen(items, 3)
+        self.assertEqual(r.NumBytes(), sum(len(x) for x in items))
+        # Other keys have their own limit.
+        r.AddItem("other", "y" * 40)
+        self.assertEqual(r.Items("other"), ("y" * 40,))
+
+    def testMaxBytesKeepsOneItem(self):
+        r = reservoir.Reservoir(10, size_fn=len, max_bytes=5)
+        r.AddItem("key", "too large")
+        r.AddItem("key", "also too large")
+        self.assertEqual(r.Items("key"), ("also too large",))
+
+    def testMaxBytesIsDeterministic(self):
+        def fill():
+            r = reservoir.Reservoir(10, size_fn=len, max_bytes=20)
+            for i in range(100):
+                r.AddItem("key", str(i))
+            return r.Items("key")
+
+        self.assertEqual(fill(), fill())
+
+    def testByteBudgetSharedAcrossReservoirs(self):
+        budget = reservoir.ByteBudget(100)
+        r1 = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        r2 = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        for i in range(20):
+            r1.AddItem("key", "a" * 10)
+        self.assertLessEqual(budget.num_bytes, 100)
+        for i in range(5):
+            r2.AddItem("key", "b" * 10)
+        self.assertLessEqual(budget.num_bytes, 100)
+        # The budget is split between the keys.
+        self.assertLen(r2.Items("key"), len(r1.Items("key")))
+        self.assertEqual(budget.num_bytes, r1.NumBytes() + r2.NumBytes())
+        r1.ReleaseBudgets()
+        self.assertEqual(budget.num_bytes, r2.NumBytes())
+        self.assertNotEmpty(r1.Items("key"))
+
+    def testByteBudgetEvictsFromLargestHolders(self):
+        budget = reservoir.ByteBudget(1000)
+        large = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        small = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        for i in range(20):
+            large.AddItem("key", "a" * 100)
+        self.assertLen(large.Items("key"), 10)
+        for i in range(20):
+            small.AddItem("key", "b")
+        # The key that filled the budget first makes room for the other.
+        self.assertLen(small.Items("key"), 20)
+        self.assertLess(len(large.Items("key")), 10)
+        self.assertLessEqual(budget.num_bytes, 1000)
+
+    def testByteBudgetIsSharedEvenly(self):
+        # Events have a `len` of 2, so 10 fit in the budget.
+        budget = reservoir.ByteBudget(20)
+        r = reservoir.Reservoir(
+            0, size_fn=len, byte_budgets=[budget], track_stats=True
+        )
+        for key in ("first", "second"):
+            for i in range(20):
+                r.AddItem(key, _Event(step=i, wall_time=float(i)))
+        sizes = [len(r.Items(key)) for key in ("first", "second")]
+        # Up to the room left after evicting, which the writer takes.
+        self.assertAllInRange(sizes, 4, 6)
+        self.assertLessEqual(budget.num_bytes, 20)
+        # The stats of the key evicted by another's writes are updated.
+        self.assertEqual(r.Stats("first").count, sizes[0])
+        self.assertEqual(r.Stats("first").max_step, 19)
+
+    def testByteCapacityRecoversAfterRelease(self):
+        budget = reservoir.ByteBudget(1000)
+        r1 = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        r2 = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        for i in range(20):
+            r1.AddItem("key", "a" * 100)
+        for i in range(20):
+            r2.AddItem("key", "b" * 100)
+        self.assertLess(len(r2.Items("key")), 10)
+        r1.ReleaseBudgets()
+        for i in range(40):
+            r2.AddItem("key", "b" * 100)
+        self.assertLen(r2.Items("key"), 10)
+        self.assertEqual(budget.num_bytes, 1000)
+
+    def testByteBudgetEvictionsArePublished(self):
+        budget = reservoir.ByteBudget(100)
+        r1 = reservoir.Reservoir(
+            0, size_fn=len, byte_budgets=[budget], deferred_publish=True
+        )
+        r2 = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        for i in range(10):
+            r1.AddItem("key", "a%09d" % i)
+        r1.Publish()
+        r1.AddItem("key", "a%09d" % 10)
+        for i in range(5):
+            r2.AddItem("key", "b" * 10)
+        # Evicted items are gone from the snapshot, but the unpublished
+        # new item is not yet visible.
+        items = r1.Items("key")
+        self.assertLess(len(items), 10)
+        self.assertNotIn("a%09d" % 10, items)
+        r1.Publish()
+        self.assertEqual(r1.Items("key")[-1], "a%09d" % 10)
+
+    def testMaxBytesCapacityRecoversAfterFilter(self):
+        r = reservoir.Reservoir(100, size_fn=len, max_bytes=50)
+        for i in range(20):
+            r.AddItem("key", "%010d" % i)
+        self.assertLen(r.Items("key"), 5)
+        r.FilterItems(lambda x: x == "%010d" % 19)
+        for i in range(20, 40):
+            r.AddItem("key", "%010d" % i)
+        self.assertLen(r.Items("key"), 5)
+
+    def testByteLimitsRequireSizeFn(self):
+        with self.assertRaises(ValueError):
+            reservoir.Reservoir(10, max_bytes=10)
+        with self.assertRaises(ValueError):
+            reservoir.ByteBudget(0)
+
+    def testFilterItemsReleasesBytes(self):
+        budget = reservoir.ByteBudget(1000)
+        r = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        for i in range(10):
+            r.AddItem("key", str(i))
+        r.FilterItems(lambda x: int(x) < 4)
+        self.assertEqual(r.NumBytes(), 4)
+        self.assertEqual(budget.num_bytes, 4)
+
+    def testRestoreStateEnforcesByteLimits(self):
+        r = reservoir.Reservoir(0, size_fn=len)
+        for i in range(10):
+            r.AddItem("key", "%02d" % i)
+        budget = reservoir.ByteBudget(10)
+        restored = reservoir.Reservoir(0, size_fn=len, byte_budgets=[budget])
+        restored.RestoreState(r.SaveState())
+        self.assertLen(restored.Items("key"), 5)
+        self.assertEqual(restored.Items("key")[-1], "09")
+        self.assertEqual(budget.num_bytes, 10)
+        restored.RestoreState(r.SaveState())
+        self.assertEqual(budget.num_bytes, 10)
+
+    def testReadsShareSnapshots(self):
+        r = reservoir.Reservoir(10, track_stats=True)
+        for i in range(5):
+            r.AddItem("key", _Event(step=i, wall_time=i))
+        items = r.Items("key")
+        self.assertIs(r.Items("key"), items)
+        r.AddItem("key", _Event(step=5, wall_time=5))
+        # Earlier snapshots are unaffected by writes.
+        self.assertLen(items, 5)
+        self.assertLen(r.Items("key"), 6)
+        self.assertEqual(r.Stats("key").max_step, 5)
+
+    def testDeferredPublish(self):
+        r = reservoir.Reservoir(10, track_stats=True, deferred_publish=True)
+        r.AddItem("key", _Event(step=0, wall_time=0))
+        # Keys are published on their first read.
+        self.assertLen(r.Items("key"), 1)
+        for i in range(1, 5):
+            r.AddItem("key", _Event(step=i, wall_time=i))
+        r.FilterItems(lambda x: x.step != 0)
+        self.assertLen(r.Items("key"), 1)
+        self.assertEqual(r.Stats("key").max_step, 0)
+        r.Publish()
+        self.assertEqual([x.step for x in r.Items("key")], [1, 2, 3, 4])
+        self.assertEqual(r.Stats("key").count, 4)
+        self.assertEqual(r.Stats("key").max_step, 4)
+        # Saved state includes unpublished items.
+        r.AddItem("key", _Event(step=5, wall_time=5))
+        restored = reservoir.Reservoir(10, deferred_publish=True)
+        restored.RestoreState(r.SaveState())
+        self.assertLen(restored.Items("key"), 5)
+
 
 class ReservoirBucketTest(tf.test.TestCase):
     def testEmptyBucket(self):
@@ -117,7 +363,7 @@ class ReservoirBucketTest(tf.test.TestCase):
         b = reservoir._ReservoirBucket(100)
         for i in range(100):
             b.AddItem(i)
-        self.assertEqual(b.Items(), list(range(100)))
+        self.assertEqual(b.Items(), tuple(range(100)))
         self.assertEqual(b._num_items_seen, 100)
 
     def testDoesntOverfill(self):
@@ -148,14 +394,14 @@ class ReservoirBucketTest(tf.test.TestCase):
         b = reservoir._ReservoirBucket(1)
         for i in range(20):
             b.AddItem(i)
-            self.assertEqual(b.Items(), [i])
+            self.assertEqual(b.Items(), (i,))
         self.assertEqual(b._num_items_seen, 20)
 
     def testSizeZeroBucket(self):
         b = reservoir._ReservoirBucket(0)
         for i in range(20):
             b.AddItem(i)
-            self.assertEqual(b.Items(), list(range(i + 1)))
+            self.assertEqual(b.Items(), tuple(range(i + 1)))
         self.assertEqual(b._num_items_seen, 20)
 
     def testSizeRequirement(self):
@@ -214,7 +460,7 @@ class ReservoirBucketTest(tf.test.TestCase):
         for i in range(1000):
             b.AddItem(i, incrementer.increment_and_double)
         self.assertEqual(incrementer.n, 100)
-        self.assertEqual(b.Items(), [x * 2 for x in range(100)])
+        self.assertEqual(b.Items(), tuple(x * 2 for x in range(100)))
 
         # This time, we will always keep the last item, meaning that the function
         # should get invoked once for every item we add.
@@ -224,7 +470,9 @@ class ReservoirBucketTest(tf.test.TestCase):
         for i in range(1000):
             b.AddItem(i, incrementer.increment_and_double)
         self.assertEqual(incrementer.n, 1000)
-        self.assertEqual(b.Items(), [x * 2 for x in range(99)] + [999 * 2])
+        self.assertEqual(
+            b.Items(), tuple(x * 2 for x in range(99)) + (999 * 2,)
+        )
 
 
 class ReservoirBucketStatisticalDistributionTest(tf.test.TestCase):
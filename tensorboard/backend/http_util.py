@@ -15,13 +15,14 @@
 """TensorBoard HTTP utilities."""
 
 
+import collections.abc
 import gzip
 import io
-import json
 import re
 import struct
 import time
 import wsgiref.handlers
+import zlib
 
 import werkzeug
 
@@ -80,6 +81,10 @@ _JSON_MIMETYPES = set(
 # Do not support xhtml for now.
 _HTML_MIMETYPE = "text/html"
 
+# Streamed JSON responses are encoded and compressed in pieces of about
+# this many bytes.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def Respond(
     request,
@@ -91,6 +96,7 @@ def Respond(
     encoding="utf-8",
     csp_scripts_sha256s=None,
     headers=None,
+    etag=None,
 ):
     """Construct a werkzeug Response.
 
@@ -104,6 +110,10 @@ def Respond(
     the browser for that many seconds; however, proxies are still forbidden from
     caching so that developers can bypass the cache with Ctrl+Shift+R.
 
+    If an etag is given, it is sent as the ETag header, and a GET or HEAD
+    request whose If-None-Match header matches it gets an empty 304 (Not
+    Modified) response instead, without serializing or compressing content.
+
     For textual content that isn't JSON, the encoding parameter is used as the
     transmission charset which is automatically appended to the Content-Type
     header. That is unless of course the content_type parameter contains a
@@ -111,17 +121,25 @@ def Respond(
     transcoded to the latter.
 
     If content_type declares a JSON media type, then content MAY be a dict, list,
-    tuple, or set, in which case this function has an implicit composition with
-    json_util.Cleanse and json.dumps. The encoding parameter is used to decode
-    byte strings within the JSON object; therefore transmitting binary data
-    within JSON is not permitted. JSON is transmitted as ASCII unless the
+    tuple, or set, in which case it is serialized with json_util.Dumps, which
+    is equivalent to json.dumps composed with json_util.Cleanse. The encoding
+    parameter is used to decode byte strings within the JSON object; therefore
+    transmitting binary data within JSON is not permitted. JSON is transmitted as ASCII unless the
     content_type parameter explicitly defines a charset parameter, in which case
     the serialized JSON bytes will use that instead of escape sequences.
 
+    For JSON media types, content MAY also be an iterator, such as a generator,
+    in which case it is transmitted as a JSON array of its elements. The array
+    is serialized, cleansed, and compressed incrementally while the response is
+    being sent, so memory use is bounded by the largest element rather than by
+    the whole payload. Such responses have no Content-Length, and are sent with
+    chunked transfer encoding.
+
     Args:
       request: A werkzeug Request object. Used mostly to check the
         Accept-Encoding header.
-      content: Payload data as byte string, unicode string, or maybe JSON.
+      content: Payload data as byte string, unicode string, or maybe JSON or
+        an iterator of JSON values.
       content_type: Media type and optionally an output charset.
       code: Numeric HTTP status code to use.
       expires: Second duration for browser caching.
@@ -134,20 +152,46 @@ def Respond(
       headers: Any additional headers to include on the response, as a
         list of key-value tuples: e.g., `[("Allow", "GET")]`. In case of
         conflict, these may be overridden with headers added by this function.
+      etag: Optional string identifying this version of the content, such
+        as a data generation from `DataProvider.data_generation`. It must
+        change whenever content does, for a given URL.
 
     Returns:
       A werkzeug Response object (a WSGI application).
     """
 
+    if (
+        etag is not None
+        and code == 200
+        and request.method in ("GET", "HEAD")
+        and request.if_none_match.contains(etag)
+    ):
+        return _not_modified(etag, expires, headers)
+
     mimetype = _EXTRACT_MIMETYPE_PATTERN.search(content_type).group(0)
     charset_match = _EXTRACT_CHARSET_PATTERN.search(content_type)
     charset = charset_match.group(1) if charset_match else encoding
     textual = charset_match or mimetype in _TEXTUAL_MIMETYPES
+    if mimetype in _JSON_MIMETYPES and isinstance(
+        content, collections.abc.Iterator
+    ):
+        return _respond_json_stream(
+            request,
+            content,
+            content_type,
+            code,
+            expires,
+            encoding,
+            charset,
+            ensure_ascii=not charset_match,
+            headers=headers,
+            etag=etag,
+        )
     if mimetype in _JSON_MIMETYPES and isinstance(
         content, (dict, list, set, tuple)
     ):
-        content = json.dumps(
-            json_util.Cleanse(content, encoding), ensure_ascii=not charset_match
+        content = json_util.Dumps(
+            content, encoding, ensure_ascii=not charset_match
         )
 
     # Ensure correct output encoding, transcoding if necessary.
@@ -190,13 +234,7 @@ def Respond(
     headers.append(("X-Content-Type-Options", "nosniff"))
     if content_encoding:
         headers.append(("Content-Encoding", content_encoding))
-    if expires > 0:
-        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
-        headers.append(("Expires", e))
-        headers.append(("Cache-Control", "private, max-age=%d" % expires))
-    else:
-        headers.append(("Expires", "0"))
-        headers.append(("Cache-Control", "no-cache, must-revalidate"))
+    _append_cache_headers(headers, etag, expires)
     if mimetype == _HTML_MIMETYPE:
         frags = (
             _CSP_SCRIPT_DOMAINS_WHITELIST
@@ -259,6 +297,103 @@ def Respond(
     )
 
 
+def _respond_json_stream(
+    request,
+    elements,
+    content_type,
+    code,
+    expires,
+    encoding,
+    charset,
+    ensure_ascii,
+    headers,
+    etag,
+):
+    """Constructs a response that streams an iterator as a JSON array."""
+    compress = bool(
+        _ALLOWS_GZIP_PATTERN.search(request.headers.get("Accept-Encoding", ""))
+    )
+    headers = list(headers or [])
+    headers.append(("X-Content-Type-Options", "nosniff"))
+    if compress:
+        headers.append(("Content-Encoding", "gzip"))
+    _append_cache_headers(headers, etag, expires)
+    if request.method == "HEAD":
+        content = None
+    else:
+        content = _json_stream_chunks(
+            elements, encoding, charset, ensure_ascii, compress
+        )
+    return werkzeug.wrappers.Response(
+        response=content,
+        status=code,
+        headers=headers,
+        content_type=content_type,
+    )
+
+
+def _json_stream_chunks(elements, encoding, charset, ensure_ascii, compress):
+    """Yields the encoded and optionally gzipped bytes of a JSON array.
+
+    The output is the same as that of `json_util.Dumps` on the list of
+    elements, but each element is only serialized when the preceding output
+    has been consumed.
+    """
+    if compress:
+        # Same level as non-streamed responses; a window size above 16
+        # selects a gzip header, with an mtime of zero.
+        compressor = zlib.compressobj(3, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pending = []
+    pending_size = 0
+    for text in _json_array_fragments(elements, encoding, ensure_ascii):
+        data = text.encode(charset)
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size < _STREAM_CHUNK_SIZE:
+            continue
+        chunk = b"".join(pending)
+        pending = []
+        pending_size = 0
+        if compress:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            yield chunk
+    chunk = b"".join(pending)
+    if compress:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def _json_array_fragments(elements, encoding, ensure_ascii):
+    yield "["
+    for i, element in enumerate(elements):
+        if i:
+            yield ", "
+        yield json_util.Dumps(element, encoding, ensure_ascii=ensure_ascii)
+    yield "]"
+
+
+def _not_modified(etag, expires, headers):
+    """Constructs a 304 response for a request whose ETag matched."""
+    headers = list(headers or [])
+    headers.append(("X-Content-Type-Options", "nosniff"))
+    _append_cache_headers(headers, etag, expires)
+    return werkzeug.wrappers.Response(status=304, headers=headers)
+
+
+def _append_cache_headers(headers, etag, expires):
+    if etag is not None:
+        headers.append(("ETag", werkzeug.http.quote_etag(etag)))
+    if expires > 0:
+        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
+        headers.append(("Expires", e))
+        headers.append(("Cache-Control", "private, max-age=%d" % expires))
+    else:
+        headers.append(("Expires", "0"))
+        headers.append(("Cache-Control", "no-cache, must-revalidate"))
+
+
 def _create_csp_string(*csp_fragments):
     csp_string = " ".join([frag for frag in csp_fragments if frag])
     return csp_string if csp_string else "'none'"
@@ -204,11 +204,113 @@ class RespondTest(tb_test.TestCase):
         r = http_util.Respond(q, [1, 2, 3], "application/json")
         self.assertEqual(r.response, [b"[1, 2, 3]"])
 
+    def testJsonIterator_streamsArray(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        content = [1, float("inf"), {"a": b"b"}, {3, 2}]
+        r = http_util.Respond(q, iter(content), "application/json")
+        self.assertIsNone(r.headers.get("Content-Length"))
+        self.assertIsNone(r.headers.get("Content-Encoding"))
+        self.assertEqual(
+            b"".join(r.response),
+            http_util.Respond(q, content, "application/json").get_data(),
+        )
+
+    def testJsonIterator_isConsumedLazily(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        consumed = []
+
+        def elements():
+            for i in range(3):
+                consumed.append(i)
+                yield "x" * http_util._STREAM_CHUNK_SIZE
+
+        r = http_util.Respond(q, elements(), "application/json")
+        self.assertEqual(consumed, [])
+        chunks = iter(r.response)
+        next(chunks)
+        self.assertEqual(consumed, [0])
+        next(chunks)
+        self.assertEqual(consumed, [0, 1])
+
+    def testJsonIterator_acceptGzip_compressesIncrementally(self):
+        q = wrappers.Request(
+            wtest.EnvironBuilder(
+                headers={"Accept-Encoding": "gzip"}
+            ).get_environ()
+        )
+        content = [{"step": i, "value": i * 0.5} for i in range(20000)]
+        r = http_util.Respond(q, iter(content), "application/json")
+        self.assertEqual(r.headers.get("Content-Encoding"), "gzip")
+        chunks = list(r.response)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            _gunzip(b"".join(chunks)),
+            http_util.Respond(
+                wrappers.Request(wtest.EnvironBuilder().get_environ()),
+                content,
+                "application/json",
+            ).get_data(),
+        )
+
+    def testJsonIterator_headRequest_doesNotConsume(self):
+        q = wrappers.Request(wtest.EnvironBuilder(method="HEAD").get_environ())
+        consumed = []
+
+        def elements():
+            consumed.append(True)
+            yield 1
+
+        r = http_util.Respond(q, elements(), "application/json")
+        self.assertEqual(b"".join(r.response), b"")
+        self.assertEqual(consumed, [])
+
     def testExpires_setsCruiseControl(self):
         q = wrappers.Request(wtest.EnvironBuilder().get_environ())
         r = http_util.Respond(q, "<b>hello world</b>", "text/html", expires=60)
         self.assertEqual(r.headers.get("Cache-Control"), "private, max-age=60")
 
+    def testEtag_setsHeader(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.Respond(q, [1, 2, 3], "application/json", etag="abc-1")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.headers.get("ETag"), '"abc-1"')
+        self.assertEqual(r.response, [b"[1, 2, 3]"])
+
+    def testEtag_matchingIfNoneMatch_notModified(self):
+        q = wrappers.Request(
+            wtest.EnvironBuilder(
+                headers={"If-None-Match": '"abc-0", "abc-1"'}
+            ).get_environ()
+        )
+        # Not serializable, so this also checks that content is unused.
+        content = object()
+        r = http_util.Respond(q, content, "application/json", etag="abc-1")
+        self.assertEqual(r.status_code, 304)
+        self.assertEqual(r.headers.get("ETag"), '"abc-1"')
+        self.assertEqual(
+            r.headers.get("Cache-Control"), "no-cache, must-revalidate"
+        )
+        self.assertEqual(list(r.response), [])
+
+    def testEtag_staleIfNoneMatch_sendsContent(self):
+        q = wrappers.Request(
+            wtest.EnvironBuilder(
+                headers={"If-None-Match": '"abc-0"'}
+            ).get_environ()
+        )
+        r = http_util.Respond(q, [1, 2, 3], "application/json", etag="abc-1")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.response, [b"[1, 2, 3]"])
+
+    def testEtag_post_ignoresIfNoneMatch(self):
+        q = wrappers.Request(
+            wtest.EnvironBuilder(
+                method="POST", headers={"If-None-Match": '"abc-1"'}
+            ).get_environ()
+        )
+        r = http_util.Respond(q, [1, 2, 3], "application/json", etag="abc-1")
+        self.assertEqual(r.status_code, 200)
+
     def testHeaders(self):
         q = wrappers.Request(wtest.EnvironBuilder().get_environ())
         body = "No GET, only POST"
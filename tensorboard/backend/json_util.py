@@ -25,12 +25,16 @@ keyword argument overrides this.
 
 
 import collections
+import json
 import math
+import re
 
 
 _INFINITY = float("inf")
 _NEGATIVE_INFINITY = float("-inf")
 
+_STRING_LITERAL_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+
 
 def Cleanse(obj, encoding="utf-8"):
     """Makes Python object appropriate for JSON serialization.
@@ -70,3 +74,79 @@ def Cleanse(obj, encoding="utf-8"):
         )
     else:
         return obj
+
+
+def Dumps(obj, encoding="utf-8", ensure_ascii=True):
+    """Serializes a Python object to JSON as `json.dumps(Cleanse(obj))` would.
+
+    Rather than copying the whole structure with `Cleanse` first, this lets
+    the C encoder in the `json` module do the work in a single pass:
+
+    - Infinity/-Infinity/NaN are written as bare tokens and then quoted by
+      a scan of the output, which is skipped if they cannot occur in it.
+    - Byte strings, sets, and objects with a `tolist` method (such as NumPy
+      arrays and scalars) are converted as they are encountered.
+
+    Args:
+      obj: Python data structure.
+      encoding: Charset used to decode byte strings.
+      ensure_ascii: Passed to `json.dumps`.
+
+    Returns:
+      A JSON string.
+    """
+
+    def default(o):
+        if isinstance(o, bytes):
+            return o.decode(encoding)
+        if isinstance(o, set):
+            return sorted(o)
+        if hasattr(o, "tolist"):
+            return o.tolist()
+        raise TypeError(
+            "Object of type %s is not JSON serializable" % type(o).__name__
+        )
+
+    try:
+        result = json.dumps(obj, ensure_ascii=ensure_ascii, default=default)
+    except TypeError:
+        # E.g., byte string keys, which the encoder rejects before
+        # consulting `default`.
+        return json.dumps(Cleanse(obj, encoding), ensure_ascii=ensure_ascii)
+    if "NaN" not in result and "Infinity" not in result:
+        return result
+    return _QuoteNonFiniteTokens(result)
+
+
+def _QuoteNonFiniteTokens(text):
+    """Quotes the non-finite number tokens outside string literals."""
+    # `str.find` is much faster than a regex search for these, and the
+    # tokens are usually rare.
+    positions = []
+    for token in ("NaN", "Infinity"):
+        i = text.find(token)
+        while i >= 0:
+            positions.append(i)
+            i = text.find(token, i + len(token))
+    positions.sort()
+    pieces = []
+    copied = 0
+    # A position in `text` that is known not to be inside a string literal.
+    outside = 0
+    for start in positions:
+        end = start + (3 if text.startswith("NaN", start) else 8)
+        if start > 0 and text[start - 1] == "-":
+            start -= 1
+        # Skip over any string literals before the token.
+        while outside <= start:
+            quote = text.find('"', outside, start)
+            if quote < 0:
+                break
+            outside = _STRING_LITERAL_PATTERN.match(text, quote).end()
+        if outside > start:
+            continue
+        pieces.append(text[copied:start])
+        pieces.append('"%s"' % text[start:end])
+        copied = outside = end
+    pieces.append(text[copied:])
+    return "".join(pieces)
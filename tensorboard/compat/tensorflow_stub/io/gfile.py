@@ -27,6 +27,9 @@ import os
 import os.path
 import sys
 import tempfile
+import threading
+
+from typing import Optional
 
 try:
     import botocore.exceptions
@@ -90,9 +93,12 @@ class StatData:
 
     Attributes:
       length: Length of the data content.
+      mtime_nsec: Last modification time in nanoseconds since the epoch, or
+        None if the filesystem does not report it.
     """
 
     length: int
+    mtime_nsec: Optional[int] = None
 
 
 class LocalFileSystem:
@@ -145,6 +151,27 @@ class LocalFileSystem:
             continuation_token = {"opaque_offset": f.tell()}
             return (data, continuation_token)
 
+    def open_for_read(self, filename, binary_mode=False):
+        """Opens a file for a sequence of reads.
+
+        Args:
+            filename: string, a path
+            binary_mode: bool, read as binary if True, otherwise text
+
+        Returns:
+            A readable file object, positioned at the start of the file.
+            Its `tell()` values may be used as the "opaque_offset" of a
+            continuation token for `read(...)`, and vice versa.
+        """
+        mode = "rb" if binary_mode else "r"
+        encoding = None if binary_mode else "utf8"
+        try:
+            return io.open(filename, mode, encoding=encoding)
+        except FileNotFoundError:
+            raise errors.NotFoundError(
+                None, None, "Not Found: " + compat.as_text(filename)
+            )
+
     def write(self, filename, file_content, binary_mode=False):
         """Writes string file contents to a file, overwriting any existing
         contents.
@@ -212,10 +239,10 @@ class LocalFileSystem:
         # NOTE: Size of the file is given by .st_size as returned from
         # os.stat(), but we convert to .length
         try:
-            file_length = os.stat(compat.as_bytes(filename)).st_size
+            st = os.stat(compat.as_bytes(filename))
         except OSError:
             raise errors.NotFoundError(None, None, "Could not find file")
-        return StatData(file_length)
+        return StatData(st.st_size, st.st_mtime_ns)
 
 
 class S3FileSystem:
@@ -225,6 +252,22 @@ class S3FileSystem:
         if not boto3:
             raise ImportError("boto3 must be installed for S3 support.")
         self._s3_endpoint = os.environ.get("S3_ENDPOINT", None)
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
+    def _client(self):
+        """Returns the S3 client, creating it on first use.
+
+        One client is shared by all calls, so that its connection pool
+        keeps connections alive across requests rather than setting up a
+        new session for each one. Clients are thread-safe.
+        """
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                self._s3_client = boto3.session.Session().client(
+                    "s3", endpoint_url=self._s3_endpoint
+                )
+            return self._s3_client
 
     def bucket_and_path(self, url):
         """Split an S3-prefixed URL into bucket and path."""
@@ -238,7 +281,7 @@ class S3FileSystem:
 
     def exists(self, filename):
         """Determines whether a path exists or not."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         r = client.list_objects(Bucket=bucket, Prefix=path, Delimiter="/")
         if r.get("Contents") or r.get("CommonPrefixes"):
@@ -269,9 +312,9 @@ class S3FileSystem:
             is an opaque value that can be passed to the next invocation of
             `read(...) ' in order to continue from the last read position.
         """
-        s3 = boto3.resource("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
-        args = {}
+        args = {"Bucket": bucket, "Key": path}
 
         # For the S3 case, we use continuation tokens of the form
         # {byte_offset: number}
@@ -291,13 +334,12 @@ class S3FileSystem:
             args["Range"] = "bytes={}-{}".format(offset, endpoint)
 
         try:
-            stream = s3.Object(bucket, path).get(**args)["Body"].read()
+            stream = client.get_object(**args)["Body"].read()
         except botocore.exceptions.ClientError as exc:
             if exc.response["Error"]["Code"] in ["416", "InvalidRange"]:
                 if size is not None:
                     # Asked for too much, so request just to the end. Do this
                     # in a second request so we don't check length in all cases.
-                    client = boto3.client("s3", endpoint_url=self._s3_endpoint)
                     obj = client.head_object(Bucket=bucket, Key=path)
                     content_length = obj["ContentLength"]
                     endpoint = min(content_length, offset + size)
@@ -306,7 +348,7 @@ class S3FileSystem:
                     stream = b""
                 else:
                     args["Range"] = "bytes={}-{}".format(offset, endpoint)
-                    stream = s3.Object(bucket, path).get(**args)["Body"].read()
+                    stream = client.get_object(**args)["Body"].read()
             else:
                 raise
         # `stream` should contain raw bytes here (i.e., there has been neither
@@ -326,7 +368,7 @@ class S3FileSystem:
             file_content: string, the contents
             binary_mode: bool, write as binary if True, otherwise text
         """
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         # Always convert to bytes for writing
         if binary_mode:
@@ -353,7 +395,7 @@ class S3FileSystem:
             # filesystems in some way.
             return []
         filename = filename[:-1]
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         p = client.get_paginator("list_objects")
         keys = []
@@ -364,9 +406,25 @@ class S3FileSystem:
                     keys.append(filename + key)
         return keys
 
+    def find(self, dirname):
+        """Returns the paths of all files under a directory, recursively."""
+        client = self._client()
+        bucket, path = self.bucket_and_path(dirname)
+        if path and not path.endswith("/"):
+            path += "/"
+        prefix = "s3://%s/" % bucket
+        p = client.get_paginator("list_objects")
+        keys = []
+        for r in p.paginate(Bucket=bucket, Prefix=path):
+            for o in r.get("Contents", []):
+                key = o["Key"]
+                if not key.endswith("/"):  # Skip directory markers
+                    keys.append(prefix + key)
+        return keys
+
     def isdir(self, dirname):
         """Returns whether the path is a directory or not."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(dirname)
         if not path.endswith("/"):
             path += "/"  # This will now only retrieve subdir content
@@ -377,7 +435,7 @@ class S3FileSystem:
 
     def listdir(self, dirname):
         """Returns a list of entries contained within a directory."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(dirname)
         p = client.get_paginator("list_objects")
         if not path.endswith("/"):
@@ -396,7 +454,7 @@ class S3FileSystem:
     def makedirs(self, dirname):
         """Creates a directory and all parent/intermediate directories."""
         if not self.exists(dirname):
-            client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+            client = self._client()
             bucket, path = self.bucket_and_path(dirname)
             if not path.endswith("/"):
                 path += "/"  # This will make sure we don't override a file
@@ -406,7 +464,7 @@ class S3FileSystem:
         """Returns file statistics for a given path."""
         # NOTE: Size of the file is given by ContentLength from S3,
         # but we convert to .length
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         try:
             obj = client.head_object(Bucket=bucket, Key=path)
@@ -424,8 +482,9 @@ class FSSpecFileSystem:
     The current gfile interface doesn't map perfectly to the fsspec interface
     leading to some notable inefficiencies.
 
-    * Reads and writes to files cause the file to be reopened each time which
-      can cause a performance hit when accessing local file systems.
+    * Writes to files cause the file to be reopened each time which can cause
+      a performance hit when accessing local file systems. (`GFile` keeps a
+      file open across reads via `open_for_read`.)
     * walk doesn't use the native fsspec walk function so performance may be
       slower.
 
@@ -547,6 +606,25 @@ class FSSpecFileSystem:
             )
             return (data, continuation_token)
 
+    @_translate_errors
+    def open_for_read(self, filename, binary_mode=False):
+        """Opens a file for a sequence of reads.
+
+        Args:
+            filename: string, a path
+            binary_mode: bool, read as binary if True, otherwise text
+
+        Returns:
+            A readable file object, positioned at the start of the file.
+            If it is seekable, its `tell()` values may be used as the
+            "opaque_offset" of a continuation token for `read(...)`, and
+            vice versa.
+        """
+        fs, path = self._fs_path(filename)
+        mode = "rb" if binary_mode else "r"
+        encoding = None if binary_mode else "utf8"
+        return fs.open(path, mode, encoding=encoding)
+
     @_translate_errors
     def write(self, filename, file_content, binary_mode=False):
         """Writes string file contents to a file.
@@ -610,6 +688,21 @@ class FSSpecFileSystem:
             for file in files
         ]
 
+    @_translate_errors
+    def find(self, dirname):
+        """Returns the paths of all files under a directory, recursively."""
+        if isinstance(dirname, bytes):
+            dirname = dirname.decode("utf-8")
+        fs, path = self._fs_path(dirname)
+        files = fs.find(path)
+        if (
+            self.SEPARATOR not in dirname
+            and self.CHAIN_SEPARATOR not in dirname
+        ):
+            return files
+        prefix = self._get_chain_protocol_prefix(dirname)
+        return [prefix + file for file in files]
+
     @_translate_errors
     def isdir(self, dirname):
         """Returns whether the path is a directory or not."""
@@ -672,6 +765,10 @@ class GFile:
         self.filename = compat.as_bytes(filename)
         self.fs = get_filesystem(self.filename)
         self.fs_supports_append = hasattr(self.fs, "append")
+        self.fs_supports_open_for_read = hasattr(self.fs, "open_for_read")
+        # File object from `fs.open_for_read`, kept open across reads until
+        # one reaches the end of the file.
+        self.read_handle = None
         self.buff = None
         # The buffer offset and the buffer chunk size are measured in the
         # natural units of the underlying stream, i.e. bytes for binary mode,
@@ -733,9 +830,17 @@ class GFile:
 
         # read from filesystem
         read_size = max(self.buff_chunk_size, n) if n is not None else None
-        (self.buff, self.continuation_token) = self.fs.read(
-            self.filename, self.binary_mode, read_size, self.continuation_token
-        )
+        if self.fs_supports_open_for_read:
+            (self.buff, self.continuation_token) = self._read_from_handle(
+                read_size
+            )
+        else:
+            (self.buff, self.continuation_token) = self.fs.read(
+                self.filename,
+                self.binary_mode,
+                read_size,
+                self.continuation_token,
+            )
         self.buff_offset = 0
 
         # add from filesystem
@@ -748,6 +853,70 @@ class GFile:
 
         return result
 
+    def _read_from_handle(self, size):
+        """Reads like `fs.read`, but from a file object kept open.
+
+        This saves opening the file (and, for local files, checking that it
+        exists) for every chunk. The file object is closed once a read hits
+        the end of the file, so that a file that is being tailed is not
+        kept open between reloads; it is then reopened by the next read.
+        """
+        if self.read_handle is None:
+            self.read_handle = self.fs.open_for_read(
+                self.filename, self.binary_mode
+            )
+            if self.continuation_token is not None:
+                offset = self.continuation_token.get("opaque_offset", None)
+                if offset is not None:
+                    if not self.read_handle.seekable():
+                        self._close_read_handle()
+                        raise errors.InvalidArgumentError(
+                            None,
+                            None,
+                            "{} is not seekable".format(
+                                compat.as_text(self.filename)
+                            ),
+                        )
+                    self.read_handle.seek(offset)
+        handle = self.read_handle
+        data = handle.read(size)
+        # As in `fs.read`, measure the offset in whatever terms the
+        # underlying stream uses.
+        continuation_token = (
+            {"opaque_offset": handle.tell()} if handle.seekable() else {}
+        )
+        if size is None or len(data) < size:
+            self._close_read_handle()
+        return (data, continuation_token)
+
+    def _close_read_handle(self):
+        if self.read_handle is not None:
+            self.read_handle.close()
+            self.read_handle = None
+
+    def seek(self, offset):
+        """Moves the read position to the given byte offset.
+
+        Only supported for files opened in binary read mode.
+
+        Args:
+            offset: int, non-negative byte offset from the start of the file.
+        """
+        if self.write_mode or not self.binary_mode:
+            raise errors.UnimplementedError(
+                None, None, "seek is only supported in binary read mode"
+            )
+        self.buff = None
+        self.buff_offset = 0
+        self._close_read_handle()
+        # In binary mode, the "opaque_offset" continuation token used by the
+        # local and fsspec filesystems is a byte offset, like S3's
+        # "byte_offset" token, so one token suits every filesystem.
+        self.continuation_token = {
+            "opaque_offset": offset,
+            "byte_offset": offset,
+        }
+
     def write(self, file_content):
         """Writes string file contents to file, clearing contents of the file
         on first write and then appending on subsequent calls.
@@ -829,6 +998,7 @@ class GFile:
                     self.write_temp.seek(len(chunk))
 
     def close(self):
+        self._close_read_handle()
         self.flush()
         if self.write_temp is not None:
             self.write_temp.close()
@@ -868,6 +1038,29 @@ def glob(filename):
     return get_filesystem(filename).glob(filename)
 
 
+def find(dirname):
+    """Returns the paths of all files under a directory, recursively.
+
+    This is not part of the TensorFlow API. It is only supported for object
+    stores, whose flat listings make it much cheaper than walking the tree.
+
+    Args:
+      dirname: string, path to a directory
+
+    Returns:
+      A list of strings containing the paths of all files under `dirname`.
+
+    Raises:
+      errors.UnimplementedError: If the filesystem does not support it.
+    """
+    fs = get_filesystem(dirname)
+    if not hasattr(fs, "find"):
+        raise errors.UnimplementedError(
+            None, None, "find not supported for {}".format(dirname)
+        )
+    return fs.find(dirname)
+
+
 def isdir(dirname):
     """Returns whether the path is a directory or not.
 
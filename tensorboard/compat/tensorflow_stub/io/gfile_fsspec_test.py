@@ -72,6 +72,20 @@ class GFileFSSpecTest(tb_test.TestCase):
         got = gfile.listdir(temp_dir)
         self.assertCountEqual(expected_files, got)
 
+    def testFind(self):
+        temp_dir = self.get_temp_dir()
+        self._CreateDeepDirectoryStructure(temp_dir)
+        expected = [
+            "quuz/e.tfevents.1",
+            "quuz/garply/f.tfevents.1",
+            "quuz/garply/corge/g.tfevents.1",
+            "quuz/garply/grault/h.tfevents.1",
+        ]
+        self.assertCountEqual(
+            [posixpath.join(temp_dir, f) for f in expected],
+            gfile.find(posixpath.join(temp_dir, "quuz")),
+        )
+
     def testMakeDirs(self):
         temp_dir = self.get_temp_dir()
         self._CreateDeepDirectoryStructure(temp_dir)
@@ -65,6 +65,20 @@ class GFileTest(unittest.TestCase):
             % (expected_listing, gotten_listing),
         )
 
+    @mock_s3
+    def testFind(self):
+        temp_dir = self._CreateDeepS3Structure()
+        expected = [
+            "quuz/e.tfevents.1",
+            "quuz/garply/corge/g.tfevents.1",
+            "quuz/garply/f.tfevents.1",
+            "quuz/garply/grault/h.tfevents.1",
+        ]
+        self.assertCountEqual(
+            [self._PathJoin(temp_dir, f) for f in expected],
+            gfile.find(self._PathJoin(temp_dir, "quuz")),
+        )
+
     @mock_s3
     def testIsdir(self):
         temp_dir = self._CreateDeepS3Structure()
@@ -194,6 +208,18 @@ class GFileTest(unittest.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_content, ckpt_read)
 
+    @mock_s3
+    def testRead_reusesClient(self):
+        ckpt_content = "asdfasdfasdffoobarbuzz"
+        temp_dir = self._CreateDeepS3Structure(ckpt_content=ckpt_content)
+        ckpt_path = self._PathJoin(temp_dir, "model.ckpt")
+        fs = gfile.get_filesystem(ckpt_path)
+        client = fs._client()
+        with gfile.GFile(ckpt_path, "r") as f:
+            f.buff_chunk_size = 4  # Several range requests
+            self.assertEqual(ckpt_content, f.read())
+        self.assertIs(client, fs._client())
+
     @mock_s3
     def testReadLines(self):
         ckpt_lines = ["\n"] + ["line {}\n".format(i) for i in range(10)] + [" "]
@@ -16,6 +16,7 @@
 
 import io
 import os
+from unittest import mock
 
 from tensorboard import test as tb_test
 from tensorboard.compat.tensorflow_stub import errors
@@ -230,6 +231,47 @@ class GFileTest(tb_test.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_b_content, ckpt_read)
 
+    def testRead_keepsFileOpenAcrossChunks(self):
+        ckpt_path = os.path.join(self.get_temp_dir(), "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"asdfasdfasdffoobarbuzz")
+        fs = gfile.get_filesystem(ckpt_path)
+        with mock.patch.object(
+            fs, "open_for_read", wraps=fs.open_for_read
+        ) as open_for_read, mock.patch.object(fs, "read") as read:
+            with gfile.GFile(ckpt_path, "rb") as f:
+                f.buff_chunk_size = 4
+                self.assertEqual(b"asdfasdfasdffoobar", f.read(18))
+                self.assertIsNotNone(f.read_handle)
+                self.assertEqual(b"buzz", f.read())
+                # Reaching the end of the file closes it.
+                self.assertIsNone(f.read_handle)
+        self.assertEqual(open_for_read.call_count, 1)
+        read.assert_not_called()
+
+    def testRead_reopensAfterEndOfFile(self):
+        ckpt_path = os.path.join(self.get_temp_dir(), "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"asdf")
+        with gfile.GFile(ckpt_path, "rb") as f:
+            f.buff_chunk_size = 4
+            self.assertEqual(b"asdf", f.read(10))
+            self.assertIsNone(f.read_handle)
+            with open(ckpt_path, "ab") as g:
+                g.write(b"foobar")
+            self.assertEqual(b"foo", f.read(3))
+            self.assertIsNotNone(f.read_handle)
+            f.seek(1)
+            self.assertIsNone(f.read_handle)
+            self.assertEqual(b"sdffoo", f.read(6))
+        self.assertIsNone(f.read_handle)
+
+    def testRead_notFound(self):
+        ckpt_path = os.path.join(self.get_temp_dir(), "missing")
+        with gfile.GFile(ckpt_path, "rb") as f:
+            with self.assertRaises(errors.NotFoundError):
+                f.read()
+
     def testWrite(self):
         temp_dir = self.get_temp_dir()
         self._CreateDeepDirectoryStructure(temp_dir)
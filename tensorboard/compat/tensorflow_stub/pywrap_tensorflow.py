@@ -120,25 +120,68 @@ CRC_INIT = 0
 _MASK = 0xFFFFFFFF
 
 
+def _make_slice_tables(table):
+    """Derives the seven extra lookup tables used by slice-by-8 CRC."""
+    tables = [table]
+    for _ in range(7):
+        prev = tables[-1]
+        tables.append(
+            tuple((prev[i] >> 8) ^ table[prev[i] & 0xFF] for i in range(256))
+        )
+    return tuple(tables)
+
+
+_SLICE_TABLES = _make_slice_tables(CRC_TABLE)
+
+# Optional native CRC-32C implementations, preferred when importable.
+try:
+    import google_crc32c
+
+    if google_crc32c.implementation != "c":
+        raise ImportError("google_crc32c has no native implementation")
+    _native_crc32c = google_crc32c.value
+except (ImportError, AttributeError):
+    try:
+        import crc32c as _crc32c_module
+
+        _native_crc32c = _crc32c_module.crc32c
+    except (ImportError, AttributeError):
+        _native_crc32c = None
+
+
 def crc_update(crc, data):
     """Update CRC-32C checksum with data.
 
+    Uses the slice-by-8 algorithm, consuming eight bytes per iteration.
+
     Args:
       crc: 32-bit checksum to update as long.
-      data: byte array, string or iterable over bytes.
+      data: bytes-like object, or iterable over bytes.
     Returns:
       32-bit updated CRC-32C as long.
     """
-
-    if type(data) != array.array or data.itemsize != 1:
-        buf = array.array("B", data)
-    else:
-        buf = data
+    try:
+        buf = memoryview(data).cast("B")
+    except TypeError:
+        buf = memoryview(array.array("B", data))
+    (t0, t1, t2, t3, t4, t5, t6, t7) = _SLICE_TABLES
+    aligned = len(buf) - len(buf) % 8
 
     crc ^= _MASK
-    for b in buf:
-        table_index = (crc ^ b) & 0xFF
-        crc = (CRC_TABLE[table_index] ^ (crc >> 8)) & _MASK
+    for lo, hi in struct.iter_unpack("<II", buf[:aligned]):
+        lo ^= crc
+        crc = (
+            t7[lo & 0xFF]
+            ^ t6[(lo >> 8) & 0xFF]
+            ^ t5[(lo >> 16) & 0xFF]
+            ^ t4[lo >> 24]
+            ^ t3[hi & 0xFF]
+            ^ t2[(hi >> 8) & 0xFF]
+            ^ t1[(hi >> 16) & 0xFF]
+            ^ t0[hi >> 24]
+        )
+    for b in buf[aligned:]:
+        crc = t0[(crc ^ b) & 0xFF] ^ (crc >> 8)
     return crc ^ _MASK
 
 
@@ -157,18 +200,54 @@ def crc_finalize(crc):
 def crc32c(data):
     """Compute CRC-32C checksum of the data.
 
+    Uses `google_crc32c` or `crc32c` when either is installed, and a
+    pure-Python slice-by-8 implementation otherwise.
+
     Args:
-      data: byte array, string or iterable over bytes.
+      data: bytes-like object, or iterable over bytes.
     Returns:
       32-bit CRC-32C checksum of data as long.
     """
+    if _native_crc32c is not None:
+        try:
+            return _native_crc32c(data)
+        except TypeError:
+            # Not a buffer the native implementation accepts (e.g., a
+            # list of ints, or a writable buffer for some versions).
+            return _native_crc32c(bytes(data))
     return crc_finalize(crc_update(CRC_INIT, data))
 
 
+# Record framing: an 8-byte little-endian length and its 4-byte masked
+# CRC, then the payload, then a 4-byte masked CRC of the payload.
+_HEADER_SIZE = 12
+_FOOTER_SIZE = 4
+
+# Number of bytes requested from the underlying file per refill.
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
 class PyRecordReader_New:
     def __init__(
-        self, filename=None, start_offset=0, compression_type=None, status=None
+        self,
+        filename=None,
+        start_offset=0,
+        compression_type=None,
+        status=None,
+        verify_data_crc=True,
     ):
+        """Opens a TFRecord file for reading.
+
+        Args:
+          filename: path to the record file.
+          start_offset: byte offset of the first record to read.
+          compression_type: must be empty; compression is not supported.
+          status: unused; kept for compatibility with the TF API.
+          verify_data_crc: if False, skip checking the CRC of each record
+            payload (the length header is always checked). This is safe
+            only for trusted logdirs, and saves most of the CPU time of
+            reading when no native CRC-32C library is installed.
+        """
         if filename is None:
             raise errors.NotFoundError(
                 None, None, "No filename provided, cannot read Events"
@@ -179,10 +258,6 @@ class PyRecordReader_New:
                 None,
                 "{} does not point to valid Events file".format(filename),
             )
-        if start_offset:
-            raise errors.UnimplementedError(
-                None, None, "start offset not supported by compat reader"
-            )
         if compression_type:
             # TODO: Handle gzip and zlib compressed files
             raise errors.UnimplementedError(
@@ -192,89 +267,94 @@ class PyRecordReader_New:
         self.start_offset = start_offset
         self.compression_type = compression_type
         self.status = status
+        self.verify_data_crc = verify_data_crc
         self.curr_event = None
         self.file_handle = gfile.GFile(self.filename, "rb")
-        # Maintain a buffer of partially read records, so we can recover from
-        # truncated records upon a retry.
-        self._buffer = b""
+        if start_offset:
+            self.file_handle.seek(start_offset)
+        # Data read from the file but not yet consumed. `self._buffer_pos`
+        # marks the start of the first unconsumed record, so a truncated
+        # record is simply left in place and re-parsed upon a retry.
+        self._buffer = bytearray()
         self._buffer_pos = 0
 
     def GetNext(self):
-        # Each new read should start at the beginning of any partial record.
-        self._buffer_pos = 0
-        # Read the header
         self.curr_event = None
-        header_str = self._read(8)
-        if not header_str:
+        # Read the header: the length of the record, then its masked crc32.
+        available = self._fill(_HEADER_SIZE)
+        if available == 0:
             # Hit EOF so raise and exit
             raise errors.OutOfRangeError(None, None, "No more events to read")
-        if len(header_str) < 8:
+        if available < 8:
             raise self._truncation_error("header")
-        header = struct.unpack("<Q", header_str)
-
-        # Read the crc32, which is 4 bytes, and check it against
-        # the crc32 of the header
-        crc_header_str = self._read(4)
-        if len(crc_header_str) < 4:
+        if available < _HEADER_SIZE:
             raise self._truncation_error("header crc")
-        crc_header = struct.unpack("<I", crc_header_str)
-        header_crc_calc = masked_crc32c(header_str)
-        if header_crc_calc != crc_header[0]:
+        start = self._buffer_pos
+        (header_len, crc_header) = struct.unpack_from(
+            "<QI", self._buffer, start
+        )
+        if masked_crc32c(self._buffer[start : start + 8]) != crc_header:
             raise errors.DataLossError(
                 None, None, "{} failed header crc32 check".format(self.filename)
             )
 
         # The length of the header tells us how many bytes the Event
-        # string takes
-        header_len = int(header[0])
-        event_str = self._read(header_len)
-        if len(event_str) < header_len:
+        # string takes, followed by 4 bytes of its masked crc32.
+        data_end = _HEADER_SIZE + header_len
+        available = self._fill(data_end + _FOOTER_SIZE)
+        if available < data_end:
             raise self._truncation_error("data")
-
-        event_crc_calc = masked_crc32c(event_str)
-
-        # The next 4 bytes contain the crc32 of the Event string,
-        # which we check for integrity.
-        crc_event_str = self._read(4)
-        if len(crc_event_str) < 4:
+        if available < data_end + _FOOTER_SIZE:
             raise self._truncation_error("data crc")
-        crc_event = struct.unpack("<I", crc_event_str)
-        if event_crc_calc != crc_event[0]:
-            raise errors.DataLossError(
-                None,
-                None,
-                "{} failed event crc32 check".format(self.filename),
+        start = self._buffer_pos
+        # Set the current event to be read later by record() call
+        with memoryview(self._buffer) as view:
+            self.curr_event = view[
+                start + _HEADER_SIZE : start + data_end
+            ].tobytes()
+        if self.verify_data_crc:
+            (crc_event,) = struct.unpack_from(
+                "<I", self._buffer, start + data_end
             )
+            if masked_crc32c(self.curr_event) != crc_event:
+                self.curr_event = None
+                raise errors.DataLossError(
+                    None,
+                    None,
+                    "{} failed event crc32 check".format(self.filename),
+                )
 
-        # Set the current event to be read later by record() call
-        self.curr_event = event_str
-        # Clear the buffered partial record since we're done reading it.
-        self._buffer = b""
+        # Advance past the record now that it has been fully read.
+        self._buffer_pos += data_end + _FOOTER_SIZE
 
-    def _read(self, n):
-        """Read up to n bytes from the underlying file, with buffering.
+    def _fill(self, n):
+        """Buffer at least n bytes past `self._buffer_pos`, if possible.
 
-        Reads are satisfied from a buffer of previous data read starting at
-        `self._buffer_pos` until the buffer is exhausted, and then from the
-        actual underlying file. Any new data is added to the buffer, and
-        `self._buffer_pos` is advanced to the point in the buffer past all
-        data returned as part of this read.
+        Data already consumed is discarded from the front of the buffer,
+        and the file is read in large chunks rather than field by field.
 
         Args:
-          n: non-negative number of bytes to read
+          n: non-negative number of bytes wanted
 
         Returns:
-          bytestring of data read, up to n bytes
+          The number of bytes available past `self._buffer_pos`, which is
+          less than n only if the file is exhausted.
         """
-        result = self._buffer[self._buffer_pos : self._buffer_pos + n]
-        self._buffer_pos += len(result)
-        n -= len(result)
-        if n > 0:
-            new_data = self.file_handle.read(n)
-            result += new_data
+        available = len(self._buffer) - self._buffer_pos
+        if available >= n:
+            return available
+        if self._buffer_pos:
+            del self._buffer[: self._buffer_pos]
+            self._buffer_pos = 0
+        while available < n:
+            new_data = self.file_handle.read(
+                max(_READ_CHUNK_SIZE, n - available)
+            )
+            if not new_data:
+                break
             self._buffer += new_data
-            self._buffer_pos += len(new_data)
-        return result
+            available += len(new_data)
+        return available
 
     def _truncation_error(self, section):
         return errors.DataLossError(
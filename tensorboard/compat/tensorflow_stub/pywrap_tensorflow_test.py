@@ -0,0 +1,171 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the TF-free record reader and CRC-32C implementation."""
+
+
+import os
+import struct
+from unittest import mock
+
+from tensorboard import test as tb_test
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.summary.writer.record_writer import RecordWriter
+
+
+def _bytewise_crc32c(data):
+    crc = 0xFFFFFFFF
+    for b in data:
+        crc = pywrap_tensorflow.CRC_TABLE[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _record(data):
+    """Returns the framed bytes of a single TFRecord holding `data`."""
+    header = struct.pack("<Q", len(data))
+    return (
+        header
+        + struct.pack("<I", pywrap_tensorflow.masked_crc32c(header))
+        + data
+        + struct.pack("<I", pywrap_tensorflow.masked_crc32c(data))
+    )
+
+
+class Crc32cTest(tb_test.TestCase):
+    def test_check_value(self):
+        self.assertEqual(pywrap_tensorflow.crc32c(b"123456789"), 0xE3069283)
+
+    def test_slice_by_8_matches_bytewise(self):
+        for size in [0, 1, 7, 8, 9, 15, 16, 100, 1023]:
+            data = os.urandom(size)
+            self.assertEqual(
+                pywrap_tensorflow.crc_update(0, data), _bytewise_crc32c(data)
+            )
+
+    def test_accepts_memoryview_and_iterables(self):
+        data = b"hello world"
+        expected = _bytewise_crc32c(data)
+        self.assertEqual(pywrap_tensorflow.crc32c(memoryview(data)), expected)
+        self.assertEqual(pywrap_tensorflow.crc32c(bytearray(data)), expected)
+        self.assertEqual(pywrap_tensorflow.crc_update(0, list(data)), expected)
+
+    def test_native_implementation_receives_buffers(self):
+        received = []
+
+        def native_crc32c(data):
+            received.append(type(data))
+            return 42
+
+        with mock.patch.object(
+            pywrap_tensorflow, "_native_crc32c", native_crc32c
+        ):
+            for data in [b"ab", bytearray(b"ab"), memoryview(b"ab")]:
+                self.assertEqual(pywrap_tensorflow.crc32c(data), 42)
+        self.assertEqual(received, [bytes, bytearray, memoryview])
+
+    def test_native_implementation_falls_back_to_bytes(self):
+        def native_crc32c(data):
+            if not isinstance(data, bytes):
+                raise TypeError("a bytes-like object is required")
+            return len(data)
+
+        with mock.patch.object(
+            pywrap_tensorflow, "_native_crc32c", native_crc32c
+        ):
+            self.assertEqual(pywrap_tensorflow.crc32c(bytearray(b"abc")), 3)
+            self.assertEqual(pywrap_tensorflow.crc32c([1, 2]), 2)
+
+
+class PyRecordReaderTest(tb_test.TestCase):
+    def _write(self, filename, payloads):
+        with open(filename, "ab") as f:
+            for payload in payloads:
+                f.write(_record(payload))
+
+    def test_reads_records_spanning_chunks(self):
+        filename = os.path.join(self.get_temp_dir(), "big")
+        payloads = [os.urandom(n) for n in (0, 10, 3 * 1024 * 1024, 5, 1000)]
+        self._write(filename, payloads)
+        r = pywrap_tensorflow.PyRecordReader_New(filename)
+        for payload in payloads:
+            r.GetNext()
+            self.assertEqual(r.record(), payload)
+            self.assertIsInstance(r.record(), bytes)
+        with self.assertRaises(errors.OutOfRangeError):
+            r.GetNext()
+
+    def test_truncated_record_resumes_after_append(self):
+        filename = os.path.join(self.get_temp_dir(), "truncated")
+        full = _record(b"first") + _record(b"second")
+        for cut in [3, 10, 15, 19]:
+            with open(filename, "wb") as f:
+                f.write(_record(b"zeroth") + full[:cut])
+            r = pywrap_tensorflow.PyRecordReader_New(filename)
+            r.GetNext()
+            self.assertEqual(r.record(), b"zeroth")
+            with self.assertRaisesRegex(errors.DataLossError, "truncated"):
+                r.GetNext()
+            self.assertIsNone(r.record())
+            with open(filename, "ab") as f:
+                f.write(full[cut:])
+            r.GetNext()
+            self.assertEqual(r.record(), b"first")
+            r.GetNext()
+            self.assertEqual(r.record(), b"second")
+            with self.assertRaises(errors.OutOfRangeError):
+                r.GetNext()
+
+    def test_data_crc_mismatch(self):
+        filename = os.path.join(self.get_temp_dir(), "corrupt")
+        record = bytearray(_record(b"payload"))
+        record[-1] ^= 0xFF
+        with open(filename, "wb") as f:
+            f.write(record)
+        r = pywrap_tensorflow.PyRecordReader_New(filename)
+        with self.assertRaisesRegex(errors.DataLossError, "event crc32"):
+            r.GetNext()
+        r = pywrap_tensorflow.PyRecordReader_New(
+            filename, verify_data_crc=False
+        )
+        r.GetNext()
+        self.assertEqual(r.record(), b"payload")
+
+    def test_header_crc_checked_without_data_crc(self):
+        filename = os.path.join(self.get_temp_dir(), "corrupt_header")
+        record = bytearray(_record(b"payload"))
+        record[8] ^= 0xFF
+        with open(filename, "wb") as f:
+            f.write(record)
+        r = pywrap_tensorflow.PyRecordReader_New(
+            filename, verify_data_crc=False
+        )
+        with self.assertRaisesRegex(errors.DataLossError, "header crc32"):
+            r.GetNext()
+
+    def test_roundtrip_with_record_writer(self):
+        filename = os.path.join(self.get_temp_dir(), "roundtrip")
+        payloads = [b"record %d" % i for i in range(1000)]
+        w = RecordWriter(open(filename, "wb"))
+        for payload in payloads:
+            w.write(payload)
+        w.close()
+        r = pywrap_tensorflow.PyRecordReader_New(filename)
+        for payload in payloads:
+            r.GetNext()
+            self.assertEqual(r.record(), payload)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -0,0 +1,194 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the TF-free `PyRecordReader_New` implementation.
+
+Compares the buffered reader against the previous implementation, which
+read each record field by field and computed CRC-32C one byte at a time.
+
+Here are the results of running this benchmark on a Linux workstation with
+an Intel(R) Xeon(R) CPU, first without and then with `google-crc32c`
+installed:
+
+                  READER  RECORD_SIZE  RECORDS  RECORDS_PER_SEC  MB_PER_SEC
+                  legacy           64    50000          50705.1         3.2
+                buffered           64    50000          62439.5         4.0
+    buffered_no_data_crc           64    50000         250938.0        16.1
+                  legacy         4096     2000           1105.0         4.5
+                buffered         4096     2000           2198.7         9.0
+    buffered_no_data_crc         4096     2000         130945.1       536.4
+
+                  READER  RECORD_SIZE  RECORDS  RECORDS_PER_SEC  MB_PER_SEC
+                  legacy           64    50000          50567.0         3.2
+                buffered           64    50000         224483.0        14.4
+    buffered_no_data_crc           64    50000         235902.0        15.1
+                  legacy         4096     2000           1325.1         5.4
+                buffered         4096     2000         111679.8       457.4
+    buffered_no_data_crc         4096     2000         138423.6       567.0
+
+The pure-Python slice-by-8 CRC roughly doubles throughput on large records;
+skipping data CRC validation, or installing a native CRC-32C library,
+makes reading bound by protobuf parsing rather than by the reader.
+"""
+
+
+import os
+import struct
+import tempfile
+import time
+
+from absl import app
+from absl import logging
+
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.compat.tensorflow_stub.io import gfile
+from tensorboard.summary.writer.record_writer import RecordWriter
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+
+def _bytewise_masked_crc32c(data):
+    crc = 0xFFFFFFFF
+    for b in data:
+        crc = pywrap_tensorflow.CRC_TABLE[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    x = crc ^ 0xFFFFFFFF
+    return (((x >> 15) | (x << 17) & 0xFFFFFFFF) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+class _LegacyRecordReader:
+    """The previous reader, kept here only as a baseline."""
+
+    def __init__(self, filename):
+        self.file_handle = gfile.GFile(filename, "rb")
+        self._buffer = b""
+        self._buffer_pos = 0
+        self.curr_event = None
+
+    def GetNext(self):
+        self._buffer_pos = 0
+        header_str = self._read(8)
+        if not header_str:
+            raise errors.OutOfRangeError(None, None, "No more events to read")
+        crc_header = struct.unpack("<I", self._read(4))[0]
+        if _bytewise_masked_crc32c(header_str) != crc_header:
+            raise errors.DataLossError(None, None, "header crc")
+        header_len = struct.unpack("<Q", header_str)[0]
+        event_str = self._read(header_len)
+        crc_event = struct.unpack("<I", self._read(4))[0]
+        if _bytewise_masked_crc32c(event_str) != crc_event:
+            raise errors.DataLossError(None, None, "event crc")
+        self.curr_event = event_str
+        self._buffer = b""
+
+    def _read(self, n):
+        result = self._buffer[self._buffer_pos : self._buffer_pos + n]
+        self._buffer_pos += len(result)
+        n -= len(result)
+        if n > 0:
+            new_data = self.file_handle.read(n)
+            result += new_data
+            self._buffer += new_data
+            self._buffer_pos += len(new_data)
+        return result
+
+    def record(self):
+        return self.curr_event
+
+
+def _write_file(path, record_count, record_size):
+    payload = os.urandom(record_size)
+    w = RecordWriter(open(path, "wb"))
+    for _ in range(record_count):
+        w.write(payload)
+    w.close()
+
+
+def bench(make_reader):
+    """Reads every record of a file.
+
+    Returns:
+      A pair `(record_count, seconds)`.
+    """
+    reader = make_reader()
+    count = 0
+    start_time = time.time()
+    while True:
+        try:
+            reader.GetNext()
+        except errors.OutOfRangeError:
+            break
+        count += 1
+    return (count, time.time() - start_time)
+
+
+def _format_line(headers, fields):
+    """Format a line of a table, right-aligning each field."""
+    fields = [
+        "%.1f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    readers = [
+        ("legacy", _LegacyRecordReader),
+        ("buffered", pywrap_tensorflow.PyRecordReader_New),
+        (
+            "buffered_no_data_crc",
+            lambda f: pywrap_tensorflow.PyRecordReader_New(
+                f, verify_data_crc=False
+            ),
+        ),
+    ]
+    headers = (
+        "READER",
+        "RECORD_SIZE",
+        "RECORDS",
+        "RECORDS_PER_SEC",
+        "MB_PER_SEC",
+    )
+    logger.info(
+        "Native CRC-32C: %s", pywrap_tensorflow._native_crc32c is not None
+    )
+    logger.info(_format_line(headers, headers))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for record_size, record_count in [(64, 50000), (4096, 2000)]:
+            path = os.path.join(tmpdir, "records_%d" % record_size)
+            _write_file(path, record_count, record_size)
+            for name, reader in readers:
+                (count, seconds) = min(
+                    (bench(lambda: reader(path)) for _ in range(3)),
+                    key=lambda result: result[1],
+                )  # best-of-three timing
+                rate = count / seconds
+                fields = (
+                    name,
+                    record_size,
+                    count,
+                    rate,
+                    rate * record_size / 1e6,
+                )
+                logger.info(_format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -166,6 +166,29 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         return None
 
+    def data_generation(self, ctx=None, *, experiment_id, run_tag_filter=None):
+        """Get a token that changes whenever the given data may change.
+
+        Clients can use this to cache results derived from the data, and
+        to implement HTTP conditional requests: if the token is unchanged,
+        so is the result of any `list_*` or `read_*` call for the same
+        experiment, covering only runs and tags admitted by the filter.
+
+        This operation is optional.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          run_tag_filter: Optional `RunTagFilter` value. If omitted, all
+            runs and tags are covered.
+
+        Returns:
+          An opaque string of characters that are valid in an HTTP entity
+          tag, or `None` if this operation is not supported by this data
+          provider.
+        """
+        return None
+
     @abc.abstractmethod
     def list_runs(self, ctx=None, *, experiment_id):
         """List all runs within an experiment.
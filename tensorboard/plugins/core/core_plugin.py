@@ -21,6 +21,7 @@ import gzip
 import io
 import mimetypes
 import posixpath
+import re
 import zipfile
 
 from werkzeug import utils
@@ -560,6 +561,36 @@ relevant for db read-only mode. Each thread reloads one run at a time.
 """,
         )
 
+        parser.add_argument(
+            "--max_reload_processes",
+            metavar="COUNT",
+            type=_nonnegative_int,
+            default=0,
+            help="""\
+[experimental] If positive, runs are reloaded in this many worker processes
+instead of in --max_reload_threads threads. Each run is always loaded by the
+same worker, which parses its new events and sends the sampled data back to
+the server. This scales with the number of cores for logdirs with many runs,
+at the cost of keeping a second copy of the loaded data in the workers. This
+option is incompatible with --load_fast=true, and if passed will disable
+fast-loading mode. (default: %(default)s)\
+""",
+        )
+
+        parser.add_argument(
+            "--metrics_read_threads",
+            metavar="COUNT",
+            type=_nonnegative_int,
+            default=1,
+            help="""\
+[experimental] The number of threads the Time Series dashboard uses to read
+series data for a single request. Series are read with one query per plugin
+and run; with more than one thread, these queries are issued in parallel,
+which helps most with data providers that have high per-query latency.
+(default: %(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--reload_interval",
             metavar="SECONDS",
@@ -586,6 +617,36 @@ reload finishes, and requires --load_interval=0. (default: %(default)s)\
 """,
         )
 
+        parser.add_argument(
+            "--reload_backoff",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, each run is reloaded on its own schedule: every
+--reload_interval seconds while it receives new data or is being viewed, and
+otherwise less and less often, up to every --reload_max_interval seconds.
+Runs whose latest data is older than --reload_multifile_inactive_secs are
+reloaded at the longest interval. This keeps the runs being watched fresh in
+logdirs with many finished runs. This option is incompatible with
+--load_fast=true, and if passed will disable fast-loading mode.
+(default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--reload_max_interval",
+            metavar="SECONDS",
+            type=_nonnegative_float,
+            default=300.0,
+            help="""\
+[experimental] With --reload_backoff=true, the longest time between two
+reloads of any run, in seconds. (default: %(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--reload_multifile",
             metavar="BOOL",
@@ -621,6 +682,90 @@ it receives new data at least once per 24 hour period)\
 """,
         )
 
+        parser.add_argument(
+            "--reload_incremental",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, each reload skips runs whose event files have not
+changed in size or modification time since the previous reload, and only
+re-lists log directories whose modification time has changed. This greatly
+reduces reload cost for large logdirs in which most runs have finished. Only
+applies to local paths. This option is incompatible with --load_fast=true, and
+if passed will disable fast-loading mode. (default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--blob_spill_dir",
+            metavar="PATH",
+            type=str,
+            default="",
+            help="""\
+[experimental] Local directory in which to keep the data of images, audio,
+and graphs, in a temporary file, rather than in memory. Only recently viewed
+data is kept in memory. This greatly reduces memory use for logdirs with many
+images. This option is incompatible with --load_fast=true, and if passed
+will disable fast-loading mode.\
+""",
+        )
+
+        parser.add_argument(
+            "--reload_watch",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, local log directories are watched for changes with
+inotify (on Linux), and only runs whose event files changed are reloaded, as
+soon as they change. Log directories are still scanned in full every few
+minutes, to pick up any changes that were not reported. Falls back to
+reloading every --reload_interval seconds if the log directories cannot be
+watched, e.g. because they are not local. This option is incompatible with
+--load_fast=true, and if passed will disable fast-loading mode.
+(default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--load_on_demand",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, runs are at first only indexed: just the latest point
+of each time series is kept, which is enough to list runs and tags. All data
+of a run is loaded the first time it is requested. This makes TensorBoard
+usable much sooner for logdirs with many runs, and bounds memory use to the
+runs actually viewed (see --idle_run_ttl_secs). Nothing is written to disk
+unless --ingest_cache_dir is set: then loaded runs are saved there, using disk
+space comparable to their size in memory, and restored from there when they
+are requested again. This option is incompatible with --load_fast=true and
+with --max_reload_processes. (default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--idle_run_ttl_secs",
+            metavar="SECONDS",
+            type=_nonnegative_int,
+            default=0,
+            help="""\
+[experimental] With --load_on_demand=true, runs whose data has not been
+requested for this many seconds are reduced back to an index at the next
+reload, freeing their memory, after being saved to --ingest_cache_dir if that
+is set. If 0, loaded runs are kept. (default:
+%(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--generic_data",
             metavar="TYPE",
@@ -653,6 +798,49 @@ and 1000 for scalars). Most users should not need to set this flag.\
 """,
         )
 
+        parser.add_argument(
+            "--max_bytes_per_tag",
+            metavar="SIZE",
+            type=_parse_byte_size,
+            default=0,
+            help="""\
+[experimental] Maximum memory to use for the samples kept for each
+non-scalar tag of each run, as a byte count with an optional K, M, G, or T
+suffix (e.g., 64M). Once a tag's samples reach this size, fewer samples are
+kept than --samples_per_plugin allows. 0 means no limit. This option is
+incompatible with --load_fast=true, and if passed will disable fast-loading
+mode. (default: 0)\
+""",
+        )
+
+        parser.add_argument(
+            "--bytes_per_plugin",
+            type=_parse_bytes_per_plugin,
+            default="",
+            help="""\
+[experimental] An optional comma separated list of plugin_name=size pairs,
+limiting the memory used for samples of that plugin across all runs, with
+sizes as for --max_bytes_per_tag (e.g., images=2G,histograms=512M). This
+option is incompatible with --load_fast=true, and if passed will disable
+fast-loading mode.\
+""",
+        )
+
+        parser.add_argument(
+            "--max_tensor_bytes",
+            metavar="SIZE",
+            type=_parse_byte_size,
+            default=0,
+            help="""\
+[experimental] Maximum memory to use for the samples of all non-scalar tags
+across all runs, with sizes as for --max_bytes_per_tag. Once this is reached,
+the tags holding the most memory evict some of their samples. 0 means no
+limit.
+This option is incompatible with --load_fast=true, and if passed will
+disable fast-loading mode. (default: 0)\
+""",
+        )
+
         parser.add_argument(
             "--detect_file_replacement",
             metavar="BOOL",
@@ -670,6 +858,42 @@ are first written to a temporary file, then swapped into the final location.
 
 This option is currently incompatible with --load_fast=true, and if passed will
 disable fast-loading mode. (default: false)\
+""",
+        )
+
+        parser.add_argument(
+            "--ingest_cache_dir",
+            metavar="PATH",
+            type=str,
+            default="",
+            help="""\
+[experimental] Local directory in which to persist a snapshot of the loaded
+data for each run, including how far each event file has been read. On
+restart, runs are restored from their snapshots and only data appended since
+is read, unless an event file has been modified other than by appending, in
+which case that run is loaded from scratch. A run that is still being written
+is snapshotted once it stops growing, or at most every 5 minutes. Only trusted
+users should be able to write to this directory. This option is incompatible with
+--load_fast=true, and if passed will disable fast-loading mode. (default:
+disabled)\
+""",
+        )
+
+        parser.add_argument(
+            "--skip_data_crc",
+            metavar="BOOL",
+            # Custom str-to-bool converter since regular bool() doesn't work.
+            type=lambda v: {"true": True, "false": False}.get(v.lower(), v),
+            choices=[True, False],
+            default=None,
+            help="""\
+[experimental] If true, the checksum of each event read from local event files
+is not verified, so these files are read without TensorFlow even if it is
+installed. The length of each record is still verified. When no native CRC-32C
+library (google-crc32c or crc32c) is installed, this saves most of the CPU
+time spent reading event files, but corrupted events may then fail to parse or
+be misread. Only use this for trusted logdirs. This option is incompatible with --load_fast=true, and if
+passed will disable fast-loading mode. (default: false)\
 """,
         )
 
@@ -714,6 +938,58 @@ disable fast-loading mode. (default: false)\
                 "Must not specify both --load_fast=true and"
                 "--detect_file_replacement=true"
             )
+        elif flags.load_fast == "true" and flags.ingest_cache_dir:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and --ingest_cache_dir"
+            )
+        elif flags.load_fast == "true" and flags.reload_incremental is True:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--reload_incremental=true"
+            )
+        elif flags.load_fast == "true" and flags.max_reload_processes:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--max_reload_processes"
+            )
+        elif flags.load_fast == "true" and (
+            flags.max_bytes_per_tag
+            or flags.bytes_per_plugin
+            or flags.max_tensor_bytes
+        ):
+            raise FlagsError(
+                "Must not specify both --load_fast=true and any of "
+                "--max_bytes_per_tag, --bytes_per_plugin, or --max_tensor_bytes"
+            )
+        elif flags.load_fast == "true" and flags.blob_spill_dir:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and --blob_spill_dir"
+            )
+        elif flags.load_fast == "true" and flags.reload_watch is True:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--reload_watch=true"
+            )
+        elif flags.load_fast == "true" and flags.reload_backoff is True:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--reload_backoff=true"
+            )
+        elif flags.load_fast == "true" and flags.load_on_demand is True:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--load_on_demand=true"
+            )
+        elif flags.load_fast == "true" and flags.skip_data_crc is True:
+            raise FlagsError(
+                "Must not specify both --load_fast=true and "
+                "--skip_data_crc=true"
+            )
+        elif flags.load_on_demand is True and flags.max_reload_processes:
+            raise FlagsError(
+                "Must not specify both --load_on_demand=true and "
+                "--max_reload_processes"
+            )
 
         flags.path_prefix = flags.path_prefix.rstrip("/")
         if flags.path_prefix and not flags.path_prefix.startswith("/"):
@@ -745,6 +1021,43 @@ def _parse_samples_per_plugin(value):
     return result
 
 
+_BYTE_SIZE_SUFFIXES = {
+    "": 1,
+    "K": 1 << 10,
+    "M": 1 << 20,
+    "G": 1 << 30,
+    "T": 1 << 40,
+}
+
+
+def _parse_byte_size(value):
+    """Parses a byte count with an optional binary suffix, like `512M`."""
+    match = re.match(r"^\s*(\d+)\s*([KMGT]?)(?:i?B)?\s*$", value, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError("invalid size: %r" % value)
+    return int(match.group(1)) * _BYTE_SIZE_SUFFIXES[match.group(2).upper()]
+
+
+def _parse_bytes_per_plugin(value):
+    """Parses `value` as a string-to-size dict like `foo=12M,bar=1G`."""
+    result = {}
+    for token in value.split(","):
+        if token:
+            k, v = token.strip().split("=")
+            result[k] = _parse_byte_size(v)
+    return result
+
+
+def _nonnegative_int(v):
+    try:
+        v = int(v)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid int: %r" % v)
+    if v < 0:
+        raise argparse.ArgumentTypeError("must be non-negative: %r" % v)
+    return v
+
+
 def _nonnegative_float(v):
     try:
         v = float(v)
@@ -15,6 +15,7 @@
 """Tests the TensorBoard core endpoints."""
 
 
+import argparse
 import collections.abc
 import contextlib
 import io
@@ -55,6 +56,7 @@ class FakeFlags:
         host=None,
         inspect=False,
         load_fast="auto",
+        load_on_demand=None,
         logdir="",
         logdir_spec="",
         path_prefix="",
@@ -69,6 +71,7 @@ class FakeFlags:
         self.host = host
         self.inspect = inspect
         self.load_fast = load_fast
+        self.load_on_demand = load_on_demand
         self.logdir = logdir
         self.logdir_spec = logdir_spec
         self.path_prefix = path_prefix
@@ -110,6 +113,51 @@ class CorePluginFlagsTest(tf.test.TestCase):
                 FakeFlags(inspect=False, event_file="/tmp/event.out")
             )
 
+    def testParseByteSizes(self):
+        parse = core_plugin._parse_bytes_per_plugin
+        self.assertEqual(
+            parse("images=512,audio=64K,histograms=2m,x=1GiB,y=3TB"),
+            {
+                "images": 512,
+                "audio": 64 << 10,
+                "histograms": 2 << 20,
+                "x": 1 << 30,
+                "y": 3 << 40,
+            },
+        )
+        self.assertEqual(parse(""), {})
+        with self.assertRaises(argparse.ArgumentTypeError):
+            core_plugin._parse_byte_size("1.5G")
+
+    def testIncompatibleFlagsMessages(self):
+        loader = core_plugin.CorePluginLoader()
+        parser = argparse.ArgumentParser()
+        loader.define_flags(parser)
+        for args in (
+            ["--reload_incremental=true"],
+            ["--max_reload_processes=2"],
+            ["--max_tensor_bytes=1G"],
+            ["--reload_watch=true"],
+            ["--reload_backoff=true"],
+            ["--load_on_demand=true"],
+            ["--skip_data_crc=true"],
+        ):
+            flags = parser.parse_args(
+                ["--logdir=/tmp", "--load_fast=true"] + args
+            )
+            with self.assertRaises(base_plugin.FlagsError) as cm:
+                loader.fix_flags(flags)
+            self.assertRegex(str(cm.exception), r" and (any of )?--")
+        flags = parser.parse_args(
+            [
+                "--logdir=/tmp",
+                "--load_on_demand=true",
+                "--max_reload_processes=2",
+            ]
+        )
+        with self.assertRaisesRegex(base_plugin.FlagsError, r" and --max"):
+            loader.fix_flags(flags)
+
     def testPathPrefix_stripsTrailingSlashes(self):
         loader = core_plugin.CorePluginLoader()
         for path_prefix in ("/hello", "/hello/", "/hello//", "/hello///"):
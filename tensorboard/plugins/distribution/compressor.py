@@ -154,6 +154,69 @@ def compress_histogram(buckets, bps=NORMAL_HISTOGRAM_BPS):
     return result
 
 
+def compress_histograms(buckets, bps=NORMAL_HISTOGRAM_BPS):
+    """Compresses many histograms with the same number of buckets at once.
+
+    This computes, for each histogram, the values of `compress_histogram`
+    for all basis points together with array operations.
+
+    Args:
+      buckets: A float array of shape `[num_histograms, num_buckets, 3]`,
+        where `buckets[i]` holds the `(min, max, count)` buckets of the
+        `i`th histogram.
+      bps: Compression points represented in basis points, 1/100ths of a percent.
+          Defaults to normal distribution.
+
+    Returns:
+      A float64 array of shape `[num_histograms, len(bps)]` with the value of
+      each histogram at each basis point.
+    """
+    buckets = np.asarray(buckets, dtype=np.float64)
+    (num_histograms, num_buckets, _) = buckets.shape
+    if not num_buckets:
+        return np.zeros((num_histograms, len(bps)))
+    bps_array = np.asarray(bps, dtype=np.float64)
+    rows = np.arange(num_histograms)[:, np.newaxis]
+    minmin = buckets[:, 0, 0][:, np.newaxis]
+    maxmax = buckets[:, -1, 1][:, np.newaxis]
+    counts = buckets[:, :, 2]
+    right_edges = buckets[:, :, 1]
+    totals = counts.sum(axis=1)
+    totals[totals == 0] = 1.0
+    weights = (counts * bps[-1] / totals[:, np.newaxis]).cumsum(axis=1)
+    weights_prev = np.zeros_like(weights)
+    weights_prev[:, 1:] = weights[:, :-1]
+
+    # For each basis point, the first bucket whose cumulative weight is
+    # larger, as from `np.searchsorted(..., side="right")`...
+    indices = (weights[:, :, np.newaxis] <= bps_array).sum(axis=1)
+    # ...skipping buckets that add no weight.
+    adds_weight = weights != weights_prev
+    next_adding = np.where(adds_weight, np.arange(num_buckets), num_buckets)
+    next_adding = np.minimum.accumulate(next_adding[:, ::-1], axis=1)[:, ::-1]
+    next_adding = np.concatenate(
+        [next_adding, np.full((num_histograms, 1), num_buckets)], axis=1
+    )
+    indices = next_adding[rows, indices]
+    found = indices < num_buckets
+    i = np.minimum(indices, num_buckets - 1)
+
+    cumsum = weights[rows, i]
+    cumsum_prev = weights_prev[rows, i]
+    lhs = np.where(
+        (i == 0) | (cumsum_prev == 0),
+        minmin,
+        np.maximum(right_edges[rows, np.maximum(i - 1, 0)], minmin),
+    )
+    rhs = np.minimum(right_edges[rows, i], maxmax)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = lhs + (bps_array - cumsum_prev) * (rhs - lhs) / (
+            cumsum - cumsum_prev
+        )
+    # Basis points past the last bucket that adds weight take the maximum.
+    return np.where(found, values, maxmax)
+
+
 def _lerp(x, x0, x1, y0, y1):
     """Affinely map from [x0, x1] onto [y0, y1]."""
     return y0 + (x - x0) * float(y1 - y0) / (x1 - x0)
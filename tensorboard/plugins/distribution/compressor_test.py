@@ -14,6 +14,7 @@
 # ==============================================================================
 
 
+import numpy as np
 import tensorflow as tf
 
 from tensorboard.plugins.distribution import compressor
@@ -96,6 +97,38 @@ class CompressorTest(tf.test.TestCase):
         self.assertAlmostEqual(values[7], 0.91697249669848446)
         self.assertAlmostEqual(values[8], 1.7976931348623157e308)
 
+    def test_compress_histograms_matches_compress_histogram(self):
+        rng = np.random.default_rng(0)
+        for num_buckets in (0, 1, 2, 5, 30):
+            edges = np.sort(rng.normal(size=(20, num_buckets + 1)), axis=1)
+            buckets = np.stack(
+                [
+                    edges[:, :-1],
+                    edges[:, 1:],
+                    # Include buckets and histograms without any counts.
+                    rng.choice([0.0, 0.0, 1.0, 3.5], size=(20, num_buckets)),
+                ],
+                axis=-1,
+            )
+            values = compressor.compress_histograms(buckets)
+            self.assertEqual(values.shape, (20, 9))
+            for histogram, histogram_values in zip(buckets, values):
+                expected = compressor.compress_histogram(histogram.tolist())
+                self.assertEqual(
+                    [v for (_, v) in expected], histogram_values.tolist()
+                )
+
+    def test_compress_histograms_ugly(self):
+        buckets = [
+            [-1.0, 0.0, 0.0],
+            [0.0, 0.917246389039776, 896.0],
+            [0.917246389039776, 1.0089710279437536, 0.0],
+            [1.0089710279437536, 1.7976931348623157e308, 64.0],
+        ]
+        values = compressor.compress_histograms([buckets, buckets])
+        expected = [v for (_, v) in compressor.compress_histogram(buckets)]
+        self.assertEqual(values.tolist(), [expected, expected])
+
 
 if __name__ == "__main__":
     tf.test.main()
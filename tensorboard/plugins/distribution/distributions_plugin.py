@@ -19,6 +19,10 @@ this plugin.
 """
 
 
+import collections
+import threading
+
+import numpy as np
 from werkzeug import wrappers
 
 from tensorboard import plugin_util
@@ -29,6 +33,10 @@ from tensorboard.plugins.distribution import metadata
 from tensorboard.plugins.histogram import histograms_plugin
 
 
+# Number of time series whose compressed histograms are cached.
+_MAX_CACHED_TIME_SERIES = 128
+
+
 class DistributionsPlugin(base_plugin.TBPlugin):
     """Distributions Plugin for TensorBoard.
 
@@ -51,6 +59,10 @@ class DistributionsPlugin(base_plugin.TBPlugin):
           context: A base_plugin.TBContext instance.
         """
         self._histograms_plugin = histograms_plugin.HistogramsPlugin(context)
+        # Maps `(experiment, run, tag)` to a dict from `(step, wall_time)`
+        # to the compressed histogram at that step, in LRU order.
+        self._compressed = collections.OrderedDict()
+        self._compressed_lock = threading.Lock()
 
     def get_plugin_apps(self):
         return {
@@ -80,18 +92,63 @@ class DistributionsPlugin(base_plugin.TBPlugin):
         Raises:
           tensorboard.errors.PublicError: On invalid request.
         """
-        (histograms, mime_type) = self._histograms_plugin.histograms_impl(
+        histograms = self._histograms_plugin.read_histograms(
             ctx, tag, run, experiment=experiment, downsample_to=self.SAMPLE_SIZE
         )
+        compressed = self._compress(experiment, run, tag, histograms)
+        bps = compressor.NORMAL_HISTOGRAM_BPS
         return (
-            [self._compress(histogram) for histogram in histograms],
-            mime_type,
+            [
+                [e.wall_time, e.step, list(zip(bps, values.tolist()))]
+                for (e, values) in zip(histograms, compressed)
+            ],
+            "application/json",
         )
 
-    def _compress(self, histogram):
-        (wall_time, step, buckets) = histogram
-        converted_buckets = compressor.compress_histogram(buckets)
-        return [wall_time, step, converted_buckets]
+    def _compress(self, experiment, run, tag, histograms):
+        """Compresses the histograms of a time series.
+
+        Histograms compressed by earlier requests for the same time series
+        are reused; the others are compressed together, in one batch per
+        number of buckets.
+
+        Returns:
+          A list with a float array of the values at each basis point for
+          each histogram.
+        """
+        key = (experiment, run, tag)
+        with self._compressed_lock:
+            cached = self._compressed.get(key, {})
+        # A step is rewritten with a new wall time, so the pair identifies
+        # the histogram at the step.
+        result = [cached.get((e.step, e.wall_time)) for e in histograms]
+        positions_by_size = collections.defaultdict(list)
+        for i, e in enumerate(histograms):
+            if result[i] is None:
+                positions_by_size[e.numpy.size].append(i)
+        for positions in positions_by_size.values():
+            buckets = np.stack(
+                [histograms[i].numpy.reshape(-1, 3) for i in positions]
+            )
+            for i, values in zip(
+                positions, compressor.compress_histograms(buckets)
+            ):
+                result[i] = values
+        if positions_by_size:
+            compressed = {
+                (e.step, e.wall_time): values
+                for (e, values) in zip(histograms, result)
+            }
+            with self._compressed_lock:
+                self._compressed[key] = compressed
+                self._compressed.move_to_end(key)
+                while len(self._compressed) > _MAX_CACHED_TIME_SERIES:
+                    self._compressed.popitem(last=False)
+        else:
+            with self._compressed_lock:
+                if key in self._compressed:
+                    self._compressed.move_to_end(key)
+        return result
 
     def index_impl(self, ctx, experiment):
         return self._histograms_plugin.index_impl(ctx, experiment=experiment)
@@ -18,6 +18,7 @@
 
 import collections.abc
 import os.path
+from unittest import mock
 
 import tensorflow as tf
 
@@ -187,6 +188,49 @@ class DistributionsPluginTest(tf.test.TestCase):
             "%s/histogram_summary" % self._DISTRIBUTION_TAG,
         )
 
+    def test_distributions_match_compress_histogram(self):
+        self.set_up_with_runs([self._RUN_WITH_DISTRIBUTION])
+        tag = "%s/histogram_summary" % self._DISTRIBUTION_TAG
+        (data, _) = self.plugin.distributions_impl(
+            context.RequestContext(), tag, self._RUN_WITH_DISTRIBUTION, "exp"
+        )
+        (histograms, _) = self.plugin._histograms_plugin.histograms_impl(
+            context.RequestContext(),
+            tag,
+            self._RUN_WITH_DISTRIBUTION,
+            experiment="exp",
+            downsample_to=self.plugin.SAMPLE_SIZE,
+        )
+        expected = [
+            [wall_time, step, compressor.compress_histogram(buckets)]
+            for (wall_time, step, buckets) in histograms
+        ]
+        self.assertEqual(data, expected)
+
+    def test_distributions_reuse_compressed_histograms(self):
+        self.set_up_with_runs([self._RUN_WITH_DISTRIBUTION])
+        tag = "%s/histogram_summary" % self._DISTRIBUTION_TAG
+        with mock.patch.object(
+            compressor,
+            "compress_histograms",
+            wraps=compressor.compress_histograms,
+        ) as compress_histograms:
+            (data, _) = self.plugin.distributions_impl(
+                context.RequestContext(),
+                tag,
+                self._RUN_WITH_DISTRIBUTION,
+                experiment="exp",
+            )
+            self.assertEqual(compress_histograms.call_count, 1)
+            (data_again, _) = self.plugin.distributions_impl(
+                context.RequestContext(),
+                tag,
+                self._RUN_WITH_DISTRIBUTION,
+                experiment="exp",
+            )
+            self.assertEqual(compress_histograms.call_count, 1)
+        self.assertEqual(data, data_again)
+
 
 if __name__ == "__main__":
     tf.test.main()
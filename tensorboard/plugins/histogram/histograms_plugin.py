@@ -27,6 +27,7 @@ from tensorboard.backend import http_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.histogram import metadata
+from tensorboard.plugins.histogram import rebinning
 
 
 _DEFAULT_DOWNSAMPLING = 500  # histograms per time series
@@ -99,12 +100,80 @@ class HistogramsPlugin(base_plugin.TBPlugin):
             element_name="tf-histogram-dashboard"
         )
 
-    def histograms_impl(self, ctx, tag, run, experiment, downsample_to=None):
+    def histograms_impl(
+        self,
+        ctx,
+        tag,
+        run,
+        experiment,
+        downsample_to=None,
+        bin_count=None,
+        max_steps=None,
+    ):
         """Result of the form `(body, mime_type)`.
 
         At most `downsample_to` events will be returned. If this value is
         `None`, then default downsampling will be performed.
 
+        If `max_steps` is given, at most that many evenly spaced events of
+        those are returned. If `bin_count` is given, the histograms are
+        re-binned into that many common bins; see `rebinning.rebin`.
+
+        Raises:
+          tensorboard.errors.PublicError: On invalid request.
+        """
+        events = self._histogram_events(
+            ctx,
+            tag,
+            run,
+            experiment,
+            downsample_to=downsample_to,
+            bin_count=bin_count,
+            max_steps=max_steps,
+        )
+        return (list(events), "application/json")
+
+    def _histogram_events(
+        self,
+        ctx,
+        tag,
+        run,
+        experiment,
+        downsample_to=None,
+        bin_count=None,
+        max_steps=None,
+    ):
+        """Like `histograms_impl`, but returns a generator of the events.
+
+        The histograms are read right away, so that errors are raised from
+        this call, but each event's buckets are only converted to Python
+        lists as the generator is consumed.
+
+        Raises:
+          tensorboard.errors.PublicError: On invalid request.
+        """
+        histograms = self.read_histograms(
+            ctx, tag, run, experiment, downsample_to=downsample_to
+        )
+        if max_steps is not None:
+            histograms = [
+                histograms[i]
+                for i in rebinning.downsample_steps(len(histograms), max_steps)
+            ]
+        buckets = [e.numpy for e in histograms]
+        if bin_count is not None:
+            buckets = rebinning.rebin(buckets, bin_count)
+        return (
+            (e.wall_time, e.step, b.tolist())
+            for (e, b) in zip(histograms, buckets)
+        )
+
+    def read_histograms(self, ctx, tag, run, experiment, downsample_to=None):
+        """Reads the histograms of a time series.
+
+        Like `histograms_impl`, but returns the `provider.TensorDatum`s,
+        whose `numpy` arrays have shape `[num_buckets, 3]`.
+
         Raises:
           tensorboard.errors.PublicError: On invalid request.
         """
@@ -123,8 +192,7 @@ class HistogramsPlugin(base_plugin.TBPlugin):
             raise errors.NotFoundError(
                 "No histogram tag %r for run %r" % (tag, run)
             )
-        events = [(e.wall_time, e.step, e.numpy.tolist()) for e in histograms]
-        return (events, "application/json")
+        return histograms
 
     @wrappers.Request.application
     def tags_route(self, request):
@@ -140,7 +208,46 @@ class HistogramsPlugin(base_plugin.TBPlugin):
         experiment = plugin_util.experiment_id(request.environ)
         tag = request.args.get("tag")
         run = request.args.get("run")
-        (body, mime_type) = self.histograms_impl(
-            ctx, tag, run, experiment=experiment, downsample_to=self.SAMPLE_SIZE
+        bin_count = _positive_int_arg(request, "bin_count")
+        max_steps = _positive_int_arg(request, "max_steps")
+        etag = None
+        if tag is not None and run is not None:
+            etag = self._data_provider.data_generation(
+                ctx,
+                experiment_id=experiment,
+                run_tag_filter=provider.RunTagFilter(runs=[run], tags=[tag]),
+            )
+        events = self._histogram_events(
+            ctx,
+            tag,
+            run,
+            experiment=experiment,
+            downsample_to=self.SAMPLE_SIZE,
+            bin_count=bin_count,
+            max_steps=max_steps,
+        )
+        # Stream the events, so that the JSON-ready lists, serialized and
+        # compressed forms of a large response are never held in memory all
+        # at once.
+        return http_util.Respond(request, events, "application/json", etag=etag)
+
+
+def _positive_int_arg(request, name):
+    """Parses an optional positive integer query parameter.
+
+    Raises:
+      tensorboard.errors.InvalidArgumentError: If the parameter is given
+        but is not a positive integer.
+    """
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        raise errors.InvalidArgumentError(
+            "%s must be a positive integer, got %r" % (name, value)
         )
-        return http_util.Respond(request, body, mime_type)
+    return result
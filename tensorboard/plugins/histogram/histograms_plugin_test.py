@@ -17,9 +17,14 @@
 
 
 import collections.abc
+import json
 import os.path
+from unittest import mock
 
+import numpy as np
 import tensorflow as tf
+from werkzeug import test as werkzeug_test
+from werkzeug import wrappers
 
 from tensorboard import errors
 from tensorboard import context
@@ -28,6 +33,7 @@ from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
 from tensorboard.backend.event_processing import tag_types
+from tensorboard.data import provider as provider_lib
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.histogram import histograms_plugin
 from tensorboard.plugins.histogram import summary
@@ -220,6 +226,72 @@ class HistogramsPluginTest(tf.test.TestCase):
             "%s/histogram_summary" % self._HISTOGRAM_TAG,
         )
 
+    def test_histograms_rebinned(self):
+        plugin = self.load_plugin([self._RUN_WITH_HISTOGRAM])
+        (data, _) = plugin.histograms_impl(
+            context.RequestContext(),
+            "%s/histogram_summary" % self._HISTOGRAM_TAG,
+            self._RUN_WITH_HISTOGRAM,
+            experiment="exp",
+            bin_count=10,
+            max_steps=5,
+        )
+        self.assertEqual([0, 24, 49, 74, 98], [step for (_, step, _) in data])
+        for _, step, buckets in data:
+            self.assertLen(buckets, 10)
+            # The buckets span the range of all steps.
+            self.assertEqual(1.0, buckets[0][0])
+            self.assertAlmostEqual(3.0 + self._STEPS - 1, buckets[-1][1])
+            self.assertAlmostEqual(3, sum(bucket[2] for bucket in buckets))
+
+    def test_histograms_route_rejects_invalid_bin_count(self):
+        plugin = self.load_plugin([self._RUN_WITH_HISTOGRAM])
+        server = werkzeug_test.Client(
+            plugin.histograms_route, wrappers.Response
+        )
+        with self.assertRaisesRegex(errors.InvalidArgumentError, "bin_count"):
+            server.get(
+                "/?run=%s&tag=%s&bin_count=zero"
+                % (self._RUN_WITH_HISTOGRAM, self._HISTOGRAM_TAG)
+            )
+
+    def test_histograms_route_streams_events(self):
+        plugin = self.load_plugin([self._RUN_WITH_HISTOGRAM])
+        converted = []
+
+        class Buckets(np.ndarray):
+            def tolist(self):
+                converted.append(self)
+                return super().tolist()
+
+        # Each event serializes to more than one chunk of the response.
+        histograms = [
+            provider_lib.TensorDatum(
+                step=step,
+                wall_time=1.0 + step,
+                numpy=np.full((5000, 3), step, dtype=np.float64).view(Buckets),
+            )
+            for step in range(10)
+        ]
+        server = werkzeug_test.Client(
+            plugin.histograms_route, wrappers.Response
+        )
+        with mock.patch.object(
+            plugin, "read_histograms", return_value=histograms
+        ):
+            response = server.get(
+                "/?run=%s&tag=%s" % (self._RUN_WITH_HISTOGRAM, "tag"),
+                buffered=False,
+            )
+            self.assertEqual(200, response.status_code)
+            # The test client reads the first chunk of the body, but no more.
+            self.assertLen(converted, 1)
+            body = b"".join(response.response)
+        self.assertLen(converted, 10)
+        data = json.loads(body)
+        self.assertEqual(list(range(10)), [step for (_, step, _) in data])
+        self.assertEqual([[9.0] * 3] * 5000, data[9][2])
+
 
 if __name__ == "__main__":
     tf.test.main()
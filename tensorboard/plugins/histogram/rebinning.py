@@ -0,0 +1,112 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Server-side re-binning and step downsampling of histogram time series.
+
+Re-binning follows `buildNormalizedHistograms` in the frontend's
+`histogram_util.ts`: all histograms of a time series are re-binned into
+the same `bin_count` equal-width bins, spanning the range of all of
+their buckets, and the count of each bucket is spread over the new bins
+it overlaps. The frontend applies the same normalization, which leaves
+histograms re-binned here unchanged.
+"""
+
+
+import numpy as np
+
+
+def downsample_steps(num_steps, max_steps):
+    """Chooses evenly spaced steps of a time series.
+
+    Args:
+      num_steps: The number of steps of the time series.
+      max_steps: The maximum number of steps to keep. Must be positive.
+
+    Returns:
+      A sorted int array of the positions of the steps to keep. The first
+      and last steps are always kept.
+    """
+    if num_steps <= max_steps:
+        return np.arange(num_steps)
+    if max_steps == 1:
+        return np.array([num_steps - 1])
+    return np.unique(
+        np.round(np.linspace(0, num_steps - 1, max_steps)).astype(np.int64)
+    )
+
+
+def rebin(histograms, bin_count):
+    """Re-bins the histograms of a time series into the same bins.
+
+    The count of a bucket of nonzero width is spread uniformly over its
+    width. A bucket of zero width `[x, x]` is counted in the bin `[left,
+    right)` that contains `x`, or in the last bin if `x` is its right
+    edge. The total count of each histogram is preserved.
+
+    Args:
+      histograms: A list of float arrays of shape `[num_buckets, 3]`, as
+        from the `numpy` field of a histogram `TensorDatum`. Each holds
+        the `(min, max, count)` buckets of a histogram, sorted and not
+        overlapping. The number of buckets may differ.
+      bin_count: The number of bins to re-bin into. Must be positive.
+
+    Returns:
+      A float64 array of shape `[len(histograms), bin_count, 3]` with the
+      re-binned histograms. If all histograms are empty, the array has no
+      bins. If their range is not finite, as with buckets that extend to
+      infinity, the histograms are returned unchanged, as a list.
+    """
+    histograms = [
+        np.asarray(h, dtype=np.float64).reshape(-1, 3) for h in histograms
+    ]
+    nonempty = [h for h in histograms if len(h)]
+    if not nonempty:
+        return np.zeros((len(histograms), 0, 3))
+    left = min(h[0, 0] for h in nonempty)
+    right = max(h[-1, 1] for h in nonempty)
+    if not (np.isfinite(left) and np.isfinite(right)):
+        return histograms
+    if left == right:
+        # If the output range is 0 width, use a default non 0 range.
+        (left, right) = (left / 1.1 - 1, right * 1.1 + 1)
+    dx = (right - left) / bin_count
+    edges = left + np.arange(bin_count + 1) * dx
+    result = np.empty((len(histograms), bin_count, 3))
+    result[:, :, 0] = edges[:-1]
+    result[:, :, 1] = edges[:-1] + dx
+    for i, histogram in enumerate(histograms):
+        cumulative = _cumulative_counts(histogram, edges[1:-1])
+        total = histogram[:, 2].sum()
+        result[i, :, 2] = np.diff(cumulative, prepend=0.0, append=total)
+    return result
+
+
+def _cumulative_counts(histogram, xs):
+    """Returns the count of a histogram to the left of each of `xs`."""
+    (lefts, rights, counts) = histogram.T
+    widths = rights - lefts
+    has_width = widths > 0
+    # The count of buckets with a width grows linearly over the bucket.
+    xp = np.stack([lefts[has_width], rights[has_width]], axis=1).ravel()
+    fp = np.cumsum(
+        np.stack([np.zeros(has_width.sum()), counts[has_width]], axis=1).ravel()
+    )
+    result = np.interp(xs, xp, fp) if len(xp) else np.zeros(len(xs))
+    # Buckets without a width are counted once `x` is strictly past them.
+    point_order = np.argsort(lefts[~has_width], kind="stable")
+    points = lefts[~has_width][point_order]
+    point_counts = np.concatenate(
+        [[0.0], np.cumsum(counts[~has_width][point_order])]
+    )
+    return result + point_counts[np.searchsorted(points, xs, side="left")]
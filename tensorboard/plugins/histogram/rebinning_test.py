@@ -0,0 +1,108 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for histogram re-binning."""
+
+
+import numpy as np
+import tensorflow as tf
+
+from tensorboard.plugins.histogram import rebinning
+
+
+class RebinTest(tf.test.TestCase):
+    def test_spreads_counts_over_overlapping_bins(self):
+        # [ 5 ][   10   ] into 2 bins: half of the 10 goes left.
+        histogram = np.array([[0.0, 1.0, 5.0], [1.0, 3.0, 10.0]])
+        result = rebinning.rebin([histogram], 2)
+        self.assertAllClose([[[0.0, 1.5, 7.5], [1.5, 3.0, 7.5]]], result)
+
+    def test_uses_common_range(self):
+        histograms = [
+            np.array([[0.0, 2.0, 4.0]]),
+            np.array([[2.0, 3.0, 1.0], [3.0, 4.0, 3.0]]),
+        ]
+        result = rebinning.rebin(histograms, 4)
+        self.assertAllClose(
+            [
+                [[0, 1, 2], [1, 2, 2], [2, 3, 0], [3, 4, 0]],
+                [[0, 1, 0], [1, 2, 0], [2, 3, 1], [3, 4, 3]],
+            ],
+            result,
+        )
+
+    def test_preserves_counts(self):
+        rng = np.random.default_rng(0)
+        histograms = []
+        for num_buckets in (1, 5, 30, 1000):
+            edges = np.sort(rng.normal(size=num_buckets + 1))
+            counts = rng.choice([0.0, 1.0, 7.0], size=num_buckets)
+            histograms.append(np.stack([edges[:-1], edges[1:], counts], axis=1))
+        result = rebinning.rebin(histograms, 30)
+        self.assertEqual((4, 30, 3), result.shape)
+        self.assertAllClose(
+            [h[:, 2].sum() for h in histograms], result[:, :, 2].sum(axis=1)
+        )
+
+    def test_zero_width_buckets(self):
+        histograms = [
+            # A single value, as written by the v2 histogram summary.
+            np.array([[0.0, 0.0, 0.0]] * 29 + [[0.0, 0.0, 1.0]]),
+            # A value on the edge between two bins counts in the right one.
+            np.array([[5.0, 5.0, 2.0]]),
+            # A value on the right edge of the range counts in the last bin.
+            np.array([[10.0, 10.0, 3.0]]),
+        ]
+        result = rebinning.rebin(histograms, 2)
+        self.assertAllClose([[1, 0], [0, 2], [0, 3]], result[:, :, 2])
+
+    def test_zero_width_range(self):
+        histograms = [np.array([[1.0, 1.0, 3.0]])]
+        result = rebinning.rebin(histograms, 2)
+        # Like the frontend, widen the range around the value.
+        (left, right) = (1 / 1.1 - 1, 1 * 1.1 + 1)
+        middle = (left + right) / 2
+        self.assertAllClose(
+            [[[left, middle, 3], [middle, right, 0]]],
+            result,
+        )
+
+    def test_empty_histograms(self):
+        result = rebinning.rebin([np.zeros((0, 3)), np.zeros((0, 3))], 30)
+        self.assertEqual((2, 0, 3), result.shape)
+        result = rebinning.rebin([np.zeros((0, 3)), np.array([[0, 1, 2]])], 2)
+        self.assertAllClose([[0, 0], [1, 1]], result[:, :, 2])
+
+    def test_infinite_range_is_unchanged(self):
+        histograms = [np.array([[-np.inf, 0.0, 1.0], [0.0, 1.0, 2.0]])]
+        result = rebinning.rebin(histograms, 30)
+        self.assertAllEqual(histograms[0], result[0])
+
+
+class DownsampleStepsTest(tf.test.TestCase):
+    def test_keeps_all_steps(self):
+        self.assertAllEqual([0, 1, 2], rebinning.downsample_steps(3, 3))
+        self.assertAllEqual([0, 1, 2], rebinning.downsample_steps(3, 10))
+
+    def test_keeps_evenly_spaced_steps(self):
+        self.assertAllEqual([0, 3, 6, 9], rebinning.downsample_steps(10, 4))
+        self.assertAllEqual([0, 9], rebinning.downsample_steps(10, 2))
+        self.assertLen(rebinning.downsample_steps(1000, 51), 51)
+
+    def test_keeps_last_step(self):
+        self.assertAllEqual([9], rebinning.downsample_steps(10, 1))
+
+
+if __name__ == "__main__":
+    tf.test.main()
@@ -18,6 +18,7 @@ handlers for the HParams plugin backend."""
 
 import collections
 import os
+import threading
 
 
 from tensorboard.data import provider
@@ -27,6 +28,9 @@ from tensorboard.plugins.hparams import metadata
 from google.protobuf import json_format
 from tensorboard.plugins.scalar import metadata as scalar_metadata
 
+# Number of session group indexes kept across all experiments and views.
+_MAX_SESSION_GROUP_INDEXES = 8
+
 _DISCRETE_DOMAIN_TYPE_TO_DATA_TYPE = {
     provider.HyperparameterDomainType.DISCRETE_BOOL: api_pb2.DATA_TYPE_BOOL,
     provider.HyperparameterDomainType.DISCRETE_FLOAT: api_pb2.DATA_TYPE_FLOAT64,
@@ -52,6 +56,10 @@ class Context:
           tb_context: base_plugin.TBContext. The "base" context we extend.
         """
         self._tb_context = tb_context
+        # Dict mapping `(experiment_id, key)` to a `SessionGroupIndex`, in
+        # order of last use.
+        self._session_group_indexes = collections.OrderedDict()
+        self._session_group_indexes_lock = threading.Lock()
 
     def experiment_from_metadata(
         self,
@@ -192,6 +200,46 @@ class Context:
             run_tag_filter=run_tag_filter,
         )
 
+    def data_generation(self, ctx, experiment_id):
+        """Calls DataProvider.data_generation() and returns the result.
+
+        Returns:
+          A token that changes whenever the data of the experiment may
+          change, or None if the data provider does not support it.
+        """
+        return self._tb_context.data_provider.data_generation(
+            ctx, experiment_id=experiment_id
+        )
+
+    def session_group_index(self, experiment_id, key):
+        """Returns the session group index last stored for an experiment.
+
+        Args:
+          experiment_id: String, from `plugin_util.experiment_id`.
+          key: A hashable value identifying how the session groups of the
+            index were built.
+
+        Returns:
+          A `session_group_index.SessionGroupIndex`, or None. It may be
+          for an earlier data generation.
+        """
+        with self._session_group_indexes_lock:
+            index = self._session_group_indexes.get((experiment_id, key))
+            if index is not None:
+                self._session_group_indexes.move_to_end((experiment_id, key))
+            return index
+
+    def set_session_group_index(self, experiment_id, key, index):
+        """Stores a session group index, for `session_group_index`.
+
+        Only the most recently used indexes are kept.
+        """
+        with self._session_group_indexes_lock:
+            self._session_group_indexes[(experiment_id, key)] = index
+            self._session_group_indexes.move_to_end((experiment_id, key))
+            while len(self._session_group_indexes) > _MAX_SESSION_GROUP_INDEXES:
+                self._session_group_indexes.popitem(last=False)
+
     def hparams_from_data_provider(self, ctx, experiment_id, limit):
         """Calls DataProvider.list_hyperparameters() and returns the result."""
         return self._tb_context.data_provider.list_hyperparameters(
@@ -21,16 +21,16 @@ import operator
 import re
 from typing import Optional
 
-from google.protobuf import struct_pb2
+import numpy as np
 
 from tensorboard.data import provider
 from tensorboard.plugins.hparams import api_pb2
 from tensorboard.plugins.hparams import backend_context as backend_context_lib
 from tensorboard.plugins.hparams import error
-from tensorboard.plugins.hparams import json_format_compat
 from tensorboard.plugins.hparams import metadata
 from tensorboard.plugins.hparams import metrics
 from tensorboard.plugins.hparams import plugin_data_pb2
+from tensorboard.plugins.hparams import session_group_index
 
 
 class Handler:
@@ -72,9 +72,16 @@ class Handler:
           A ListSessionGroupsResponse object.
         """
 
-        session_groups_from_tags = self._session_groups_from_tags()
-        if session_groups_from_tags:
-            return self._create_response(session_groups_from_tags)
+        (session_groups, total_size) = self._session_groups_from_tags()
+        if total_size:
+            response = api_pb2.ListSessionGroupsResponse(
+                session_groups=session_groups, total_size=total_size
+            )
+            if _specifies_include(self._request.col_params):
+                _reduce_to_hparams_to_include(
+                    response.session_groups, self._request.col_params
+                )
+            return response
 
         session_groups_from_data_provider = (
             self._session_groups_from_data_provider()
@@ -87,40 +94,55 @@ class Handler:
         )
 
     def _session_groups_from_tags(self):
-        """Constructs lists of SessionGroups based on hparam tag metadata."""
-        # Query for all Hparams summary metadata one time to minimize calls to
-        # the underlying DataProvider.
-        hparams_run_to_tag_to_content = self._backend_context.hparams_metadata(
+        """Finds the requested SessionGroups based on hparam tag metadata.
+
+        Returns:
+          A pair `(session_groups, total_size)`, where `session_groups` is
+          the requested slice of the filtered and sorted session groups,
+          shared with the session group index, and `total_size` is the
+          number of session groups that pass the filters.
+        """
+        index = self._session_group_index()
+        return index.query(
+            filters=_create_filters(self._request.col_params),
+            sort_columns=_create_sort_columns(self._request.col_params),
+            start_index=self._request.start_index,
+            slice_size=self._request.slice_size,
+        )
+
+    def _session_group_index(self):
+        """Returns a SessionGroupIndex of the session groups from tags.
+
+        The index is kept in the backend context, and reused for later
+        requests with the same data generation and the same parameters
+        for building session groups. When the data changes, the new index
+        only rebuilds the session groups whose data changed.
+        """
+        # Read the generation before the data, so that an index of data
+        # that changes concurrently is never stored as current.
+        generation = self._backend_context.data_generation(
             self._request_context, self._experiment_id
         )
-        # Construct the experiment one time since an context.experiment() call
-        # may search through all the runs.
-        experiment = self._backend_context.experiment_from_metadata(
-            self._request_context,
-            self._experiment_id,
+        key = (
             self._include_metrics,
-            hparams_run_to_tag_to_content,
-            # Don't pass any information from the DataProvider since we are only
-            # examining session groups based on tag metadata
-            provider.ListHyperparametersResult(
-                hyperparameters=[], session_groups=[]
-            ),
-        )
-        extractors = _create_extractors(self._request.col_params)
-        filters = _create_filters(self._request.col_params, extractors)
-
-        session_groups = self._build_session_groups(
-            hparams_run_to_tag_to_content, experiment.metric_infos
+            tuple(sorted(set(self._request.allowed_statuses))),
+            self._request.aggregation_type,
+            self._request.aggregation_metric.group,
+            self._request.aggregation_metric.tag,
         )
-        session_groups = self._filter(session_groups, filters)
-        self._sort(session_groups, extractors)
-
-        if _specifies_include(self._request.col_params):
-            _reduce_to_hparams_to_include(
-                session_groups, self._request.col_params
+        previous = None
+        if generation is not None:
+            previous = self._backend_context.session_group_index(
+                self._experiment_id, key
             )
-
-        return session_groups
+            if previous is not None and previous.generation == generation:
+                return previous
+        index = self._build_session_group_index(generation, previous)
+        if generation is not None:
+            self._backend_context.set_session_group_index(
+                self._experiment_id, key, index
+            )
+        return index
 
     def _session_groups_from_data_provider(self):
         """Constructs lists of SessionGroups based on DataProvider results."""
@@ -213,10 +235,8 @@ class Handler:
             if group.sessions:
                 self._aggregate_metrics(group)
 
-        extractors = _create_extractors(self._request.col_params)
         filters = _create_filters(
             self._request.col_params,
-            extractors,
             # We assume the DataProvider will apply hparam filters and we do not
             # attempt to reapply them.
             include_hparam_filters=False,
@@ -224,19 +244,109 @@ class Handler:
         session_groups = self._filter(session_groups, filters)
         return session_groups
 
-    def _build_session_groups(
-        self, hparams_run_to_tag_to_content, metric_infos
-    ):
-        """Returns a list of SessionGroups protobuffers from the summary
-        data."""
-
-        # Algorithm: We keep a dict 'groups_by_name' mapping a SessionGroup name
-        # (str) to a SessionGroup protobuffer. We traverse the runs associated with
-        # the plugin--each representing a single session. We form a Session
-        # protobuffer from each run and add it to the relevant SessionGroup object
-        # in the 'groups_by_name' dict. We create the SessionGroup object, if this
-        # is the first session of that group we encounter.
-        groups_by_name = {}
+    def _build_session_group_index(self, generation, previous):
+        """Builds a SessionGroupIndex from the summary data.
+
+        Args:
+          generation: The data generation read before the data, or None.
+          previous: Optional earlier SessionGroupIndex built with the same
+            parameters. Its session groups whose data did not change are
+            reused rather than rebuilt.
+
+        Returns:
+          A SessionGroupIndex.
+        """
+        # Query for all Hparams summary metadata one time to minimize calls to
+        # the underlying DataProvider.
+        hparams_run_to_tag_to_content = self._backend_context.hparams_metadata(
+            self._request_context, self._experiment_id
+        )
+        # Construct the experiment one time since an context.experiment() call
+        # may search through all the runs.
+        experiment = self._backend_context.experiment_from_metadata(
+            self._request_context,
+            self._experiment_id,
+            self._include_metrics,
+            hparams_run_to_tag_to_content,
+            # Don't pass any information from the DataProvider since we are only
+            # examining session groups based on tag metadata
+            provider.ListHyperparametersResult(
+                hyperparameters=[], session_groups=[]
+            ),
+        )
+        metric_infos = experiment.metric_infos
+        all_metric_evals = self._read_metric_evals(
+            hparams_run_to_tag_to_content, metric_infos
+        )
+
+        # Algorithm: We traverse the runs associated with the plugin--each
+        # representing a single session--and collect the sessions, along
+        # with a fingerprint of the data each session is built from. The
+        # index reuses the session groups of the previous index whose
+        # sessions have unchanged fingerprints.
+        previous_infos = previous.session_infos if previous else {}
+        session_infos = {}
+
+        def parse(content, parse_fn):
+            info = previous_infos.get(content)
+            if info is None:
+                info = parse_fn(content)
+            session_infos[content] = info
+            return info
+
+        sessions = []
+        for (
+            session_name,
+            tag_to_content,
+        ) in hparams_run_to_tag_to_content.items():
+            start_content = tag_to_content.get(metadata.SESSION_START_INFO_TAG)
+            if start_content is None:
+                continue
+            start_info = parse(
+                start_content, metadata.parse_session_start_info_plugin_data
+            )
+            end_content = tag_to_content.get(metadata.SESSION_END_INFO_TAG)
+            end_info = None
+            status = api_pb2.STATUS_UNKNOWN
+            if end_content is not None:
+                end_info = parse(
+                    end_content, metadata.parse_session_end_info_plugin_data
+                )
+                status = end_info.status
+            if status not in self._request.allowed_statuses:
+                continue
+            metric_data = tuple(
+                _metric_datum(all_metric_evals, session_name, metric_info.name)
+                for metric_info in metric_infos
+            )
+            sessions.append(
+                session_group_index.Session(
+                    name=session_name,
+                    start_info=start_info,
+                    end_info=end_info,
+                    metric_data=metric_data,
+                    fingerprint=(
+                        session_name,
+                        start_content,
+                        end_content,
+                        metric_data,
+                    ),
+                )
+            )
+        return session_group_index.SessionGroupIndex(
+            generation,
+            sessions,
+            [metric_info.name for metric_info in metric_infos],
+            aggregation_type=self._request.aggregation_type,
+            aggregation_metric=self._request.aggregation_metric,
+            previous=previous,
+            session_infos=session_infos,
+        )
+
+    def _read_metric_evals(self, hparams_run_to_tag_to_content, metric_infos):
+        """Reads the last values of the metrics of all sessions."""
+        if not self._include_metrics:
+            return {}
         # The TensorBoard runs with session start info are the
         # "sessions", which are not necessarily the runs that actually
         # contain metrics (may be in subdirectories).
@@ -255,90 +365,13 @@ class Handler:
                 )
                 metric_runs.add(run)
                 metric_tags.add(tag)
-        all_metric_evals = (
-            self._backend_context.read_last_scalars(
-                self._request_context,
-                self._experiment_id,
-                run_tag_filter=provider.RunTagFilter(
-                    runs=metric_runs, tags=metric_tags
-                ),
-            )
-            if self._include_metrics
-            else {}
+        return self._backend_context.read_last_scalars(
+            self._request_context,
+            self._experiment_id,
+            run_tag_filter=provider.RunTagFilter(
+                runs=metric_runs, tags=metric_tags
+            ),
         )
-        for (
-            session_name,
-            tag_to_content,
-        ) in hparams_run_to_tag_to_content.items():
-            if metadata.SESSION_START_INFO_TAG not in tag_to_content:
-                continue
-            start_info = metadata.parse_session_start_info_plugin_data(
-                tag_to_content[metadata.SESSION_START_INFO_TAG]
-            )
-            end_info = None
-            if metadata.SESSION_END_INFO_TAG in tag_to_content:
-                end_info = metadata.parse_session_end_info_plugin_data(
-                    tag_to_content[metadata.SESSION_END_INFO_TAG]
-                )
-            session = self._build_session(
-                metric_infos,
-                session_name,
-                start_info,
-                end_info,
-                all_metric_evals,
-            )
-            if session.status in self._request.allowed_statuses:
-                self._add_session(session, start_info, groups_by_name)
-
-        # Compute the session group's aggregated metrics for each group.
-        groups = groups_by_name.values()
-        for group in groups:
-            # We sort the sessions in a group so that the order is deterministic.
-            group.sessions.sort(key=operator.attrgetter("name"))
-            self._aggregate_metrics(group)
-        return groups
-
-    def _add_session(self, session, start_info, groups_by_name):
-        """Adds a new Session protobuffer to the 'groups_by_name' dictionary.
-
-        Called by _build_session_groups when we encounter a new session. Creates
-        the Session protobuffer and adds it to the relevant group in the
-        'groups_by_name' dict. Creates the session group if this is the first time
-        we encounter it.
-
-        Args:
-          session: api_pb2.Session. The session to add.
-          start_info: The SessionStartInfo protobuffer associated with the session.
-          groups_by_name: A str to SessionGroup protobuffer dict. Representing the
-            session groups and sessions found so far.
-        """
-        # If the group_name is empty, this session's group contains only
-        # this session. Use the session name for the group name since session
-        # names are unique.
-        group_name = start_info.group_name or session.name
-        if group_name in groups_by_name:
-            groups_by_name[group_name].sessions.extend([session])
-        else:
-            # Create the group and add the session as the first one.
-            group = api_pb2.SessionGroup(
-                name=group_name,
-                sessions=[session],
-                monitor_url=start_info.monitor_url,
-            )
-            # Copy hparams from the first session (all sessions should have the same
-            # hyperparameter values) into result.
-            # There doesn't seem to be a way to initialize a protobuffer map in the
-            # constructor.
-            for key, value in start_info.hparams.items():
-                if not json_format_compat.is_serializable_value(value):
-                    # NaN number_value cannot be serialized by higher level layers
-                    # that are using json_format.MessageToJson(). To workaround
-                    # the issue we do not copy them to the session group and
-                    # effectively treat them as "unset".
-                    continue
-
-                group.hparams[key].CopyFrom(value)
-            groups_by_name[group_name] = group
 
     def _build_session(
         self, metric_infos, name, start_info, end_info, all_metric_evals
@@ -414,47 +447,14 @@ class Handler:
             )
 
     def _filter(self, session_groups, filters):
-        return [
-            sg for sg in session_groups if self._passes_all_filters(sg, filters)
-        ]
-
-    def _passes_all_filters(self, session_group, filters):
-        return all(filter_fn(session_group) for filter_fn in filters)
-
-    def _sort(self, session_groups, extractors):
-        """Sorts 'session_groups' in place according to _request.col_params."""
-
-        # Sort by session_group name so we have a deterministic order.
-        session_groups.sort(key=operator.attrgetter("name"))
-        # Sort by lexicographical order of the _request.col_params whose order
-        # is not ORDER_UNSPECIFIED. The first such column is the primary sorting
-        # key, the second is the secondary sorting key, etc. To achieve that we
-        # need to iterate on these columns in reverse order (thus the primary key
-        # is the key used in the last sort).
-        for col_param, extractor in reversed(
-            list(zip(self._request.col_params, extractors))
-        ):
-            if col_param.order == api_pb2.ORDER_UNSPECIFIED:
-                continue
-            if col_param.order == api_pb2.ORDER_ASC:
-                session_groups.sort(
-                    key=_create_key_func(
-                        extractor,
-                        none_is_largest=not col_param.missing_values_first,
-                    )
-                )
-            elif col_param.order == api_pb2.ORDER_DESC:
-                session_groups.sort(
-                    key=_create_key_func(
-                        extractor,
-                        none_is_largest=col_param.missing_values_first,
-                    ),
-                    reverse=True,
-                )
-            else:
-                raise error.HParamsError(
-                    "Unknown col_param.order given: %s" % col_param
-                )
+        passes = np.ones(len(session_groups), dtype=bool)
+        for column_filter in filters:
+            extractor = _create_extractor(column_filter.column_key)
+            column = session_group_index.Column.from_values(
+                [extractor(session_group) for session_group in session_groups]
+            )
+            passes &= column_filter.evaluate(column)
+        return [sg for (sg, p) in zip(session_groups, passes) if p]
 
     def _create_response(self, session_groups):
         return api_pb2.ListSessionGroupsResponse(
@@ -466,58 +466,43 @@ class Handler:
         )
 
 
-def _create_key_func(extractor, none_is_largest):
-    """Returns a key_func to be used in list.sort().
-
-    Returns a key_func to be used in list.sort() that sorts session groups
-    by the value extracted by extractor. 'None' extracted values will either
-    be considered largest or smallest as specified by the "none_is_largest"
-    boolean parameter.
-
-    Args:
-      extractor: An extractor function that extract the key from the session
-        group.
-      none_is_largest: bool. If true treats 'None's as largest; otherwise
-        smallest.
-    """
-    if none_is_largest:
-
-        def key_func_none_is_largest(session_group):
-            value = extractor(session_group)
-            return (value is None, value)
-
-        return key_func_none_is_largest
-
-    def key_func_none_is_smallest(session_group):
-        value = extractor(session_group)
-        return (value is not None, value)
-
-    return key_func_none_is_smallest
-
-
-# Extractors. An extractor is a function that extracts some property (a metric
-# or a hyperparameter) from a SessionGroup instance.
-def _create_extractors(col_params):
-    """Creates extractors to extract properties corresponding to 'col_params'.
+def _create_sort_columns(col_params):
+    """Creates the columns to sort session groups by.
 
     Args:
       col_params: List of ListSessionGroupsRequest.ColParam protobufs.
+
     Returns:
-      A list of extractor functions. The ith element in the
-      returned list extracts the column corresponding to the ith element of
-      _request.col_params
+      A list of session_group_index.SortColumn, with the primary sorting
+      key first. Columns whose order is ORDER_UNSPECIFIED are skipped.
     """
     result = []
     for col_param in col_params:
-        result.append(_create_extractor(col_param))
+        if col_param.order == api_pb2.ORDER_UNSPECIFIED:
+            continue
+        if col_param.order not in (api_pb2.ORDER_ASC, api_pb2.ORDER_DESC):
+            raise error.HParamsError(
+                "Unknown col_param.order given: %s" % col_param
+            )
+        result.append(
+            session_group_index.SortColumn(
+                column_key=_column_key(col_param),
+                descending=col_param.order == api_pb2.ORDER_DESC,
+                missing_values_first=col_param.missing_values_first,
+            )
+        )
     return result
 
 
-def _create_extractor(col_param):
+def _column_key(col_param):
+    """Returns the key of the column of a ColParam.
+
+    See `session_group_index.SessionGroupIndex.column`.
+    """
     if col_param.HasField("metric"):
-        return _create_metric_extractor(col_param.metric)
+        return ("metric", col_param.metric.group, col_param.metric.tag)
     elif col_param.HasField("hparam"):
-        return _create_hparam_extractor(col_param.hparam)
+        return ("hparam", col_param.hparam)
     else:
         raise error.HParamsError(
             'Got ColParam with both "metric" and "hparam" fields unset: %s'
@@ -525,6 +510,35 @@ def _create_extractor(col_param):
         )
 
 
+def _metric_datum(all_metric_evals, session_name, metric_name):
+    """Returns the last value of a session's metric, as a hashable value.
+
+    Returns:
+      A tuple `(wall_time, step, value)`, or None if the session has no
+      value for the metric.
+    """
+    (run, tag) = metrics.run_tag_from_session_and_metric(
+        session_name, metric_name
+    )
+    datum = all_metric_evals.get(run, {}).get(tag)
+    if not datum:
+        return None
+    return (datum.wall_time, datum.step, datum.value)
+
+
+# Extractors. An extractor is a function that extracts some property (a metric
+# or a hyperparameter) from a SessionGroup instance.
+def _create_extractor(column_key):
+    """Creates an extractor for the column with the given key."""
+    if column_key[0] == "metric":
+        (_, group, tag) = column_key
+        return _create_metric_extractor(
+            api_pb2.MetricName(group=group, tag=tag)
+        )
+    (_, hparam_name) = column_key
+    return _create_hparam_extractor(hparam_name)
+
+
 def _create_metric_extractor(metric_name):
     """Returns function that extracts a metric from a session group or a
     session.
@@ -582,87 +596,90 @@ def _create_hparam_extractor(hparam_name):
 
     def extractor_fn(session_group):
         if hparam_name in session_group.hparams:
-            return _value_to_python(session_group.hparams[hparam_name])
+            return session_group_index.value_to_python(
+                session_group.hparams[hparam_name]
+            )
         return None
 
     return extractor_fn
 
 
-# Filters. A filter is a boolean function that takes a session group and returns
-# True if it should be included in the result. Currently, Filters are functions
-# of a single column value extracted from the session group with a given
-# extractor specified in the construction of the filter.
-def _create_filters(col_params, extractors, *, include_hparam_filters=True):
+# Filters. A filter is a session_group_index.ColumnFilter. It tests each
+# distinct value of a column once, rather than the value of each session
+# group, and tells which session groups pass.
+def _create_filters(col_params, *, include_hparam_filters=True):
     """Creates filters for the given col_params.
 
     Args:
       col_params: List of ListSessionGroupsRequest.ColParam protobufs.
-      extractors: list of extractor functions of the same length as col_params.
-        Each element should extract the column described by the corresponding
-        element of col_params.
       include_hparam_filters: bool that indicates whether hparam filters should
         be generated. Defaults to True.
     Returns:
-      A list of filter functions. Each corresponding to a single
-      col_params.filter oneof field of _request
+      A list of session_group_index.ColumnFilter. Each corresponding to a
+      single col_params.filter oneof field of _request
     """
     result = []
-    for col_param, extractor in zip(col_params, extractors):
+    for col_param in col_params:
         if not include_hparam_filters and col_param.hparam:
             continue
 
-        a_filter = _create_filter(col_param, extractor)
+        a_filter = _create_filter(col_param)
         if a_filter:
             result.append(a_filter)
     return result
 
 
-def _create_filter(col_param, extractor):
-    """Creates a filter for the given col_param and extractor.
+def _create_filter(col_param):
+    """Creates a filter for the given col_param.
 
     Args:
       col_param: A tensorboard.hparams.ColParams object identifying the column
         and describing the filter to apply.
-      extractor: A function that extract the column value identified by
-        'col_param' from a tensorboard.hparams.SessionGroup protobuffer.
     Returns:
-      A boolean function taking a tensorboard.hparams.SessionGroup protobuffer
-      returning True if the session group passes the filter described by
-      'col_param'. If col_param does not specify a filter (i.e. any session
-      group passes) returns None.
+      A session_group_index.ColumnFilter of the session groups that pass
+      the filter described by 'col_param'. If col_param does not specify a
+      filter (i.e. any session group passes) returns None.
     """
     include_missing_values = not col_param.exclude_missing_values
     if col_param.HasField("filter_regexp"):
-        value_filter_fn = _create_regexp_filter(col_param.filter_regexp)
+        key = ("filter_regexp", col_param.filter_regexp)
+        passes = _create_regexp_filter(col_param.filter_regexp)
     elif col_param.HasField("filter_interval"):
-        value_filter_fn = _create_interval_filter(col_param.filter_interval)
+        interval = col_param.filter_interval
+        key = ("filter_interval", interval.min_value, interval.max_value)
+        passes = _create_interval_filter(interval)
     elif col_param.HasField("filter_discrete"):
-        value_filter_fn = _create_discrete_set_filter(col_param.filter_discrete)
+        key = (
+            "filter_discrete",
+            col_param.filter_discrete.SerializeToString(deterministic=True),
+        )
+        passes = _create_discrete_set_filter(col_param.filter_discrete)
     elif include_missing_values:
         # No 'filter' field and include_missing_values is True.
         # Thus, the resulting filter always returns True, so to optimize for this
         # common case we do not include it in the list of filters to check.
         return None
     else:
-        value_filter_fn = lambda _: True
-
-    def filter_fn(session_group):
-        value = extractor(session_group)
-        if value is None:
-            return include_missing_values
-        return value_filter_fn(value)
-
-    return filter_fn
+        key = None
+        passes = lambda column: np.ones(len(column.distinct), dtype=bool)
+
+    return session_group_index.ColumnFilter(
+        column_key=_column_key(col_param),
+        key=key,
+        passes=passes,
+        include_missing_values=include_missing_values,
+    )
 
 
 def _create_regexp_filter(regex):
-    """Returns a boolean function that filters strings based on a regular exp.
+    """Returns a function that filters strings based on a regular exp.
 
     Args:
       regex: A string describing the regexp to use.
     Returns:
-      A function taking a string and returns True if any of its substrings
-      matches regex.
+      A function taking a session_group_index.Column of strings that returns
+      a bool array telling which of its distinct values have a substring
+      that matches regex.
     """
     # Warning: Note that python's regex library allows inputs that take
     # exponential time. Time-limiting it is difficult. When we move to
@@ -670,70 +687,72 @@ def _create_regexp_filter(regex):
     # would need to be replaced by something more secure.
     compiled_regex = re.compile(regex)
 
-    def filter_fn(value):
-        if not isinstance(value, str):
-            raise error.HParamsError(
-                "Cannot use a regexp filter for a value of type %s. Value: %s"
-                % (type(value), value)
-            )
-        return re.search(compiled_regex, value) is not None
+    def filter_fn(column):
+        for value in column.distinct:
+            if not isinstance(value, str):
+                raise error.HParamsError(
+                    "Cannot use a regexp filter for a value of type %s. Value: %s"
+                    % (type(value), value)
+                )
+        return np.array(
+            [
+                compiled_regex.search(value) is not None
+                for value in column.distinct
+            ],
+            dtype=bool,
+        )
 
     return filter_fn
 
 
 def _create_interval_filter(interval):
-    """Returns a function that checkes whether a number belongs to an interval.
+    """Returns a function that checkes whether numbers belong to an interval.
 
     Args:
       interval: A tensorboard.hparams.Interval protobuf describing the interval.
     Returns:
-      A function taking a number (float or int) that returns True if the number
-      belongs to (the closed) 'interval'.
+      A function taking a session_group_index.Column of numbers (float or
+      int) that returns a bool array telling which of its distinct values
+      belong to (the closed) 'interval'.
     """
 
-    def filter_fn(value):
-        if not isinstance(value, (int, float)):
+    def filter_fn(column):
+        if column.numbers is None:
+            value = next(
+                v for v in column.distinct if not isinstance(v, (int, float))
+            )
             raise error.HParamsError(
                 "Cannot use an interval filter for a value of type: %s, Value: %s"
                 % (type(value), value)
             )
-        return interval.min_value <= value and value <= interval.max_value
+        return (interval.min_value <= column.numbers) & (
+            column.numbers <= interval.max_value
+        )
 
     return filter_fn
 
 
 def _create_discrete_set_filter(discrete_set):
-    """Returns a function that checks whether a value belongs to a set.
+    """Returns a function that checks whether values belong to a set.
 
     Args:
       discrete_set: A list of objects representing the set.
     Returns:
-      A function taking an object and returns True if its in the set. Membership
+      A function taking a session_group_index.Column that returns a bool
+      array telling which of its distinct values are in the set. Membership
       is tested using the Python 'in' operator (thus, equality of distinct
       objects is computed using the '==' operator).
     """
+    values = list(discrete_set)
 
-    def filter_fn(value):
-        return value in discrete_set
+    def filter_fn(column):
+        return np.array(
+            [value in values for value in column.distinct], dtype=bool
+        )
 
     return filter_fn
 
 
-def _value_to_python(value):
-    """Converts a google.protobuf.Value to a native Python object."""
-
-    assert isinstance(value, struct_pb2.Value)
-    field = value.WhichOneof("kind")
-    if field == "number_value":
-        return value.number_value
-    elif field == "string_value":
-        return value.string_value
-    elif field == "bool_value":
-        return value.bool_value
-    else:
-        raise ValueError("Unknown struct_pb2.Value oneof field set: %s" % field)
-
-
 @dataclasses.dataclass(frozen=True)
 class _MetricIdentifier:
     """An identifier for a metric.
@@ -937,7 +956,10 @@ def _build_data_provider_filter(col_param):
         )
     elif col_param.HasField("filter_discrete"):
         filter_type = provider.HyperparameterFilterType.DISCRETE
-        fltr = [_value_to_python(b) for b in col_param.filter_discrete.values]
+        fltr = [
+            session_group_index.value_to_python(b)
+            for b in col_param.filter_discrete.values
+        ]
     else:
         return None
 
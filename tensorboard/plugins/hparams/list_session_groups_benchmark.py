@@ -0,0 +1,273 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for filtering, sorting and aggregating session groups.
+
+Compares the columnar `SessionGroupIndex` against the previous approach,
+which built the SessionGroup protobuffers of all groups, aggregated their
+metrics proto by proto, and filtered and sorted them through per-group
+extractor functions. The synthetic experiment has 50000 sessions in
+12500 groups, with 4 hyperparameters and 3 metrics.
+
+BUILD is the time to build the groups and aggregate their metrics. QUERY
+is the time to filter on an hparam and a metric, sort by a metric and
+return the first page of 100 groups. QUERY_WARM is a different query on
+the same index, whose columns are already computed.
+
+Here are the results of running this benchmark on a Linux workstation
+with an Intel(R) Xeon(R) CPU:
+
+        IMPL         AGGREGATION  BUILD_SECS  QUERY_SECS  QUERY_WARM_SECS
+      legacy     AGGREGATION_AVG       1.192       0.212            0.131
+    columnar     AGGREGATION_AVG       0.244       0.055            0.013
+      legacy  AGGREGATION_MEDIAN       0.889       0.147            0.096
+    columnar  AGGREGATION_MEDIAN       0.146       0.029            0.005
+
+Most of the remaining build time is reading the metric values of the
+sessions into arrays; queries only touch the protobuffers of one page.
+"""
+
+
+import random
+import re
+import time
+
+from absl import app
+from absl import logging
+
+from tensorboard.plugins.hparams import api_pb2
+from tensorboard.plugins.hparams import list_session_groups
+from tensorboard.plugins.hparams import plugin_data_pb2
+from tensorboard.plugins.hparams import session_group_index
+from tensorboard.util import tb_logging
+
+logger = tb_logging.get_logger()
+
+_NUM_SESSIONS = 50000
+_SESSIONS_PER_GROUP = 4
+_PAGE_SIZE = 100
+_METRIC_NAMES = [
+    api_pb2.MetricName(group="train", tag="loss"),
+    api_pb2.MetricName(group="validation", tag="loss"),
+    api_pb2.MetricName(group="", tag="accuracy"),
+]
+
+
+def _make_sessions():
+    rng = random.Random(0)
+    sessions = []
+    for i in range(_NUM_SESSIONS // _SESSIONS_PER_GROUP):
+        start_info = plugin_data_pb2.SessionStartInfo(group_name="g%06d" % i)
+        start_info.hparams["learning_rate"].number_value = rng.choice(
+            [1e-4, 3e-4, 1e-3, 3e-3, 1e-2]
+        )
+        start_info.hparams["num_layers"].number_value = rng.randrange(1, 9)
+        start_info.hparams["dropout"].number_value = rng.random() * 0.5
+        start_info.hparams["optimizer"].string_value = rng.choice(
+            ["adam", "sgd", "rmsprop"]
+        )
+        for k in range(_SESSIONS_PER_GROUP):
+            metric_data = tuple(
+                (1000.0 + k, 100, rng.random()) if rng.random() < 0.9 else None
+                for _ in _METRIC_NAMES
+            )
+            name = "g%06d/%d" % (i, k)
+            sessions.append(
+                session_group_index.Session(
+                    name=name,
+                    start_info=start_info,
+                    end_info=None,
+                    metric_data=metric_data,
+                    fingerprint=(name, metric_data),
+                )
+            )
+    return sessions
+
+
+def _col_params(optimizer_regexp, max_accuracy):
+    return [
+        api_pb2.ColParams(hparam="optimizer", filter_regexp=optimizer_regexp),
+        api_pb2.ColParams(
+            metric=_METRIC_NAMES[2],
+            filter_interval=api_pb2.Interval(
+                min_value=0.0, max_value=max_accuracy
+            ),
+        ),
+        api_pb2.ColParams(metric=_METRIC_NAMES[1], order=api_pb2.ORDER_DESC),
+    ]
+
+
+class _Legacy:
+    """The previous approach, kept here only as a baseline."""
+
+    def __init__(self, sessions, aggregation_type, aggregation_metric):
+        groups_by_name = {}
+        for session in sorted(sessions, key=lambda s: s.name):
+            group = groups_by_name.get(session.group_name)
+            if group is None:
+                group = api_pb2.SessionGroup(name=session.group_name)
+                for key, value in session.start_info.hparams.items():
+                    group.hparams[key].CopyFrom(value)
+                groups_by_name[session.group_name] = group
+            proto = group.sessions.add(name=session.name)
+            for metric_name, datum in zip(_METRIC_NAMES, session.metric_data):
+                if datum is not None:
+                    (wall_time, step, value) = datum
+                    proto.metric_values.add(
+                        name=metric_name,
+                        wall_time_secs=wall_time,
+                        training_step=step,
+                        value=value,
+                    )
+        for group in groups_by_name.values():
+            if aggregation_type == api_pb2.AGGREGATION_AVG:
+                list_session_groups._set_avg_session_metrics(group)
+            elif any(
+                list_session_groups._find_metric_value(s, aggregation_metric)
+                for s in group.sessions
+            ):
+                list_session_groups._set_median_session_metrics(
+                    group, aggregation_metric
+                )
+        self._groups = sorted(groups_by_name.values(), key=lambda g: g.name)
+
+    def query(self, col_params):
+        extractors = [
+            (
+                list_session_groups._create_metric_extractor(c.metric)
+                if c.HasField("metric")
+                else list_session_groups._create_hparam_extractor(c.hparam)
+            )
+            for c in col_params
+        ]
+        groups = self._groups
+        for col_param, extractor in zip(col_params, extractors):
+            if col_param.HasField("filter_regexp"):
+                regexp = col_param.filter_regexp
+                groups = [
+                    g
+                    for g in groups
+                    if extractor(g) is None or re.search(regexp, extractor(g))
+                ]
+            elif col_param.HasField("filter_interval"):
+                interval = col_param.filter_interval
+                groups = [
+                    g
+                    for g in groups
+                    if extractor(g) is None
+                    or interval.min_value <= extractor(g) <= interval.max_value
+                ]
+        for col_param, extractor in reversed(list(zip(col_params, extractors))):
+            if col_param.order == api_pb2.ORDER_UNSPECIFIED:
+                continue
+            descending = col_param.order == api_pb2.ORDER_DESC
+            groups = sorted(
+                groups,
+                key=lambda g: (
+                    (extractor(g) is None) != descending,
+                    extractor(g) or 0,
+                ),
+                reverse=descending,
+            )
+        return (groups[:_PAGE_SIZE], len(groups))
+
+
+class _Columnar:
+    def __init__(self, sessions, aggregation_type, aggregation_metric):
+        self._index = session_group_index.SessionGroupIndex(
+            "gen",
+            sessions,
+            _METRIC_NAMES,
+            aggregation_type=aggregation_type,
+            aggregation_metric=aggregation_metric,
+        )
+
+    def query(self, col_params):
+        return self._index.query(
+            list_session_groups._create_filters(col_params),
+            list_session_groups._create_sort_columns(col_params),
+            0,
+            _PAGE_SIZE,
+        )
+
+
+def bench(make_impl, sessions, aggregation_type):
+    """Builds an implementation and runs two queries on it.
+
+    Returns:
+      A tuple `(build_seconds, query_seconds, warm_query_seconds, result)`.
+    """
+    start_time = time.time()
+    impl = make_impl(sessions, aggregation_type, _METRIC_NAMES[1])
+    build_time = time.time()
+    result = impl.query(_col_params("adam|sgd", 0.8))
+    query_time = time.time()
+    impl.query(_col_params("rmsprop", 0.5))
+    warm_time = time.time()
+    return (
+        build_time - start_time,
+        query_time - build_time,
+        warm_time - query_time,
+        result,
+    )
+
+
+def _format_line(headers, fields):
+    """Format a line of a table, right-aligning each field."""
+    fields = [
+        "%.3f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    sessions = _make_sessions()
+    impls = [("legacy", _Legacy), ("columnar", _Columnar)]
+    headers = (
+        "IMPL",
+        "AGGREGATION",
+        "BUILD_SECS",
+        "QUERY_SECS",
+        "QUERY_WARM_SECS",
+    )
+    logger.info(_format_line(headers, headers))
+    for aggregation_type in (
+        api_pb2.AGGREGATION_AVG,
+        api_pb2.AGGREGATION_MEDIAN,
+    ):
+        pages = []
+        for name, impl in impls:
+            (build, query, warm, (page, total_size)) = bench(
+                impl, sessions, aggregation_type
+            )
+            pages.append(([g.name for g in page], total_size))
+            fields = (
+                name,
+                api_pb2.AggregationType.Name(aggregation_type),
+                build,
+                query,
+                warm,
+            )
+            logger.info(_format_line(headers, fields))
+        if pages[0] != pages[1]:
+            logger.error("Implementations returned different pages")
+
+
+if __name__ == "__main__":
+    app.run(main)
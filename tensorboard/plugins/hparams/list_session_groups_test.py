@@ -1075,6 +1075,60 @@ class ListSessionGroupsTest(tf.test.TestCase):
             expected_total_size=3,
         )
 
+    def test_reuses_session_groups_of_same_data_generation(self):
+        data_provider = self._mock_tb_context.data_provider
+        data_provider.data_generation.return_value = "gen1"
+        hparams_context = backend_context.Context(self._mock_tb_context)
+        request = """
+            col_params: {
+              metric: { tag: 'delta_temp' }
+              order: ORDER_ASC
+            }
+            allowed_statuses: [
+              STATUS_UNKNOWN,
+              STATUS_SUCCESS,
+              STATUS_FAILURE,
+              STATUS_RUNNING
+            ]
+            start_index: 0
+            slice_size: 3
+        """
+        response = self._run_handler(request, hparams_context)
+        self.assertEqual(
+            ["group_3", "group_1", "group_2"],
+            [sg.name for sg in response.session_groups],
+        )
+        num_reads = data_provider.read_last_scalars.call_count
+        response = self._run_handler(
+            request.replace("start_index: 0", "start_index: 1"),
+            hparams_context,
+        )
+        self.assertEqual(
+            ["group_1", "group_2"], [sg.name for sg in response.session_groups]
+        )
+        self.assertEqual(data_provider.read_last_scalars.call_count, num_reads)
+
+        # Negate the metric values of the new data generation.
+        def read_last_scalars(*args, **kwargs):
+            result = self._mock_read_last_scalars(*args, **kwargs)
+            for tag_to_datum in result.values():
+                if "delta_temp" in tag_to_datum:
+                    datum = tag_to_datum["delta_temp"]
+                    tag_to_datum["delta_temp"] = provider.ScalarDatum(
+                        wall_time=datum.wall_time,
+                        step=datum.step,
+                        value=-datum.value,
+                    )
+            return result
+
+        data_provider.read_last_scalars.side_effect = read_last_scalars
+        data_provider.data_generation.return_value = "gen2"
+        response = self._run_handler(request, hparams_context)
+        self.assertEqual(
+            ["group_2", "group_1", "group_3"],
+            [sg.name for sg in response.session_groups],
+        )
+
     def test_sort_multiple_columns(self):
         self._verify_handler(
             request="""
@@ -2420,11 +2474,13 @@ class ListSessionGroupsTest(tf.test.TestCase):
             ["hparam1", "hparam3", "hparam4"],
         )
 
-    def _run_handler(self, request):
+    def _run_handler(self, request, hparams_context=None):
         request_proto = api_pb2.ListSessionGroupsRequest()
         text_format.Merge(request, request_proto)
+        if hparams_context is None:
+            hparams_context = backend_context.Context(self._mock_tb_context)
         handler = list_session_groups.Handler(
-            backend_context=backend_context.Context(self._mock_tb_context),
+            backend_context=hparams_context,
             request_context=context.RequestContext(),
             experiment_id="123",
             request=request_proto,
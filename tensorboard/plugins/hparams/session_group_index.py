@@ -0,0 +1,662 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""An index of the session groups of an experiment, for paged queries.
+
+The index lays out the metric values of sessions and session groups, and
+the hyperparameter values of groups, in NumPy columns. Filters, sorting
+and metric aggregation work on whole columns, and SessionGroup protos
+are only built for the groups that are returned.
+"""
+
+
+import collections
+import dataclasses
+import operator
+import threading
+
+from typing import Any, Callable
+
+import numpy as np
+
+from google.protobuf import struct_pb2
+
+from tensorboard.plugins.hparams import api_pb2
+from tensorboard.plugins.hparams import error
+from tensorboard.plugins.hparams import json_format_compat
+
+
+# Number of query results kept by each index.
+_MAX_CACHED_QUERIES = 32
+
+
+def value_to_python(value):
+    """Converts a google.protobuf.Value to a native Python object."""
+
+    assert isinstance(value, struct_pb2.Value)
+    field = value.WhichOneof("kind")
+    if field == "number_value":
+        return value.number_value
+    elif field == "string_value":
+        return value.string_value
+    elif field == "bool_value":
+        return value.bool_value
+    else:
+        raise ValueError("Unknown struct_pb2.Value oneof field set: %s" % field)
+
+
+class Column:
+    """The values of a column of session groups, dictionary-encoded.
+
+    Attributes:
+      codes: An int64 array with, for each group, the position of its
+        value in `distinct`, or -1 if the group has no value.
+      distinct: A list of the distinct values of the column, as native
+        Python objects.
+      numbers: A float64 array of `distinct` if all distinct values are
+        numbers or bools, else None.
+    """
+
+    def __init__(self, codes, distinct, numbers=None, is_sorted=False):
+        self.codes = codes
+        self.distinct = distinct
+        self.numbers = numbers
+        self._ranks = codes if is_sorted else None
+
+    @classmethod
+    def from_values(cls, values):
+        """Creates a column from a sequence of values or Nones."""
+        code_of = {}
+        codes = np.fromiter(
+            (
+                -1 if v is None else code_of.setdefault(v, len(code_of))
+                for v in values
+            ),
+            dtype=np.int64,
+            count=len(values),
+        )
+        distinct = list(code_of)
+        numbers = None
+        if all(isinstance(v, (int, float)) for v in distinct):
+            numbers = np.array(distinct, dtype=np.float64)
+        return cls(codes, distinct, numbers)
+
+    @classmethod
+    def from_numbers(cls, values, present):
+        """Creates a column from float64 values and a mask of present ones."""
+        (numbers, inverse) = np.unique(values[present], return_inverse=True)
+        codes = np.full(len(values), -1, dtype=np.int64)
+        codes[present] = inverse
+        return cls(codes, numbers.tolist(), numbers, is_sorted=True)
+
+    @property
+    def present(self):
+        return self.codes >= 0
+
+    def ranks(self):
+        """Returns the rank of the value of each group, or -1 if missing.
+
+        Ranks are positions in the ascending order of the distinct values.
+        """
+        if self._ranks is None:
+            if self.numbers is not None:
+                order = np.argsort(self.numbers, kind="stable")
+            else:
+                # Mixed types that Python can't compare raise a TypeError,
+                # as when sorting session groups by their values directly.
+                order = np.array(
+                    sorted(
+                        range(len(self.distinct)),
+                        key=self.distinct.__getitem__,
+                    ),
+                    dtype=np.int64,
+                )
+            rank_of_code = np.empty(len(self.distinct) + 1, dtype=np.int64)
+            rank_of_code[order] = np.arange(len(self.distinct))
+            rank_of_code[-1] = -1
+            self._ranks = rank_of_code[self.codes]
+        return self._ranks
+
+
+@dataclasses.dataclass(frozen=True)
+class ColumnFilter:
+    """A filter on the values of a column of session groups.
+
+    Attributes:
+      column_key: The key of the column; see `SessionGroupIndex.column`.
+      key: A hashable value identifying `passes`.
+      passes: A function that takes a `Column` and returns a bool array
+        telling which of its distinct values pass the filter. Only `key`
+        is compared, so equal keys must come with equivalent functions.
+      include_missing_values: Whether groups without a value pass.
+    """
+
+    column_key: Any
+    key: Any
+    passes: Callable = dataclasses.field(compare=False)
+    include_missing_values: bool = True
+
+    def evaluate(self, column):
+        """Returns a bool array telling which groups pass the filter."""
+        passes = np.zeros(len(column.distinct) + 1, dtype=bool)
+        passes[:-1] = self.passes(column)
+        # Missing values have code -1, so they look up the last element.
+        passes[-1] = self.include_missing_values
+        return passes[column.codes]
+
+
+@dataclasses.dataclass(frozen=True)
+class SortColumn:
+    """A column to sort session groups by.
+
+    Attributes:
+      column_key: The key of the column; see `SessionGroupIndex.column`.
+      descending: Whether to sort in descending order.
+      missing_values_first: Whether groups without a value come first,
+        rather than last.
+    """
+
+    column_key: Any
+    descending: bool = False
+    missing_values_first: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class Session:
+    """A session, as read from the hparams metadata of its run.
+
+    Attributes:
+      name: The session name.
+      start_info: The SessionStartInfo protobuffer of the session.
+      end_info: The SessionEndInfo protobuffer of the session, or None.
+      metric_data: A tuple with an element for each metric of the index:
+        a tuple `(wall_time, step, value)` with the last value of the
+        metric in the session, or None if the session has no value.
+      fingerprint: A value that changes with the data the session is
+        built from.
+    """
+
+    name: str
+    start_info: Any
+    end_info: Any
+    metric_data: tuple
+    fingerprint: Any
+
+    @property
+    def group_name(self):
+        # If the group_name is empty, this session's group contains only
+        # this session. Use the session name for the group name since
+        # session names are unique.
+        return self.start_info.group_name or self.name
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueryResult:
+    """The sorted positions of the groups matching a query.
+
+    Attributes:
+      order: Array of positions in the index of the matching groups, in
+        sorted order. Unless `complete`, only holds the first few.
+      total_size: Number of matching groups.
+      complete: Whether `order` holds all the matching groups.
+    """
+
+    order: np.ndarray
+    total_size: int
+    complete: bool
+
+
+class SessionGroupIndex:
+    """The session groups of an experiment at one data generation.
+
+    The index answers filtered, sorted and paged queries. Columns are
+    computed once, from arrays of the metric values of all sessions and
+    groups. Only the groups of the requested page are fully sorted; the
+    rest are selected with a partial sort. Recent results are cached, so
+    paging through the results of a query costs the size of a page.
+
+    SessionGroup protobuffers are built when first returned. An index
+    built from an earlier one reuses those of groups whose sessions have
+    unchanged fingerprints.
+
+    This class is thread-safe. SessionGroup protobuffers returned by
+    `query` are shared by all readers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        generation,
+        sessions,
+        metric_names,
+        aggregation_type=api_pb2.AGGREGATION_AVG,
+        aggregation_metric=None,
+        previous=None,
+        session_infos=None,
+    ):
+        """Creates an index.
+
+        Args:
+          generation: The data generation the sessions were read from, as
+            from `DataProvider.data_generation`.
+          sessions: A list of `Session`s. Each group takes its hparams and
+            monitor URL from its first session in this list.
+          metric_names: A list of MetricName protobuffers, for the
+            `metric_data` of the sessions.
+          aggregation_type: The api_pb2.AggregationType used to compute
+            the metric values of groups from those of their sessions.
+          aggregation_metric: A MetricName protobuffer. The metric used to
+            choose a session, unless aggregating by average.
+          previous: Optional earlier `SessionGroupIndex` built with the
+            same parameters, to reuse the protobuffers of unchanged groups.
+          session_infos: Optional dict of parsed session metadata, keyed
+            by serialized content, for later indexes to reuse.
+        """
+        self._generation = generation
+        self._session_infos = session_infos or {}
+        self._metric_names = list(metric_names)
+        self._metric_index = {
+            (name.group, name.tag): i
+            for (i, name) in enumerate(self._metric_names)
+        }
+        sessions_by_group = collections.defaultdict(list)
+        for session in sessions:
+            sessions_by_group[session.group_name].append(session)
+        self._group_names = sorted(sessions_by_group)
+        self._positions = {
+            name: i for (i, name) in enumerate(self._group_names)
+        }
+        self._first_sessions = [
+            sessions_by_group[name][0] for name in self._group_names
+        ]
+        # Sessions in group order, and by name within each group.
+        self._sessions = []
+        for name in self._group_names:
+            self._sessions.extend(
+                sorted(sessions_by_group[name], key=operator.attrgetter("name"))
+            )
+        group_sizes = [len(sessions_by_group[n]) for n in self._group_names]
+        self._group_starts = np.cumsum([0] + group_sizes)
+        self._group_of_session = np.repeat(
+            np.arange(len(self._group_names)), group_sizes
+        )
+        self._fingerprints = [
+            tuple(session.fingerprint for session in sessions_by_group[name])
+            for name in self._group_names
+        ]
+        self._session_metrics = self._lay_out_session_metrics()
+        (self._group_metrics, self._chosen_sessions) = self._aggregate_metrics(
+            aggregation_type, aggregation_metric
+        )
+
+        # Dict mapping a group name to its SessionGroup protobuffer.
+        self._groups = {}
+        if (
+            previous is not None
+            and previous._metric_names == self._metric_names
+        ):
+            for name, fingerprint in zip(self._group_names, self._fingerprints):
+                group = previous._groups.get(name)
+                if (
+                    group is not None
+                    and previous._fingerprint(name) == fingerprint
+                ):
+                    self._groups[name] = group
+        self._mutex = threading.Lock()
+        self._columns = {}
+        self._masks = {}
+        self._queries = collections.OrderedDict()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    @property
+    def session_infos(self):
+        return self._session_infos
+
+    def __len__(self):
+        return len(self._group_names)
+
+    def _fingerprint(self, name):
+        return self._fingerprints[self._positions[name]]
+
+    def _lay_out_session_metrics(self):
+        """Lays out the metric values of all sessions in arrays.
+
+        Returns:
+          A tuple `(values, steps, wall_times, present)` of arrays of
+          shape `[num_sessions, num_metrics]`.
+        """
+        shape = (len(self._sessions), len(self._metric_names))
+        values = np.full(shape, np.nan)
+        steps = np.zeros(shape, dtype=np.int64)
+        wall_times = np.zeros(shape)
+        present = np.zeros(shape, dtype=bool)
+        for i, session in enumerate(self._sessions):
+            for m, datum in enumerate(session.metric_data):
+                if datum is not None:
+                    (wall_times[i, m], steps[i, m], values[i, m]) = datum
+                    present[i, m] = True
+        return (values, steps, wall_times, present)
+
+    def _aggregate_metrics(self, aggregation_type, aggregation_metric):
+        """Computes the metric values of groups from those of sessions.
+
+        Returns:
+          A pair `(metrics, chosen_sessions)`. `metrics` is a tuple of
+          arrays like that of `_lay_out_session_metrics`, with a row per group.
+          `chosen_sessions` is None for averages; otherwise it holds for
+          each group the position of the session whose metric values the
+          group takes, or -1 if no session has the aggregation metric.
+        """
+        (values, steps, wall_times, present) = self._session_metrics
+        num_groups = len(self._group_names)
+        group_of = self._group_of_session
+        if aggregation_type in (
+            api_pb2.AGGREGATION_AVG,
+            api_pb2.AGGREGATION_UNSET,
+        ):
+            shape = (num_groups, len(self._metric_names))
+            counts = np.zeros(shape, dtype=np.int64)
+            totals = np.zeros(shape)
+            total_steps = np.zeros(shape, dtype=np.int64)
+            total_wall_times = np.zeros(shape)
+            np.add.at(counts, group_of, present)
+            np.add.at(totals, group_of, np.where(present, values, 0.0))
+            np.add.at(total_steps, group_of, np.where(present, steps, 0))
+            np.add.at(
+                total_wall_times, group_of, np.where(present, wall_times, 0.0)
+            )
+            group_present = counts > 0
+            divisors = np.maximum(counts, 1)
+            return (
+                (
+                    np.where(group_present, totals / divisors, np.nan),
+                    total_steps // divisors,
+                    total_wall_times / divisors,
+                    group_present,
+                ),
+                None,
+            )
+        if aggregation_type not in (
+            api_pb2.AGGREGATION_MEDIAN,
+            api_pb2.AGGREGATION_MIN,
+            api_pb2.AGGREGATION_MAX,
+        ):
+            raise error.HParamsError(
+                "Unknown aggregation_type in request: %s" % aggregation_type
+            )
+        chosen = np.full(num_groups, -1, dtype=np.int64)
+        m = self._metric_index.get(
+            (aggregation_metric.group, aggregation_metric.tag)
+        )
+        if m is not None:
+            candidates = np.flatnonzero(present[:, m])
+            keys = values[candidates, m]
+            if aggregation_type == api_pb2.AGGREGATION_MAX:
+                keys = -keys
+            # Order by group, then value; ties keep the session order.
+            order = np.lexsort((candidates, keys, group_of[candidates]))
+            candidates = candidates[order]
+            counts = np.bincount(group_of[candidates], minlength=num_groups)
+            starts = np.cumsum(counts) - counts
+            if aggregation_type == api_pb2.AGGREGATION_MEDIAN:
+                starts += (counts - 1) // 2
+            measured = counts > 0
+            chosen[measured] = candidates[starts[measured]]
+        rows = np.maximum(chosen, 0)
+        measured = (chosen >= 0)[:, np.newaxis]
+        return (
+            (
+                np.where(measured, values[rows], np.nan),
+                steps[rows],
+                wall_times[rows],
+                measured & present[rows],
+            ),
+            chosen,
+        )
+
+    def column(self, key):
+        """Returns a `Column` of values of the session groups.
+
+        Args:
+          key: Either `("metric", group, tag)`, for the aggregated values
+            of a metric, or `("hparam", name)`, for the values of a
+            hyperparameter. Hyperparameter values that can't be
+            serialized to JSON, like NaN, are treated as missing.
+
+        Returns:
+          A `Column`, shared with the index.
+        """
+        with self._mutex:
+            column = self._columns.get(key)
+        if column is None:
+            if key[0] == "metric":
+                m = self._metric_index.get(key[1:])
+                num_groups = len(self._group_names)
+                if m is None:
+                    column = Column.from_numbers(
+                        np.zeros(num_groups), np.zeros(num_groups, dtype=bool)
+                    )
+                else:
+                    (values, _, _, present) = self._group_metrics
+                    column = Column.from_numbers(values[:, m], present[:, m])
+            else:
+                (_, name) = key
+                column = Column.from_values(
+                    [
+                        _hparam_value(session.start_info.hparams, name)
+                        for session in self._first_sessions
+                    ]
+                )
+            with self._mutex:
+                self._columns[key] = column
+        return column
+
+    def query(self, filters, sort_columns, start_index, slice_size):
+        """Returns a page of the groups that pass filters, in sorted order.
+
+        Args:
+          filters: A sequence of `ColumnFilter`s that groups must all pass.
+          sort_columns: A sequence of `SortColumn`s. The first is the
+            primary sort key, and so on. Groups that compare equal on all
+            columns are ordered by name.
+          start_index: Position of the first group to return.
+          slice_size: Maximum number of groups to return.
+
+        Returns:
+          A pair `(session_groups, total_size)`, where `session_groups` is
+          a list of SessionGroup protobuffers and `total_size` is the
+          number of groups that pass the filters.
+        """
+        end_index = start_index + slice_size
+        key = (tuple(filters), tuple(sort_columns))
+        with self._mutex:
+            result = self._queries.get(key)
+            if result is not None:
+                self._queries.move_to_end(key)
+        if result is None or (
+            not result.complete and end_index > len(result.order)
+        ):
+            # When paging past the groups selected so far, select twice as
+            # many, so that the next pages are served from the cache too.
+            num_wanted = max(
+                end_index, 2 * len(result.order) if result is not None else 0
+            )
+            result = self._query(filters, sort_columns, num_wanted)
+            with self._mutex:
+                self._queries[key] = result
+                self._queries.move_to_end(key)
+                while len(self._queries) > _MAX_CACHED_QUERIES:
+                    self._queries.popitem(last=False)
+        positions = result.order[start_index:end_index].tolist()
+        return ([self._group(i) for i in positions], result.total_size)
+
+    def _query(self, filters, sort_columns, num_wanted):
+        candidates = np.flatnonzero(self._mask(filters))
+        total_size = len(candidates)
+        if not sort_columns:
+            return _QueryResult(candidates, total_size, complete=True)
+        sort_keys = self._sort_key(sort_columns)
+        if sort_keys is None:
+            # Too many distinct values for a single integer key.
+            columns = [self._column_sort_key(c)[0] for c in sort_columns]
+            order = np.lexsort(
+                [candidates] + [c[candidates] for c in reversed(columns)]
+            )
+            return _QueryResult(candidates[order], total_size, complete=True)
+        candidate_keys = sort_keys[candidates]
+        if 0 < num_wanted < total_size:
+            top = np.argpartition(candidate_keys, num_wanted - 1)[:num_wanted]
+            top = top[np.argsort(candidate_keys[top])]
+            return _QueryResult(candidates[top], total_size, complete=False)
+        order = np.argsort(candidate_keys)
+        return _QueryResult(candidates[order], total_size, complete=True)
+
+    def _mask(self, filters):
+        """Returns a bool array telling which groups pass all filters."""
+        result = np.ones(len(self._group_names), dtype=bool)
+        for column_filter in filters:
+            with self._mutex:
+                mask = self._masks.get(column_filter)
+            if mask is None:
+                mask = column_filter.evaluate(
+                    self.column(column_filter.column_key)
+                )
+                with self._mutex:
+                    self._masks[column_filter] = mask
+            result &= mask
+        return result
+
+    def _column_sort_key(self, sort_column):
+        """Returns integer sort keys for a column, and their number."""
+        column = self.column(sort_column.column_key)
+        ranks = column.ranks()
+        num_distinct = len(column.distinct)
+        if sort_column.descending:
+            keys = num_distinct - ranks
+        else:
+            keys = ranks + 1
+        keys[ranks < 0] = (
+            0 if sort_column.missing_values_first else num_distinct + 1
+        )
+        return (keys, num_distinct + 2)
+
+    def _sort_key(self, sort_columns):
+        """Combines the sort columns and names into one integer key.
+
+        Returns:
+          An array of distinct keys in the sort order of the groups, or
+          None if the keys would overflow.
+        """
+        num_groups = len(self._group_names)
+        columns = [self._column_sort_key(c) for c in sort_columns]
+        num_keys = num_groups
+        for _, radix in columns:
+            num_keys *= radix
+        if num_keys >= np.iinfo(np.int64).max:
+            return None
+        result = np.zeros(num_groups, dtype=np.int64)
+        for keys, radix in columns:
+            result = result * radix + keys
+        return result * num_groups + np.arange(num_groups)
+
+    def _group(self, position):
+        """Returns the SessionGroup protobuffer of a group, building it once."""
+        name = self._group_names[position]
+        with self._mutex:
+            group = self._groups.get(name)
+        if group is None:
+            group = self._build_group(position)
+            with self._mutex:
+                group = self._groups.setdefault(name, group)
+        return group
+
+    def _build_group(self, position):
+        first_session = self._first_sessions[position]
+        group = api_pb2.SessionGroup(
+            name=self._group_names[position],
+            monitor_url=first_session.start_info.monitor_url,
+        )
+        # Copy hparams from the first session (all sessions should have the
+        # same hyperparameter values).
+        for key, value in first_session.start_info.hparams.items():
+            if not json_format_compat.is_serializable_value(value):
+                # NaN number_value cannot be serialized by higher level layers
+                # that are using json_format.MessageToJson(). To workaround
+                # the issue we do not copy them to the session group and
+                # effectively treat them as "unset".
+                continue
+            group.hparams[key].CopyFrom(value)
+        start = self._group_starts[position]
+        end = self._group_starts[position + 1]
+        for i in range(start, end):
+            group.sessions.append(self._build_session(self._sessions[i]))
+        if self._chosen_sessions is not None:
+            chosen = self._chosen_sessions[position]
+            if chosen >= 0:
+                group.metric_values.MergeFrom(
+                    group.sessions[chosen - start].metric_values
+                )
+        else:
+            # As many metric values as the sessions have, in the order in
+            # which they first appear in the sessions.
+            (values, steps, wall_times, present) = self._group_metrics
+            session_present = self._session_metrics[3][start:end]
+            firsts = np.where(
+                session_present.any(axis=0),
+                session_present.argmax(axis=0),
+                len(session_present),
+            )
+            for m in np.lexsort((np.arange(len(firsts)), firsts)).tolist():
+                if not present[position, m]:
+                    continue
+                group.metric_values.add(
+                    name=self._metric_names[m],
+                    value=float(values[position, m]),
+                    training_step=int(steps[position, m]),
+                    wall_time_secs=float(wall_times[position, m]),
+                )
+        return group
+
+    def _build_session(self, session):
+        result = api_pb2.Session(
+            name=session.name,
+            start_time_secs=session.start_info.start_time_secs,
+            model_uri=session.start_info.model_uri,
+            monitor_url=session.start_info.monitor_url,
+        )
+        for metric_name, datum in zip(self._metric_names, session.metric_data):
+            if datum is None:
+                # It's ok if we don't find the metric in the session.
+                continue
+            (wall_time, step, value) = datum
+            result.metric_values.add(
+                name=metric_name,
+                wall_time_secs=wall_time,
+                training_step=step,
+                value=value,
+            )
+        if session.end_info is not None:
+            result.status = session.end_info.status
+            result.end_time_secs = session.end_info.end_time_secs
+        return result
+
+
+def _hparam_value(hparams, name):
+    """Returns the value of an hparam as a native Python object, or None."""
+    value = hparams.get(name)
+    if value is None or not json_format_compat.is_serializable_value(value):
+        return None
+    return value_to_python(value)
@@ -0,0 +1,281 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for session_group_index."""
+
+
+import random
+
+import numpy as np
+import tensorflow as tf
+
+from tensorboard.plugins.hparams import api_pb2
+from tensorboard.plugins.hparams import list_session_groups
+from tensorboard.plugins.hparams import plugin_data_pb2
+from tensorboard.plugins.hparams import session_group_index
+
+
+_METRIC_NAMES = [
+    api_pb2.MetricName(group="train", tag="loss"),
+    api_pb2.MetricName(group="", tag="accuracy"),
+]
+
+
+def _make_sessions(num_groups, num_hparams, num_values, seed=0):
+    rng = random.Random(seed)
+    sessions = []
+    for i in range(num_groups):
+        start_info = plugin_data_pb2.SessionStartInfo(
+            group_name="group_%05d" % i
+        )
+        for j in range(num_hparams):
+            # Leave some values missing.
+            value = rng.randrange(num_values + 1)
+            if value < num_values:
+                start_info.hparams["h%d" % j].number_value = value
+        for k in range(rng.randrange(1, 4)):
+            metric_data = tuple(
+                (
+                    (
+                        float(rng.randrange(100)),
+                        rng.randrange(100),
+                        rng.random(),
+                    )
+                    if rng.random() < 0.8
+                    else None
+                )
+                for _ in _METRIC_NAMES
+            )
+            name = "session_%05d_%d" % (i, k)
+            sessions.append(
+                session_group_index.Session(
+                    name=name,
+                    start_info=start_info,
+                    end_info=None,
+                    metric_data=metric_data,
+                    fingerprint=(name, metric_data),
+                )
+            )
+    rng.shuffle(sessions)
+    return sessions
+
+
+def _hparam_value(group, name):
+    if name not in group.hparams:
+        return None
+    return group.hparams[name].number_value
+
+
+def _column(name, descending=False, missing_values_first=False):
+    return session_group_index.SortColumn(
+        column_key=("hparam", name),
+        descending=descending,
+        missing_values_first=missing_values_first,
+    )
+
+
+def _reference_sort(groups, columns):
+    """Sorts like `list_session_groups` used to: one stable sort per column."""
+    groups = sorted(groups, key=lambda group: group.name)
+    for column in reversed(columns):
+        none_is_largest = column.descending == column.missing_values_first
+        (_, name) = column.column_key
+
+        def key(group):
+            value = _hparam_value(group, name)
+            return (value is None) == none_is_largest, value or 0
+
+        groups.sort(key=key, reverse=column.descending)
+    return [group.name for group in groups]
+
+
+class SessionGroupIndexTest(tf.test.TestCase):
+    def _index(self, sessions, previous=None, **kwargs):
+        return session_group_index.SessionGroupIndex(
+            generation="gen",
+            sessions=sessions,
+            metric_names=_METRIC_NAMES,
+            previous=previous,
+            **kwargs,
+        )
+
+    def _all_groups(self, index):
+        (groups, _) = index.query([], [], 0, len(index))
+        return groups
+
+    def _page(self, index, sort_columns, start_index, slice_size):
+        (page, total_size) = index.query(
+            [], sort_columns, start_index, slice_size
+        )
+        return ([group.name for group in page], total_size)
+
+    def test_no_sort_orders_by_name(self):
+        index = self._index(_make_sessions(50, 1, 3))
+        (names, total_size) = self._page(index, [], 10, 5)
+        self.assertEqual(names, ["group_%05d" % i for i in range(10, 15)])
+        self.assertEqual(total_size, 50)
+
+    def test_builds_sessions_sorted_by_name(self):
+        index = self._index(_make_sessions(20, 1, 3))
+        for group in self._all_groups(index):
+            names = [session.name for session in group.sessions]
+            self.assertEqual(names, sorted(names))
+            self.assertTrue(
+                all(n.startswith("session_" + group.name[6:]) for n in names)
+            )
+
+    def test_sorts_like_stable_sorts(self):
+        index = self._index(_make_sessions(300, 3, 5))
+        groups = self._all_groups(index)
+        for sort_columns in [
+            [_column("h0")],
+            [_column("h0", descending=True)],
+            [_column("h1", missing_values_first=True)],
+            [_column("h1", descending=True, missing_values_first=True)],
+            [_column("h2"), _column("h0", descending=True)],
+            [_column("h0"), _column("h1"), _column("h2", descending=True)],
+        ]:
+            expected = _reference_sort(groups, sort_columns)
+            # Page through the results, which only partially sorts them.
+            names = []
+            for start_index in range(0, 300, 40):
+                (page, total_size) = self._page(
+                    index, sort_columns, start_index, 40
+                )
+                self.assertEqual(total_size, 300)
+                names.extend(page)
+            self.assertEqual(names, expected, msg=str(sort_columns))
+
+    def test_sorts_many_distinct_values_without_overflow(self):
+        index = self._index(_make_sessions(1000, 8, 1000))
+        groups = self._all_groups(index)
+        sort_columns = [_column("h%d" % j) for j in range(8)]
+        (names, _) = self._page(index, sort_columns, 0, 1000)
+        self.assertEqual(names, _reference_sort(groups, sort_columns))
+
+    def test_filter(self):
+        index = self._index(_make_sessions(100, 1, 4))
+        column_filter = session_group_index.ColumnFilter(
+            column_key=("hparam", "h0"),
+            key="h0 == 1",
+            passes=lambda column: column.numbers == 1.0,
+            include_missing_values=False,
+        )
+        (page, total_size) = index.query(
+            [column_filter], [_column("h0")], 0, 1000
+        )
+        expected = sorted(
+            group.name
+            for group in self._all_groups(index)
+            if _hparam_value(group, "h0") == 1.0
+        )
+        self.assertEqual([g.name for g in page], expected)
+        self.assertEqual(total_size, len(expected))
+
+    def test_aggregates_like_session_group_protos(self):
+        sessions = _make_sessions(200, 0, 0)
+        aggregation_metric = _METRIC_NAMES[1]
+        for aggregation_type, set_metrics in [
+            (
+                api_pb2.AGGREGATION_AVG,
+                list_session_groups._set_avg_session_metrics,
+            ),
+            (
+                api_pb2.AGGREGATION_MEDIAN,
+                lambda g: list_session_groups._set_median_session_metrics(
+                    g, aggregation_metric
+                ),
+            ),
+            (
+                api_pb2.AGGREGATION_MIN,
+                lambda g: list_session_groups._set_extremum_session_metrics(
+                    g, aggregation_metric, min
+                ),
+            ),
+            (
+                api_pb2.AGGREGATION_MAX,
+                lambda g: list_session_groups._set_extremum_session_metrics(
+                    g, aggregation_metric, max
+                ),
+            ),
+        ]:
+            index = self._index(
+                sessions,
+                aggregation_type=aggregation_type,
+                aggregation_metric=aggregation_metric,
+            )
+            for group in self._all_groups(index):
+                expected = api_pb2.SessionGroup()
+                expected.CopyFrom(group)
+                if (
+                    any(
+                        list_session_groups._find_metric_value(
+                            s, aggregation_metric
+                        )
+                        for s in expected.sessions
+                    )
+                    or aggregation_type == api_pb2.AGGREGATION_AVG
+                ):
+                    set_metrics(expected)
+                else:
+                    # No session measured the metric.
+                    del expected.metric_values[:]
+                self.assertEqual(group, expected, msg=group.name)
+
+    def test_metric_column(self):
+        index = self._index(_make_sessions(50, 0, 0))
+        column = index.column(("metric", "", "accuracy"))
+        for group, code in zip(self._all_groups(index), column.codes):
+            value = list_session_groups._create_metric_extractor(
+                _METRIC_NAMES[1]
+            )(group)
+            if value is None:
+                self.assertEqual(code, -1)
+            else:
+                self.assertAllClose(column.distinct[code], value)
+        missing = index.column(("metric", "", "unknown"))
+        self.assertFalse(np.any(missing.present))
+
+    def test_reuses_protos_of_unchanged_groups(self):
+        sessions = _make_sessions(10, 1, 4)
+        index = self._index(sessions)
+        groups = {group.name: group for group in self._all_groups(index)}
+
+        changed = sessions[0]
+        sessions[0] = session_group_index.Session(
+            name=changed.name,
+            start_info=changed.start_info,
+            end_info=plugin_data_pb2.SessionEndInfo(
+                status=api_pb2.STATUS_SUCCESS
+            ),
+            metric_data=changed.metric_data,
+            fingerprint="changed",
+        )
+        new_index = session_group_index.SessionGroupIndex(
+            generation="gen2",
+            sessions=sessions,
+            metric_names=_METRIC_NAMES,
+            previous=index,
+        )
+        for group in self._all_groups(new_index):
+            if group.name == changed.group_name:
+                self.assertIsNot(group, groups[group.name])
+                statuses = [s.status for s in group.sessions]
+                self.assertIn(api_pb2.STATUS_SUCCESS, statuses)
+            else:
+                self.assertIs(group, groups[group.name])
+
+
+if __name__ == "__main__":
+    tf.test.main()
@@ -16,8 +16,10 @@
 
 
 import collections
+import concurrent.futures
 import imghdr
 import json
+import threading
 
 from werkzeug import wrappers
 
@@ -27,6 +29,7 @@ from tensorboard.backend import http_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.histogram import metadata as histogram_metadata
+from tensorboard.plugins.histogram import rebinning
 from tensorboard.plugins.image import metadata as image_metadata
 from tensorboard.plugins.metrics import metadata
 from tensorboard.plugins.scalar import metadata as scalar_metadata
@@ -49,6 +52,10 @@ _SINGLE_RUN_PLUGINS = frozenset(
 _SAMPLED_PLUGINS = frozenset([image_metadata.PLUGIN_NAME])
 
 
+def _is_positive_int(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
 def _get_tag_description_info(mapping):
     """Gets maps from tags to descriptions, and descriptions to runs.
 
@@ -278,6 +285,11 @@ class MetricsPlugin(base_plugin.TBPlugin):
             data_kind="image time series",
             latest_known_version=0,
         )
+        self._read_threads = (
+            getattr(context.flags, "metrics_read_threads", None) or 1
+        )
+        self._read_executor_instance = None
+        self._read_executor_lock = threading.Lock()
 
     def frontend_metadata(self):
         return base_plugin.FrontendMetadata(
@@ -396,6 +408,12 @@ class MetricsPlugin(base_plugin.TBPlugin):
     def _time_series_impl(self, ctx, experiment, series_requests):
         """Constructs a list of responses from a list of series requests.
 
+        Requests are grouped by plugin and run, and each group is served
+        by a single data provider read covering all of its tags, so that
+        the cost scales with the data returned rather than the number of
+        requests. With `--metrics_read_threads`, groups are read in
+        parallel.
+
         Args:
             ctx: A `tensorboard.context.RequestContext` value.
             experiment: string ID of the request's experiment.
@@ -404,12 +422,88 @@ class MetricsPlugin(base_plugin.TBPlugin):
         Returns:
             A list of `TimeSeriesResponse` dicts (see http_api.md).
         """
-        responses = [
-            self._get_time_series(ctx, experiment, request)
-            for request in series_requests
-        ]
+        responses = []
+        # Maps `(plugin, run)` to a list of `(response, series_request)`
+        # pairs, where `run` is `None` to read all runs.
+        groups = collections.defaultdict(list)
+        for series_request in series_requests:
+            response = self._create_base_response(series_request)
+            responses.append(response)
+            request_error = self._get_invalid_request_error(series_request)
+            if request_error:
+                response["error"] = request_error
+                continue
+            plugin = series_request.get("plugin")
+            run = series_request.get("run") or None
+            groups[(plugin, run)].append((response, series_request))
+
+        def fill_group(item):
+            ((plugin, run), members) = item
+            runs = [run] if run else None
+            tags = [
+                series_request.get("tag") for (_, series_request) in members
+            ]
+            mapping = self._read_time_series(
+                ctx, experiment, plugin, runs, tags
+            )
+            for response, series_request in members:
+                response["runToSeries"] = self._get_run_to_series(
+                    mapping, series_request
+                )
+
+        if self._read_threads > 1 and len(groups) > 1:
+            # Consume the iterator to wait for completion and propagate
+            # any errors.
+            list(self._read_executor().map(fill_group, groups.items()))
+        else:
+            for item in groups.items():
+                fill_group(item)
         return responses
 
+    def _read_executor(self):
+        """Returns the thread pool for reading groups of time series."""
+        with self._read_executor_lock:
+            if self._read_executor_instance is None:
+                self._read_executor_instance = (
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self._read_threads,
+                        thread_name_prefix="MetricsPluginRead",
+                    )
+                )
+            return self._read_executor_instance
+
+    def _read_time_series(self, ctx, experiment, plugin, runs, tags):
+        """Reads the data for some tags of a plugin in a single call.
+
+        Args:
+            ctx: A `tensorboard.context.RequestContext` value.
+            experiment: a string experiment id.
+            plugin: the name of a plugin in `data_plugin_names()`.
+            runs: optional list of run names as strings.
+            tags: list of tag names as strings.
+
+        Returns:
+            A nested map `d` such that `d[run][tag]` is a list of data from
+            the data provider's `read_*` method for the plugin.
+        """
+        run_tag_filter = provider.RunTagFilter(runs=runs, tags=tags)
+        if plugin == scalar_metadata.PLUGIN_NAME:
+            read = self._data_provider.read_scalars
+            downsample = self._plugin_downsampling["scalars"]
+        elif plugin == histogram_metadata.PLUGIN_NAME:
+            read = self._data_provider.read_tensors
+            downsample = self._plugin_downsampling["histograms"]
+        else:
+            read = self._data_provider.read_blob_sequences
+            downsample = self._plugin_downsampling["images"]
+        return read(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=plugin,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+
     def _create_base_response(self, series_request):
         tag = series_request.get("tag")
         run = series_request.get("run")
@@ -445,69 +539,50 @@ class MetricsPlugin(base_plugin.TBPlugin):
         if plugin in _SAMPLED_PLUGINS and not isinstance(sample, int):
             return "Missing sample"
 
+        if plugin == histogram_metadata.PLUGIN_NAME:
+            for field in ("binCount", "maxSteps"):
+                value = series_request.get(field)
+                if value is not None and not _is_positive_int(value):
+                    return "Invalid %s" % field
+
         return None
 
-    def _get_time_series(self, ctx, experiment, series_request):
-        """Returns time series data for a given tag, plugin.
+    def _get_run_to_series(self, mapping, series_request):
+        """Extracts the series for a valid request from a combined read.
 
         Args:
-            ctx: A `tensorboard.context.RequestContext` value.
-            experiment: string ID of the request's experiment.
+            mapping: the result of `_read_time_series` for a set of tags
+                including the requested one.
             series_request: a `TimeSeriesRequest` (see http_api.md).
 
         Returns:
-            A `TimeSeriesResponse` dict (see http_api.md).
+            A `RunToSeries` dict (see http_api.md).
         """
         tag = series_request.get("tag")
-        run = series_request.get("run")
         plugin = series_request.get("plugin")
-        sample = series_request.get("sample")
-        response = self._create_base_response(series_request)
-        request_error = self._get_invalid_request_error(series_request)
-        if request_error:
-            response["error"] = request_error
-            return response
-
-        runs = [run] if run else None
-        run_to_series = None
         if plugin == scalar_metadata.PLUGIN_NAME:
-            run_to_series = self._get_run_to_scalar_series(
-                ctx, experiment, tag, runs
-            )
-
+            return self._get_run_to_scalar_series(mapping, tag)
         if plugin == histogram_metadata.PLUGIN_NAME:
-            run_to_series = self._get_run_to_histogram_series(
-                ctx, experiment, tag, runs
+            return self._get_run_to_histogram_series(
+                mapping,
+                tag,
+                bin_count=series_request.get("binCount"),
+                max_steps=series_request.get("maxSteps"),
             )
+        sample = series_request.get("sample")
+        return self._get_run_to_image_series(mapping, tag, sample)
 
-        if plugin == image_metadata.PLUGIN_NAME:
-            run_to_series = self._get_run_to_image_series(
-                ctx, experiment, tag, sample, runs
-            )
-
-        response["runToSeries"] = run_to_series
-        return response
-
-    def _get_run_to_scalar_series(self, ctx, experiment, tag, runs):
+    def _get_run_to_scalar_series(self, mapping, tag):
         """Builds a run-to-scalar-series dict for client consumption.
 
         Args:
-            ctx: A `tensorboard.context.RequestContext` value.
-            experiment: a string experiment id.
+            mapping: a nested map `d` such that `d[run][tag]` is a list of
+                `ScalarDatum`s, as returned by `read_scalars`.
             tag: string of the requested tag.
-            runs: optional list of run names as strings.
 
         Returns:
             A map from string run names to `ScalarStepDatum` (see http_api.md).
         """
-        mapping = self._data_provider.read_scalars(
-            ctx,
-            experiment_id=experiment,
-            plugin_name=scalar_metadata.PLUGIN_NAME,
-            downsample=self._plugin_downsampling["scalars"],
-            run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
-        )
-
         run_to_series = {}
         for result_run, tag_data in mapping.items():
             if tag not in tag_data:
@@ -524,76 +599,74 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         return run_to_series
 
-    def _format_histogram_datum_bins(self, datum):
+    def _format_histogram_datum_bins(self, buckets):
         """Formats a histogram datum's bins for client consumption.
 
         Args:
-            datum: a DataProvider's TensorDatum.
+            buckets: an array of shape `[num_buckets, 3]`, as the `numpy`
+                field of a DataProvider's TensorDatum.
 
         Returns:
             A list of `HistogramBin`s (see http_api.md).
         """
-        numpy_list = datum.numpy.tolist()
+        numpy_list = buckets.tolist()
         bins = [{"min": x[0], "max": x[1], "count": x[2]} for x in numpy_list]
         return bins
 
-    def _get_run_to_histogram_series(self, ctx, experiment, tag, runs):
+    def _get_run_to_histogram_series(
+        self, mapping, tag, bin_count=None, max_steps=None
+    ):
         """Builds a run-to-histogram-series dict for client consumption.
 
         Args:
-            ctx: A `tensorboard.context.RequestContext` value.
-            experiment: a string experiment id.
+            mapping: a nested map `d` such that `d[run][tag]` is a list of
+                `TensorDatum`s, as returned by `read_tensors`.
             tag: string of the requested tag.
-            runs: optional list of run names as strings.
+            bin_count: optional number of bins to re-bin the histograms of
+                each run into; see `rebinning.rebin`.
+            max_steps: optional maximum number of evenly spaced steps to
+                return for each run.
 
         Returns:
             A map from string run names to `HistogramStepDatum` (see http_api.md).
         """
-        mapping = self._data_provider.read_tensors(
-            ctx,
-            experiment_id=experiment,
-            plugin_name=histogram_metadata.PLUGIN_NAME,
-            downsample=self._plugin_downsampling["histograms"],
-            run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
-        )
-
         run_to_series = {}
         for result_run, tag_data in mapping.items():
             if tag not in tag_data:
                 continue
+            data = tag_data[tag]
+            if max_steps is not None:
+                data = [
+                    data[i]
+                    for i in rebinning.downsample_steps(len(data), max_steps)
+                ]
+            buckets = [datum.numpy for datum in data]
+            if bin_count is not None:
+                buckets = rebinning.rebin(buckets, bin_count)
             values = [
                 {
                     "wallTime": datum.wall_time,
                     "step": datum.step,
-                    "bins": self._format_histogram_datum_bins(datum),
+                    "bins": self._format_histogram_datum_bins(datum_buckets),
                 }
-                for datum in tag_data[tag]
+                for (datum, datum_buckets) in zip(data, buckets)
             ]
             run_to_series[result_run] = values
 
         return run_to_series
 
-    def _get_run_to_image_series(self, ctx, experiment, tag, sample, runs):
+    def _get_run_to_image_series(self, mapping, tag, sample):
         """Builds a run-to-image-series dict for client consumption.
 
         Args:
-            ctx: A `tensorboard.context.RequestContext` value.
-            experiment: a string experiment id.
+            mapping: a nested map `d` such that `d[run][tag]` is a list of
+                `BlobSequenceDatum`s, as returned by `read_blob_sequences`.
             tag: string of the requested tag.
             sample: zero-indexed integer for the requested sample.
-            runs: optional list of run names as strings.
 
         Returns:
             A `RunToSeries` dict (see http_api.md).
         """
-        mapping = self._data_provider.read_blob_sequences(
-            ctx,
-            experiment_id=experiment,
-            plugin_name=image_metadata.PLUGIN_NAME,
-            downsample=self._plugin_downsampling["images"],
-            run_tag_filter=provider.RunTagFilter(runs, tags=[tag]),
-        )
-
         run_to_series = {}
         for result_run, tag_data in mapping.items():
             if tag not in tag_data:
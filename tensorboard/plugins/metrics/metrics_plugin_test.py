@@ -18,6 +18,7 @@
 import argparse
 import collections.abc
 import os.path
+from unittest import mock
 
 import tensorflow.compat.v1 as tf1
 import tensorflow.compat.v2 as tf
@@ -453,6 +454,82 @@ class MetricsPluginTest(tf.test.TestCase):
             clean_response,
         )
 
+    def test_time_series_histogram_rebinned(self):
+        self._write_histogram_data("run1", "histograms/tagA", [0, 10, 5, 7])
+        self._multiplexer.Reload()
+
+        requests = [
+            {
+                "plugin": "histograms",
+                "tag": "histograms/tagA",
+                "run": "run1",
+                "binCount": 2,
+                "maxSteps": 2,
+            }
+        ]
+        response = self._plugin._time_series_impl(
+            context.RequestContext(), "", requests
+        )
+        clean_response = self._clean_time_series_responses(response)
+
+        # Steps 0 and 3 are kept, and re-binned over the range [0, 7].
+        self.assertEqual(
+            [
+                {
+                    "plugin": "histograms",
+                    "tag": "histograms/tagA",
+                    "run": "run1",
+                    "runToSeries": {
+                        "run1": [
+                            {
+                                "wallTime": "<wall_time>",
+                                "step": 0,
+                                "bins": [
+                                    {"min": 0.0, "max": 3.5, "count": 1.0},
+                                    {"min": 3.5, "max": 7.0, "count": 0.0},
+                                ],
+                            },
+                            {
+                                "wallTime": "<wall_time>",
+                                "step": 3,
+                                "bins": [
+                                    {"min": 0.0, "max": 3.5, "count": 0.0},
+                                    {"min": 3.5, "max": 7.0, "count": 1.0},
+                                ],
+                            },
+                        ]
+                    },
+                }
+            ],
+            clean_response,
+        )
+
+    def test_time_series_histogram_invalid_rebinning(self):
+        self._write_histogram_data("run1", "histograms/tagA", [0])
+        self._multiplexer.Reload()
+
+        requests = [
+            {
+                "plugin": "histograms",
+                "tag": "histograms/tagA",
+                "run": "run1",
+                "binCount": 0,
+            },
+            {
+                "plugin": "histograms",
+                "tag": "histograms/tagA",
+                "run": "run1",
+                "maxSteps": "10",
+            },
+        ]
+        response = self._plugin._time_series_impl(
+            context.RequestContext(), "", requests
+        )
+        self.assertEqual(
+            ["Invalid binCount", "Invalid maxSteps"],
+            [r.get("error") for r in response],
+        )
+
     def test_time_series_unmatching_request(self):
         self._write_scalar_data("run1", "scalars/tagA", [0, 100, -200])
 
@@ -575,6 +652,83 @@ class MetricsPluginTest(tf.test.TestCase):
             clean_response,
         )
 
+    def test_time_series_batches_reads_per_plugin_and_run(self):
+        self._write_scalar_data("run1", "scalars/tagA", [0])
+        self._write_scalar_data("run2", "scalars/tagB", [1])
+        self._write_histogram_data("run1", "histograms/tagA", [0])
+        self._multiplexer.Reload()
+
+        requests = [
+            {"plugin": "scalars", "tag": "scalars/tagA"},
+            {"plugin": "histograms", "tag": "histograms/tagA", "run": "run1"},
+            {"plugin": "scalars", "tag": "scalars/tagB"},
+            {"plugin": "scalars", "tag": "scalars/tagB", "run": "run2"},
+        ]
+        with mock.patch.object(
+            self._plugin._data_provider,
+            "read_scalars",
+            wraps=self._plugin._data_provider.read_scalars,
+        ) as read_scalars, mock.patch.object(
+            self._plugin._data_provider,
+            "read_tensors",
+            wraps=self._plugin._data_provider.read_tensors,
+        ) as read_tensors:
+            response = self._plugin._time_series_impl(
+                context.RequestContext(), "", requests
+            )
+
+        self.assertEqual(read_scalars.call_count, 2)
+        self.assertEqual(read_tensors.call_count, 1)
+        filters = [
+            (
+                call.kwargs["run_tag_filter"].runs,
+                call.kwargs["run_tag_filter"].tags,
+            )
+            for call in read_scalars.call_args_list
+        ]
+        self.assertCountEqual(
+            filters,
+            [
+                (None, frozenset(["scalars/tagA", "scalars/tagB"])),
+                (frozenset(["run2"]), frozenset(["scalars/tagB"])),
+            ],
+        )
+        self.assertEqual(
+            [list(r["runToSeries"]) for r in response],
+            [["run1"], ["run1"], ["run2"], ["run2"]],
+        )
+
+    def test_time_series_parallel_reads(self):
+        self._write_scalar_data("run1", "scalars/tagA", [0, 1])
+        self._write_scalar_data("run2", "scalars/tagB", [2])
+        self._write_histogram_data("run1", "histograms/tagA", [0, 10])
+        self._multiplexer.Reload()
+
+        requests = [
+            {"plugin": "scalars", "tag": "scalars/tagA", "run": "run1"},
+            {"plugin": "histograms", "tag": "histograms/tagA", "run": "run1"},
+            {"plugin": "scalars", "tag": "scalars/tagB"},
+            {"plugin": "scalars"},
+        ]
+        expected = self._plugin._time_series_impl(
+            context.RequestContext(), "", requests
+        )
+
+        flags = argparse.Namespace(generic_data="true", metrics_read_threads=4)
+        ctx = base_plugin.TBContext(
+            flags=flags,
+            logdir=self._logdir,
+            multiplexer=self._multiplexer,
+            data_provider=self._plugin._data_provider,
+        )
+        plugin = metrics_plugin.MetricsPlugin(ctx)
+        actual = plugin._time_series_impl(
+            context.RequestContext(), "", requests
+        )
+
+        self.assertEqual(actual, expected)
+        self.assertIsNotNone(plugin._read_executor_instance)
+
     def test_time_series_single_request_specific_run(self):
         self._write_scalar_data("run1", "scalars/tagA", [0])
         self._write_scalar_data("run2", "scalars/tagA", [1])
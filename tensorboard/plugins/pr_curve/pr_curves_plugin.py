@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import collections
+
 import numpy as np
 from werkzeug import wrappers
 
@@ -72,10 +74,23 @@ class PrCurvesPlugin(base_plugin.TBPlugin):
                 request, "No tag provided when fetching PR curve data", 400
             )
 
+        max_thresholds = request.args.get("max_thresholds")
+        if max_thresholds is not None:
+            try:
+                max_thresholds = int(max_thresholds)
+            except ValueError:
+                max_thresholds = 0
+            if max_thresholds < 1:
+                return http_util.Respond(
+                    request, "max_thresholds must be a positive integer", 400
+                )
+
         try:
             response = http_util.Respond(
                 request,
-                self.pr_curves_impl(ctx, experiment, runs, tag),
+                self.pr_curves_impl(
+                    ctx, experiment, runs, tag, max_thresholds=max_thresholds
+                ),
                 "application/json",
             )
         except ValueError as e:
@@ -83,13 +98,16 @@ class PrCurvesPlugin(base_plugin.TBPlugin):
 
         return response
 
-    def pr_curves_impl(self, ctx, experiment, runs, tag):
+    def pr_curves_impl(self, ctx, experiment, runs, tag, max_thresholds=None):
         """Creates the JSON object for the PR curves response for a run-tag
         combo.
 
         Arguments:
           runs: A list of runs to fetch the curves for.
           tag: The tag to fetch the curves for.
+          max_thresholds: Optional maximum number of thresholds of each
+            curve. If given, at most that many evenly spaced thresholds are
+            kept, including the first and last ones.
 
         Raises:
           ValueError: If no PR curves could be fetched for a run and tag.
@@ -113,7 +131,7 @@ class PrCurvesPlugin(base_plugin.TBPlugin):
                     "No PR curves could be found for run %r and tag %r"
                     % (run, tag)
                 )
-            response_mapping[run] = [self._process_datum(d) for d in data]
+            response_mapping[run] = self._make_pr_entries(data, max_thresholds)
         return response_mapping
 
     @wrappers.Request.application
@@ -181,62 +199,121 @@ class PrCurvesPlugin(base_plugin.TBPlugin):
             tab_name="PR Curves",
         )
 
-    def _process_datum(self, datum):
-        """Converts a TensorDatum into a dict that encapsulates information on
-        it.
+    def _make_pr_entries(self, data, max_thresholds=None):
+        """Creates the entries for PR curve data. Each entry corresponds to
+        1 step.
 
-        Args:
-          datum: The TensorDatum to convert.
-
-        Returns:
-          A JSON-able dictionary of PR curve data for 1 step.
-        """
-        return self._make_pr_entry(datum.step, datum.wall_time, datum.numpy)
-
-    def _make_pr_entry(self, step, wall_time, data_array):
-        """Creates an entry for PR curve data. Each entry corresponds to 1
-        step.
+        The data of all steps with the same number of thresholds are
+        processed together, as one array of shape `[num_steps, 6,
+        num_thresholds]`.
 
         Args:
-          step: The step.
-          wall_time: The wall time.
-          data_array: A numpy array of PR curve data stored in the summary format.
+          data: A list of TensorDatums of PR curve data stored in the summary
+            format.
+          max_thresholds: Optional maximum number of thresholds to keep.
 
         Returns:
-          A PR curve entry.
+          A list of PR curve entries, one for each TensorDatum.
         """
-        tp_index = metadata.TRUE_POSITIVES_INDEX
-        fp_index = metadata.FALSE_POSITIVES_INDEX
-        tn_index = metadata.TRUE_NEGATIVES_INDEX
-        fn_index = metadata.FALSE_NEGATIVES_INDEX
-
-        # Trim entries for which TP + FP = 0 (precision is undefined) at the tail of
-        # the data.
-        positives = data_array[[tp_index, fp_index], :].astype(int).sum(axis=0)
-        # Searching from the end, find the farthest index where TP + FP = 0.
-        end_index_inclusive = len(positives) - 1
-        while end_index_inclusive > 0 and positives[end_index_inclusive] == 0:
-            end_index_inclusive -= 1
-        end_index = end_index_inclusive + 1
-        # Generate thresholds in [0, 1].
-        num_thresholds = data_array.shape[1]
-        thresholds = np.linspace(0.0, 1.0, num_thresholds)
-
-        true_positives = [int(v) for v in data_array[tp_index]]
-        false_positives = [int(v) for v in data_array[fp_index]]
-        true_negatives = [int(v) for v in data_array[tn_index]]
-        false_negatives = [int(v) for v in data_array[fn_index]]
+        entries = [None] * len(data)
+        positions_by_shape = collections.defaultdict(list)
+        for i, datum in enumerate(data):
+            positions_by_shape[datum.numpy.shape].append(i)
+        for positions in positions_by_shape.values():
+            data_array = np.stack([data[i].numpy for i in positions])
+            for i, entry in zip(
+                positions,
+                _make_pr_entries(
+                    [data[i].step for i in positions],
+                    [data[i].wall_time for i in positions],
+                    data_array,
+                    max_thresholds,
+                ),
+            ):
+                entries[i] = entry
+        return entries
+
+
+def _make_pr_entries(steps, wall_times, data_array, max_thresholds):
+    """Creates the PR curve entries of steps with the same thresholds.
+
+    Args:
+      steps: A list of the steps.
+      wall_times: A list of the wall times.
+      data_array: A numpy array of shape `[num_steps, 6, num_thresholds]` of
+        PR curve data stored in the summary format.
+      max_thresholds: Optional maximum number of thresholds to keep.
+
+    Returns:
+      A list of PR curve entries.
+    """
+    num_thresholds = data_array.shape[2]
+    # Generate thresholds in [0, 1].
+    thresholds = np.linspace(0.0, 1.0, num_thresholds)
+    if max_thresholds is not None and num_thresholds > max_thresholds:
+        kept = _evenly_spaced_indices(num_thresholds, max_thresholds)
+        data_array = data_array[:, :, kept]
+        thresholds = thresholds[kept]
+        num_thresholds = len(kept)
+
+    # Trim entries for which TP + FP = 0 (precision is undefined) at the tail of
+    # the data.
+    positives = (
+        data_array[
+            :, [metadata.TRUE_POSITIVES_INDEX, metadata.FALSE_POSITIVES_INDEX]
+        ]
+        .astype(int)
+        .sum(axis=1)
+    )
+    # Searching from the end, find the farthest index where TP + FP = 0, but
+    # keep at least the first threshold.
+    nonzero = positives[:, ::-1] != 0
+    end_indices = np.where(
+        nonzero.any(axis=1),
+        num_thresholds - nonzero.argmax(axis=1),
+        min(num_thresholds, 1),
+    ).tolist()
+
+    counts = data_array[
+        :,
+        [
+            metadata.TRUE_POSITIVES_INDEX,
+            metadata.FALSE_POSITIVES_INDEX,
+            metadata.TRUE_NEGATIVES_INDEX,
+            metadata.FALSE_NEGATIVES_INDEX,
+        ],
+    ].astype(np.int64)
+    rates = data_array[:, [metadata.PRECISION_INDEX, metadata.RECALL_INDEX]]
+    thresholds = thresholds.tolist()
+
+    result = []
+    for i, end_index in enumerate(end_indices):
+        # Convert only the kept thresholds of each step to Python lists.
+        (true_positives, false_positives, true_negatives, false_negatives) = (
+            counts[i, :, :end_index].tolist()
+        )
+        (precision, recall) = rates[i, :, :end_index].tolist()
+        result.append(
+            {
+                "wall_time": wall_times[i],
+                "step": steps[i],
+                "precision": precision,
+                "recall": recall,
+                "true_positives": true_positives,
+                "false_positives": false_positives,
+                "true_negatives": true_negatives,
+                "false_negatives": false_negatives,
+                "thresholds": thresholds[:end_index],
+            }
+        )
+    return result
 
-        return {
-            "wall_time": wall_time,
-            "step": step,
-            "precision": data_array[
-                metadata.PRECISION_INDEX, :end_index
-            ].tolist(),
-            "recall": data_array[metadata.RECALL_INDEX, :end_index].tolist(),
-            "true_positives": true_positives[:end_index],
-            "false_positives": false_positives[:end_index],
-            "true_negatives": true_negatives[:end_index],
-            "false_negatives": false_negatives[:end_index],
-            "thresholds": thresholds[:end_index].tolist(),
-        }
+
+def _evenly_spaced_indices(num_indices, max_indices):
+    """Returns at most `max_indices` evenly spaced indices, including the
+    first and last ones."""
+    if max_indices == 1:
+        return np.array([num_indices - 1])
+    return np.unique(
+        np.round(np.linspace(0, num_indices - 1, max_indices)).astype(np.int64)
+    )
@@ -0,0 +1,177 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for building the PR curve entries of a response.
+
+Compares `PrCurvesPlugin._make_pr_entries`, which processes all steps of
+a time series as one array, against the previous implementation, which
+built each step's entry separately, converting counts with per-element
+`int` calls and trimming with a Python loop.
+
+Here are the results of running this benchmark on a Linux workstation
+with an Intel(R) Xeon(R) CPU:
+
+       IMPL  STEPS  THRESHOLDS  MAX_THRESHOLDS  SECONDS  STEPS_PER_SEC
+     legacy    100         200                    0.025         3930.2
+    batched    100         200                    0.004        22734.6
+    batched    100         200              50    0.002        54436.1
+     legacy   5000         200                    1.402         3567.4
+    batched   5000         200                    0.468        10675.1
+    batched   5000         200              50    0.170        29443.8
+
+Most of the remaining time is spent creating the Python lists of the
+response, so downsampling thresholds helps the most.
+"""
+
+
+import time
+
+from absl import app
+from absl import logging
+import numpy as np
+
+from tensorboard.data import provider
+from tensorboard.plugins import base_plugin
+from tensorboard.plugins.pr_curve import metadata
+from tensorboard.plugins.pr_curve import pr_curves_plugin
+from tensorboard.util import tb_logging
+
+logger = tb_logging.get_logger()
+
+
+def _legacy_make_pr_entry(step, wall_time, data_array):
+    """The previous implementation, kept here only as a baseline."""
+    tp_index = metadata.TRUE_POSITIVES_INDEX
+    fp_index = metadata.FALSE_POSITIVES_INDEX
+    tn_index = metadata.TRUE_NEGATIVES_INDEX
+    fn_index = metadata.FALSE_NEGATIVES_INDEX
+    positives = data_array[[tp_index, fp_index], :].astype(int).sum(axis=0)
+    end_index_inclusive = len(positives) - 1
+    while end_index_inclusive > 0 and positives[end_index_inclusive] == 0:
+        end_index_inclusive -= 1
+    end_index = end_index_inclusive + 1
+    num_thresholds = data_array.shape[1]
+    thresholds = np.linspace(0.0, 1.0, num_thresholds)
+    true_positives = [int(v) for v in data_array[tp_index]]
+    false_positives = [int(v) for v in data_array[fp_index]]
+    true_negatives = [int(v) for v in data_array[tn_index]]
+    false_negatives = [int(v) for v in data_array[fn_index]]
+    return {
+        "wall_time": wall_time,
+        "step": step,
+        "precision": data_array[metadata.PRECISION_INDEX, :end_index].tolist(),
+        "recall": data_array[metadata.RECALL_INDEX, :end_index].tolist(),
+        "true_positives": true_positives[:end_index],
+        "false_positives": false_positives[:end_index],
+        "true_negatives": true_negatives[:end_index],
+        "false_negatives": false_negatives[:end_index],
+        "thresholds": thresholds[:end_index].tolist(),
+    }
+
+
+def _make_data(num_steps, num_thresholds):
+    rng = np.random.default_rng(0)
+    data = []
+    for step in range(num_steps):
+        # Decreasing counts of positives, reaching zero before the last
+        # thresholds as with real data.
+        tp = np.sort(rng.integers(0, 1000, num_thresholds))[::-1]
+        fp = np.sort(rng.integers(0, 1000, num_thresholds))[::-1]
+        tp[-num_thresholds // 10 :] = 0
+        fp[-num_thresholds // 10 :] = 0
+        tn = 1000 - fp
+        fn = 1000 - tp
+        precision = tp / np.maximum(tp + fp, 1)
+        recall = tp / np.maximum(tp + fn, 1)
+        data.append(
+            provider.TensorDatum(
+                step=step,
+                wall_time=1.5 * step,
+                numpy=np.stack([tp, fp, tn, fn, precision, recall]).astype(
+                    np.float32
+                ),
+            )
+        )
+    return data
+
+
+def bench(fn):
+    """Returns the result of `fn` and the best of three timings."""
+    seconds = []
+    for _ in range(3):
+        start_time = time.time()
+        result = fn()
+        seconds.append(time.time() - start_time)
+    return (result, min(seconds))
+
+
+def _format_line(headers, fields):
+    """Format a line of a table, right-aligning each field."""
+    fields = [
+        "%.3f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    plugin = pr_curves_plugin.PrCurvesPlugin(
+        base_plugin.TBContext(data_provider=None)
+    )
+    headers = (
+        "       IMPL",
+        "STEPS",
+        "THRESHOLDS",
+        "MAX_THRESHOLDS",
+        "SECONDS",
+        "STEPS_PER_SEC",
+    )
+    logger.info(_format_line(headers, headers))
+    for num_steps, num_thresholds in [(100, 200), (5000, 200)]:
+        data = _make_data(num_steps, num_thresholds)
+        impls = [
+            (
+                "legacy",
+                None,
+                lambda: [
+                    _legacy_make_pr_entry(d.step, d.wall_time, d.numpy)
+                    for d in data
+                ],
+            ),
+            ("batched", None, lambda: plugin._make_pr_entries(data)),
+            ("batched", 50, lambda: plugin._make_pr_entries(data, 50)),
+        ]
+        results = []
+        for name, max_thresholds, fn in impls:
+            (result, seconds) = bench(fn)
+            results.append(result)
+            fields = (
+                name,
+                num_steps,
+                num_thresholds,
+                max_thresholds or "",
+                seconds,
+                "%.1f" % (num_steps / seconds),
+            )
+            logger.info(_format_line(headers, fields))
+        if results[0] != results[1]:
+            logger.error("Implementations returned different entries")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -27,6 +27,7 @@ from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
 from tensorboard.backend.event_processing import data_provider
+from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.pr_curve import pr_curve_demo
 from tensorboard.plugins.pr_curve import pr_curves_plugin
@@ -278,6 +279,57 @@ class PrCurvesPluginTest(tf.test.TestCase):
             pr_curve_entry=entries[2],
         )
 
+    def testPrCurvesDownsampleThresholds(self):
+        """Tests that thresholds are downsampled when requested."""
+        full = self.plugin.pr_curves_impl(
+            context.RequestContext(), "123", ["colors"], "blue/pr_curves"
+        )["colors"]
+        downsampled = self.plugin.pr_curves_impl(
+            context.RequestContext(),
+            "123",
+            ["colors"],
+            "blue/pr_curves",
+            max_thresholds=3,
+        )["colors"]
+        self.assertEqual(len(full), len(downsampled))
+        for full_entry, entry in zip(full, downsampled):
+            # Of the thresholds 0, 0.25, 0.5, 0.75 and 1, keep 0, 0.5 and 1.
+            # The last one is trimmed, as it has no positives.
+            self.assertEqual([0.0, 0.5], entry["thresholds"])
+            for key in ("precision", "recall", "true_positives"):
+                self.assertEqual(
+                    [full_entry[key][0], full_entry[key][2]], entry[key]
+                )
+
+    def testMakePrEntriesTrimsEachStep(self):
+        """Tests that steps processed together are trimmed separately."""
+        data_array = np.zeros([6, 4])
+        data_array[:4] = [
+            [3, 2, 1, 0],
+            [5, 0, 0, 0],
+            [1, 2, 3, 4],
+            [0, 0, 1, 2],
+        ]
+        data_array[4:] = 0.5
+        datum = functools.partial(provider.TensorDatum, wall_time=1.5)
+        data = [
+            datum(step=0, numpy=data_array),
+            # Only the first threshold is kept, even without positives.
+            datum(step=1, numpy=np.zeros([6, 4])),
+            # A curve with a different number of thresholds.
+            datum(step=2, numpy=np.ones([6, 2])),
+        ]
+        entries = self.plugin._make_pr_entries(data)
+        self.assertEqual([0, 1, 2], [e["step"] for e in entries])
+        self.assertEqual([3, 2, 1], entries[0]["true_positives"])
+        self.assertEqual([5, 0, 0], entries[0]["false_positives"])
+        self.assertEqual([0.0, 1 / 3, 2 / 3], entries[0]["thresholds"])
+        self.assertEqual([0], entries[1]["true_positives"])
+        self.assertEqual([0.0], entries[1]["thresholds"])
+        self.assertEqual([1, 1], entries[2]["false_negatives"])
+        self.assertEqual([0.0, 1.0], entries[2]["thresholds"])
+        self.assertIsInstance(entries[0]["true_positives"][0], int)
+
     def testPrCurvesRaisesValueErrorWhenNoData(self):
         """Tests that the method for obtaining PR curve data raises a
         ValueError.
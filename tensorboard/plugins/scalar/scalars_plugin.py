@@ -158,10 +158,15 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         ctx = plugin_util.context(request.environ)
         experiment = plugin_util.experiment_id(request.environ)
         output_format = request.args.get("format")
+        etag = self._data_provider.data_generation(
+            ctx,
+            experiment_id=experiment,
+            run_tag_filter=provider.RunTagFilter(runs=[run], tags=[tag]),
+        )
         (body, mime_type) = self.scalars_impl(
             ctx, tag, run, experiment, output_format
         )
-        return http_util.Respond(request, body, mime_type)
+        return http_util.Respond(request, body, mime_type, etag=etag)
 
     @wrappers.Request.application
     def scalars_multirun_route(self, request):
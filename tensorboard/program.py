@@ -500,6 +500,66 @@ def _should_use_data_server(flags):
             "path."
         )
         return False
+    if flags.ingest_cache_dir:
+        logger.info(
+            "Note: --ingest_cache_dir is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if flags.reload_incremental is True:
+        logger.info(
+            "Note: --reload_incremental=true is not supported with "
+            "--load_fast behavior; falling back to slower Python-only load "
+            "path."
+        )
+        return False
+    if flags.max_reload_processes:
+        logger.info(
+            "Note: --max_reload_processes is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if (
+        flags.max_bytes_per_tag
+        or flags.bytes_per_plugin
+        or flags.max_tensor_bytes
+    ):
+        logger.info(
+            "Note: --max_bytes_per_tag, --bytes_per_plugin, and "
+            "--max_tensor_bytes are not supported with --load_fast behavior; "
+            "falling back to slower Python-only load path."
+        )
+        return False
+    if flags.blob_spill_dir:
+        logger.info(
+            "Note: --blob_spill_dir is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if flags.reload_watch is True:
+        logger.info(
+            "Note: --reload_watch=true is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if flags.reload_backoff is True:
+        logger.info(
+            "Note: --reload_backoff=true is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if flags.load_on_demand is True:
+        logger.info(
+            "Note: --load_on_demand=true is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
+    if flags.skip_data_crc is True:
+        logger.info(
+            "Note: --skip_data_crc=true is not supported with --load_fast "
+            "behavior; falling back to slower Python-only load path."
+        )
+        return False
     return True
 
 
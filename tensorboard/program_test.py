@@ -87,6 +87,17 @@ class TensorBoardTest(tb_test.TestCase):
             kwargs.setdefault("logdir", "")
             kwargs.setdefault("logdir_spec", "")
             kwargs.setdefault("detect_file_replacement", None)
+            kwargs.setdefault("ingest_cache_dir", "")
+            kwargs.setdefault("reload_incremental", None)
+            kwargs.setdefault("max_reload_processes", 0)
+            kwargs.setdefault("reload_watch", None)
+            kwargs.setdefault("blob_spill_dir", "")
+            kwargs.setdefault("load_on_demand", None)
+            kwargs.setdefault("reload_backoff", None)
+            kwargs.setdefault("max_bytes_per_tag", 0)
+            kwargs.setdefault("bytes_per_plugin", {})
+            kwargs.setdefault("max_tensor_bytes", 0)
+            kwargs.setdefault("skip_data_crc", None)
             flags = argparse.Namespace()
             for k, v in kwargs.items():
                 setattr(flags, k, v)
@@ -98,6 +109,17 @@ class TensorBoardTest(tb_test.TestCase):
         self.assertTrue(f(logdir="gs://logs"))
         self.assertFalse(f(logdir="notgs://logs"))
         self.assertFalse(f(logdir="foo", detect_file_replacement=True))
+        self.assertFalse(f(logdir="foo", ingest_cache_dir="/tmp/cache"))
+        self.assertFalse(f(logdir="foo", reload_incremental=True))
+        self.assertFalse(f(logdir="foo", max_reload_processes=4))
+        self.assertFalse(f(logdir="foo", reload_watch=True))
+        self.assertFalse(f(logdir="foo", blob_spill_dir="/tmp/blobs"))
+        self.assertFalse(f(logdir="foo", load_on_demand=True))
+        self.assertFalse(f(logdir="foo", reload_backoff=True))
+        self.assertFalse(f(logdir="foo", max_bytes_per_tag=1 << 20))
+        self.assertFalse(f(logdir="foo", bytes_per_plugin={"images": 1 << 30}))
+        self.assertFalse(f(logdir="foo", max_tensor_bytes=1 << 30))
+        self.assertFalse(f(logdir="foo", skip_data_crc=True))
 
 
 class WerkzeugServerTest(tb_test.TestCase):